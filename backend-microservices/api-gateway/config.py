@@ -3,7 +3,7 @@ Configuration settings for the API Gateway
 """
 
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = True
     log_level: str = "INFO"
+    access_log_sample_rate: float = 0.1  # share of successful, fast requests logged
+    access_log_slow_seconds: float = 1.0  # slower requests are always logged
     
     # Service URLs
     account_service_url: str = "http://account_service:8100"
@@ -36,14 +38,38 @@ class Settings(BaseSettings):
         env="ALLOWED_ORIGINS"
     )
     
-    # Rate Limiting
+    # Rate Limiting (token buckets shared by all gateway replicas through Redis)
+    redis_url: Optional[str] = None  # unset: per-process buckets only
     rate_limit_requests: int = 100
     rate_limit_window: int = 60  # seconds
+    rate_limit_dealer_requests: int = 1000  # per dealer per window, 0 disables
+    # Per-client budgets for route prefixes, as "prefix=requests/window_seconds,..."
+    rate_limit_routes: str = (
+        "/api/v1/auth/login=10/60,"
+        "/api/v1/auth/password-reset=5/300,"
+        "/api/v1/customer/customer-satisfaction/upload=10/60,"
+        "/api/v1/customer/reminder/upload=10/60,"
+        "/api/v1/h23-dashboard/exports=20/60"
+    )
+    rate_limit_local_cache_size: int = 10000
+    rate_limit_redis_timeout: float = 0.05  # seconds
+    
+    # Response Cache for dashboard GETs (opt-in, needs redis_url)
+    response_cache_enabled: bool = False
+    response_cache_ttl: int = 300  # seconds
+    response_cache_max_body_bytes: int = 1048576
+    response_cache_routes: str = "/api/v1/dashboard/,/api/v1/h23-dashboard/,/v1/dashboard/,/v1/h23-dashboard/"
+    response_cache_exclude_routes: str = "/api/v1/h23-dashboard/exports,/v1/h23-dashboard/exports"
     
     # Timeout Configuration - Environment Configurable
     request_timeout: int = Field(default=120, env="API_GATEWAY_REQUEST_TIMEOUT")  # Increased for file uploads
     file_upload_timeout: int = Field(default=300, env="API_GATEWAY_FILE_UPLOAD_TIMEOUT")  # 5 minutes for large files
     
+    # Upstream connection pool (per service)
+    proxy_max_connections: int = 100
+    proxy_max_keepalive_connections: int = 20
+    proxy_keepalive_expiry: float = 30.0  # seconds
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -53,6 +79,27 @@ class Settings(BaseSettings):
         """Get CORS origins as list"""
         return [origin.strip() for origin in self.allowed_origins.split(",")]
     
+    def get_response_cache_routes(self) -> List[str]:
+        """Get route prefixes whose GET responses may be cached"""
+        if not self.response_cache_enabled:
+            return []
+        return [route.strip() for route in self.response_cache_routes.split(",") if route.strip()]
+    
+    def get_response_cache_exclude_routes(self) -> List[str]:
+        """Get route prefixes never cached (e.g. Excel exports)"""
+        return [route.strip() for route in self.response_cache_exclude_routes.split(",") if route.strip()]
+    
+    def get_rate_limit_routes(self) -> Dict[str, Tuple[int, int]]:
+        """Get per-route rate limit budgets as prefix -> (requests, window seconds)"""
+        routes = {}
+        for entry in self.rate_limit_routes.split(","):
+            if not entry.strip():
+                continue
+            prefix, budget = entry.strip().split("=")
+            requests, window = budget.split("/")
+            routes[prefix.strip()] = (int(requests), int(window))
+        return routes
+    
     def get_service_routes(self) -> Dict[str, str]:
         """Get service routing configuration"""
         return {
@@ -2,6 +2,7 @@
 API Gateway for microservices
 """
 
+import math
 import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException, status
@@ -17,7 +18,7 @@ if utils_path not in sys.path:
     sys.path.append(utils_path)
 
 from config import settings
-from middleware import RateLimitMiddleware, AuthMiddleware, ProxyMiddleware, LoggingMiddleware
+from middleware import RateLimitMiddleware, AuthMiddleware, ProxyMiddleware, ResponseCacheMiddleware, LoggingMiddleware
 from utils.logger import setup_logger
 
 # Setup logger
@@ -26,7 +27,12 @@ logger = setup_logger(__name__)
 # Initialize middleware
 rate_limiter = RateLimitMiddleware(
     requests_per_window=settings.rate_limit_requests,
-    window_seconds=settings.rate_limit_window
+    window_seconds=settings.rate_limit_window,
+    redis_url=settings.redis_url,
+    route_limits=settings.get_rate_limit_routes(),
+    dealer_requests_per_window=settings.rate_limit_dealer_requests,
+    local_cache_size=settings.rate_limit_local_cache_size,
+    redis_timeout=settings.rate_limit_redis_timeout
 )
 
 auth_middleware = AuthMiddleware(
@@ -37,10 +43,26 @@ auth_middleware = AuthMiddleware(
 proxy_middleware = ProxyMiddleware(
     service_routes=settings.get_service_routes(),
     timeout=settings.request_timeout,
-    file_upload_timeout=settings.file_upload_timeout
+    file_upload_timeout=settings.file_upload_timeout,
+    max_connections=settings.proxy_max_connections,
+    max_keepalive_connections=settings.proxy_max_keepalive_connections,
+    keepalive_expiry=settings.proxy_keepalive_expiry
 )
 
-logging_middleware = LoggingMiddleware()
+response_cache = ResponseCacheMiddleware(
+    redis_url=settings.redis_url,
+    routes=settings.get_response_cache_routes(),
+    exclude_routes=settings.get_response_cache_exclude_routes(),
+    ttl_seconds=settings.response_cache_ttl,
+    max_body_bytes=settings.response_cache_max_body_bytes,
+    redis_timeout=settings.rate_limit_redis_timeout
+)
+
+logging_middleware = LoggingMiddleware(
+    sample_rate=settings.access_log_sample_rate,
+    slow_request_seconds=settings.access_log_slow_seconds,
+    level=settings.log_level
+)
 
 
 @asynccontextmanager
@@ -55,6 +77,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down API Gateway")
     await proxy_middleware.close()
+    await rate_limiter.close()
+    await response_cache.close()
 
 
 # Create FastAPI application
@@ -121,11 +145,23 @@ async def process_request(request: Request, call_next):
     start_time = time.time()
     
     try:
+        is_gateway_path = request.url.path in ["/", "/health", "/docs", "/redoc", "/openapi.json"]
+        requires_auth = not is_gateway_path and not auth_middleware.is_public_path(request.url.path)
+
+        # Decode the token first so the dealer budget applies; rejecting comes after rate limiting
+        user = auth_middleware.extract_user_from_token(request) if requires_auth else None
+
         # Rate limiting
         client_ip = request.client.host if request.client else "unknown"
-        if not rate_limiter.is_allowed(client_ip):
+        retry_after = await rate_limiter.check(
+            client_ip,
+            request.url.path,
+            dealer_id=user.get("dealer_id") if user else None
+        )
+        if retry_after > 0:
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(math.ceil(retry_after))},
                 content={
                     "error": {
                         "code": 429,
@@ -136,12 +172,11 @@ async def process_request(request: Request, call_next):
             )
         
         # Check if this is a gateway endpoint (handle directly)
-        if request.url.path in ["/", "/health", "/docs", "/redoc", "/openapi.json"]:
+        if is_gateway_path:
             response = await call_next(request)
         else:
             # Authentication (for non-public paths)
-            if not auth_middleware.is_public_path(request.url.path):
-                user = auth_middleware.extract_user_from_token(request)
+            if requires_auth:
                 if not user:
                     return JSONResponse(
                         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -156,8 +191,11 @@ async def process_request(request: Request, call_next):
                 # Store user in request state
                 request.state.user = user
 
-            # Proxy request to appropriate service
-            response = await proxy_middleware.proxy_request(request)
+            # Proxy request to appropriate service (whitelisted dashboard GETs through the cache)
+            if response_cache.is_cacheable(request):
+                response = await response_cache.fetch(request, user, proxy_middleware.proxy_request)
+            else:
+                response = await proxy_middleware.proxy_request(request)
         
         # Log request
         process_time = time.time() - start_time
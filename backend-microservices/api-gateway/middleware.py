@@ -4,10 +4,18 @@ Middleware for API Gateway
 
 import time
 import json
-from typing import Dict, Optional
+import hashlib
+import logging
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 from fastapi import Request, Response, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 import httpx
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 import sys
 import os
 
@@ -16,45 +24,178 @@ utils_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../utils')
 if utils_path not in sys.path:
     sys.path.append(utils_path)
 
-from utils.auth import decode_token
+from utils.auth import decode_token_cached
 from utils.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = setup_logger(__name__, level=os.getenv("LOG_LEVEL", "INFO"))
+
+
+# Token bucket check over one or more buckets, all-or-nothing: a request consumes one
+# token from every bucket only when each of them has one. Uses the Redis clock so
+# gateway replicas agree on refills.
+#   KEYS[i]            bucket key
+#   ARGV[2i-1], ARGV[2i]  capacity, refill rate in tokens per millisecond
+# Returns 0 when allowed, otherwise milliseconds until a token is available.
+TOKEN_BUCKET_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local tokens = {}
+local retry_ms = 0
+
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local bucket = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local available = tonumber(bucket[1]) or capacity
+    local last_ms = tonumber(bucket[2]) or now_ms
+    available = math.min(capacity, available + math.max(0, now_ms - last_ms) * rate)
+    tokens[i] = available
+    if available < 1 then
+        retry_ms = math.max(retry_ms, math.ceil((1 - available) / rate))
+    end
+end
+
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local available = tokens[i]
+    if retry_ms == 0 then
+        available = available - 1
+    end
+    redis.call('HSET', KEYS[i], 'tokens', available, 'ts', now_ms)
+    redis.call('PEXPIRE', KEYS[i], math.ceil(capacity / rate))
+end
+
+return retry_ms
+"""
 
 
 class RateLimitMiddleware:
-    """Rate limiting middleware"""
-    
-    def __init__(self, requests_per_window: int = 100, window_seconds: int = 60):
+    """Distributed token-bucket rate limiting middleware
+
+    Every request draws from a per-IP bucket, a per-IP bucket for the matching
+    budgeted route prefix (if any) and, for authenticated requests, a per-dealer
+    bucket. All buckets live in Redis and are checked in one atomic Lua call, so
+    limits hold across gateway replicas.
+
+    Two bounded in-process structures keep the hot path cheap and safe:
+    - a deny cache: a client that was just rejected is rejected locally until its
+      bucket refills, without another Redis round trip
+    - local fallback buckets: if Redis is slow or down, limits are enforced per
+      replica instead of failing open (Redis is retried after REDIS_RETRY_SECONDS)
+    """
+
+    KEY_PREFIX = "gateway:ratelimit"
+    REDIS_RETRY_SECONDS = 5
+
+    def __init__(
+        self,
+        requests_per_window: int = 100,
+        window_seconds: int = 60,
+        redis_url: Optional[str] = None,
+        route_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        dealer_requests_per_window: Optional[int] = None,
+        local_cache_size: int = 10000,
+        redis_timeout: float = 0.05
+    ):
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        self.clients: Dict[str, Dict] = {}
-    
-    def is_allowed(self, client_ip: str) -> bool:
-        """Check if client is allowed to make request"""
-        current_time = time.time()
-        
-        if client_ip not in self.clients:
-            self.clients[client_ip] = {
-                "requests": 1,
-                "window_start": current_time
-            }
-            return True
-        
-        client_data = self.clients[client_ip]
-        
-        # Reset window if expired
-        if current_time - client_data["window_start"] > self.window_seconds:
-            client_data["requests"] = 1
-            client_data["window_start"] = current_time
-            return True
-        
-        # Check if within limit
-        if client_data["requests"] < self.requests_per_window:
-            client_data["requests"] += 1
-            return True
-        
-        return False
+        # Longest prefix first so the most specific budget wins
+        self.route_limits = sorted((route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.dealer_requests_per_window = dealer_requests_per_window
+        self.local_cache_size = local_cache_size
+
+        self.redis = None
+        self.script = None
+        self.redis_retry_at = 0.0
+        if redis_url:
+            self.redis = aioredis.from_url(
+                redis_url,
+                socket_timeout=redis_timeout,
+                socket_connect_timeout=redis_timeout
+            )
+            self.script = self.redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+        # key tuple -> monotonic time until which requests are denied locally
+        self.denied_until: "OrderedDict[Tuple[str, ...], float]" = OrderedDict()
+        # key -> [tokens, last refill monotonic time], used when Redis is unavailable
+        self.local_buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def _buckets(self, client_ip: str, path: str, dealer_id: Optional[str]) -> List[Tuple[str, int, int]]:
+        """(key, capacity, window seconds) of every bucket the request draws from"""
+        buckets = [(f"{self.KEY_PREFIX}:ip:{client_ip}", self.requests_per_window, self.window_seconds)]
+
+        for prefix, (requests, window) in self.route_limits:
+            if path.startswith(prefix):
+                buckets.append((f"{self.KEY_PREFIX}:route:{prefix}:{client_ip}", requests, window))
+                break
+
+        if dealer_id and self.dealer_requests_per_window:
+            buckets.append((f"{self.KEY_PREFIX}:dealer:{dealer_id}", self.dealer_requests_per_window, self.window_seconds))
+
+        return buckets
+
+    def _remember(self, cache: OrderedDict, key, value) -> None:
+        """Insert into a bounded LRU, evicting the least recently used entry"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.local_cache_size:
+            cache.popitem(last=False)
+
+    def _check_local(self, buckets: List[Tuple[str, int, int]]) -> float:
+        """Same all-or-nothing token bucket as the Lua script, per process"""
+        now = time.monotonic()
+        states = []
+        retry_after = 0.0
+
+        for key, capacity, window in buckets:
+            rate = capacity / window
+            tokens, last = self.local_buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - last) * rate)
+            states.append((key, tokens))
+            if tokens < 1:
+                retry_after = max(retry_after, (1 - tokens) / rate)
+
+        for key, tokens in states:
+            self._remember(self.local_buckets, key, [tokens if retry_after else tokens - 1, now])
+
+        return retry_after
+
+    async def check(self, client_ip: str, path: str, dealer_id: Optional[str] = None) -> float:
+        """Consume a token for the request; returns 0 if allowed, else seconds to retry after"""
+        buckets = self._buckets(client_ip, path, dealer_id)
+        cache_key = tuple(key for key, _, _ in buckets)
+
+        # Local fast path: still inside a known denial
+        until = self.denied_until.get(cache_key)
+        if until is not None:
+            remaining = until - time.monotonic()
+            if remaining > 0:
+                return remaining
+            del self.denied_until[cache_key]
+
+        retry_after = None
+        if self.script is not None and time.monotonic() >= self.redis_retry_at:
+            args = []
+            for _, capacity, window in buckets:
+                args.extend([capacity, capacity / (window * 1000)])
+            try:
+                retry_after = int(await self.script(keys=list(cache_key), args=args)) / 1000
+            except (RedisError, OSError) as e:
+                logger.warning(f"Rate limiter falling back to local buckets for {self.REDIS_RETRY_SECONDS}s: {str(e)}")
+                self.redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+
+        if retry_after is None:
+            retry_after = self._check_local(buckets)
+
+        if retry_after > 0:
+            self._remember(self.denied_until, cache_key, time.monotonic() + retry_after)
+        return retry_after
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        if self.redis is not None:
+            await self.redis.aclose()
 
 
 class AuthMiddleware:
@@ -91,7 +232,7 @@ class AuthMiddleware:
             token = auth_header.split(" ")[1]
             
             # Decode token
-            payload = decode_token(token)
+            payload = decode_token_cached(token)
             if not payload or payload.get("type") != "access":
                 return None
             
@@ -107,13 +248,55 @@ class AuthMiddleware:
 
 
 class ProxyMiddleware:
-    """Proxy middleware for routing requests to services"""
-    
-    def __init__(self, service_routes: Dict[str, str], timeout: int = 30, file_upload_timeout: int = 300):
+    """Proxy middleware for routing requests to services
+
+    Request and response bodies are streamed chunk by chunk instead of being buffered,
+    so large Excel uploads and exports pass through the gateway in constant memory.
+    Each upstream service gets its own pooled client with explicit connection limits.
+    """
+
+    # Connection-scoped headers that must not be forwarded (RFC 7230 section 6.1);
+    # transfer-encoding is re-applied by httpx/uvicorn for each hop
+    HOP_BY_HOP_HEADERS = {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    }
+
+    def __init__(
+        self,
+        service_routes: Dict[str, str],
+        timeout: int = 30,
+        file_upload_timeout: int = 300,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0
+    ):
         self.service_routes = service_routes
+        # Compiled routing table: prefixes longest first, so the most specific route wins
+        self.route_table: List[Tuple[str, str]] = sorted(
+            service_routes.items(), key=lambda item: len(item[0]), reverse=True
+        )
         self.timeout = timeout
         self.file_upload_timeout = file_upload_timeout
-        self.client = httpx.AsyncClient()  # Don't set default timeout, we'll set it per request
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+
+        # One connection pool per upstream, so a slow service cannot starve the others.
+        # No default timeout, we set it per request
+        self.clients: Dict[str, httpx.AsyncClient] = {
+            service_url: httpx.AsyncClient(limits=self.limits)
+            for service_url in set(service_routes.values())
+        }
         
         # File upload endpoint patterns
         self.file_upload_patterns = [
@@ -124,8 +307,8 @@ class ProxyMiddleware:
         ]
     
     def get_target_service(self, path: str) -> Optional[str]:
-        """Get target service URL for given path"""
-        for route_prefix, service_url in self.service_routes.items():
+        """Get target service URL for given path (longest matching prefix)"""
+        for route_prefix, service_url in self.route_table:
             if path.startswith(route_prefix):
                 return service_url
         return None
@@ -133,71 +316,70 @@ class ProxyMiddleware:
     def is_file_upload_request(self, path: str) -> bool:
         """Check if the request is a file upload endpoint"""
         return any(pattern in path for pattern in self.file_upload_patterns)
+
+    def _forward_headers(self, headers: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Copy headers minus hop-by-hop ones, keeping repeated headers (e.g. set-cookie)"""
+        return [
+            (name, value) for name, value in headers
+            if name.lower() not in self.HOP_BY_HOP_HEADERS
+        ]
     
     async def proxy_request(self, request: Request) -> Response:
         """Proxy request to target service"""
-        path = str(request.url.path)
-        full_url = str(request.url)
-        method = request.method
-        
-        logger.info(f"=== PROXY REQUEST DEBUG ===")
-        logger.info(f"Method: {method}")
-        logger.info(f"Full URL: {full_url}")
-        logger.info(f"Path: {path}")
-        logger.info(f"Available service routes: {list(self.service_routes.keys())}")
+        path = request.url.path
 
         target_service = self.get_target_service(path)
         if not target_service:
-            logger.error(f"❌ No service found for path: {path}")
-            logger.error(f"Available routes: {list(self.service_routes.keys())}")
-            # Check if any routes partially match
-            partial_matches = [route for route in self.service_routes.keys() if route in path or path in route]
-            if partial_matches:
-                logger.error(f"Partial matches found: {partial_matches}")
+            logger.warning(f"No service found for path: {path}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Service not found for path: {path}"
             )
-
-        logger.info(f"✅ Found target service: {target_service} for path: {path}")
         
         # Build target URL
-        target_url = f"{target_service}{request.url.path}"
+        target_url = f"{target_service}{path}"
         if request.url.query:
             target_url += f"?{request.url.query}"
-        
-        logger.info(f"🎯 Proxying {method} {path} -> {target_url}")
+
+        is_file_upload = self.is_file_upload_request(path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Proxying {request.method} {path} -> {target_url} ({'file upload' if is_file_upload else 'regular'} request)")
         
         try:
-            # Get request body
-            body = await request.body()
-            
-            # Prepare headers (exclude host and content-length)
-            headers = dict(request.headers)
-            headers.pop("host", None)
-            headers.pop("content-length", None)
+            # Prepare headers (exclude host). A client content-length is kept so the
+            # body goes upstream with the same framing; otherwise httpx sends it chunked
+            headers = [
+                (name, value) for name, value in self._forward_headers(request.headers.items())
+                if name.lower() != "host"
+            ]
             
             # Determine timeout based on request type
-            request_timeout = self.file_upload_timeout if self.is_file_upload_request(path) else self.timeout
-            
-            logger.info(f"Using timeout: {request_timeout}s for {'file upload' if self.is_file_upload_request(path) else 'regular'} request")
-            
-            # Make request to target service with dynamic timeout
-            response = await self.client.request(
+            request_timeout = self.file_upload_timeout if is_file_upload else self.timeout
+
+            # Stream the request body through as it arrives
+            has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+            client = self.clients[target_service]
+            upstream_request = client.build_request(
                 method=request.method,
                 url=target_url,
                 headers=headers,
-                content=body,
+                content=request.stream() if has_body else None,
                 timeout=request_timeout
             )
+            response = await client.send(upstream_request, stream=True)
             
-            # Return response
-            return Response(
-                content=response.content,
+            # Stream the raw (still encoded) response body back; the upstream
+            # connection returns to the pool once the body is sent or aborted
+            proxied = StreamingResponse(
+                response.aiter_raw(),
                 status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
+                background=BackgroundTask(response.aclose)
             )
+            proxied.raw_headers = [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in self._forward_headers(response.headers.multi_items())
+            ]
+            return proxied
             
         except httpx.TimeoutException:
             logger.error(f"Timeout when proxying to {target_url}")
@@ -219,30 +401,222 @@ class ProxyMiddleware:
             )
     
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Close HTTP clients"""
+        for client in self.clients.values():
+            await client.aclose()
+
+
+class ResponseCacheMiddleware:
+    """Redis cache for whitelisted, idempotent dashboard GET responses
+
+    Entries are keyed by path, sorted query and the caller's scope (role and token
+    dealer), live for ttl_seconds, and carry an ETag so browsers can revalidate
+    with If-None-Match and get a 304. Each entry also records the generation of the
+    dealer it belongs to; the backend processors bump that generation when an
+    ingestion run changes the dealer's data, which turns older entries into misses.
+    Redis errors bypass the cache rather than failing the request.
+    """
+
+    KEY_PREFIX = "gateway:cache:response"
+    # Must match GENERATION_KEY in backend/tasks/gateway_cache.py
+    GENERATION_KEY = "gateway:cache:generation:{dealer_id}"
+    # Upstream headers that are not replayed from the cache: per-connection, per-response,
+    # rewritten by the cache itself, or never shareable (cookies)
+    UNCACHED_HEADERS = frozenset({
+        "connection", "keep-alive", "transfer-encoding", "content-length", "content-encoding",
+        "content-type", "date", "server", "etag", "cache-control", "x-cache", "set-cookie"
+    })
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        routes: List[str],
+        exclude_routes: Optional[List[str]] = None,
+        ttl_seconds: int = 300,
+        max_body_bytes: int = 1024 * 1024,
+        redis_timeout: float = 0.05
+    ):
+        self.routes = tuple(routes)
+        self.exclude_routes = tuple(exclude_routes or ())
+        self.ttl_seconds = ttl_seconds
+        self.max_body_bytes = max_body_bytes
+        self.redis = None
+        if redis_url and self.routes:
+            self.redis = aioredis.from_url(
+                redis_url,
+                socket_timeout=redis_timeout,
+                socket_connect_timeout=redis_timeout
+            )
+
+    def is_cacheable(self, request: Request) -> bool:
+        """Only GETs on whitelisted route prefixes are cached"""
+        path = request.url.path
+        return (
+            self.redis is not None
+            and request.method == "GET"
+            and path.startswith(self.routes)
+            and not path.startswith(self.exclude_routes)
+        )
+
+    def _cache_key(self, request: Request, user: Optional[Dict], dealer_id: str) -> str:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        scope = f"{user.get('role')}|{user.get('dealer_id')}" if user else "anonymous"
+        digest = hashlib.sha256(f"{request.url.path}?{query}|{scope}".encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{dealer_id}:{digest}"
+
+    @staticmethod
+    def _etag_matches(request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+    def _replayable_headers(self, response: Response) -> List[Tuple[str, str]]:
+        """Upstream headers stored with a cache entry (duplicates kept, in order)"""
+        return [
+            (name, value) for name, value in response.headers.items()
+            if name.lower() not in self.UNCACHED_HEADERS
+        ]
+
+    def _cached_response(
+        self,
+        request: Request,
+        body: bytes,
+        content_type: str,
+        etag: str,
+        upstream_headers: List[Tuple[str, str]],
+        cache_status: str
+    ) -> Response:
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache", "X-Cache": cache_status}
+        if self._etag_matches(request, etag):
+            response = Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        else:
+            response = Response(content=body, status_code=status.HTTP_200_OK, media_type=content_type, headers=headers)
+        response.raw_headers.extend(
+            (name.encode("latin-1"), value.encode("latin-1")) for name, value in upstream_headers
+        )
+        return response
+
+    async def fetch(self, request: Request, user: Optional[Dict], proxy) -> Response:
+        """Serve the request from the cache, or through ``proxy(request)`` and cache the result"""
+        dealer_id = request.query_params.get("dealer_id") or (user.get("dealer_id") if user else None)
+        if not dealer_id:
+            return await proxy(request)
+
+        key = self._cache_key(request, user, dealer_id)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(self.GENERATION_KEY.format(dealer_id=dealer_id))
+            pipe.hmget(key, "generation", "etag", "content_type", "headers", "body")
+            generation, (entry_generation, etag, content_type, headers, body) = await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning(f"Response cache lookup failed, bypassing: {str(e)}")
+            return await proxy(request)
+
+        generation = generation or b"0"
+        bypass = "no-cache" in request.headers.get("cache-control", "")
+        if body is not None and entry_generation == generation and not bypass:
+            upstream_headers = [tuple(header) for header in json.loads(headers)] if headers else []
+            return self._cached_response(
+                request, body, content_type.decode("utf-8"), etag.decode("utf-8"), upstream_headers, "HIT"
+            )
+
+        response = await proxy(request)
+        return await self._store(request, response, key, generation)
+
+    async def _store(self, request: Request, response: Response, key: str, generation: bytes) -> Response:
+        """Buffer a successful, small, unencoded upstream response and cache it"""
+        if response.status_code != status.HTTP_200_OK or "content-encoding" in response.headers:
+            return response
+
+        # Read the proxied stream up to the size limit; larger bodies are passed through uncached
+        chunks = []
+        size = 0
+        body_iterator = response.body_iterator
+        async for chunk in body_iterator:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                async def replay():
+                    for buffered in chunks:
+                        yield buffered
+                    async for rest in body_iterator:
+                        yield rest
+                passthrough = StreamingResponse(replay(), status_code=response.status_code, background=response.background)
+                passthrough.raw_headers = response.raw_headers
+                return passthrough
+
+        if response.background is not None:
+            await response.background()
+
+        body = b"".join(chunks)
+        content_type = response.headers.get("content-type", "application/json")
+        upstream_headers = self._replayable_headers(response)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(key, mapping={
+                "generation": generation,
+                "etag": etag,
+                "content_type": content_type,
+                "headers": json.dumps(upstream_headers),
+                "body": body
+            })
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning(f"Response cache store failed: {str(e)}")
+
+        return self._cached_response(request, body, content_type, etag, upstream_headers, "MISS")
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        if self.redis is not None:
+            await self.redis.aclose()
 
 
 class LoggingMiddleware:
-    """Request/response logging middleware"""
+    """Request/response logging middleware
+
+    Access logs are structured and sampled: errors (status >= 400) and slow
+    requests are always logged, the rest at sample_rate. Nothing is formatted
+    unless the gateway.requests logger is enabled for INFO.
+    """
     
-    def __init__(self):
-        self.logger = setup_logger("gateway.requests")
+    def __init__(self, sample_rate: float = 1.0, slow_request_seconds: float = 1.0, level: str = "INFO"):
+        self.logger = setup_logger("gateway.requests", level=level)
+        self.sample_rate = sample_rate
+        self.slow_request_seconds = slow_request_seconds
+    
+    def should_log(self, status_code: int, process_time: float) -> bool:
+        """Decide whether this request gets an access log line"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return False
+        if status_code >= 400 or process_time >= self.slow_request_seconds:
+            return True
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
     
     async def log_request(self, request: Request, response: Response, process_time: float):
         """Log request and response"""
+        if not self.should_log(response.status_code, process_time):
+            return
+
         log_data = {
             "method": request.method,
-            "url": str(request.url),
+            "path": request.url.path,
+            "query": request.url.query,
             "status_code": response.status_code,
             "process_time": round(process_time, 4),
             "client_ip": request.client.host if request.client else "unknown",
-            "user_agent": request.headers.get("user-agent", "unknown")
+            "user_agent": request.headers.get("user-agent", "unknown"),
+            "sample_rate": self.sample_rate
         }
         
         # Add user info if available
         if hasattr(request.state, "user") and request.state.user:
             log_data["user_id"] = request.state.user.get("user_id")
             log_data["user_email"] = request.state.user.get("email")
+            log_data["dealer_id"] = request.state.user.get("dealer_id")
         
         self.logger.info("Request processed", extra={"extra_fields": log_data})
@@ -26,6 +26,10 @@ class Settings(BaseSettings):
     db_schema: str = "customer"
     dealer_integration_schema: str = "dealer_integration"
     
+    # Threads serving the synchronous (def) routes; the DB pool (15 + 30 overflow) keeps
+    # 5 connections for background sentiment analysis, which runs outside this pool
+    threadpool_max_workers: int = 40
+    
     # JWT Configuration
     jwt_secret_key: str = "your-super-secret-jwt-key-here-change-this-in-production"
     jwt_algorithm: str = "HS256"
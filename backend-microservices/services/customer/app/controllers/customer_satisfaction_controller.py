@@ -160,127 +160,182 @@ class CustomerSatisfactionController:
         except Exception as e:
             return False, f"Error validating date '{date_str}': {str(e)}. Expected: 'DD Month YYYY' format (e.g., '24 Desember 2024')"
     
+    # tanggal_rating rejections checked in order before the 'DD Month YYYY' pattern: (regex, message prefix)
+    TANGGAL_RATING_REJECTIONS = [
+        (r'\d{1,2}-\d{1,2}-\d{4}', "Numeric date format with dashes not allowed. Expected: 'DD Month YYYY' (e.g., '24 Desember 2024'), got '"),
+        (r'\d{4}-\d{1,2}-\d{1,2}', "ISO date format (YYYY-MM-DD) not allowed. Expected: 'DD Month YYYY' (e.g., '24 Desember 2024'), got '"),
+        (r'\d{1,2}/\d{1,2}/\d{4}', "Numeric date format with slashes not allowed. Expected: 'DD Month YYYY' (e.g., '24 Desember 2024'), got '"),
+        (r'\d{4}/\d{1,2}/\d{1,2}', "ISO date format with slashes not allowed. Expected: 'DD Month YYYY' (e.g., '24 Desember 2024'), got '"),
+        (r'\d{1,2}\.\d{1,2}\.\d{4}', "Numeric date format with dots not allowed. Expected: 'DD Month YYYY' (e.g., '24 Desember 2024'), got '"),
+        (r':', "Time components not allowed. Expected: 'DD Month YYYY' (e.g., '24 Desember 2024'), got '"),
+        (r'^[\d\s\-/\.]+$', "Numeric-only date format not allowed. Expected: 'DD Month YYYY' with Indonesian month name (e.g., '24 Desember 2024'), got '"),
+    ]
+
+    @staticmethod
+    def _column_values(df: pd.DataFrame, *columns: str) -> pd.Series:
+        """
+        Value per row from the first listed column whose cell is truthy, as a string
+
+        Same result as ``str(row.get(a, '') or row.get(b, ''))`` over iterrows():
+        '' and 0 fall through to the next column, missing cells do not (rows hand them
+        over as NaN, or NaT in date columns, which are truthy), and dates keep their
+        full str() form ('2024-01-01 00:00:00').
+        """
+        values = pd.Series('', index=df.index, dtype=object)
+        for column in reversed(columns):
+            if column in df.columns:
+                cells = df[column]
+                missing = cells.isna()
+                objects = cells.astype(object).where(~missing, '')
+                missing_text = 'NaT' if pd.api.types.is_datetime64_any_dtype(cells) else 'nan'
+                text = objects.map(str).where(~missing, missing_text)
+                # Object cells cast to bool with Python truthiness
+                values = text.where(missing | objects.astype(bool), values)
+        return values
+
+    @staticmethod
+    def _is_present(values: pd.Series) -> pd.Series:
+        """Mask of cells that hold a value: non-blank and not the literal 'nan'"""
+        return (values.str.strip() != '') & (values.str.lower() != 'nan')
+
+    def _tanggal_rating_errors(self, values: pd.Series) -> pd.Series:
+        """
+        Vectorized _validate_indonesian_date over a column of present date strings
+
+        Returns:
+            Series of error messages aligned with values ('' where the date is valid)
+        """
+        clean = values.str.strip()
+        errors = pd.Series('', index=values.index, dtype=object)
+        pending = clean != ''
+
+        for pattern, message in self.TANGGAL_RATING_REJECTIONS:
+            rejected = pending & clean.str.contains(pattern, regex=True)
+            errors[rejected] = message + values[rejected] + "'"
+            pending &= ~rejected
+
+        parts = clean.str.extract(r'^(\d{1,2})\s([a-zA-Z]+)\s(\d{4})$')
+        rejected = pending & parts[0].isna()
+        errors[rejected] = "Invalid date format. Expected exactly 'DD Month YYYY' with single spaces (e.g., '24 Desember 2024'), got '" + values[rejected] + "'"
+        pending &= ~rejected
+
+        months = parts[1].str.lower().map(self.INDONESIAN_MONTHS)
+        rejected = pending & months.isna()
+        valid_months = ', '.join(self.INDONESIAN_MONTHS.keys())
+        errors[rejected] = "Invalid Indonesian month '" + parts[1][rejected] + f"'. Must use Indonesian month name. Valid months: {valid_months}"
+        pending &= ~rejected
+
+        # Calendar check for the common case; impossible dates and out-of-range years
+        # are rare, so those rows get the exact per-value message
+        if pending.any():
+            years = parts[2][pending].astype(int)
+            in_range = years.between(1900, 2100)
+            dates = pd.to_datetime(
+                pd.DataFrame({
+                    'year': years[in_range],
+                    'month': months[pending][in_range].astype(int),
+                    'day': parts[0][pending][in_range].astype(int)
+                }),
+                errors='coerce'
+            )
+            for index in in_range.index[~in_range].union(dates.index[dates.isna()]):
+                errors[index] = self._validate_indonesian_date(values[index])[1]
+
+        return errors
+
+    def _rating_errors(self, values: pd.Series) -> pd.Series:
+        """Rating error message per present value ('' when valid), parsed once per distinct value"""
+        def rating_error(rating: str) -> str:
+            try:
+                rating_value = float(rating.strip())
+            except (ValueError, TypeError):
+                return f"Rating must be numeric, got '{rating}'"
+            if not (0 <= rating_value <= 5):
+                return f"Rating must be between 0 and 5, got {rating_value}"
+            return ''
+
+        return values.map({rating: rating_error(rating) for rating in values.unique()})
+
     def _validate_data_records(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Validate data records for critical fields before bulk insert
+
+        Checks run column-wise over the whole DataFrame (string masks, regex
+        extraction, month-name mapping) rather than row by row.
         
         Args:
             df: DataFrame containing records to validate
             
         Returns:
-            Dict containing validation results and statistics
+            Dict containing validation results and statistics, plus "row_errors"
+            with the error messages of every row in DataFrame order
         """
+        # Validate no_tiket (required for duplicate checking)
+        no_tiket = self._column_values(df, 'No Tiket')
+        no_tiket_errors = pd.Series('', index=df.index, dtype=object)
+        no_tiket_errors[~self._is_present(no_tiket)] = "Missing or empty 'No Tiket' field (required)"
+
+        # Validate tanggal_rating format
+        tanggal_rating = self._column_values(df, 'tanggal Rating', 'tanggal_rating')
+        present = self._is_present(tanggal_rating)
+        tanggal_rating_errors = pd.Series('', index=df.index, dtype=object)
+        tanggal_rating_errors[present] = self._tanggal_rating_errors(tanggal_rating[present])
+
+        # Validate rating format (if present)
+        rating = self._column_values(df, 'Rating')
+        present = self._is_present(rating)
+        rating_errors = pd.Series('', index=df.index, dtype=object)
+        rating_errors[present] = self._rating_errors(rating[present])
+
+        failed = {
+            "missing_no_tiket": no_tiket_errors != '',
+            "tanggal_rating_format": tanggal_rating_errors != '',
+            "rating_format": rating_errors != ''
+        }
+
+        # Per-row messages in the original order; +2 because pandas is 0-indexed and Excel has header row
+        row_prefix = "Row " + pd.Series(range(2, len(df) + 2), index=df.index).astype(str) + ": "
+        messages = [
+            (failed["missing_no_tiket"].tolist(), (row_prefix + no_tiket_errors).tolist()),
+            (failed["tanggal_rating_format"].tolist(), (row_prefix + "tanggal_rating - " + tanggal_rating_errors).tolist()),
+            (failed["rating_format"].tolist(), (row_prefix + rating_errors).tolist())
+        ]
+        row_errors = [[] for _ in range(len(df))]
+        for flags, texts in messages:
+            for position, (is_failed, text) in enumerate(zip(flags, texts)):
+                if is_failed:
+                    row_errors[position].append(text)
+
+        invalid_records = sum(1 for errors in row_errors if errors)
+        error_types = {name: int(mask.sum()) for name, mask in failed.items()}
+        validation_errors = [message for errors in row_errors for message in errors]
+
         validation_results = {
             "total_records": len(df),
-            "valid_records": 0,
-            "invalid_records": 0,
-            "validation_errors": [],
-            "invalid_tanggal_rating_count": 0,
-            "invalid_rating_count": 0,
-            "missing_no_tiket_count": 0,
-            "error_summary": {}
-        }
-        
-        error_types = {
-            "tanggal_rating_format": 0,
-            "rating_format": 0, 
-            "missing_no_tiket": 0
-        }
-        
-        for index, row in df.iterrows():
-            record_errors = []
-            row_number = index + 2  # +2 because pandas is 0-indexed and Excel has header row
-            
-            # Validate no_tiket (required for duplicate checking)
-            no_tiket = row.get('No Tiket', '')
-            if not no_tiket or str(no_tiket).strip() == '' or str(no_tiket).lower() == 'nan':
-                record_errors.append(f"Row {row_number}: Missing or empty 'No Tiket' field (required)")
-                validation_results["missing_no_tiket_count"] += 1
-                error_types["missing_no_tiket"] += 1
-            
-            # Validate tanggal_rating format
-            tanggal_rating = row.get('tanggal Rating', '') or row.get('tanggal_rating', '')
-            if tanggal_rating and str(tanggal_rating).strip() and str(tanggal_rating).lower() != 'nan':
-                is_valid_date, date_error = self._validate_indonesian_date(str(tanggal_rating))
-                if not is_valid_date:
-                    record_errors.append(f"Row {row_number}: tanggal_rating - {date_error}")
-                    validation_results["invalid_tanggal_rating_count"] += 1
-                    error_types["tanggal_rating_format"] += 1
-            
-            # Validate rating format (if present)
-            rating = row.get('Rating', '')
-            if rating and str(rating).strip() and str(rating).lower() != 'nan':
-                try:
-                    rating_value = float(str(rating).strip())
-                    if not (0 <= rating_value <= 5):
-                        record_errors.append(f"Row {row_number}: Rating must be between 0 and 5, got {rating_value}")
-                        validation_results["invalid_rating_count"] += 1
-                        error_types["rating_format"] += 1
-                except (ValueError, TypeError):
-                    record_errors.append(f"Row {row_number}: Rating must be numeric, got '{rating}'")
-                    validation_results["invalid_rating_count"] += 1
-                    error_types["rating_format"] += 1
-            
-            # Track record validity
-            if record_errors:
-                validation_results["invalid_records"] += 1
-                validation_results["validation_errors"].extend(record_errors)
-            else:
-                validation_results["valid_records"] += 1
-        
-        # Create error summary
-        validation_results["error_summary"] = {
-            "tanggal_rating_format_errors": error_types["tanggal_rating_format"],
-            "rating_format_errors": error_types["rating_format"], 
-            "missing_no_tiket_errors": error_types["missing_no_tiket"]
+            "valid_records": len(df) - invalid_records,
+            "invalid_records": invalid_records,
+            "validation_errors": validation_errors,
+            "invalid_tanggal_rating_count": error_types["tanggal_rating_format"],
+            "invalid_rating_count": error_types["rating_format"],
+            "missing_no_tiket_count": error_types["missing_no_tiket"],
+            # Create error summary
+            "error_summary": {
+                "tanggal_rating_format_errors": error_types["tanggal_rating_format"],
+                "rating_format_errors": error_types["rating_format"], 
+                "missing_no_tiket_errors": error_types["missing_no_tiket"]
+            },
+            "row_errors": row_errors
         }
         
         # Limit validation_errors to prevent overwhelming response
-        if len(validation_results["validation_errors"]) > 50:
-            validation_results["validation_errors"] = validation_results["validation_errors"][:50]
+        if len(validation_errors) > 50:
+            validation_results["validation_errors"] = validation_errors[:50]
             validation_results["validation_errors"].append("... (showing first 50 errors only)")
         
         logger.info(f"Data validation completed: {validation_results['valid_records']} valid, {validation_results['invalid_records']} invalid records")
         
         return validation_results
     
-    def _has_validation_errors(self, record_dict: Dict[str, Any], row_number: int) -> Tuple[bool, List[str]]:
-        """
-        Check if an individual record has validation errors
-        
-        Args:
-            record_dict: Dictionary containing record data
-            row_number: Row number in the file (for error reporting)
-            
-        Returns:
-            (has_errors, error_list): Boolean indicating if errors exist and list of error messages
-        """
-        record_errors = []
-        
-        # Check no_tiket (required for duplicate checking)
-        no_tiket = record_dict.get('No Tiket', '')
-        if not no_tiket or str(no_tiket).strip() == '' or str(no_tiket).lower() == 'nan':
-            record_errors.append(f"Row {row_number}: Missing or empty 'No Tiket' field (required)")
-        
-        # Check tanggal_rating format
-        tanggal_rating = record_dict.get('tanggal Rating', '') or record_dict.get('tanggal_rating', '')
-        if tanggal_rating and str(tanggal_rating).strip() and str(tanggal_rating).lower() != 'nan':
-            is_valid_date, date_error = self._validate_indonesian_date(str(tanggal_rating))
-            if not is_valid_date:
-                record_errors.append(f"Row {row_number}: tanggal_rating - {date_error}")
-        
-        # Check rating format (if present)
-        rating = record_dict.get('Rating', '')
-        if rating and str(rating).strip() and str(rating).lower() != 'nan':
-            try:
-                rating_value = float(str(rating).strip())
-                if not (0 <= rating_value <= 5):
-                    record_errors.append(f"Row {row_number}: Rating must be between 0 and 5, got {rating_value}")
-            except (ValueError, TypeError):
-                record_errors.append(f"Row {row_number}: Rating must be numeric, got '{rating}'")
-        
-        return len(record_errors) > 0, record_errors
-    
     def _reformat_tanggal_rating(self, date_str: str) -> Tuple[str, bool]:
         """
         Attempt to reformat various date formats to Indonesian format: 'DD Month YYYY'
@@ -514,13 +569,16 @@ class CustomerSatisfactionController:
             reformatted_count = 0
             if reformat_tanggal_rating and 'tanggal_rating' in df.columns:
                 logger.info("Applying tanggal_rating reformatting before validation")
-                for index in df.index:
-                    original_value = df.at[index, 'tanggal_rating']
-                    if original_value and str(original_value).strip():
-                        reformatted_value, was_reformatted = self._reformat_tanggal_rating(str(original_value).strip())
-                        if was_reformatted:
-                            df.at[index, 'tanggal_rating'] = reformatted_value
-                            reformatted_count += 1
+                # Reformat each distinct date once, then write back the changed cells
+                original_values = df['tanggal_rating'].fillna('')
+                stripped = original_values.astype(str).str.strip()
+                present = original_values.astype(bool) & (stripped != '')
+                reformatted = stripped[present].map(
+                    {value: self._reformat_tanggal_rating(value) for value in stripped[present].unique()}
+                )
+                changed = reformatted.map(lambda outcome: outcome[1]).astype(bool)
+                df.loc[changed[changed].index, 'tanggal_rating'] = reformatted[changed].map(lambda outcome: outcome[0])
+                reformatted_count = int(changed.sum())
                 logger.info(f"Reformatted {reformatted_count} tanggal_rating values")
             
             # Step 4: Validate data records
@@ -535,11 +593,8 @@ class CustomerSatisfactionController:
             invalid_records = []
             invalid_record_errors = []
             
-            for index, record_dict in enumerate(all_records_data):
-                row_number = index + 2  # +2 because pandas is 0-indexed and Excel has header row
-                has_errors, error_list = self._has_validation_errors(record_dict, row_number)
-                
-                if has_errors:
+            for record_dict, error_list in zip(all_records_data, validation_results["row_errors"]):
+                if error_list:
                     invalid_records.append(record_dict)
                     invalid_record_errors.extend(error_list)
                 else:
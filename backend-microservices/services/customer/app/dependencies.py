@@ -16,7 +16,7 @@ if utils_path not in sys.path:
     sys.path.append(utils_path)
 
 from utils.database import DatabaseManager
-from utils.auth import decode_token
+from utils.auth import decode_token_cached
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -47,15 +47,16 @@ class UserContext:
 
 
 def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> UserContext:
     """
     Get current authenticated user from JWT token
     
+    Stateless: the token is verified (or found in the decoded-token cache) without
+    touching the database, so authentication never takes a pooled connection.
+    
     Args:
         credentials: HTTP Bearer credentials
-        db: Database session
         
     Returns:
         UserContext: User context with dealer information
@@ -68,7 +69,7 @@ def get_current_user(
         token = credentials.credentials
         
         # Decode and validate JWT token
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
         if not payload or payload.get("type") != "access":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,20 +120,18 @@ def get_current_user(
 
 
 def get_optional_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Optional[UserContext]:
     """
     Get current authenticated user from JWT token (optional)
     
     Args:
         credentials: HTTP Bearer credentials
-        db: Database session
         
     Returns:
         UserContext or None if not authenticated
     """
     try:
-        return get_current_user(credentials, db)
+        return get_current_user(credentials)
     except HTTPException:
         return None
\ No newline at end of file
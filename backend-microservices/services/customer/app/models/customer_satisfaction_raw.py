@@ -4,7 +4,7 @@ Customer satisfaction raw data model for customer service
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, Text, Numeric
+from sqlalchemy import Column, String, Date, DateTime, Integer, Text, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -53,6 +53,7 @@ class CustomerSatisfactionRaw(Base):
     tanggal_service = Column(String(50), nullable=True)
     periode_service = Column(String(10), nullable=True)
     tanggal_rating = Column(String(50), nullable=True)
+    tanggal_rating_date = Column(Date, nullable=True, index=True)  # tanggal_rating parsed at upload, for date filters
     jenis_hari = Column(String(50), nullable=True)
     periode_utk_suspend = Column(String(100), nullable=True, index=True)  # Indexed for filtering
     submit_review_date_first_fu_cs = Column(String(50), nullable=True, index=True)  # Indexed for filtering
@@ -9,7 +9,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import pytz
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc, text
+from sqlalchemy import and_, func, desc, insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.utils.timezone_utils import (
@@ -38,6 +38,42 @@ class CustomerSatisfactionRepository:
         9: 'September', 10: 'Oktober', 11: 'November', 12: 'Desember'
     }
     
+    # Table column -> upload file header
+    UPLOAD_COLUMN_MAP = {
+        'no_tiket': 'No Tiket',
+        'no_booking_no_order_pemesanan': 'No Booking/No order pemesanan',
+        'nama_konsumen': 'Nama Konsumen',
+        'no_hp': 'No HP',
+        'alamat_email': 'Alamat Email',
+        'source': 'Source',
+        'kota': 'Kota',
+        'fu_by_se': 'FU by SE',
+        'fu_by_sda': 'FU by SDA',
+        'no_ahass': 'No AHASS',
+        'status': 'Status',
+        'nama_ahass': 'Nama AHASS',
+        'tanggal_service': 'Tanggal Service',
+        'periode_service': 'Periode Service',
+        'tanggal_rating': 'tanggal Rating',
+        'jenis_hari': 'JENIS HARI',
+        'periode_utk_suspend': 'PERIODE UTK SUSPEND',
+        'submit_review_date_first_fu_cs': 'Submit Review Date (FIRST FU CS)',
+        'lt_tgl_rating_submit': 'LT TGL RATING - SUBMIT',
+        'sesuai_lt': 'SESUAI LT',
+        'periode_fu': 'Periode FU',
+        'inbox': 'Inbox',
+        'indikasi_keluhan': 'Indikasi Keluhan',
+        'rating': 'Rating',
+        'departemen': 'Departemen',
+        # Duplicate columns (second occurrence in the file)
+        'no_ahass_duplicate': 'No AHASS.1',
+        'status_duplicate': 'Status.1',
+        'nama_ahass_duplicate': 'Nama AHASS.1',
+    }
+
+    # Rows per prefetch / delete / INSERT statement in bulk uploads
+    BULK_BATCH_SIZE = 1000
+    
     def __init__(self, db: Session):
         self.db = db
     
@@ -111,83 +147,21 @@ class CustomerSatisfactionRepository:
     
     def _build_tanggal_rating_date_filter(self, query, date_from: datetime = None, date_to: datetime = None):
         """
-        Build date filter for tanggal_rating field using Indonesian date parsing
+        Build date filter for tanggal_rating field on its parsed tanggal_rating_date column
         
         Args:
             query: SQLAlchemy query object
             date_from: Start date filter
-            date_to: End date filter
+            date_to: End date filter (inclusive, whole day)
             
         Returns:
             Updated query with date filters
         """
-        if not date_from and not date_to:
-            return query
-        
-        try:
-            # We'll use a subquery approach to parse Indonesian dates and compare them
-            date_conditions = []
-            
-            if date_from:
-                # Create SQL condition to parse Indonesian date and compare with date_from
-                date_from_str = date_from.strftime('%Y-%m-%d')
-                date_conditions.append(f"""
-                    CASE 
-                        WHEN tanggal_rating ~ '^[0-9]{{1,2}} [A-Za-z]+ [0-9]{{4}}$' THEN
-                            CASE LOWER(SPLIT_PART(tanggal_rating, ' ', 2))
-                                WHEN 'januari' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-01-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'februari' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-02-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'maret' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-03-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'april' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-04-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'mei' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-05-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'juni' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-06-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'juli' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-07-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'agustus' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-08-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'september' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-09-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'oktober' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-10-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'november' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-11-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'desember' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-12-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                ELSE NULL
-                            END >= TO_DATE('{date_from_str}', 'YYYY-MM-DD')
-                        ELSE FALSE
-                    END
-                """)
-            
-            if date_to:
-                date_to_str = date_to.strftime('%Y-%m-%d')
-                date_conditions.append(f"""
-                    CASE 
-                        WHEN tanggal_rating ~ '^[0-9]{{1,2}} [A-Za-z]+ [0-9]{{4}}$' THEN
-                            CASE LOWER(SPLIT_PART(tanggal_rating, ' ', 2))
-                                WHEN 'januari' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-01-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'februari' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-02-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'maret' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-03-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'april' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-04-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'mei' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-05-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'juni' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-06-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'juli' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-07-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'agustus' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-08-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'september' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-09-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'oktober' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-10-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'november' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-11-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                WHEN 'desember' THEN TO_DATE(SPLIT_PART(tanggal_rating, ' ', 3) || '-12-' || LPAD(SPLIT_PART(tanggal_rating, ' ', 1), 2, '0'), 'YYYY-MM-DD')
-                                ELSE NULL
-                            END <= TO_DATE('{date_to_str}', 'YYYY-MM-DD')
-                        ELSE FALSE
-                    END
-                """)
-            
-            # Combine conditions with AND
-            if date_conditions:
-                combined_condition = " AND ".join(date_conditions)
-                query = query.filter(text(combined_condition))
-            
-            return query
-            
-        except Exception as e:
-            logger.error(f"Error building tanggal_rating date filter: {str(e)}")
-            # Return unfiltered query if there's an error
-            return query
+        if date_from:
+            query = query.filter(CustomerSatisfactionRaw.tanggal_rating_date >= date_from.date())
+        if date_to:
+            query = query.filter(CustomerSatisfactionRaw.tanggal_rating_date <= date_to.date())
+        return query
     
     def create_upload_tracker(
         self, 
@@ -267,6 +241,12 @@ class CustomerSatisfactionRepository:
         override_existing: bool = False
     ) -> tuple[int, int, int, int]:
         """Bulk create customer satisfaction records with override support
+
+        Set-based: existing no_tiket values are prefetched in batches, overridden
+        rows are deleted with one statement per batch and new rows are inserted
+        with batched multi-row INSERTs, all in one (short) transaction. Duplicate
+        no_tiket values within the file behave as if inserted one by one: the last
+        one wins with override_existing, otherwise the first one is kept.
         
         Returns: (successful_count, failed_count, replaced_count, skipped_count)
         """
@@ -276,75 +256,84 @@ class CustomerSatisfactionRepository:
         skipped_count = 0
         
         try:
+            batch_uuid = uuid.UUID(upload_batch_id)
+
+            # Step 1: Map file rows to column values, keyed by the trimmed no_tiket
+            candidates = []
             for record_data in records_data:
-                try:
-                    no_tiket = record_data.get('No Tiket')
-                    
-                    # Skip records without no_tiket (cannot check for duplicates)
-                    if not no_tiket or str(no_tiket).strip() == '':
-                        logger.warning("Skipping record without No Tiket")
-                        failed_count += 1
-                        continue
-                    
-                    # Check if record with same no_tiket already exists
-                    existing_record = self.db.query(CustomerSatisfactionRaw).filter_by(no_tiket=str(no_tiket).strip()).first()
-                    
-                    if existing_record:
-                        if override_existing:
-                            # Delete existing record and create new one
-                            logger.info(f"Overriding existing record with no_tiket: {no_tiket}")
-                            self.db.delete(existing_record)
-                            self.db.flush()  # Ensure deletion is processed before insert
-                            replaced_count += 1
-                        else:
-                            # Skip duplicate record
-                            logger.info(f"Skipping duplicate record with no_tiket: {no_tiket}")
-                            failed_count += 1
-                            skipped_count += 1
-                            continue
-                    
-                    # Create new satisfaction record
-                    satisfaction_record = CustomerSatisfactionRaw(
-                        no_tiket=record_data.get('No Tiket'),
-                        no_booking_no_order_pemesanan=record_data.get('No Booking/No order pemesanan'),
-                        nama_konsumen=record_data.get('Nama Konsumen'),
-                        no_hp=record_data.get('No HP'),
-                        alamat_email=record_data.get('Alamat Email'),
-                        source=record_data.get('Source'),
-                        kota=record_data.get('Kota'),
-                        fu_by_se=record_data.get('FU by SE'),
-                        fu_by_sda=record_data.get('FU by SDA'),
-                        no_ahass=record_data.get('No AHASS'),
-                        status=record_data.get('Status'),
-                        nama_ahass=record_data.get('Nama AHASS'),
-                        tanggal_service=record_data.get('Tanggal Service'),
-                        periode_service=record_data.get('Periode Service'),
-                        tanggal_rating=record_data.get('tanggal Rating'),
-                        jenis_hari=record_data.get('JENIS HARI'),
-                        periode_utk_suspend=record_data.get('PERIODE UTK SUSPEND'),
-                        submit_review_date_first_fu_cs=record_data.get('Submit Review Date (FIRST FU CS)'),
-                        lt_tgl_rating_submit=record_data.get('LT TGL RATING - SUBMIT'),
-                        sesuai_lt=record_data.get('SESUAI LT'),
-                        periode_fu=record_data.get('Periode FU'),
-                        inbox=record_data.get('Inbox'),
-                        indikasi_keluhan=record_data.get('Indikasi Keluhan'),
-                        rating=record_data.get('Rating'),
-                        departemen=record_data.get('Departemen'),
-                        # Handle duplicate columns (assuming they appear later in CSV)
-                        no_ahass_duplicate=record_data.get('No AHASS.1'),  # Second occurrence
-                        status_duplicate=record_data.get('Status.1'),      # Second occurrence
-                        nama_ahass_duplicate=record_data.get('Nama AHASS.1'),  # Second occurrence
-                        upload_batch_id=uuid.UUID(upload_batch_id),
-                        created_by=created_by
-                    )
-                    
-                    self.db.add(satisfaction_record)
-                    successful_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing satisfaction record with no_tiket {record_data.get('No Tiket', 'N/A')}: {str(e)}")
+                no_tiket = record_data.get('No Tiket')
+                
+                # Skip records without no_tiket (cannot check for duplicates)
+                if not no_tiket or str(no_tiket).strip() == '':
                     failed_count += 1
                     continue
+
+                candidates.append((str(no_tiket).strip(), {
+                    column: record_data.get(field)
+                    for column, field in self.UPLOAD_COLUMN_MAP.items()
+                }))
+
+            if failed_count:
+                logger.warning(f"Skipping {failed_count} records without No Tiket")
+
+            # Step 2: Prefetch which no_tiket values already exist
+            existing_tikets = set()
+            unique_tikets = list({no_tiket for no_tiket, _ in candidates})
+            for i in range(0, len(unique_tikets), self.BULK_BATCH_SIZE):
+                chunk = unique_tikets[i:i + self.BULK_BATCH_SIZE]
+                existing_tikets.update(
+                    row[0] for row in self.db.query(CustomerSatisfactionRaw.no_tiket).filter(
+                        CustomerSatisfactionRaw.no_tiket.in_(chunk)
+                    ).distinct()
+                )
+
+            # Step 3: Resolve existing and in-file duplicates
+            rows_by_tiket: Dict[str, Dict[str, Any]] = {}
+            for no_tiket, row in candidates:
+                if no_tiket in existing_tikets or no_tiket in rows_by_tiket:
+                    if not override_existing:
+                        failed_count += 1
+                        skipped_count += 1
+                        continue
+                    replaced_count += 1
+                rows_by_tiket[no_tiket] = row
+                successful_count += 1
+
+            if skipped_count:
+                logger.info(f"Skipping {skipped_count} duplicate records (no_tiket already exists)")
+
+            # Step 4: Delete the rows being overridden
+            overridden = [no_tiket for no_tiket in existing_tikets if no_tiket in rows_by_tiket]
+            for i in range(0, len(overridden), self.BULK_BATCH_SIZE):
+                self.db.query(CustomerSatisfactionRaw).filter(
+                    CustomerSatisfactionRaw.no_tiket.in_(overridden[i:i + self.BULK_BATCH_SIZE])
+                ).delete(synchronize_session=False)
+            if overridden:
+                logger.info(f"Overriding {len(overridden)} existing records")
+
+            # Step 5: Insert in batched multi-row statements
+            now = get_indonesia_utc_now()
+            # Parse tanggal_rating once per distinct value for the indexed date column
+            rating_dates: Dict[Any, Any] = {}
+            for row in rows_by_tiket.values():
+                tanggal_rating = row.get('tanggal_rating')
+                if tanggal_rating not in rating_dates:
+                    parsed = self._parse_indonesian_date(tanggal_rating)
+                    rating_dates[tanggal_rating] = parsed.date() if parsed else None
+            rows = [
+                {
+                    **row,
+                    'tanggal_rating_date': rating_dates[row.get('tanggal_rating')],
+                    'id': uuid.uuid4(),
+                    'upload_batch_id': batch_uuid,
+                    'created_by': created_by,
+                    'created_date': now,
+                    'last_modified_date': now
+                }
+                for row in rows_by_tiket.values()
+            ]
+            for i in range(0, len(rows), self.BULK_BATCH_SIZE):
+                self.db.execute(insert(CustomerSatisfactionRaw), rows[i:i + self.BULK_BATCH_SIZE])
             
             # Commit all successful records
             self.db.commit()
@@ -352,7 +341,7 @@ class CustomerSatisfactionRepository:
             
             return successful_count, failed_count, replaced_count, skipped_count
             
-        except SQLAlchemyError as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(f"Error in bulk create satisfaction records: {str(e)}")
             self.db.rollback()
             return 0, len(records_data), 0, 0
@@ -382,7 +371,7 @@ class CustomerSatisfactionRepository:
             if no_ahass:
                 query = query.filter(CustomerSatisfactionRaw.no_ahass == no_ahass)
             
-            # Apply tanggal_rating date filtering using Indonesian date parsing
+            # Apply tanggal_rating date filtering on the parsed date column
             query = self._build_tanggal_rating_date_filter(query, date_from, date_to)
             
             # Order by created_date descending
@@ -449,7 +438,7 @@ class CustomerSatisfactionRepository:
             if no_ahass:
                 query = query.filter(CustomerSatisfactionRaw.no_ahass == no_ahass)
             
-            # Apply tanggal_rating date filtering using Indonesian date parsing
+            # Apply tanggal_rating date filtering on the parsed date column
             query = self._build_tanggal_rating_date_filter(query, date_from, date_to)
             
             # Get basic statistics
@@ -703,7 +692,7 @@ class CustomerSatisfactionRepository:
             if no_ahass:
                 query = query.filter(CustomerSatisfactionRaw.no_ahass == no_ahass)
             
-            # Apply tanggal_rating date filtering using Indonesian date parsing
+            # Apply tanggal_rating date filtering on the parsed date column
             query = self._build_tanggal_rating_date_filter(query, date_from, date_to)
             
             # Get total count for percentage calculation
@@ -776,9 +765,9 @@ class CustomerSatisfactionRepository:
             def calculate_rating_for_period(query, date_from_param=None, date_to_param=None, tanggal_rating_from_param=None, tanggal_rating_to_param=None):
                 period_query = query
                 
-                # Apply date filters - always use tanggal_rating Indonesian date filtering
+                # Apply date filters - always use the parsed tanggal_rating date
                 if tanggal_rating_from_param or tanggal_rating_to_param:
-                    # Use Indonesian date filtering for tanggal_rating field
+                    # Use the parsed tanggal_rating date column
                     period_query = self._build_tanggal_rating_date_filter(period_query, tanggal_rating_from_param, tanggal_rating_to_param)
                 elif date_from_param or date_to_param:
                     # Also use tanggal_rating filtering for date_from/date_to parameters
@@ -1094,7 +1083,7 @@ class CustomerSatisfactionRepository:
             if no_ahass:
                 query = query.filter(CustomerSatisfactionRaw.no_ahass == no_ahass)
             
-            # Apply tanggal_rating date filtering using Indonesian date parsing
+            # Apply tanggal_rating date filtering on the parsed date column
             query = self._build_tanggal_rating_date_filter(query, date_from, date_to)
             
             # Get sentiment distribution
@@ -1210,7 +1199,7 @@ class CustomerSatisfactionRepository:
             if no_ahass:
                 query = query.filter(CustomerSatisfactionRaw.no_ahass == no_ahass)
             
-            # Apply tanggal_rating date filtering using Indonesian date parsing
+            # Apply tanggal_rating date filtering on the parsed date column
             query = self._build_tanggal_rating_date_filter(query, date_from, date_to)
             
             # Get all records with themes
@@ -129,7 +129,7 @@ async def validate_customer(
     summary="Get customer validation request by ID",
     description="Retrieve a specific customer validation request by its ID"
 )
-async def get_request(
+def get_request(
     request_id: str,
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
@@ -161,7 +161,7 @@ async def get_request(
     summary="Get customer validation requests for a dealer",
     description="Retrieve paginated customer validation requests for a specific dealer with date filtering"
 )
-async def get_dealer_requests(
+def get_dealer_requests(
     dealer_id: str,
     page: int = 1,
     page_size: int = 10,
@@ -203,7 +203,7 @@ async def get_dealer_requests(
     summary="Get dealer statistics",
     description="Get statistics and WhatsApp status breakdown for a dealer with date filtering"
 )
-async def get_dealer_stats(
+def get_dealer_stats(
     dealer_id: str,
     date_from: str = None,
     date_to: str = None,
@@ -132,7 +132,7 @@ async def add_bulk_reminders(
     summary="Get customer reminder requests for dealer",
     description="Retrieve paginated customer reminder requests with date and type filtering. SUPER_ADMIN can specify dealer_id, others use their own dealer."
 )
-async def get_dealer_reminders(
+def get_dealer_reminders(
     page: int = 1,
     page_size: int = 10,
     date_from: str = None,
@@ -191,7 +191,7 @@ async def get_dealer_reminders(
     summary="Get reminder statistics for dealer",
     description="Get statistics and breakdown for reminder types and WhatsApp status with date and target filtering. SUPER_ADMIN can specify dealer_id, others use their own dealer."
 )
-async def get_dealer_reminder_stats(
+def get_dealer_reminder_stats(
     date_from: str = None,
     date_to: str = None,
     reminder_target: str = None,
@@ -270,7 +270,7 @@ async def get_reminder_types() -> Dict[str, Any]:
     summary="Get reminder type and WhatsApp status statistics",
     description="Get cross-tabulation statistics grouped by reminder_type and whatsapp_status with filtering. SUPER_ADMIN can specify dealer_id, others use their own dealer."
 )
-async def get_reminder_type_whatsapp_status_stats(
+def get_reminder_type_whatsapp_status_stats(
     date_from: str = None,
     date_to: str = None,
     reminder_target: str = None,
@@ -325,7 +325,7 @@ async def get_reminder_type_whatsapp_status_stats(
     summary="Get vehicle type statistics",
     description="Get statistics grouped by tipe_unit (vehicle type) with filtering. SUPER_ADMIN can specify dealer_id, others use their own dealer."
 )
-async def get_tipe_unit_stats(
+def get_tipe_unit_stats(
     date_from: str = None,
     date_to: str = None,
     reminder_target: str = None,
@@ -449,7 +449,7 @@ def get_reminder_targets(db: Session = Depends(get_db)) -> ReminderTargetRespons
     summary="Get customer reminder requests by transaction ID",
     description="Retrieve all customer reminder requests for a specific transaction ID without pagination"
 )
-async def get_reminders_by_transaction(
+def get_reminders_by_transaction(
     transaction_id: str,
     current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -484,7 +484,7 @@ async def get_reminders_by_transaction(
     summary="Get customer reminder request by ID",
     description="Retrieve a specific customer reminder request by its ID"
 )
-async def get_reminder(
+def get_reminder(
     reminder_id: str,
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
@@ -112,7 +112,7 @@ async def upload_satisfaction_file(
     summary="Get customer satisfaction records",
     description="Retrieve customer satisfaction records with filtering and pagination. Supports filtering by PERIODE UTK SUSPEND, Submit Review Date, and No AHASS."
 )
-async def get_satisfaction_records(
+def get_satisfaction_records(
     periode_utk_suspend: str = Query(None, description="Filter by periode untuk suspend"),
     submit_review_date: str = Query(None, description="Filter by submit review date (partial match)"),
     no_ahass: str = Query(None, description="Filter by No AHASS"),
@@ -168,7 +168,7 @@ async def get_satisfaction_records(
     summary="Get customer satisfaction statistics",
     description="Get statistics and analysis of customer satisfaction data with filtering support"
 )
-async def get_satisfaction_statistics(
+def get_satisfaction_statistics(
     periode_utk_suspend: str = Query(None, description="Filter by periode untuk suspend"),
     submit_review_date: str = Query(None, description="Filter by submit review date (partial match)"),
     no_ahass: str = Query(None, description="Filter by No AHASS"),
@@ -221,7 +221,7 @@ async def get_satisfaction_statistics(
     summary="Get upload trackers",
     description="Get paginated list of file upload trackers with status information"
 )
-async def get_upload_trackers(
+def get_upload_trackers(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of trackers per page"),
     status: str = Query(None, description="Filter by upload status (PROCESSING, COMPLETED, FAILED)"),
@@ -264,7 +264,7 @@ async def get_upload_trackers(
     summary="Get upload tracker by ID",
     description="Get detailed information about a specific upload tracker"
 )
-async def get_upload_tracker(
+def get_upload_tracker(
     tracker_id: str,
     current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -309,7 +309,7 @@ async def get_upload_tracker(
     summary="Get latest upload information",
     description="Get the most recent upload information for quick display including upload date, status, and statistics"
 )
-async def get_latest_upload_info(
+def get_latest_upload_info(
     current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
@@ -345,7 +345,7 @@ async def get_latest_upload_info(
     summary="Get latest upload information (simplified)",
     description="Get the most recent upload date from customer satisfaction records (simplified version)"
 )
-async def get_latest_upload_info_simple(
+def get_latest_upload_info_simple(
     current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
@@ -378,7 +378,7 @@ async def get_latest_upload_info_simple(
     summary="Get top indikasi keluhan (complaint indicators)",
     description="Get the top complaint indicators with counts and percentages based on filtering"
 )
-async def get_top_indikasi_keluhan(
+def get_top_indikasi_keluhan(
     periode_utk_suspend: str = Query(None, description="Filter by periode untuk suspend"),
     submit_review_date: str = Query(None, description="Filter by submit review date (partial match)"),
     no_ahass: str = Query(None, description="Filter by No AHASS"),
@@ -433,7 +433,7 @@ async def get_top_indikasi_keluhan(
     summary="Get overall rating with period comparison",
     description="Get overall customer satisfaction rating with optional comparison to previous period"
 )
-async def get_overall_rating(
+def get_overall_rating(
     periode_utk_suspend: str = Query(None, description="Filter by periode untuk suspend"),
     submit_review_date: str = Query(None, description="Filter by submit review date (partial match)"),
     no_ahass: str = Query(None, description="Filter by No AHASS"),
@@ -653,7 +653,7 @@ async def sync_process_sentiment_analysis(
     summary="Get sentiment analysis statistics",
     description="Get comprehensive statistics about sentiment analysis results with filtering support"
 )
-async def get_sentiment_statistics(
+def get_sentiment_statistics(
     periode_utk_suspend: str = Query(None, description="Filter by periode untuk suspend"),
     submit_review_date: str = Query(None, description="Filter by submit review date (partial match)"),
     no_ahass: str = Query(None, description="Filter by No AHASS"),
@@ -721,7 +721,7 @@ async def get_sentiment_statistics(
     summary="Get sentiment themes statistics",
     description="Get statistics about sentiment themes with counts and percentages"
 )
-async def get_sentiment_themes_statistics(
+def get_sentiment_themes_statistics(
     dealer_id: str = Query(None, description="Filter by dealer ID"),
     date_from: str = Query(None, description="Filter by analysis date from (YYYY-MM-DD format)"),
     date_to: str = Query(None, description="Filter by analysis date to (YYYY-MM-DD format)"),
@@ -795,7 +795,7 @@ async def get_sentiment_themes_statistics(
     summary="Get records by sentiment",
     description="Get customer satisfaction records filtered by specific sentiment (Positive/Negative/Neutral)"
 )
-async def get_records_by_sentiment(
+def get_records_by_sentiment(
     sentiment: str,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of records per page"),
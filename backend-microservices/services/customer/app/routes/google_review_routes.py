@@ -123,7 +123,7 @@ async def scrape_reviews_for_dealer(
     - Business information and last scraping date
     """
 )
-async def get_reviews_for_dealer(
+def get_reviews_for_dealer(
     dealer_id: str,
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page (1-100)"),
@@ -194,7 +194,7 @@ async def get_reviews_for_dealer(
     - Business performance metrics
     """
 )
-async def get_review_statistics(
+def get_review_statistics(
     dealer_id: str,
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
 ) -> Dict[str, Any]:
@@ -234,7 +234,7 @@ async def get_review_statistics(
     - Quick customer feedback overview
     """
 )
-async def get_recent_reviews(
+def get_recent_reviews(
     dealer_id: str,
     limit: int = Query(5, ge=1, le=20, description="Number of recent reviews to return (1-20)"),
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
@@ -298,7 +298,7 @@ async def health_check() -> Dict[str, str]:
     - Integration status monitoring
     """
 )
-async def check_dealer_has_reviews(
+def check_dealer_has_reviews(
     dealer_id: str,
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
 ) -> Dict[str, Any]:
@@ -434,7 +434,7 @@ async def analyze_reviews_sentiment(
     ```
     """
 )
-async def get_sentiment_statistics(
+def get_sentiment_statistics(
     dealer_id: str,
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
 ) -> Dict[str, Any]:
@@ -503,7 +503,7 @@ async def get_sentiment_statistics(
     ```
     """
 )
-async def get_monthly_review_totals(
+def get_monthly_review_totals(
     dealer_id: str,
     year: int = Query(None, description="Year to get monthly totals for (default: current year)"),
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
@@ -560,7 +560,7 @@ async def get_monthly_review_totals(
     - Business contact information from Google Business listings
     """
 )
-async def get_dealer_profile(
+def get_dealer_profile(
     dealer_id: str,
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
 ) -> DealerProfileResponse:
@@ -614,7 +614,7 @@ async def get_dealer_profile(
     - DEALER_USER: Can only view history for their assigned dealer
     """
 )
-async def get_scrape_history(
+def get_scrape_history(
     dealer_id: Optional[str] = Query(None, description="Filter by dealer ID (optional)"),
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     per_page: int = Query(10, ge=1, le=50, description="Items per page (1-50)"),
@@ -667,7 +667,7 @@ async def get_scrape_history(
     - Sorted by dealer name for easy selection
     """
 )
-async def get_dealer_options(
+def get_dealer_options(
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
 ) -> DealerOptionsResponse:
     """
@@ -768,7 +768,7 @@ async def get_dealer_options(
     ```
     """
 )
-async def get_latest_scrape_info(
+def get_latest_scrape_info(
     dealer_id: str,
     controller: CustomerGoogleReviewController = Depends(get_google_review_controller)
 ) -> Dict[str, Any]:
@@ -31,7 +31,7 @@ async def health_check():
     summary="Detailed health check",
     description="Detailed health check including database connectivity"
 )
-async def detailed_health_check(db: Session = Depends(get_db)):
+def detailed_health_check(db: Session = Depends(get_db)):
     """Detailed health check including database"""
     health_status = {
         "status": "healthy",
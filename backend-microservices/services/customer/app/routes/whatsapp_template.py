@@ -31,7 +31,7 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
 
 
 @router.get("", response_model=WhatsAppTemplateListResponse, summary="Get WhatsApp Templates")
-async def get_templates(
+def get_templates(
     dealer_id: Optional[str] = None,
     reminder_target: Optional[str] = None,
     template: Optional[str] = None,
@@ -80,7 +80,7 @@ async def get_templates(
 
 
 @router.put("/{template_id}", response_model=WhatsAppTemplateUpdateResponse, summary="Update WhatsApp Template")
-async def update_template(
+def update_template(
     template_id: str,
     request_data: WhatsAppTemplateUpdateRequest,
     request: Request = None,
@@ -121,7 +121,7 @@ async def update_template(
 
 
 @router.delete("/{template_id}", response_model=WhatsAppTemplateDeleteResponse, summary="Delete WhatsApp Template")
-async def delete_template(
+def delete_template(
     template_id: str,
     request: Request = None,
     db: Session = Depends(get_db),
@@ -157,7 +157,7 @@ async def delete_template(
 
 
 @router.post("/copy", response_model=WhatsAppTemplateCopyResponse, summary="Copy WhatsApp Templates")
-async def copy_templates(
+def copy_templates(
     request_data: WhatsAppTemplateCopyRequest,
     request: Request = None,
     db: Session = Depends(get_db),
@@ -199,7 +199,7 @@ async def copy_templates(
 
 
 @router.get("/logs", response_model=WhatsAppTemplateLogsResponse, summary="Get Template Audit Logs")
-async def get_template_logs(
+def get_template_logs(
     template_id: Optional[str] = None,
     dealer_id: Optional[str] = None,
     operation: Optional[str] = None,
@@ -24,6 +24,7 @@ from app.routes.google_review_routes import router as google_review_router
 from app.routes.health import router as health_router
 from utils.database import DatabaseManager
 from utils.logger import setup_logger
+from utils.threadpool import configure_threadpool
 from sqlalchemy import text
 
 # Setup logger
@@ -43,6 +44,8 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info(f"Starting {settings.service_name} v{settings.service_version}")
+    # Background sentiment analysis runs on its own executors, outside the route threadpool
+    configure_threadpool(settings.threadpool_max_workers, reserved_connections=5)
     
     # Create database schema and tables
     try:
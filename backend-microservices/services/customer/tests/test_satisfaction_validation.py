@@ -0,0 +1,210 @@
+"""
+Tests for the vectorized customer satisfaction upload validation
+
+_validate_data_records must report exactly what the previous row-by-row
+(iterrows) implementation reported: same messages, order, row numbers and counts.
+"""
+
+import random
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.controllers.customer_satisfaction_controller import CustomerSatisfactionController
+
+
+@pytest.fixture(scope="module")
+def controller():
+    """Controller without database or sentiment model"""
+    with patch('app.controllers.customer_satisfaction_controller.CustomerSatisfactionRepository'), \
+         patch('app.controllers.customer_satisfaction_controller.SentimentAnalysisService'):
+        controller = CustomerSatisfactionController(Mock())
+    yield controller
+    controller.thread_pool.shutdown(wait=False)
+
+
+def iterrows_validation(controller, df):
+    """Baseline: the row-by-row validation the upload used before vectorizing"""
+    results = {
+        "total_records": len(df),
+        "valid_records": 0,
+        "invalid_records": 0,
+        "validation_errors": [],
+        "invalid_tanggal_rating_count": 0,
+        "invalid_rating_count": 0,
+        "missing_no_tiket_count": 0
+    }
+
+    for index, row in df.iterrows():
+        record_errors = []
+        row_number = index + 2
+
+        no_tiket = row.get('No Tiket', '')
+        if not no_tiket or str(no_tiket).strip() == '' or str(no_tiket).lower() == 'nan':
+            record_errors.append(f"Row {row_number}: Missing or empty 'No Tiket' field (required)")
+            results["missing_no_tiket_count"] += 1
+
+        tanggal_rating = row.get('tanggal Rating', '') or row.get('tanggal_rating', '')
+        if tanggal_rating and str(tanggal_rating).strip() and str(tanggal_rating).lower() != 'nan':
+            is_valid_date, date_error = controller._validate_indonesian_date(str(tanggal_rating))
+            if not is_valid_date:
+                record_errors.append(f"Row {row_number}: tanggal_rating - {date_error}")
+                results["invalid_tanggal_rating_count"] += 1
+
+        rating = row.get('Rating', '')
+        if rating and str(rating).strip() and str(rating).lower() != 'nan':
+            try:
+                rating_value = float(str(rating).strip())
+                if not (0 <= rating_value <= 5):
+                    record_errors.append(f"Row {row_number}: Rating must be between 0 and 5, got {rating_value}")
+                    results["invalid_rating_count"] += 1
+            except (ValueError, TypeError):
+                record_errors.append(f"Row {row_number}: Rating must be numeric, got '{rating}'")
+                results["invalid_rating_count"] += 1
+
+        if record_errors:
+            results["invalid_records"] += 1
+            results["validation_errors"].extend(record_errors)
+        else:
+            results["valid_records"] += 1
+
+    if len(results["validation_errors"]) > 50:
+        results["validation_errors"] = results["validation_errors"][:50]
+        results["validation_errors"].append("... (showing first 50 errors only)")
+
+    return results
+
+
+NO_TIKET_VALUES = ['TKT-001', 'TKT-002', '', '   ', 'nan', 'NaN', np.nan, None, 0, 12345]
+
+TANGGAL_RATING_VALUES = [
+    '24 Desember 2024', '1 januari 2025', '31 MARET 2025', ' 5 Mei 2025 ',
+    '24-12-2024', '2024-12-24', '24/12/2024', '2024/12/24', '24.12.2024',
+    '24 Desember 2024 10:00', '24 12 2024', '24  Desember 2024', '24 December 2024',
+    '30 Februari 2025', '29 Februari 2024', '0 Januari 2025', '15 Juni 1850', '15 Juni 2150',
+    '123 Juni 2025', 'kemarin', '', '   ', 'nan', np.nan, None
+]
+
+RATING_VALUES = ['5', '4', ' 3 ', '0', '4.5', '5.5', '-1', 'abc', '', 'nan', np.nan, None, 0, 3.0, 6, -0.5]
+
+
+def validation_result(controller, df):
+    """Vectorized result without the per-row lists the baseline does not produce"""
+    result = controller._validate_data_records(df)
+    result.pop("error_summary")
+    row_errors = result.pop("row_errors")
+    assert len(row_errors) == len(df)
+    assert sum(1 for errors in row_errors if errors) == result["invalid_records"]
+    return result, row_errors
+
+
+def assert_matches_baseline(controller, df):
+    result, _ = validation_result(controller, df)
+    assert result == iterrows_validation(controller, df)
+
+
+class TestValidationEquivalence:
+    """Vectorized validation versus the iterrows baseline"""
+
+    def test_every_branch(self, controller):
+        rows = max(len(NO_TIKET_VALUES), len(TANGGAL_RATING_VALUES), len(RATING_VALUES))
+        df = pd.DataFrame({
+            'No Tiket': [NO_TIKET_VALUES[i % len(NO_TIKET_VALUES)] for i in range(rows)],
+            'tanggal Rating': [TANGGAL_RATING_VALUES[i % len(TANGGAL_RATING_VALUES)] for i in range(rows)],
+            'Rating': [RATING_VALUES[i % len(RATING_VALUES)] for i in range(rows)]
+        })
+        assert_matches_baseline(controller, df)
+
+    def test_randomized_rows(self, controller):
+        rng = random.Random(19)
+        rows = 3000
+        df = pd.DataFrame({
+            'No Tiket': [rng.choice(NO_TIKET_VALUES) for _ in range(rows)],
+            'tanggal Rating': [rng.choice(TANGGAL_RATING_VALUES) for _ in range(rows)],
+            'tanggal_rating': [rng.choice(TANGGAL_RATING_VALUES) for _ in range(rows)],
+            'Rating': [rng.choice(RATING_VALUES) for _ in range(rows)]
+        })
+        assert_matches_baseline(controller, df)
+
+    def test_fallback_date_column_only(self, controller):
+        df = pd.DataFrame({
+            'No Tiket': ['TKT-1', 'TKT-2', 'TKT-3', 'TKT-4'],
+            'tanggal_rating': ['24 Desember 2024', '2024-12-24', '', np.nan],
+            'Rating': ['5', '1', '2', '3']
+        })
+        assert_matches_baseline(controller, df)
+
+    def test_empty_primary_date_falls_through(self, controller):
+        df = pd.DataFrame({
+            'No Tiket': ['TKT-1', 'TKT-2', 'TKT-3'],
+            'tanggal Rating': ['', np.nan, '24 Desember 2024'],
+            'tanggal_rating': ['24-12-2024', '24-12-2024', '24-12-2024'],
+            'Rating': ['5', '5', '5']
+        })
+        assert_matches_baseline(controller, df)
+
+    def test_numeric_columns(self, controller):
+        df = pd.DataFrame({
+            'No Tiket': [101, 0, 103, 104],
+            'tanggal Rating': ['1 Mei 2025'] * 4,
+            'Rating': [4.0, np.nan, 0.0, 7.5]
+        })
+        assert_matches_baseline(controller, df)
+
+    def test_datetime_column(self, controller):
+        df = pd.DataFrame({
+            'No Tiket': ['TKT-1', 'TKT-2', 'TKT-3'],
+            'tanggal Rating': pd.to_datetime([datetime(2024, 12, 24), None, datetime(2025, 1, 1, 8, 30)]),
+            'Rating': ['5', '4', '3']
+        })
+        assert_matches_baseline(controller, df)
+
+    def test_missing_columns(self, controller):
+        df = pd.DataFrame({'Nama': ['Adit', 'Budi']})
+        assert_matches_baseline(controller, df)
+
+
+class TestRatingValidation:
+    """Rating checks, parsed once per distinct value"""
+
+    def test_messages(self, controller):
+        values = pd.Series(['5', ' 2.5 ', '0', '5.5', '-1', 'abc', 'lima'])
+        assert controller._rating_errors(values).tolist() == [
+            '',
+            '',
+            '',
+            'Rating must be between 0 and 5, got 5.5',
+            'Rating must be between 0 and 5, got -1.0',
+            "Rating must be numeric, got 'abc'",
+            "Rating must be numeric, got 'lima'"
+        ]
+
+    def test_repeated_values_keep_row_alignment(self, controller):
+        values = pd.Series(['9', '4', '9', 'x', '4'], index=[10, 11, 12, 13, 14])
+        errors = controller._rating_errors(values)
+        assert errors.index.tolist() == [10, 11, 12, 13, 14]
+        assert errors.tolist() == [
+            'Rating must be between 0 and 5, got 9.0',
+            '',
+            'Rating must be between 0 and 5, got 9.0',
+            "Rating must be numeric, got 'x'",
+            ''
+        ]
+
+    def test_row_errors_keep_row_order(self, controller):
+        df = pd.DataFrame({
+            'No Tiket': ['', 'TKT-2', 'TKT-3'],
+            'tanggal Rating': ['24-12-2024', '24 Desember 2024', '1 Mei 2025'],
+            'Rating': ['abc', '4', '6']
+        })
+        _, row_errors = validation_result(controller, df)
+        assert row_errors[0] == [
+            "Row 2: Missing or empty 'No Tiket' field (required)",
+            "Row 2: tanggal_rating - " + controller._validate_indonesian_date('24-12-2024')[1],
+            "Row 2: Rating must be numeric, got 'abc'"
+        ]
+        assert row_errors[1] == []
+        assert row_errors[2] == ["Row 4: Rating must be between 0 and 5, got 6.0"]
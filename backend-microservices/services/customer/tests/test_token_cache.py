@@ -0,0 +1,147 @@
+"""
+Tests for the decoded-token cache the customer service authenticates through
+"""
+
+import os
+import sys
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+# Add backend-microservices to path for the shared utils package
+services_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+if services_root not in sys.path:
+    sys.path.append(services_root)
+
+from utils import auth
+from utils.auth import AuthUtils, TokenCache, create_access_token
+
+
+@pytest.fixture
+def decode_calls():
+    """Count signature verifications while still decoding for real"""
+    with patch.object(AuthUtils, 'decode_token', wraps=AuthUtils.decode_token) as decode:
+        yield decode
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.time() as seen by TokenCache"""
+    now = [time.time()]
+    with patch.object(auth.time, 'time', side_effect=lambda: now[0]):
+        yield now
+
+
+def make_token(user_id: str, minutes: int = 30) -> str:
+    return create_access_token({"sub": user_id, "role": "DEALER_ADMIN"}, timedelta(minutes=minutes))
+
+
+class TestTokenCacheHits:
+    """Repeat tokens skip verification, invalid ones never get cached"""
+
+    def test_repeat_token_decoded_once(self, decode_calls):
+        cache = TokenCache(max_size=10, ttl_seconds=300)
+        token = make_token("user-1")
+
+        first = cache.decode(token)
+        second = cache.decode(token)
+
+        assert first["sub"] == "user-1"
+        assert second == first
+        assert decode_calls.call_count == 1
+
+    def test_invalid_token_not_cached(self, decode_calls):
+        cache = TokenCache(max_size=10, ttl_seconds=300)
+
+        assert cache.decode("not-a-jwt") is None
+        assert cache.decode("not-a-jwt") is None
+        assert decode_calls.call_count == 2
+        assert len(cache.entries) == 0
+
+    def test_keyed_by_hash_not_token(self):
+        cache = TokenCache(max_size=10, ttl_seconds=300)
+        token = make_token("user-1")
+
+        cache.decode(token)
+
+        assert token not in cache.entries
+        assert all(len(key) == 64 for key in cache.entries)
+
+    def test_zero_size_disables_caching(self, decode_calls):
+        cache = TokenCache(max_size=0, ttl_seconds=300)
+        token = make_token("user-1")
+
+        assert cache.decode(token)["sub"] == "user-1"
+        assert cache.decode(token)["sub"] == "user-1"
+        assert decode_calls.call_count == 2
+        assert len(cache.entries) == 0
+
+
+class TestTokenCacheEviction:
+    """Bounded LRU"""
+
+    def test_least_recently_used_evicted(self, decode_calls):
+        cache = TokenCache(max_size=2, ttl_seconds=300)
+        token_a, token_b, token_c = make_token("a"), make_token("b"), make_token("c")
+
+        cache.decode(token_a)
+        cache.decode(token_b)
+        cache.decode(token_a)  # a is now the most recently used
+        cache.decode(token_c)  # evicts b
+
+        assert len(cache.entries) == 2
+        assert decode_calls.call_count == 3
+
+        cache.decode(token_a)
+        assert decode_calls.call_count == 3
+
+        cache.decode(token_b)
+        assert decode_calls.call_count == 4
+        assert len(cache.entries) == 2
+
+
+class TestTokenCacheExpiry:
+    """Entries live for the TTL, or until the token's own expiry if that is sooner"""
+
+    def test_entry_expires_after_ttl(self, decode_calls, clock):
+        cache = TokenCache(max_size=10, ttl_seconds=60)
+        token = make_token("user-1", minutes=30)
+
+        cache.decode(token)
+        clock[0] += 59
+        cache.decode(token)
+        assert decode_calls.call_count == 1
+
+        clock[0] += 2
+        assert cache.decode(token)["sub"] == "user-1"
+        assert decode_calls.call_count == 2
+
+    def test_entry_expires_with_token(self, decode_calls, clock):
+        cache = TokenCache(max_size=10, ttl_seconds=3600)
+        token = make_token("user-1", minutes=1)
+        exp = AuthUtils.decode_token(token)["exp"]
+        decode_calls.reset_mock()
+
+        cache.decode(token)
+        clock[0] = exp - 1
+        cache.decode(token)
+        assert decode_calls.call_count == 1
+
+        # Past the token's exp the cached payload is no longer served
+        clock[0] = exp + 1
+        cache.decode(token)
+        assert decode_calls.call_count == 2
+
+    def test_expired_entry_replaced(self, clock):
+        cache = TokenCache(max_size=10, ttl_seconds=60)
+        token = make_token("user-1")
+
+        cache.decode(token)
+        clock[0] += 120
+        cache.decode(token)
+
+        assert len(cache.entries) == 1
+        expires_at, _ = next(iter(cache.entries.values()))
+        assert expires_at == pytest.approx(clock[0] + 60)
@@ -25,7 +25,7 @@ class AdminDashboardController:
     def __init__(self, db: Session):
         self.db = db
     
-    async def get_all_active_dealers(self) -> ActiveDealersResponse:
+    def get_all_active_dealers(self) -> ActiveDealersResponse:
         """
         Get all active dealers without pagination
         
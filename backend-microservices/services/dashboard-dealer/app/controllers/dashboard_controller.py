@@ -13,7 +13,9 @@ if utils_path not in sys.path:
     sys.path.append(utils_path)
 
 from utils.logger import setup_logger
+from app.config import settings
 from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.dashboard_rollup_repository import DashboardRollupRepository
 from app.schemas.dashboard import UnitInboundStatusResponse, UnitInboundStatusItem, PaymentTypeResponse, PaymentTypeItem, PaymentMethodResponse, PaymentStatusResponse, PaymentRevenueResponse, PaymentDataHistoryResponse, LeasingDataHistoryResponse, DocumentHandlingDataHistoryResponse, UnitInboundDataHistoryResponse, TopPenerimaanUnitResponse, PODocumentStatusResponse, TrenRevenueResponse, POCreationMonthlyResponse, PermohonanFakturResponse, STNKDiterimaResponse, BPKBDiterimaResponse, DeliveryProcessStatusResponse, DeliveryProcessStatusItem, ProspectFollowUpResponse, ProspectFollowUpItem, SPKStatusResponse, SPKStatusItem, TopLeasingResponse, TopLeasingItem, DocumentHandlingCountResponse, StatusProspectResponse, MetodeFollowUpResponse, SumberProspectResponse, SebaranProspectResponse, ProspectDataTableResponse, TopDealingUnitsResponse, RevenueResponse, TopDriverResponse, DeliveryLocationResponse, DeliveryDataHistoryResponse, SPKDealingProcessDataResponse
 
 logger = setup_logger(__name__)
@@ -24,9 +26,12 @@ class DashboardController:
     
     def __init__(self, db: Session):
         self.db = db
-        self.repository = DashboardRepository(db)
+        if settings.dashboard_use_rollups:
+            self.repository = DashboardRollupRepository(db)
+        else:
+            self.repository = DashboardRepository(db)
     
-    async def get_unit_inbound_status_statistics(
+    def get_unit_inbound_status_statistics(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -78,7 +83,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_payment_type_statistics(
+    def get_payment_type_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -139,7 +144,7 @@ class DashboardController:
                 total_amount=0
             )
 
-    async def get_payment_method_statistics(
+    def get_payment_method_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -191,7 +196,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_payment_status_statistics(
+    def get_payment_status_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -243,7 +248,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_payment_revenue_total(
+    def get_payment_revenue_total(
         self,
         dealer_id: str,
         date_from: str,
@@ -291,7 +296,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_payment_data_history(
+    def get_payment_data_history(
         self,
         dealer_id: str,
         date_from: str,
@@ -352,7 +357,7 @@ class DashboardController:
                 total_pages=0
             )
 
-    async def get_leasing_data_history(
+    def get_leasing_data_history(
         self,
         dealer_id: str,
         date_from: str,
@@ -413,7 +418,7 @@ class DashboardController:
                 total_pages=0
             )
 
-    async def get_document_handling_data_history(
+    def get_document_handling_data_history(
         self,
         dealer_id: str,
         date_from: str,
@@ -474,7 +479,7 @@ class DashboardController:
                 total_pages=0
             )
 
-    async def get_unit_inbound_data_history(
+    def get_unit_inbound_data_history(
         self,
         dealer_id: str,
         date_from: str,
@@ -535,7 +540,7 @@ class DashboardController:
                 total_pages=0
             )
 
-    async def get_top_penerimaan_unit(
+    def get_top_penerimaan_unit(
         self,
         dealer_id: str,
         date_from: str,
@@ -580,7 +585,7 @@ class DashboardController:
                 data=[]
             )
 
-    async def get_po_document_status_statistics(
+    def get_po_document_status_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -628,7 +633,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_revenue_trend_data(
+    def get_revenue_trend_data(
         self,
         dealer_id: str,
         current_year: str
@@ -674,7 +679,7 @@ class DashboardController:
                 data=empty_data
             )
 
-    async def get_po_creation_monthly_data(
+    def get_po_creation_monthly_data(
         self,
         dealer_id: str,
         current_year: str
@@ -722,7 +727,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_permohonan_faktur_data(
+    def get_permohonan_faktur_data(
         self,
         dealer_id: str,
         date_from: str,
@@ -773,7 +778,7 @@ class DashboardController:
                 percentage=0.0
             )
 
-    async def get_stnk_diterima_data(
+    def get_stnk_diterima_data(
         self,
         dealer_id: str,
         date_from: str,
@@ -824,7 +829,7 @@ class DashboardController:
                 percentage=0.0
             )
 
-    async def get_bpkb_diterima_data(
+    def get_bpkb_diterima_data(
         self,
         dealer_id: str,
         date_from: str,
@@ -875,7 +880,7 @@ class DashboardController:
                 percentage=0.0
             )
 
-    async def get_delivery_process_status_statistics(
+    def get_delivery_process_status_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -927,7 +932,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_prospect_followup_statistics(
+    def get_prospect_followup_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -979,7 +984,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_spk_status_statistics(
+    def get_spk_status_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -1031,7 +1036,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_top_leasing_statistics(
+    def get_top_leasing_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -1083,7 +1088,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_document_handling_statistics(
+    def get_document_handling_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -1135,7 +1140,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_status_prospect_statistics(
+    def get_status_prospect_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -1187,7 +1192,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_metode_follow_up_statistics(
+    def get_metode_follow_up_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -1239,7 +1244,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_sumber_prospect_statistics(
+    def get_sumber_prospect_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -1291,7 +1296,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_sebaran_prospect_statistics(
+    def get_sebaran_prospect_statistics(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1343,7 +1348,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_prospect_data_table(
+    def get_prospect_data_table(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1421,7 +1426,7 @@ class DashboardController:
                 per_page=per_page
             )
 
-    async def get_top_dealing_units_statistics(
+    def get_top_dealing_units_statistics(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1473,7 +1478,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_revenue_statistics(
+    def get_revenue_statistics(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1518,7 +1523,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_top_driver_statistics(
+    def get_top_driver_statistics(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1570,7 +1575,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_delivery_location_statistics(
+    def get_delivery_location_statistics(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1622,7 +1627,7 @@ class DashboardController:
                 total_records=0
             )
 
-    async def get_delivery_data_history(
+    def get_delivery_data_history(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -1709,7 +1714,7 @@ class DashboardController:
                 per_page=per_page
             )
 
-    async def get_spk_dealing_process_data(
+    def get_spk_dealing_process_data(
         self, 
         dealer_id: str, 
         page: int = 1,
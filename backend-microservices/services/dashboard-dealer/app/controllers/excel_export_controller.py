@@ -4,7 +4,7 @@ Controller for Excel export operations
 
 import os
 import sys
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, IO, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -16,8 +16,10 @@ if utils_path not in sys.path:
 from utils.logger import setup_logger
 from app.repositories.excel_export_repository import ExcelExportRepository
 from app.services.excel_export_service import ExcelExportService
+from app.services.export_job_service import export_job_service
 from app.schemas.excel_export import (
     ExcelExportMetadata,
+    ExcelExportJob,
     ExcelExportResponse,
     ExcelExportError,
     WORK_ORDER_COLUMNS,
@@ -30,6 +32,23 @@ from app.schemas.excel_export import (
 
 logger = setup_logger(__name__)
 
+# export_type -> (controller export method, backend fetch_type whose runs change its data)
+EXPORT_JOB_TYPES = {
+    'work_order': ('export_work_order_excel', 'pkb'),
+    'work_order_detail': ('export_work_order_detail_excel', 'pkb'),
+    'njb_nsc': ('export_njb_nsc_excel', 'inv2_read'),
+    'njb_nsc_detail': ('export_njb_nsc_detail_excel', 'inv2_read'),
+    'hlo': ('export_hlo_excel', 'dphlo_read'),
+    'hlo_detail': ('export_hlo_detail_excel', 'dphlo_read'),
+}
+
+
+def _run_export_job(db: Session, export_type: str, dealer_id: str, date_from: str, date_to: str):
+    """Export job body: runs on the export thread pool with its own session"""
+    method_name, _ = EXPORT_JOB_TYPES[export_type]
+    controller = ExcelExportController(db)
+    return getattr(controller, method_name)(dealer_id=dealer_id, date_from=date_from, date_to=date_to)
+
 
 class ExcelExportController:
     """Controller for Excel export analytics operations"""
@@ -38,13 +57,46 @@ class ExcelExportController:
         self.db = db
         self.repository = ExcelExportRepository(db)
         self.excel_service = ExcelExportService()
+
+    def _build_export(
+        self,
+        export_type: str,
+        data: Iterable[Dict[str, Any]],
+        columns: List[Dict[str, str]],
+        sheet_name: str,
+        title: str,
+        dealer_id: str,
+        date_from: str,
+        date_to: str
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
+        """Write streamed rows into a temporary Excel file and describe it"""
+        excel_file, total_records, file_size = self.excel_service.create_excel_tempfile(
+            data=data,
+            columns=columns,
+            sheet_name=sheet_name,
+            title=title
+        )
+
+        metadata = ExcelExportMetadata(
+            filename=self.excel_service.generate_filename(
+                export_type=export_type,
+                dealer_id=dealer_id,
+                date_from=date_from,
+                date_to=date_to
+            ),
+            total_records=total_records,
+            export_type=export_type,
+            generated_at=datetime.now().isoformat(),
+            file_size_bytes=file_size
+        )
+        return excel_file, metadata
     
     def export_work_order_excel(
         self,
         dealer_id: str,
         date_from: str,
         date_to: str
-    ) -> Tuple[bytes, ExcelExportMetadata]:
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
         """
         Export Work Order data to Excel file
         
@@ -54,44 +106,31 @@ class ExcelExportController:
             date_to: End date (YYYY-MM-DD format)
             
         Returns:
-            Tuple[bytes, ExcelExportMetadata]: Excel file bytes and metadata
+            Tuple[IO[bytes], ExcelExportMetadata]: Temporary Excel file (rewound) and metadata
         """
         try:
             logger.info(f"Exporting Work Order Excel for dealer {dealer_id} from {date_from} to {date_to}")
             
-            # Get data from repository
+            # Stream rows from the repository into the workbook
             data = self.repository.get_work_order_export_data(
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
-            
-            # Generate Excel file
-            excel_bytes = self.excel_service.create_excel_file(
+
+            excel_file, metadata = self._build_export(
+                export_type="WorkOrder",
                 data=data,
                 columns=WORK_ORDER_COLUMNS,
                 sheet_name="Work Order Data",
-                title=f"Work Order Export - Dealer {dealer_id} ({date_from} to {date_to})"
-            )
-            
-            # Generate filename and metadata
-            filename = self.excel_service.generate_filename(
-                export_type="WorkOrder",
+                title=f"Work Order Export - Dealer {dealer_id} ({date_from} to {date_to})",
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
-            
-            metadata = ExcelExportMetadata(
-                filename=filename,
-                total_records=len(data),
-                export_type="WorkOrder",
-                generated_at=datetime.now().isoformat(),
-                file_size_bytes=len(excel_bytes)
-            )
-            
-            logger.info(f"Work Order Excel export completed: {len(data)} records, {len(excel_bytes)} bytes")
-            return excel_bytes, metadata
+
+            logger.info(f"Work Order Excel export completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+            return excel_file, metadata
             
         except Exception as e:
             logger.error(f"Error exporting Work Order Excel: {str(e)}")
@@ -102,7 +141,7 @@ class ExcelExportController:
         dealer_id: str,
         date_from: str,
         date_to: str
-    ) -> Tuple[bytes, ExcelExportMetadata]:
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
         """
         Export NJB/NSC data to Excel file
         
@@ -112,44 +151,31 @@ class ExcelExportController:
             date_to: End date (YYYY-MM-DD format)
             
         Returns:
-            Tuple[bytes, ExcelExportMetadata]: Excel file bytes and metadata
+            Tuple[IO[bytes], ExcelExportMetadata]: Temporary Excel file (rewound) and metadata
         """
         try:
             logger.info(f"Exporting NJB/NSC Excel for dealer {dealer_id} from {date_from} to {date_to}")
             
-            # Get data from repository
+            # Stream rows from the repository into the workbook
             data = self.repository.get_njb_nsc_export_data(
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
-            
-            # Generate Excel file
-            excel_bytes = self.excel_service.create_excel_file(
+
+            excel_file, metadata = self._build_export(
+                export_type="NJB_NSC",
                 data=data,
                 columns=NJB_NSC_COLUMNS,
                 sheet_name="NJB NSC Data",
-                title=f"NJB/NSC Export - Dealer {dealer_id} ({date_from} to {date_to})"
-            )
-            
-            # Generate filename and metadata
-            filename = self.excel_service.generate_filename(
-                export_type="NJB_NSC",
+                title=f"NJB/NSC Export - Dealer {dealer_id} ({date_from} to {date_to})",
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
-            
-            metadata = ExcelExportMetadata(
-                filename=filename,
-                total_records=len(data),
-                export_type="NJB_NSC",
-                generated_at=datetime.now().isoformat(),
-                file_size_bytes=len(excel_bytes)
-            )
-            
-            logger.info(f"NJB/NSC Excel export completed: {len(data)} records, {len(excel_bytes)} bytes")
-            return excel_bytes, metadata
+
+            logger.info(f"NJB/NSC Excel export completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+            return excel_file, metadata
             
         except Exception as e:
             logger.error(f"Error exporting NJB/NSC Excel: {str(e)}")
@@ -160,7 +186,7 @@ class ExcelExportController:
         dealer_id: str,
         date_from: str,
         date_to: str
-    ) -> Tuple[bytes, ExcelExportMetadata]:
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
         """
         Export HLO data to Excel file
         
@@ -170,44 +196,31 @@ class ExcelExportController:
             date_to: End date (YYYY-MM-DD format)
             
         Returns:
-            Tuple[bytes, ExcelExportMetadata]: Excel file bytes and metadata
+            Tuple[IO[bytes], ExcelExportMetadata]: Temporary Excel file (rewound) and metadata
         """
         try:
             logger.info(f"Exporting HLO Excel for dealer {dealer_id} from {date_from} to {date_to}")
             
-            # Get data from repository
+            # Stream rows from the repository into the workbook
             data = self.repository.get_hlo_export_data(
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
-            
-            # Generate Excel file
-            excel_bytes = self.excel_service.create_excel_file(
+
+            excel_file, metadata = self._build_export(
+                export_type="HLO",
                 data=data,
                 columns=HLO_COLUMNS,
                 sheet_name="HLO Data",
-                title=f"HLO Export - Dealer {dealer_id} ({date_from} to {date_to})"
-            )
-            
-            # Generate filename and metadata
-            filename = self.excel_service.generate_filename(
-                export_type="HLO",
+                title=f"HLO Export - Dealer {dealer_id} ({date_from} to {date_to})",
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
-            
-            metadata = ExcelExportMetadata(
-                filename=filename,
-                total_records=len(data),
-                export_type="HLO",
-                generated_at=datetime.now().isoformat(),
-                file_size_bytes=len(excel_bytes)
-            )
-            
-            logger.info(f"HLO Excel export completed: {len(data)} records, {len(excel_bytes)} bytes")
-            return excel_bytes, metadata
+
+            logger.info(f"HLO Excel export completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+            return excel_file, metadata
 
         except Exception as e:
             logger.error(f"Error exporting HLO Excel: {str(e)}")
@@ -218,7 +231,7 @@ class ExcelExportController:
         dealer_id: str,
         date_from: str,
         date_to: str
-    ) -> Tuple[bytes, ExcelExportMetadata]:
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
         """
         Export Work Order Detail data to Excel file (includes PKBData, PKBService, and PKBPart)
 
@@ -228,44 +241,31 @@ class ExcelExportController:
             date_to: End date (YYYY-MM-DD format)
 
         Returns:
-            Tuple[bytes, ExcelExportMetadata]: Excel file bytes and metadata
+            Tuple[IO[bytes], ExcelExportMetadata]: Temporary Excel file (rewound) and metadata
         """
         try:
             logger.info(f"Exporting Work Order Detail Excel for dealer {dealer_id} from {date_from} to {date_to}")
 
-            # Get data from repository
+            # Stream rows from the repository into the workbook
             data = self.repository.get_work_order_detail_export_data(
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
 
-            # Generate Excel file
-            excel_bytes = self.excel_service.create_excel_file(
+            excel_file, metadata = self._build_export(
+                export_type="WorkOrderDetail",
                 data=data,
                 columns=WORK_ORDER_DETAIL_COLUMNS,
                 sheet_name="Work Order Detail Data",
-                title=f"Work Order Detail Export - Dealer {dealer_id} ({date_from} to {date_to})"
-            )
-
-            # Generate filename and metadata
-            filename = self.excel_service.generate_filename(
-                export_type="WorkOrderDetail",
+                title=f"Work Order Detail Export - Dealer {dealer_id} ({date_from} to {date_to})",
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
 
-            metadata = ExcelExportMetadata(
-                filename=filename,
-                total_records=len(data),
-                export_type="WorkOrderDetail",
-                generated_at=datetime.now().isoformat(),
-                file_size_bytes=len(excel_bytes)
-            )
-
-            logger.info(f"Work Order Detail Excel export completed: {len(data)} records, {len(excel_bytes)} bytes")
-            return excel_bytes, metadata
+            logger.info(f"Work Order Detail Excel export completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+            return excel_file, metadata
 
         except Exception as e:
             logger.error(f"Error exporting Work Order Detail Excel: {str(e)}")
@@ -276,7 +276,7 @@ class ExcelExportController:
         dealer_id: str,
         date_from: str,
         date_to: str
-    ) -> Tuple[bytes, ExcelExportMetadata]:
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
         """
         Export NJB/NSC Detail data to Excel file (includes WorkshopInvoiceData, WorkshopInvoiceNJB, and WorkshopInvoiceNSC)
 
@@ -286,44 +286,31 @@ class ExcelExportController:
             date_to: End date (YYYY-MM-DD format)
 
         Returns:
-            Tuple[bytes, ExcelExportMetadata]: Excel file bytes and metadata
+            Tuple[IO[bytes], ExcelExportMetadata]: Temporary Excel file (rewound) and metadata
         """
         try:
             logger.info(f"Exporting NJB/NSC Detail Excel for dealer {dealer_id} from {date_from} to {date_to}")
 
-            # Get data from repository
+            # Stream rows from the repository into the workbook
             data = self.repository.get_njb_nsc_detail_export_data(
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
 
-            # Generate Excel file
-            excel_bytes = self.excel_service.create_excel_file(
+            excel_file, metadata = self._build_export(
+                export_type="NJB_NSC_Detail",
                 data=data,
                 columns=NJB_NSC_DETAIL_COLUMNS,
                 sheet_name="NJB NSC Detail Data",
-                title=f"NJB/NSC Detail Export - Dealer {dealer_id} ({date_from} to {date_to})"
-            )
-
-            # Generate filename and metadata
-            filename = self.excel_service.generate_filename(
-                export_type="NJB_NSC_Detail",
+                title=f"NJB/NSC Detail Export - Dealer {dealer_id} ({date_from} to {date_to})",
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
 
-            metadata = ExcelExportMetadata(
-                filename=filename,
-                total_records=len(data),
-                export_type="NJB_NSC_Detail",
-                generated_at=datetime.now().isoformat(),
-                file_size_bytes=len(excel_bytes)
-            )
-
-            logger.info(f"NJB/NSC Detail Excel export completed: {len(data)} records, {len(excel_bytes)} bytes")
-            return excel_bytes, metadata
+            logger.info(f"NJB/NSC Detail Excel export completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+            return excel_file, metadata
 
         except Exception as e:
             logger.error(f"Error exporting NJB/NSC Detail Excel: {str(e)}")
@@ -334,7 +321,7 @@ class ExcelExportController:
         dealer_id: str,
         date_from: str,
         date_to: str
-    ) -> Tuple[bytes, ExcelExportMetadata]:
+    ) -> Tuple[IO[bytes], ExcelExportMetadata]:
         """
         Export HLO Detail data to Excel file (includes DPHLOData and DPHLOPart)
 
@@ -344,44 +331,31 @@ class ExcelExportController:
             date_to: End date (YYYY-MM-DD format)
 
         Returns:
-            Tuple[bytes, ExcelExportMetadata]: Excel file bytes and metadata
+            Tuple[IO[bytes], ExcelExportMetadata]: Temporary Excel file (rewound) and metadata
         """
         try:
             logger.info(f"Exporting HLO Detail Excel for dealer {dealer_id} from {date_from} to {date_to}")
 
-            # Get data from repository
+            # Stream rows from the repository into the workbook
             data = self.repository.get_hlo_detail_export_data(
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
 
-            # Generate Excel file
-            excel_bytes = self.excel_service.create_excel_file(
+            excel_file, metadata = self._build_export(
+                export_type="HLO_Detail",
                 data=data,
                 columns=HLO_DETAIL_COLUMNS,
                 sheet_name="HLO Detail Data",
-                title=f"HLO Detail Export - Dealer {dealer_id} ({date_from} to {date_to})"
-            )
-
-            # Generate filename and metadata
-            filename = self.excel_service.generate_filename(
-                export_type="HLO_Detail",
+                title=f"HLO Detail Export - Dealer {dealer_id} ({date_from} to {date_to})",
                 dealer_id=dealer_id,
                 date_from=date_from,
                 date_to=date_to
             )
 
-            metadata = ExcelExportMetadata(
-                filename=filename,
-                total_records=len(data),
-                export_type="HLO_Detail",
-                generated_at=datetime.now().isoformat(),
-                file_size_bytes=len(excel_bytes)
-            )
-
-            logger.info(f"HLO Detail Excel export completed: {len(data)} records, {len(excel_bytes)} bytes")
-            return excel_bytes, metadata
+            logger.info(f"HLO Detail Excel export completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+            return excel_file, metadata
 
         except Exception as e:
             logger.error(f"Error exporting HLO Detail Excel: {str(e)}")
@@ -471,4 +445,85 @@ class ExcelExportController:
             
         except Exception as e:
             logger.error(f"Error getting export preview: {str(e)}")
-            raise Exception(f"Failed to generate export preview: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Failed to generate export preview: {str(e)}")
+
+    def submit_export_job(
+        self,
+        export_type: str,
+        dealer_id: str,
+        date_from: str,
+        date_to: str
+    ) -> ExcelExportJob:
+        """
+        Queue an export to run in the background, reusing a cached file for unchanged data
+
+        Args:
+            export_type: Type of export ('work_order', 'work_order_detail', 'njb_nsc', 'njb_nsc_detail', 'hlo', 'hlo_detail')
+            dealer_id: Dealer ID to filter by
+            date_from: Start date (YYYY-MM-DD format)
+            date_to: End date (YYYY-MM-DD format)
+
+        Returns:
+            ExcelExportJob: Job status (completed right away on a cache hit)
+        """
+        if export_type not in EXPORT_JOB_TYPES:
+            raise ValueError(f"Invalid export_type. Must be one of: {', '.join(EXPORT_JOB_TYPES)}")
+        self.validate_export_request(dealer_id, date_from, date_to)
+
+        _, fetch_type = EXPORT_JOB_TYPES[export_type]
+        data_version = self.repository.get_export_data_version(fetch_type, dealer_id)
+
+        job = export_job_service.submit(
+            export_type=export_type,
+            dealer_id=dealer_id,
+            date_from=date_from,
+            date_to=date_to,
+            data_version=data_version,
+            build=lambda db: _run_export_job(db, export_type, dealer_id, date_from, date_to)
+        )
+        return self._to_export_job(job)
+
+    def get_export_job(self, job_id: str) -> Optional[ExcelExportJob]:
+        """
+        Get the status of an export job
+
+        Args:
+            job_id: Job ID returned by submit_export_job
+
+        Returns:
+            ExcelExportJob or None if the job is unknown or its file expired
+        """
+        job = export_job_service.get_status(job_id)
+        return self._to_export_job(job) if job else None
+
+    def get_export_job_file(self, job_id: str) -> Optional[Tuple[IO[bytes], ExcelExportMetadata]]:
+        """
+        Get the cached file of a completed export job
+
+        Args:
+            job_id: Job ID returned by submit_export_job
+
+        Returns:
+            Tuple of (open file, metadata) or None if the job is not completed;
+            stream the file with excel_service.iter_file(), which closes it
+        """
+        result = export_job_service.get_file(job_id)
+        if not result:
+            return None
+        excel_file, metadata = result
+        return excel_file, ExcelExportMetadata(**metadata)
+
+    def _to_export_job(self, job: Dict[str, Any]) -> ExcelExportJob:
+        completed = job['status'] == 'completed'
+        return ExcelExportJob(
+            job_id=job['job_id'],
+            export_type=job.get('export_type', ''),
+            dealer_id=job.get('dealer_id', ''),
+            date_from=job.get('date_from', ''),
+            date_to=job.get('date_to', ''),
+            status=job['status'],
+            cached=job.get('cached', False),
+            metadata=ExcelExportMetadata(**job['metadata']) if completed else None,
+            error_message=job.get('error_message'),
+            download_url=f"/api/v1/h23-dashboard/exports/jobs/{job['job_id']}/download" if completed else None
+        )
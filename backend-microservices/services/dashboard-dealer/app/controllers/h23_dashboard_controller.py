@@ -35,7 +35,7 @@ class H23DashboardController:
     
     # Work Order Section Methods
     
-    async def get_total_unit_entry(
+    def get_total_unit_entry(
         self, 
         dealer_id: str, 
         date_from: str, 
@@ -89,7 +89,7 @@ class H23DashboardController:
                 percentage=0.0
             )
 
-    async def get_work_order_revenue(
+    def get_work_order_revenue(
         self,
         dealer_id: str,
         date_from: str,
@@ -137,7 +137,7 @@ class H23DashboardController:
                 total_records=0
             )
 
-    async def get_work_order_status_statistics(
+    def get_work_order_status_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -191,7 +191,7 @@ class H23DashboardController:
 
     # Pembayaran Section Methods
     
-    async def get_njb_statistics(
+    def get_njb_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -239,7 +239,7 @@ class H23DashboardController:
                 total_records=0
             )
 
-    async def get_nsc_statistics(
+    def get_nsc_statistics(
         self,
         dealer_id: str,
         date_from: str,
@@ -287,7 +287,7 @@ class H23DashboardController:
                 total_records=0
             )
 
-    async def get_hlo_statistics(
+    def get_hlo_statistics(
         self,
         dealer_id: str,
         date_from: str,
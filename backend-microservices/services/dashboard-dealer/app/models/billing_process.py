@@ -7,7 +7,7 @@ from the dealer_integration schema.
 
 import os
 import sys
-from sqlalchemy import Column, String, DateTime, ForeignKey, DECIMAL
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, DECIMAL
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -38,6 +38,7 @@ class BillingProcessData(Base):
     note = Column(String, nullable=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
     def __repr__(self):
@@ -0,0 +1,37 @@
+"""
+Dashboard Daily Rollup Model
+
+This module defines the SQLAlchemy model for the per-dealer daily aggregates
+maintained by the backend processors in the dealer_integration schema.
+"""
+
+import os
+import sys
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from datetime import datetime
+
+# Add utils to path
+utils_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../utils'))
+if utils_path not in sys.path:
+    sys.path.append(utils_path)
+
+from utils.database import Base
+
+class DashboardDailyRollup(Base):
+    """Per-(dealer, metric, day, dimension) aggregate refreshed after each processor run"""
+    __tablename__ = "dashboard_daily_rollups"
+    __table_args__ = {'schema': 'dealer_integration'}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    dealer_id = Column(String(10), ForeignKey("dealer_integration.dealers.dealer_id"), nullable=False)
+    metric = Column(String(50), nullable=False)
+    day = Column(Date, nullable=False)
+    dimension = Column(String(255), nullable=True)
+    record_count = Column(Integer, nullable=False, default=0)
+    amount_total = Column(Numeric(20, 2), nullable=True)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DashboardDailyRollup(dealer_id={self.dealer_id}, metric={self.metric}, day={self.day}, dimension={self.dimension})>"
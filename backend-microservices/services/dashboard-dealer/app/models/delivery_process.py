@@ -4,7 +4,7 @@ Delivery process data models
 
 import os
 import sys
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, UUID
+from sqlalchemy import Column, String, DateTime, Date, Text, ForeignKey, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
@@ -26,6 +26,7 @@ class DeliveryProcessData(Base):
     dealer_id = Column(String(10), nullable=False, index=True)
     delivery_document_id = Column(String(100), nullable=True, index=True)
     tanggal_pengiriman = Column(String(50), nullable=True)
+    tanggal_pengiriman_date = Column(Date, nullable=True)  # Parsed from tanggal_pengiriman at ingest
     id_driver = Column(String(100), nullable=True)
     status_delivery_document = Column(String(10), nullable=True, index=True)
     created_time = Column(String(50), nullable=True)
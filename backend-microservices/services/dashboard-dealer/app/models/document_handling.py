@@ -7,7 +7,7 @@ from the dealer_integration schema.
 
 import os
 import sys
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Integer, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -32,6 +32,7 @@ class DocumentHandlingData(Base):
     id_spk = Column(String(100), nullable=True, index=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -51,14 +52,17 @@ class DocumentHandlingUnit(Base):
     nomor_rangka = Column(String(100), nullable=True, index=True)
     nomor_faktur_stnk = Column(String(100), nullable=True)
     tanggal_pengajuan_stnk_ke_biro = Column(String(50), nullable=True, index=True)
+    tanggal_pengajuan_stnk_ke_biro_date = Column(Date, nullable=True)  # Parsed from tanggal_pengajuan_stnk_ke_biro at ingest
     status_faktur_stnk = Column(String(10), nullable=True, index=True)
     nomor_stnk = Column(String(100), nullable=True)
     tanggal_penerimaan_stnk_dari_biro = Column(String(50), nullable=True)
     plat_nomor = Column(String(50), nullable=True)
     nomor_bpkb = Column(String(100), nullable=True)
     tanggal_penerimaan_bpkb_dari_biro = Column(String(50), nullable=True)
+    tanggal_penerimaan_bpkb_dari_biro_date = Column(Date, nullable=True)  # Parsed from tanggal_penerimaan_bpkb_dari_biro at ingest
     tanggal_terima_stnk_oleh_konsumen = Column(String(50), nullable=True)
     tanggal_terima_bpkb_oleh_konsumen = Column(String(50), nullable=True)
+    tanggal_terima_bpkb_oleh_konsumen_date = Column(Date, nullable=True)  # Parsed from tanggal_terima_bpkb_oleh_konsumen at ingest
     nama_penerima_bpkb = Column(String(255), nullable=True)
     nama_penerima_stnk = Column(String(255), nullable=True)
     jenis_id_penerima_bpkb = Column(String(10), nullable=True)
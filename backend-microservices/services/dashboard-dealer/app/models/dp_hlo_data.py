@@ -2,7 +2,7 @@
 DP HLO Data models for H23 dashboard
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Float, Numeric
+from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Float, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -23,6 +23,7 @@ class DPHLOData(Base):
     no_work_order = Column(String(100), nullable=True, index=True)
     id_customer = Column(String(100), nullable=True, index=True)
     created_time = Column(String(50), nullable=True)
+    created_date = Column(Date, nullable=True)  # Parsed from created_time at ingest
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
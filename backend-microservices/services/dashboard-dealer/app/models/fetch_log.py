@@ -0,0 +1,38 @@
+"""
+Fetch Log Model
+
+This module defines a read-only SQLAlchemy model for the ingest fetch logs
+written by the backend processors in the dealer_integration schema.
+"""
+
+import os
+import sys
+from sqlalchemy import Column, String, DateTime, Integer, Text
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from datetime import datetime
+
+# Add utils to path
+utils_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../utils'))
+if utils_path not in sys.path:
+    sys.path.append(utils_path)
+
+from utils.database import Base
+
+class FetchLog(Base):
+    """One processor run (dealer, fetch_type) and how many rows it changed"""
+    __tablename__ = "fetch_logs"
+    __table_args__ = {'schema': 'dealer_integration'}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    dealer_id = Column(String(10), nullable=False)
+    fetch_type = Column(String(50))
+    status = Column(String(20))  # success, failed, partial
+    records_fetched = Column(Integer, default=0)
+    records_changed = Column(Integer)  # NULL for runs logged before change tracking
+    error_message = Column(Text)
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<FetchLog(dealer_id={self.dealer_id}, fetch_type={self.fetch_type}, status={self.status}, completed_at={self.completed_at})>"
@@ -7,7 +7,7 @@ from the dealer_integration schema.
 
 import os
 import sys
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Integer, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -34,13 +34,17 @@ class LeasingData(Base):
     tenor = Column(Integer, nullable=True)
     jumlah_cicilan = Column(Numeric(15, 2), nullable=True)
     tanggal_pengajuan = Column(String(50), nullable=True, index=True)
+    tanggal_pengajuan_date = Column(Date, nullable=True)  # Parsed from tanggal_pengajuan at ingest
     id_finance_company = Column(String(100), nullable=True)
     nama_finance_company = Column(String(255), nullable=True, index=True)
     id_po_finance_company = Column(String(100), nullable=True, index=True)
     tanggal_pembuatan_po = Column(String(50), nullable=True)
+    tanggal_pembuatan_po_date = Column(Date, nullable=True)  # Parsed from tanggal_pembuatan_po at ingest
     tanggal_pengiriman_po_finance_company = Column(String(50), nullable=True)
+    tanggal_pengiriman_po_finance_company_date = Column(Date, nullable=True)  # Parsed from tanggal_pengiriman_po_finance_company at ingest
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
     def __repr__(self):
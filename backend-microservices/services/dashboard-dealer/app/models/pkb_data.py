@@ -4,7 +4,7 @@ PKB (Perintah Kerja Bengkel) Data Models for H23 Dashboard
 
 import os
 import sys
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Float, DateTime, Date, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -72,6 +72,7 @@ class PKBData(Base):
     waktu_pekerjaan = Column(String(20))
     status_work_order = Column(String(10))
     created_time = Column(String(50))
+    created_date = Column(Date, nullable=True)  # Parsed from created_time at ingest
     modified_time = Column(String(50))
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
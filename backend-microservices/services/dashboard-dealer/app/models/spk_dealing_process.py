@@ -7,7 +7,7 @@ from the dealer_integration schema.
 
 import os
 import sys
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Numeric
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Text, Integer, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -62,6 +62,7 @@ class SPKDealingProcessData(Base):
     id_sales_people = Column(String(50), nullable=True)
     id_event = Column(String(100), nullable=True)
     tanggal_pesanan = Column(String(50), nullable=True, index=True)
+    tanggal_pesanan_date = Column(Date, nullable=True)  # Parsed from tanggal_pesanan at ingest
     status_spk = Column(String(10), nullable=True, index=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
@@ -91,6 +92,7 @@ class SPKDealingProcessUnit(Base):
     tipe_pembayaran = Column(String(10), nullable=True)
     jumlah_tanda_jadi = Column(Numeric(15, 2), nullable=True)
     tanggal_pengiriman = Column(String(50), nullable=True, index=True)
+    tanggal_pengiriman_date = Column(Date, nullable=True)  # Parsed from tanggal_pengiriman at ingest
     id_sales_program = Column(Text, nullable=True)
     id_apparel = Column(Text, nullable=True)
     created_time = Column(String(50), nullable=True)
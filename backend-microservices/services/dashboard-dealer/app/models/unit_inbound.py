@@ -4,7 +4,7 @@ Unit Inbound Data models for dashboard-dealer service
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Numeric, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Text, Numeric, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -38,11 +38,13 @@ class UnitInboundData(Base):
     dealer_id = Column(String(10), ForeignKey("dealers.dealer_id"), nullable=False)
     no_shipping_list = Column(String(100), nullable=True)
     tanggal_terima = Column(String(50), nullable=True)
+    tanggal_terima_date = Column(Date, nullable=True)  # Parsed from tanggal_terima at ingest
     main_dealer_id = Column(String(10), nullable=True)
     no_invoice = Column(String(100), nullable=True)
     status_shipping_list = Column(String(10), nullable=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
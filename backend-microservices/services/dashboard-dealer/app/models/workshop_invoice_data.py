@@ -4,7 +4,7 @@ Workshop Invoice Data Models for H23 Dashboard
 
 import os
 import sys
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Numeric
+from sqlalchemy import Column, String, Integer, DateTime, Date, Text, ForeignKey, Numeric
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -34,6 +34,7 @@ class WorkshopInvoiceData(Base):
     honda_id_sa = Column(String(100), nullable=True)
     honda_id_mekanik = Column(String(100), nullable=True)
     created_time = Column(String(50), nullable=True)
+    created_date = Column(Date, nullable=True)  # Parsed from created_time at ingest
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
@@ -3,5 +3,6 @@ Repositories package for dashboard-dealer service
 """
 
 from .dashboard_repository import DashboardRepository
+from .dashboard_rollup_repository import DashboardRollupRepository
 
-__all__ = ["DashboardRepository"]
+__all__ = ["DashboardRepository", "DashboardRollupRepository"]
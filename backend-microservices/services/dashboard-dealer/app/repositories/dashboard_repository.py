@@ -5,18 +5,10 @@ Repository for dashboard data operations
 import os
 import sys
 from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, text, case
 
-# Import dateutil for date calculations
-try:
-    from dateutil.relativedelta import relativedelta
-    DATEUTIL_AVAILABLE = True
-except ImportError:
-    DATEUTIL_AVAILABLE = False
-    relativedelta = None
-
 # Add parent directory to path for utils import
 parent_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
 if parent_path not in sys.path:
@@ -32,6 +24,8 @@ from app.models.leasing_data import LeasingData
 from app.models.document_handling import DocumentHandlingData, DocumentHandlingUnit
 from app.schemas.dashboard import UnitInboundStatusItem, PaymentTypeItem, PaymentMethodItem, PaymentStatusItem, DeliveryProcessStatusItem, ProspectFollowUpItem, SPKStatusItem, TopLeasingItem, StatusProspectItem, MetodeFollowUpItem, SumberProspectItem, SebaranProspectItem, ProspectDataTableItem, TopDealingUnitItem, TopDriverItem, DeliveryLocationItem, DeliveryDataHistoryItem, SPKDealingProcessDataItem
 from app.utils.status_mapper import UnitInboundStatusMapper
+from app.utils.date_filter import date_between
+from app.utils.trend_query import count_with_previous_period, trend_summary
 
 logger = setup_logger(__name__)
 
@@ -73,21 +67,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     UnitInboundData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format (contains 4 digits at start)
-                        and_(
-                            UnitInboundData.tanggal_terima.op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                            UnitInboundData.tanggal_terima >= date_from,
-                            UnitInboundData.tanggal_terima <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format (contains / separators)
-                        and_(
-                            UnitInboundData.tanggal_terima.op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                            func.to_date(UnitInboundData.tanggal_terima, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(UnitInboundData.tanggal_terima, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(UnitInboundData.tanggal_terima_date, date_from, date_to)
                 )
             ).group_by(UnitInboundData.status_shipping_list)
 
@@ -130,21 +110,7 @@ class DashboardRepository:
             total = self.db.query(func.count(UnitInboundData.id)).filter(
                 and_(
                     UnitInboundData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format (contains 4 digits at start)
-                        and_(
-                            UnitInboundData.tanggal_terima.op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                            UnitInboundData.tanggal_terima >= date_from,
-                            UnitInboundData.tanggal_terima <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format (contains / separators)
-                        and_(
-                            UnitInboundData.tanggal_terima.op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                            func.to_date(UnitInboundData.tanggal_terima, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(UnitInboundData.tanggal_terima, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(UnitInboundData.tanggal_terima_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -183,21 +149,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format (contains 4 digits at start)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            BillingProcessData.modified_time >= date_from,
-                            BillingProcessData.modified_time <= date_to + ' 23:59:59'
-                        ),
-                        # Handle DD/MM/YYYY format (contains / separators)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(BillingProcessData.modified_date, date_from, date_to)
                 )
             ).group_by(BillingProcessData.tipe_pembayaran)
 
@@ -240,21 +192,7 @@ class DashboardRepository:
             total = self.db.query(func.count(BillingProcessData.id)).filter(
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format (contains 4 digits at start)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            BillingProcessData.modified_time >= date_from,
-                            BillingProcessData.modified_time <= date_to + ' 23:59:59'
-                        ),
-                        # Handle DD/MM/YYYY format (contains / separators)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(BillingProcessData.modified_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -284,21 +222,7 @@ class DashboardRepository:
             total = self.db.query(func.sum(BillingProcessData.amount)).filter(
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format (contains 4 digits at start)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            BillingProcessData.modified_time >= date_from,
-                            BillingProcessData.modified_time <= date_to + ' 23:59:59'
-                        ),
-                        # Handle DD/MM/YYYY format (contains / separators)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(BillingProcessData.modified_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -337,21 +261,7 @@ class DashboardRepository:
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
                     BillingProcessData.cara_bayar.isnot(None),  # Exclude null payment methods
-                    # Use regex to detect format and handle accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format (contains 4 digits at start)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            BillingProcessData.modified_time >= date_from,
-                            BillingProcessData.modified_time <= date_to + ' 23:59:59'
-                        ),
-                        # Handle DD/MM/YYYY format (contains / separators)
-                        and_(
-                            BillingProcessData.modified_time.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(BillingProcessData.modified_time, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(BillingProcessData.modified_date, date_from, date_to)
                 )
             ).group_by(BillingProcessData.cara_bayar)
 
@@ -413,29 +323,7 @@ class DashboardRepository:
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
                     BillingProcessData.status.isnot(None),
-                    # Date conversion logic for both YYYY-MM-DD and DD/MM/YYYY formats
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            func.length(BillingProcessData.modified_time) >= 10,
-                            func.substring(BillingProcessData.modified_time, 5, 1) == '-',
-                            func.substring(BillingProcessData.modified_time, 8, 1) == '-',
-                            func.to_date(func.substring(BillingProcessData.modified_time, 1, 10), 'YYYY-MM-DD').between(
-                                func.to_date(date_from, 'YYYY-MM-DD'),
-                                func.to_date(date_to, 'YYYY-MM-DD')
-                            )
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            func.length(BillingProcessData.modified_time) >= 10,
-                            func.substring(BillingProcessData.modified_time, 3, 1) == '/',
-                            func.substring(BillingProcessData.modified_time, 6, 1) == '/',
-                            func.to_date(func.substring(BillingProcessData.modified_time, 1, 10), 'DD/MM/YYYY').between(
-                                func.to_date(date_from, 'YYYY-MM-DD'),
-                                func.to_date(date_to, 'YYYY-MM-DD')
-                            )
-                        )
-                    )
+                    date_between(BillingProcessData.modified_date, date_from, date_to)
                 )
             ).group_by(BillingProcessData.status)
 
@@ -488,28 +376,7 @@ class DashboardRepository:
             Dictionary with total_revenue and total_records
         """
         try:
-            # Build date filter conditions for both YYYY-MM-DD and DD/MM/YYYY formats
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(BillingProcessData.modified_time) >= 10,
-                    func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(BillingProcessData.modified_time) >= 10,
-                    func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(BillingProcessData.modified_date, date_from, date_to)
 
             # Get total revenue
             revenue_query = self.db.query(
@@ -518,7 +385,7 @@ class DashboardRepository:
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
                     BillingProcessData.amount.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -531,7 +398,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -594,28 +461,7 @@ class DashboardRepository:
                 '2': 'Cash'
             }
 
-            # Build date filter conditions for modified_time string field (same pattern as payment revenue)
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(BillingProcessData.modified_time) >= 10,
-                    func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(BillingProcessData.modified_time) >= 10,
-                    func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(BillingProcessData.modified_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(BillingProcessData.modified_date, date_from, date_to)
 
             # Build the main query joining BillingProcessData with DeliveryProcessDetail on id_spk
             base_query = self.db.query(BillingProcessData).outerjoin(
@@ -624,7 +470,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -704,34 +550,13 @@ class DashboardRepository:
         try:
             logger.info(f"Getting leasing data history for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}, page={page}, per_page={per_page}")
 
-            # Build date filter conditions for modified_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(LeasingData.modified_time) >= 10,
-                    func.substr(LeasingData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(LeasingData.modified_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(LeasingData.modified_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(LeasingData.modified_time) >= 10,
-                    func.substr(LeasingData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(LeasingData.modified_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(LeasingData.modified_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(LeasingData.modified_date, date_from, date_to)
 
             # Build the main query for leasing data
             base_query = self.db.query(LeasingData).filter(
                 and_(
                     LeasingData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -807,28 +632,7 @@ class DashboardRepository:
         try:
             logger.info(f"Getting document handling data history for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}, page={page}, per_page={per_page}")
 
-            # Build date filter conditions for modified_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(DocumentHandlingData.modified_time) >= 10,
-                    func.substr(DocumentHandlingData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(DocumentHandlingData.modified_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(DocumentHandlingData.modified_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(DocumentHandlingData.modified_time) >= 10,
-                    func.substr(DocumentHandlingData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(DocumentHandlingData.modified_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(DocumentHandlingData.modified_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(DocumentHandlingData.modified_date, date_from, date_to)
 
             # Build the main query joining DocumentHandlingData with DocumentHandlingUnit
             base_query = self.db.query(DocumentHandlingData).outerjoin(
@@ -837,7 +641,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     DocumentHandlingData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -921,28 +725,7 @@ class DashboardRepository:
         try:
             logger.info(f"Getting unit inbound data history for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}, page={page}, per_page={per_page}")
 
-            # Build date filter conditions for modified_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(UnitInboundData.modified_time) >= 10,
-                    func.substr(UnitInboundData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(UnitInboundData.modified_time) >= 10,
-                    func.substr(UnitInboundData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(UnitInboundData.modified_date, date_from, date_to)
 
             # Build the main query joining UnitInboundData with UnitInboundUnit
             base_query = self.db.query(UnitInboundData).outerjoin(
@@ -951,7 +734,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     UnitInboundData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -1035,28 +818,7 @@ class DashboardRepository:
         try:
             logger.info(f"Getting top penerimaan unit for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Build date filter conditions for modified_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(UnitInboundData.modified_time) >= 10,
-                    func.substr(UnitInboundData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(UnitInboundData.modified_time) >= 10,
-                    func.substr(UnitInboundData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(UnitInboundData.modified_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(UnitInboundData.modified_date, date_from, date_to)
 
             # Build query to get top units by total quantity received
             # Join UnitInboundData with UnitInboundUnit, group by kode_tipe_unit and kode_warna
@@ -1070,7 +832,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     UnitInboundData.dealer_id == dealer_id,
-                    or_(*date_conditions),
+                    date_filter,
                     UnitInboundUnit.kuantitas_diterima.isnot(None),
                     UnitInboundUnit.kuantitas_diterima > 0
                 )
@@ -1135,34 +897,12 @@ class DashboardRepository:
         try:
             logger.info(f"Getting PO document status counts for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Build date filter conditions for multiple date fields (all string type)
-            date_conditions = []
-
-            # For each date field, check both YYYY-MM-DD and DD/MM/YYYY formats
-            date_fields = ['tanggal_pengiriman_po_finance_company', 'tanggal_pembuatan_po', 'tanggal_pengajuan']
-
-            for field in date_fields:
-                field_attr = getattr(LeasingData, field)
-
-                # YYYY-MM-DD format conditions
-                date_conditions.append(
-                    and_(
-                        func.length(field_attr) >= 10,
-                        func.substr(field_attr, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                        func.to_date(func.substr(field_attr, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(field_attr, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                    )
-                )
-
-                # DD/MM/YYYY format conditions
-                date_conditions.append(
-                    and_(
-                        func.length(field_attr) >= 10,
-                        func.substr(field_attr, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                        func.to_date(func.substr(field_attr, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(field_attr, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                    )
-                )
+            # Match if any of the PO dates falls in range
+            date_fields = ['tanggal_pengiriman_po_finance_company_date', 'tanggal_pembuatan_po_date', 'tanggal_pengajuan_date']
+            date_conditions = [
+                date_between(getattr(LeasingData, field), date_from, date_to)
+                for field in date_fields
+            ]
 
             # Build query with CASE logic for status determination
             # Priority: tanggal_pengiriman_po_finance_company > tanggal_pembuatan_po > tanggal_pengajuan
@@ -1258,37 +998,11 @@ class DashboardRepository:
         try:
             logger.info(f"Getting revenue trend data for dealer_id={dealer_id}, year={current_year}")
 
-            # Build date filter conditions for current year (string type modified_time)
-            date_conditions = []
-
-            # YYYY-MM-DD format conditions for current year
-            date_conditions.append(
-                and_(
-                    func.length(BillingProcessData.modified_time) >= 10,
-                    func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.substr(BillingProcessData.modified_time, 1, 4) == current_year
-                )
-            )
-
-            # DD/MM/YYYY format conditions for current year
-            date_conditions.append(
-                and_(
-                    func.length(BillingProcessData.modified_time) >= 10,
-                    func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.substr(BillingProcessData.modified_time, 7, 4) == current_year
-                )
-            )
+            # Current year on the typed date column
+            date_filter = date_between(BillingProcessData.modified_date, f"{current_year}-01-01", f"{current_year}-12-31")
 
-            # Extract month from modified_time for both date formats
-            month_case_yyyy_mm_dd = func.substr(BillingProcessData.modified_time, 6, 2)
-            month_case_dd_mm_yyyy = func.substr(BillingProcessData.modified_time, 4, 2)
-
-            # Determine which format to use based on the string pattern
-            month_extract = case(
-                (func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'), month_case_yyyy_mm_dd),
-                (func.substr(BillingProcessData.modified_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'), month_case_dd_mm_yyyy),
-                else_='00'
-            ).label('month_num')
+            # Month number ('01'..'12') from modified_time
+            month_extract = func.to_char(BillingProcessData.modified_date, 'MM').label('month_num')
 
             # Query to sum amount by month
             query = self.db.query(
@@ -1297,7 +1011,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     BillingProcessData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             ).group_by(month_extract).order_by(month_extract)
 
@@ -1365,37 +1079,11 @@ class DashboardRepository:
         try:
             logger.info(f"Getting PO creation monthly data for dealer_id={dealer_id}, year={current_year}")
 
-            # Build date filter conditions for current year (string type tanggal_pembuatan_po)
-            date_conditions = []
-
-            # YYYY-MM-DD format conditions for current year
-            date_conditions.append(
-                and_(
-                    func.length(LeasingData.tanggal_pembuatan_po) >= 10,
-                    func.substr(LeasingData.tanggal_pembuatan_po, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.substr(LeasingData.tanggal_pembuatan_po, 1, 4) == current_year
-                )
-            )
-
-            # DD/MM/YYYY format conditions for current year
-            date_conditions.append(
-                and_(
-                    func.length(LeasingData.tanggal_pembuatan_po) >= 10,
-                    func.substr(LeasingData.tanggal_pembuatan_po, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.substr(LeasingData.tanggal_pembuatan_po, 7, 4) == current_year
-                )
-            )
-
-            # Extract month from tanggal_pembuatan_po for both date formats
-            month_case_yyyy_mm_dd = func.substr(LeasingData.tanggal_pembuatan_po, 6, 2)
-            month_case_dd_mm_yyyy = func.substr(LeasingData.tanggal_pembuatan_po, 4, 2)
+            # Current year on the typed date column
+            date_filter = date_between(LeasingData.tanggal_pembuatan_po_date, f"{current_year}-01-01", f"{current_year}-12-31")
 
-            # Determine which format to use based on the string pattern
-            month_extract = case(
-                (func.substr(LeasingData.tanggal_pembuatan_po, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'), month_case_yyyy_mm_dd),
-                (func.substr(LeasingData.tanggal_pembuatan_po, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'), month_case_dd_mm_yyyy),
-                else_='00'
-            ).label('month_num')
+            # Month number ('01'..'12') from tanggal_pembuatan_po
+            month_extract = func.to_char(LeasingData.tanggal_pembuatan_po_date, 'MM').label('month_num')
 
             # Query to count id_po_finance_company by month
             query = self.db.query(
@@ -1405,7 +1093,7 @@ class DashboardRepository:
                 and_(
                     LeasingData.dealer_id == dealer_id,
                     LeasingData.id_po_finance_company.isnot(None),  # Only count records with PO finance company ID
-                    or_(*date_conditions)
+                    date_filter
                 )
             ).group_by(month_extract).order_by(month_extract)
 
@@ -1473,107 +1161,25 @@ class DashboardRepository:
         try:
             logger.info(f"Getting Permohonan Faktur count with trend for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Helper function to build date filter conditions
-            def build_date_conditions(date_from_str: str, date_to_str: str):
-                return or_(
-                    # Handle YYYY-MM-DD format
-                    and_(
-                        func.length(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro) >= 10,
-                        func.substr(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    ),
-                    # Handle DD/MM/YYYY format
-                    and_(
-                        func.length(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro) >= 10,
-                        func.substr(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    )
-                )
-
-            # Get current period count
-            current_conditions = build_date_conditions(date_from, date_to)
-
-            current_query = self.db.query(
-                func.count(DocumentHandlingUnit.id).label('count')
-            ).join(
-                DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id
-            ).filter(
-                and_(
+            # Current and previous period (minus 1 month) in one scan
+            current_count, prev_count = count_with_previous_period(
+                self.db,
+                source=DocumentHandlingUnit,
+                counted=DocumentHandlingUnit.id,
+                date_column=DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro_date,
+                date_from=date_from,
+                date_to=date_to,
+                conditions=(
                     DocumentHandlingData.dealer_id == dealer_id,
-                    DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.isnot(None),
-                    current_conditions
-                )
+                    DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.isnot(None)
+                ),
+                join=(DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id)
             )
 
-            current_result = current_query.first()
-            current_count = int(current_result.count or 0) if current_result else 0
-
-            # Calculate previous period dates (minus 1 month)
-            try:
-                if not DATEUTIL_AVAILABLE:
-                    raise ImportError("python-dateutil not available")
-
-                date_from_obj = datetime.strptime(date_from[:10], '%Y-%m-%d')
-                date_to_obj = datetime.strptime(date_to[:10], '%Y-%m-%d')
+            result = trend_summary(current_count, prev_count)
+            logger.info(f"Permohonan Faktur count: current={current_count}, previous={prev_count}, trend={result['trend']}, percentage={result['percentage']}")
 
-                # Subtract 1 month from both dates
-                prev_date_from_obj = date_from_obj - relativedelta(months=1)
-                prev_date_to_obj = date_to_obj - relativedelta(months=1)
-
-                prev_date_from = prev_date_from_obj.strftime('%Y-%m-%d')
-                prev_date_to = prev_date_to_obj.strftime('%Y-%m-%d')
-
-                # Get previous period count
-                prev_conditions = build_date_conditions(prev_date_from, prev_date_to)
-
-                prev_query = self.db.query(
-                    func.count(DocumentHandlingUnit.id).label('count')
-                ).join(
-                    DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id
-                ).filter(
-                    and_(
-                        DocumentHandlingData.dealer_id == dealer_id,
-                        DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.isnot(None),
-                        prev_conditions
-                    )
-                )
-
-                prev_result = prev_query.first()
-                prev_count = int(prev_result.count or 0) if prev_result else 0
-
-            except Exception as e:
-                logger.warning(f"Error calculating previous period: {e}")
-                prev_count = 0
-
-            # Calculate trend and percentage
-            if prev_count == 0:
-                if current_count > 0:
-                    trend = 'up'
-                    percentage = 100.0
-                else:
-                    trend = 'stable'
-                    percentage = 0.0
-            else:
-                percentage_change = ((current_count - prev_count) / prev_count) * 100
-                percentage = round(abs(percentage_change), 1)
-
-                if percentage_change > 0:
-                    trend = 'up'
-                elif percentage_change < 0:
-                    trend = 'down'
-                else:
-                    trend = 'stable'
-
-            logger.info(f"Permohonan Faktur count: current={current_count}, previous={prev_count}, trend={trend}, percentage={percentage}")
-
-            return {
-                'count': current_count,
-                'previous_count': prev_count,
-                'trend': trend,
-                'percentage': percentage
-            }
+            return result
 
         except Exception as e:
             logger.error(f"Error getting Permohonan Faktur count with trend: {e}")
@@ -1605,107 +1211,25 @@ class DashboardRepository:
         try:
             logger.info(f"Getting STNK Diterima count with trend for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Helper function to build date filter conditions
-            def build_date_conditions(date_from_str: str, date_to_str: str):
-                return or_(
-                    # Handle YYYY-MM-DD format
-                    and_(
-                        func.length(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro) >= 10,
-                        func.substr(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    ),
-                    # Handle DD/MM/YYYY format
-                    and_(
-                        func.length(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro) >= 10,
-                        func.substr(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    )
-                )
-
-            # Get current period count
-            current_conditions = build_date_conditions(date_from, date_to)
-
-            current_query = self.db.query(
-                func.count(DocumentHandlingUnit.id).label('count')
-            ).join(
-                DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id
-            ).filter(
-                and_(
+            # Current and previous period (minus 1 month) in one scan
+            current_count, prev_count = count_with_previous_period(
+                self.db,
+                source=DocumentHandlingUnit,
+                counted=DocumentHandlingUnit.id,
+                date_column=DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro_date,
+                date_from=date_from,
+                date_to=date_to,
+                conditions=(
                     DocumentHandlingData.dealer_id == dealer_id,
-                    DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro.isnot(None),
-                    current_conditions
-                )
+                    DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro.isnot(None)
+                ),
+                join=(DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id)
             )
 
-            current_result = current_query.first()
-            current_count = int(current_result.count or 0) if current_result else 0
-
-            # Calculate previous period dates (minus 1 month)
-            try:
-                if not DATEUTIL_AVAILABLE:
-                    raise ImportError("python-dateutil not available")
-
-                date_from_obj = datetime.strptime(date_from[:10], '%Y-%m-%d')
-                date_to_obj = datetime.strptime(date_to[:10], '%Y-%m-%d')
-
-                # Subtract 1 month from both dates
-                prev_date_from_obj = date_from_obj - relativedelta(months=1)
-                prev_date_to_obj = date_to_obj - relativedelta(months=1)
-
-                prev_date_from = prev_date_from_obj.strftime('%Y-%m-%d')
-                prev_date_to = prev_date_to_obj.strftime('%Y-%m-%d')
-
-                # Get previous period count
-                prev_conditions = build_date_conditions(prev_date_from, prev_date_to)
+            result = trend_summary(current_count, prev_count)
+            logger.info(f"STNK Diterima count: current={current_count}, previous={prev_count}, trend={result['trend']}, percentage={result['percentage']}")
 
-                prev_query = self.db.query(
-                    func.count(DocumentHandlingUnit.id).label('count')
-                ).join(
-                    DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id
-                ).filter(
-                    and_(
-                        DocumentHandlingData.dealer_id == dealer_id,
-                        DocumentHandlingUnit.tanggal_penerimaan_bpkb_dari_biro.isnot(None),
-                        prev_conditions
-                    )
-                )
-
-                prev_result = prev_query.first()
-                prev_count = int(prev_result.count or 0) if prev_result else 0
-
-            except Exception as e:
-                logger.warning(f"Error calculating previous period: {e}")
-                prev_count = 0
-
-            # Calculate trend and percentage
-            if prev_count == 0:
-                if current_count > 0:
-                    trend = 'up'
-                    percentage = 100.0
-                else:
-                    trend = 'stable'
-                    percentage = 0.0
-            else:
-                percentage_change = ((current_count - prev_count) / prev_count) * 100
-                percentage = round(abs(percentage_change), 1)
-
-                if percentage_change > 0:
-                    trend = 'up'
-                elif percentage_change < 0:
-                    trend = 'down'
-                else:
-                    trend = 'stable'
-
-            logger.info(f"STNK Diterima count: current={current_count}, previous={prev_count}, trend={trend}, percentage={percentage}")
-
-            return {
-                'count': current_count,
-                'previous_count': prev_count,
-                'trend': trend,
-                'percentage': percentage
-            }
+            return result
 
         except Exception as e:
             logger.error(f"Error getting STNK Diterima count with trend: {e}")
@@ -1737,107 +1261,25 @@ class DashboardRepository:
         try:
             logger.info(f"Getting BPKB Diterima count with trend for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Helper function to build date filter conditions
-            def build_date_conditions(date_from_str: str, date_to_str: str):
-                return or_(
-                    # Handle YYYY-MM-DD format
-                    and_(
-                        func.length(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen) >= 10,
-                        func.substr(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    ),
-                    # Handle DD/MM/YYYY format
-                    and_(
-                        func.length(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen) >= 10,
-                        func.substr(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    )
-                )
-
-            # Get current period count
-            current_conditions = build_date_conditions(date_from, date_to)
-
-            current_query = self.db.query(
-                func.count(DocumentHandlingUnit.id).label('count')
-            ).join(
-                DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id
-            ).filter(
-                and_(
+            # Current and previous period (minus 1 month) in one scan
+            current_count, prev_count = count_with_previous_period(
+                self.db,
+                source=DocumentHandlingUnit,
+                counted=DocumentHandlingUnit.id,
+                date_column=DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen_date,
+                date_from=date_from,
+                date_to=date_to,
+                conditions=(
                     DocumentHandlingData.dealer_id == dealer_id,
-                    DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen.isnot(None),
-                    current_conditions
-                )
+                    DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen.isnot(None)
+                ),
+                join=(DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id)
             )
 
-            current_result = current_query.first()
-            current_count = int(current_result.count or 0) if current_result else 0
-
-            # Calculate previous period dates (minus 1 month)
-            try:
-                if not DATEUTIL_AVAILABLE:
-                    raise ImportError("python-dateutil not available")
-
-                date_from_obj = datetime.strptime(date_from[:10], '%Y-%m-%d')
-                date_to_obj = datetime.strptime(date_to[:10], '%Y-%m-%d')
-
-                # Subtract 1 month from both dates
-                prev_date_from_obj = date_from_obj - relativedelta(months=1)
-                prev_date_to_obj = date_to_obj - relativedelta(months=1)
-
-                prev_date_from = prev_date_from_obj.strftime('%Y-%m-%d')
-                prev_date_to = prev_date_to_obj.strftime('%Y-%m-%d')
-
-                # Get previous period count
-                prev_conditions = build_date_conditions(prev_date_from, prev_date_to)
-
-                prev_query = self.db.query(
-                    func.count(DocumentHandlingUnit.id).label('count')
-                ).join(
-                    DocumentHandlingData, DocumentHandlingUnit.document_handling_data_id == DocumentHandlingData.id
-                ).filter(
-                    and_(
-                        DocumentHandlingData.dealer_id == dealer_id,
-                        DocumentHandlingUnit.tanggal_terima_bpkb_oleh_konsumen.isnot(None),
-                        prev_conditions
-                    )
-                )
-
-                prev_result = prev_query.first()
-                prev_count = int(prev_result.count or 0) if prev_result else 0
-
-            except Exception as e:
-                logger.warning(f"Error calculating previous period: {e}")
-                prev_count = 0
-
-            # Calculate trend and percentage
-            if prev_count == 0:
-                if current_count > 0:
-                    trend = 'up'
-                    percentage = 100.0
-                else:
-                    trend = 'stable'
-                    percentage = 0.0
-            else:
-                percentage_change = ((current_count - prev_count) / prev_count) * 100
-                percentage = round(abs(percentage_change), 1)
-
-                if percentage_change > 0:
-                    trend = 'up'
-                elif percentage_change < 0:
-                    trend = 'down'
-                else:
-                    trend = 'stable'
-
-            logger.info(f"BPKB Diterima count: current={current_count}, previous={prev_count}, trend={trend}, percentage={percentage}")
+            result = trend_summary(current_count, prev_count)
+            logger.info(f"BPKB Diterima count: current={current_count}, previous={prev_count}, trend={result['trend']}, percentage={result['percentage']}")
 
-            return {
-                'count': current_count,
-                'previous_count': prev_count,
-                'trend': trend,
-                'percentage': percentage
-            }
+            return result
 
         except Exception as e:
             logger.error(f"Error getting BPKB Diterima count with trend: {e}")
@@ -1882,8 +1324,7 @@ class DashboardRepository:
                 func.count(DeliveryProcessData.id).label('count')
             ).filter(
                 DeliveryProcessData.dealer_id == dealer_id,
-                func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= date_from,
-                func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= date_to
+                date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
             ).group_by(DeliveryProcessData.status_delivery_document)
 
             result = query.all()
@@ -1928,8 +1369,7 @@ class DashboardRepository:
         try:
             total = self.db.query(func.count(DeliveryProcessData.id)).filter(
                 DeliveryProcessData.dealer_id == dealer_id,
-                func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= date_from,
-                func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= date_to
+                date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
             ).scalar()
 
             return total or 0
@@ -2067,27 +1507,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     SPKDealingProcessData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle date conversion accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            SPKDealingProcessData.tanggal_pesanan.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            SPKDealingProcessData.tanggal_pesanan >= date_from,
-                            SPKDealingProcessData.tanggal_pesanan <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            SPKDealingProcessData.tanggal_pesanan.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(SPKDealingProcessData.tanggal_pesanan, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessData.tanggal_pesanan, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (with time)
-                        and_(
-                            SPKDealingProcessData.tanggal_pesanan.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(SPKDealingProcessData.tanggal_pesanan, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(SPKDealingProcessData.tanggal_pesanan, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(SPKDealingProcessData.tanggal_pesanan_date, date_from, date_to)
                 )
             ).group_by(SPKDealingProcessData.status_spk)
 
@@ -2132,27 +1552,7 @@ class DashboardRepository:
             total = self.db.query(func.count(SPKDealingProcessData.id)).filter(
                 and_(
                     SPKDealingProcessData.dealer_id == dealer_id,
-                    # Use regex to detect format and handle date conversion accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            SPKDealingProcessData.tanggal_pesanan.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            SPKDealingProcessData.tanggal_pesanan >= date_from,
-                            SPKDealingProcessData.tanggal_pesanan <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            SPKDealingProcessData.tanggal_pesanan.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(SPKDealingProcessData.tanggal_pesanan, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessData.tanggal_pesanan, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (with time)
-                        and_(
-                            SPKDealingProcessData.tanggal_pesanan.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(SPKDealingProcessData.tanggal_pesanan, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(SPKDealingProcessData.tanggal_pesanan, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(SPKDealingProcessData.tanggal_pesanan_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -2192,27 +1592,7 @@ class DashboardRepository:
                     LeasingData.dealer_id == dealer_id,
                     LeasingData.nama_finance_company.isnot(None),  # Exclude null company names
                     LeasingData.id_po_finance_company.isnot(None),  # Exclude null PO finance company IDs
-                    # Use regex to detect format and handle date conversion accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            LeasingData.tanggal_pengajuan.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            LeasingData.tanggal_pengajuan >= date_from,
-                            LeasingData.tanggal_pengajuan <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            LeasingData.tanggal_pengajuan.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(LeasingData.tanggal_pengajuan, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(LeasingData.tanggal_pengajuan, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (with time)
-                        and_(
-                            LeasingData.tanggal_pengajuan.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(LeasingData.tanggal_pengajuan, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(LeasingData.tanggal_pengajuan, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(LeasingData.tanggal_pengajuan_date, date_from, date_to)
                 )
             ).group_by(LeasingData.nama_finance_company).order_by(func.count(LeasingData.id_po_finance_company).desc()).limit(5)
 
@@ -2256,27 +1636,7 @@ class DashboardRepository:
                     LeasingData.dealer_id == dealer_id,
                     LeasingData.nama_finance_company.isnot(None),  # Exclude null company names
                     LeasingData.id_po_finance_company.isnot(None),  # Exclude null PO finance company IDs
-                    # Use regex to detect format and handle date conversion accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            LeasingData.tanggal_pengajuan.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            LeasingData.tanggal_pengajuan >= date_from,
-                            LeasingData.tanggal_pengajuan <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            LeasingData.tanggal_pengajuan.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(LeasingData.tanggal_pengajuan, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(LeasingData.tanggal_pengajuan, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (with time)
-                        and_(
-                            LeasingData.tanggal_pengajuan.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(LeasingData.tanggal_pengajuan, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(LeasingData.tanggal_pengajuan, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(LeasingData.tanggal_pengajuan_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -2316,27 +1676,7 @@ class DashboardRepository:
                     DocumentHandlingData.id_spk.isnot(None),  # Ensure id_spk is not null
                     DocumentHandlingUnit.status_faktur_stnk == '1',  # Filter by status_faktur_stnk == 1
                     DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.isnot(None),  # Ensure date field is not null
-                    # Use regex to detect format and handle date conversion accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro >= date_from,
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (with time)
-                        and_(
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro_date, date_from, date_to)
                 )
             )
 
@@ -2375,27 +1715,7 @@ class DashboardRepository:
                     DocumentHandlingData.dealer_id == dealer_id,
                     DocumentHandlingData.id_spk.isnot(None),  # Ensure id_spk is not null
                     DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.isnot(None),  # Ensure date field is not null
-                    # Use regex to detect format and handle date conversion accordingly
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro >= date_from,
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (with time)
-                        and_(
-                            DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DocumentHandlingUnit.tanggal_pengajuan_stnk_ke_biro_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -2914,27 +2234,7 @@ class DashboardRepository:
                     SPKDealingProcessData.dealer_id == dealer_id,
                     SPKDealingProcessUnit.kode_tipe_unit.isnot(None),  # Exclude null unit codes
                     SPKDealingProcessUnit.quantity.isnot(None),  # Exclude null quantities
-                    # Handle string date conversion for tanggal_pengiriman
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH24:MI:SS format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(SPKDealingProcessUnit.tanggal_pengiriman_date, date_from, date_to)
                 )
             ).group_by(
                 SPKDealingProcessUnit.kode_tipe_unit
@@ -2987,26 +2287,7 @@ class DashboardRepository:
             ).filter(
                 and_(
                     SPKDealingProcessData.dealer_id == dealer_id,
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH24:MI:SS format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(SPKDealingProcessUnit.tanggal_pengiriman_date, date_from, date_to)
                 )
             ).scalar()
 
@@ -3048,27 +2329,7 @@ class DashboardRepository:
                 and_(
                     SPKDealingProcessData.dealer_id == dealer_id,
                     SPKDealingProcessUnit.harga_jual.isnot(None),  # Exclude null prices
-                    # Handle string date conversion for tanggal_pengiriman
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle YYYY-MM-DD HH24:MI:SS format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.date(func.to_timestamp(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD HH24:MI:SS')) >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.date(func.to_timestamp(SPKDealingProcessUnit.tanggal_pengiriman, 'YYYY-MM-DD HH24:MI:SS')) <= func.to_date(date_to, 'YYYY-MM-DD')
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            SPKDealingProcessUnit.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(SPKDealingProcessUnit.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(SPKDealingProcessUnit.tanggal_pengiriman_date, date_from, date_to)
                 )
             )
 
@@ -3119,27 +2380,7 @@ class DashboardRepository:
                     DeliveryProcessData.id_driver.isnot(None),  # Exclude null drivers
                     DeliveryProcessData.id_driver != '',  # Exclude empty drivers
                     DeliveryProcessDetail.id_spk.isnot(None),  # Only count valid SPK IDs
-                    # Handle string date conversion for tanggal_pengiriman
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DeliveryProcessData.tanggal_pengiriman >= date_from,
-                            DeliveryProcessData.tanggal_pengiriman <= date_to
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (extract date part)
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) >= date_from,
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
                 )
             ).group_by(
                 DeliveryProcessData.id_driver
@@ -3198,27 +2439,7 @@ class DashboardRepository:
                     DeliveryProcessData.id_driver.isnot(None),
                     DeliveryProcessData.id_driver != '',
                     DeliveryProcessDetail.id_spk.isnot(None),
-                    # Handle string date conversion for tanggal_pengiriman
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DeliveryProcessData.tanggal_pengiriman >= date_from,
-                            DeliveryProcessData.tanggal_pengiriman <= date_to
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (extract date part)
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) >= date_from,
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
                 )
             )
             
@@ -3264,27 +2485,7 @@ class DashboardRepository:
                     DeliveryProcessData.dealer_id == dealer_id,
                     DeliveryProcessDetail.lokasi_pengiriman.isnot(None),  # Exclude null locations
                     DeliveryProcessDetail.lokasi_pengiriman != '',  # Exclude empty locations
-                    # Handle string date conversion for tanggal_pengiriman
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DeliveryProcessData.tanggal_pengiriman >= date_from,
-                            DeliveryProcessData.tanggal_pengiriman <= date_to
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (extract date part)
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) >= date_from,
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
                 )
             ).group_by(
                 DeliveryProcessDetail.lokasi_pengiriman
@@ -3307,24 +2508,7 @@ class DashboardRepository:
                     DeliveryProcessData.dealer_id == dealer_id,
                     DeliveryProcessDetail.lokasi_pengiriman.isnot(None),
                     DeliveryProcessDetail.lokasi_pengiriman != '',
-                    # Same date filtering logic
-                    or_(
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DeliveryProcessData.tanggal_pengiriman >= date_from,
-                            DeliveryProcessData.tanggal_pengiriman <= date_to
-                        ),
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) >= date_from,
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) <= date_to
-                        ),
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
                 )
             )
 
@@ -3382,27 +2566,7 @@ class DashboardRepository:
                     DeliveryProcessData.dealer_id == dealer_id,
                     DeliveryProcessDetail.lokasi_pengiriman.isnot(None),
                     DeliveryProcessDetail.lokasi_pengiriman != '',
-                    # Handle string date conversion for tanggal_pengiriman
-                    or_(
-                        # Handle YYYY-MM-DD format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                            DeliveryProcessData.tanggal_pengiriman >= date_from,
-                            DeliveryProcessData.tanggal_pengiriman <= date_to
-                        ),
-                        # Handle YYYY-MM-DD HH:MI:SS format (extract date part)
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) >= date_from,
-                            func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) <= date_to
-                        ),
-                        # Handle DD/MM/YYYY format
-                        and_(
-                            DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                            func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                        )
-                    )
+                    date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
                 )
             )
             
@@ -3476,27 +2640,7 @@ class DashboardRepository:
             # Build filter conditions
             filter_conditions = [
                 DeliveryProcessData.dealer_id == dealer_id,
-                # Handle string date conversion for tanggal_pengiriman date range
-                or_(
-                    # Handle YYYY-MM-DD format
-                    and_(
-                        DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2}'),
-                        DeliveryProcessData.tanggal_pengiriman >= date_from,
-                        DeliveryProcessData.tanggal_pengiriman <= date_to
-                    ),
-                    # Handle YYYY-MM-DD HH:MI:SS format (extract date part)
-                    and_(
-                        DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
-                        func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) >= date_from,
-                        func.substring(DeliveryProcessData.tanggal_pengiriman, 1, 10) <= date_to
-                    ),
-                    # Handle DD/MM/YYYY format
-                    and_(
-                        DeliveryProcessData.tanggal_pengiriman.op('~')(r'^\d{2}/\d{2}/\d{4}'),
-                        func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                        func.to_date(DeliveryProcessData.tanggal_pengiriman, 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                    )
-                )
+                date_between(DeliveryProcessData.tanggal_pengiriman_date, date_from, date_to)
             ]
 
             # Add optional filters
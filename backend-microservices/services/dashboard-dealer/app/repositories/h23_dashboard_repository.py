@@ -5,17 +5,9 @@ Repository for H23 dashboard data operations
 import os
 import sys
 from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, text, case
-
-# Import dateutil for date calculations
-try:
-    from dateutil.relativedelta import relativedelta
-    DATEUTIL_AVAILABLE = True
-except ImportError:
-    DATEUTIL_AVAILABLE = False
-    relativedelta = None
+from sqlalchemy import func, and_, text, case
 
 # Add parent directory to path for utils import
 parent_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
@@ -27,6 +19,8 @@ from app.models.pkb_data import PKBData
 from app.models.workshop_invoice_data import WorkshopInvoiceData
 from app.models.dp_hlo_data import DPHLOData, DPHLOPart
 from app.schemas.h23_dashboard import WorkOrderStatusItem
+from app.utils.date_filter import date_between
+from app.utils.trend_query import count_with_previous_period, trend_summary
 
 logger = setup_logger(__name__)
 
@@ -56,104 +50,26 @@ class H23DashboardRepository:
         """
         try:
             logger.info(f"Getting total unit entry with trend for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
-            
-            # Helper function to build date filter conditions
-            def build_date_conditions(date_from_str: str, date_to_str: str):
-                return or_(
-                    # Handle YYYY-MM-DD format
-                    and_(
-                        func.length(PKBData.created_time) >= 10,
-                        func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                        func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    ),
-                    # Handle DD/MM/YYYY format
-                    and_(
-                        func.length(PKBData.created_time) >= 10,
-                        func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                        func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from_str, 'YYYY-MM-DD'),
-                        func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to_str, 'YYYY-MM-DD')
-                    )
-                )
 
-            # Get current period count
-            current_conditions = build_date_conditions(date_from, date_to)
-            
-            current_query = self.db.query(
-                func.count(func.distinct(PKBData.no_work_order)).label('count')
-            ).filter(
-                and_(
+            # Current and previous period (minus 1 month) in one scan
+            current_count, prev_count = count_with_previous_period(
+                self.db,
+                source=PKBData,
+                counted=PKBData.no_work_order,
+                date_column=PKBData.created_date,
+                date_from=date_from,
+                date_to=date_to,
+                conditions=(
                     PKBData.dealer_id == dealer_id,
-                    PKBData.no_work_order.isnot(None),
-                    current_conditions
-                )
+                    PKBData.no_work_order.isnot(None)
+                ),
+                distinct=True
             )
 
-            current_result = current_query.first()
-            current_count = int(current_result.count or 0) if current_result else 0
-
-            # Calculate previous period dates (minus 1 month)
-            try:
-                if not DATEUTIL_AVAILABLE:
-                    raise ImportError("python-dateutil not available")
-
-                date_from_obj = datetime.strptime(date_from[:10], '%Y-%m-%d')
-                date_to_obj = datetime.strptime(date_to[:10], '%Y-%m-%d')
-
-                # Subtract 1 month from both dates
-                prev_date_from_obj = date_from_obj - relativedelta(months=1)
-                prev_date_to_obj = date_to_obj - relativedelta(months=1)
+            result = trend_summary(current_count, prev_count)
+            logger.info(f"Total unit entry count: current={current_count}, previous={prev_count}, trend={result['trend']}, percentage={result['percentage']}")
 
-                prev_date_from = prev_date_from_obj.strftime('%Y-%m-%d')
-                prev_date_to = prev_date_to_obj.strftime('%Y-%m-%d')
-
-                # Get previous period count
-                prev_conditions = build_date_conditions(prev_date_from, prev_date_to)
-
-                prev_query = self.db.query(
-                    func.count(func.distinct(PKBData.no_work_order)).label('count')
-                ).filter(
-                    and_(
-                        PKBData.dealer_id == dealer_id,
-                        PKBData.no_work_order.isnot(None),
-                        prev_conditions
-                    )
-                )
-
-                prev_result = prev_query.first()
-                prev_count = int(prev_result.count or 0) if prev_result else 0
-
-            except Exception as e:
-                logger.warning(f"Error calculating previous period: {e}")
-                prev_count = 0
-
-            # Calculate trend and percentage
-            if prev_count == 0:
-                if current_count > 0:
-                    trend = 'up'
-                    percentage = 100.0
-                else:
-                    trend = 'stable'
-                    percentage = 0.0
-            else:
-                percentage_change = ((current_count - prev_count) / prev_count) * 100
-                percentage = round(abs(percentage_change), 1)
-
-                if percentage_change > 0:
-                    trend = 'up'
-                elif percentage_change < 0:
-                    trend = 'down'
-                else:
-                    trend = 'stable'
-
-            logger.info(f"Total unit entry count: current={current_count}, previous={prev_count}, trend={trend}, percentage={percentage}")
-
-            return {
-                'count': current_count,
-                'previous_count': prev_count,
-                'trend': trend,
-                'percentage': percentage
-            }
+            return result
 
         except Exception as e:
             logger.error(f"Error getting total unit entry with trend: {e}")
@@ -184,28 +100,7 @@ class H23DashboardRepository:
         try:
             logger.info(f"Getting work order revenue for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Build date filter conditions for created_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(PKBData.created_time) >= 10,
-                    func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(PKBData.created_time) >= 10,
-                    func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(PKBData.created_date, date_from, date_to)
 
             # Get total revenue
             revenue_query = self.db.query(
@@ -214,7 +109,7 @@ class H23DashboardRepository:
                 and_(
                     PKBData.dealer_id == dealer_id,
                     PKBData.total_biaya_service.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -227,7 +122,7 @@ class H23DashboardRepository:
             ).filter(
                 and_(
                     PKBData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -277,28 +172,7 @@ class H23DashboardRepository:
                 '5': 'Cancel'
             }
 
-            # Build date filter conditions
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(PKBData.created_time) >= 10,
-                    func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(PKBData.created_time) >= 10,
-                    func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(PKBData.created_date, date_from, date_to)
 
             # Query to get counts grouped by status_work_order
             query = self.db.query(
@@ -308,7 +182,7 @@ class H23DashboardRepository:
                 and_(
                     PKBData.dealer_id == dealer_id,
                     PKBData.status_work_order.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             ).group_by(PKBData.status_work_order)
 
@@ -363,33 +237,12 @@ class H23DashboardRepository:
             Total number of records
         """
         try:
-            # Build date filter conditions
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(PKBData.created_time) >= 10,
-                    func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(PKBData.created_time) >= 10,
-                    func.substr(PKBData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(PKBData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(PKBData.created_date, date_from, date_to)
 
             total = self.db.query(func.count(PKBData.id)).filter(
                 and_(
                     PKBData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             ).scalar()
 
@@ -418,28 +271,7 @@ class H23DashboardRepository:
         try:
             logger.info(f"Getting NJB statistics for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Build date filter conditions for created_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(WorkshopInvoiceData.created_time) >= 10,
-                    func.substr(WorkshopInvoiceData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(WorkshopInvoiceData.created_time) >= 10,
-                    func.substr(WorkshopInvoiceData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(WorkshopInvoiceData.created_date, date_from, date_to)
 
             # Query for NJB statistics where no_njb is not null
             query = self.db.query(
@@ -449,7 +281,7 @@ class H23DashboardRepository:
                 and_(
                     WorkshopInvoiceData.dealer_id == dealer_id,
                     WorkshopInvoiceData.no_njb.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -491,28 +323,7 @@ class H23DashboardRepository:
         try:
             logger.info(f"Getting NSC statistics for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Build date filter conditions for created_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(WorkshopInvoiceData.created_time) >= 10,
-                    func.substr(WorkshopInvoiceData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(WorkshopInvoiceData.created_time) >= 10,
-                    func.substr(WorkshopInvoiceData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(WorkshopInvoiceData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(WorkshopInvoiceData.created_date, date_from, date_to)
 
             # Query for NSC statistics where no_nsc is not null
             # Sum total_harga_njb + total_harga_nsc as per requirements
@@ -526,7 +337,7 @@ class H23DashboardRepository:
                 and_(
                     WorkshopInvoiceData.dealer_id == dealer_id,
                     WorkshopInvoiceData.no_nsc.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -568,28 +379,7 @@ class H23DashboardRepository:
         try:
             logger.info(f"Getting HLO statistics for dealer_id={dealer_id}, date_from={date_from}, date_to={date_to}")
 
-            # Build date filter conditions for created_time string field
-            date_conditions = []
-
-            # Handle YYYY-MM-DD format
-            date_conditions.append(
-                and_(
-                    func.length(DPHLOData.created_time) >= 10,
-                    func.substr(DPHLOData.created_time, 1, 10).op('~')(r'^\d{4}-\d{2}-\d{2}$'),
-                    func.to_date(func.substr(DPHLOData.created_time, 1, 10), 'YYYY-MM-DD') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(DPHLOData.created_time, 1, 10), 'YYYY-MM-DD') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
-
-            # Handle DD/MM/YYYY format
-            date_conditions.append(
-                and_(
-                    func.length(DPHLOData.created_time) >= 10,
-                    func.substr(DPHLOData.created_time, 1, 10).op('~')(r'^\d{2}/\d{2}/\d{4}$'),
-                    func.to_date(func.substr(DPHLOData.created_time, 1, 10), 'DD/MM/YYYY') >= func.to_date(date_from, 'YYYY-MM-DD'),
-                    func.to_date(func.substr(DPHLOData.created_time, 1, 10), 'DD/MM/YYYY') <= func.to_date(date_to, 'YYYY-MM-DD')
-                )
-            )
+            date_filter = date_between(DPHLOData.created_date, date_from, date_to)
 
             # Query for HLO documents count where id_hlo_document is not null
             hlo_documents_query = self.db.query(
@@ -598,7 +388,7 @@ class H23DashboardRepository:
                 and_(
                     DPHLOData.dealer_id == dealer_id,
                     DPHLOData.id_hlo_document.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -614,7 +404,7 @@ class H23DashboardRepository:
                 and_(
                     DPHLOData.dealer_id == dealer_id,
                     DPHLOData.id_hlo_document.isnot(None),
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -627,7 +417,7 @@ class H23DashboardRepository:
             ).filter(
                 and_(
                     DPHLOData.dealer_id == dealer_id,
-                    or_(*date_conditions)
+                    date_filter
                 )
             )
 
@@ -13,7 +13,7 @@ router = APIRouter(tags=["admin-dashboard"])
 
 
 @router.get("/admin/dealers/active", response_model=ActiveDealersResponse)
-async def get_all_active_dealers(
+def get_all_active_dealers(
     db: Session = Depends(get_db)
 ):
     """
@@ -30,7 +30,7 @@ async def get_all_active_dealers(
     """
     try:
         controller = AdminDashboardController(db)
-        result = await controller.get_all_active_dealers()
+        result = controller.get_all_active_dealers()
         
         # If the controller returned an error, raise HTTPException
         if not result.success:
@@ -2,6 +2,7 @@
 Dashboard routes for analytics data
 """
 
+import time
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -9,13 +10,14 @@ from datetime import datetime, date
 
 from app.dependencies import get_db
 from app.controllers.dashboard_controller import DashboardController
-from app.schemas.dashboard import UnitInboundStatusResponse, PaymentTypeResponse, PaymentMethodResponse, PaymentStatusResponse, PaymentRevenueResponse, PaymentDataHistoryResponse, LeasingDataHistoryResponse, DocumentHandlingDataHistoryResponse, UnitInboundDataHistoryResponse, TopPenerimaanUnitResponse, PODocumentStatusResponse, TrenRevenueResponse, POCreationMonthlyResponse, PermohonanFakturResponse, STNKDiterimaResponse, BPKBDiterimaResponse, DeliveryProcessStatusResponse, ProspectFollowUpResponse, SPKStatusResponse, TopLeasingResponse, DocumentHandlingCountResponse, StatusProspectResponse, MetodeFollowUpResponse, SumberProspectResponse, SebaranProspectResponse, ProspectDataTableResponse, TopDealingUnitsResponse, RevenueResponse, TopDriverResponse, DeliveryLocationResponse, DeliveryDataHistoryResponse, SPKDealingProcessDataResponse
+from app.schemas.dashboard import UnitInboundStatusResponse, PaymentTypeResponse, PaymentMethodResponse, PaymentStatusResponse, PaymentRevenueResponse, PaymentDataHistoryResponse, LeasingDataHistoryResponse, DocumentHandlingDataHistoryResponse, UnitInboundDataHistoryResponse, TopPenerimaanUnitResponse, PODocumentStatusResponse, TrenRevenueResponse, POCreationMonthlyResponse, PermohonanFakturResponse, STNKDiterimaResponse, BPKBDiterimaResponse, DeliveryProcessStatusResponse, ProspectFollowUpResponse, SPKStatusResponse, TopLeasingResponse, DocumentHandlingCountResponse, StatusProspectResponse, MetodeFollowUpResponse, SumberProspectResponse, SebaranProspectResponse, ProspectDataTableResponse, TopDealingUnitsResponse, RevenueResponse, TopDriverResponse, DeliveryLocationResponse, DeliveryDataHistoryResponse, SPKDealingProcessDataResponse, DashboardTilesRequest, DashboardTilesResponse
+from app.services.dashboard_tile_service import DASHBOARD_TILES, dashboard_tile_service
 
 router = APIRouter(tags=["dashboard"])
 
 
 @router.get("/dashboard/unit-inbound/status-counts", response_model=UnitInboundStatusResponse)
-async def get_unit_inbound_status_counts(
+def get_unit_inbound_status_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -58,7 +60,7 @@ async def get_unit_inbound_status_counts(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_unit_inbound_status_statistics(
+        result = controller.get_unit_inbound_status_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -79,7 +81,7 @@ async def get_unit_inbound_status_counts(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -123,7 +125,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -144,7 +146,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -188,7 +190,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -209,7 +211,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -253,7 +255,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -274,7 +276,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/payment-type/statistics", response_model=PaymentTypeResponse)
-async def get_payment_type_statistics(
+def get_payment_type_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -317,7 +319,7 @@ async def get_payment_type_statistics(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_payment_type_statistics(
+        result = controller.get_payment_type_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -338,7 +340,7 @@ async def get_payment_type_statistics(
 
 
 @router.get("/dashboard/payment-method/statistics", response_model=PaymentMethodResponse)
-async def get_payment_method_statistics(
+def get_payment_method_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -381,7 +383,7 @@ async def get_payment_method_statistics(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_payment_method_statistics(
+        result = controller.get_payment_method_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -402,7 +404,7 @@ async def get_payment_method_statistics(
 
 
 @router.get("/dashboard/payment-status/statistics", response_model=PaymentStatusResponse)
-async def get_payment_status_statistics(
+def get_payment_status_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -445,7 +447,7 @@ async def get_payment_status_statistics(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_payment_status_statistics(
+        result = controller.get_payment_status_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -466,7 +468,7 @@ async def get_payment_status_statistics(
 
 
 @router.get("/dashboard/payment-revenue/total", response_model=PaymentRevenueResponse)
-async def get_payment_revenue_total(
+def get_payment_revenue_total(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -509,7 +511,7 @@ async def get_payment_revenue_total(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_payment_revenue_total(
+        result = controller.get_payment_revenue_total(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -530,7 +532,7 @@ async def get_payment_revenue_total(
 
 
 @router.get("/dashboard/payment-data-history", response_model=PaymentDataHistoryResponse)
-async def get_payment_data_history(
+def get_payment_data_history(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -583,7 +585,7 @@ async def get_payment_data_history(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_payment_data_history(
+        result = controller.get_payment_data_history(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to,
@@ -606,7 +608,7 @@ async def get_payment_data_history(
 
 
 @router.get("/dashboard/leasing-data-history", response_model=LeasingDataHistoryResponse)
-async def get_leasing_data_history(
+def get_leasing_data_history(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -654,7 +656,7 @@ async def get_leasing_data_history(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_leasing_data_history(
+        result = controller.get_leasing_data_history(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to,
@@ -677,7 +679,7 @@ async def get_leasing_data_history(
 
 
 @router.get("/dashboard/document-handling-data-history", response_model=DocumentHandlingDataHistoryResponse)
-async def get_document_handling_data_history(
+def get_document_handling_data_history(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -726,7 +728,7 @@ async def get_document_handling_data_history(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_document_handling_data_history(
+        result = controller.get_document_handling_data_history(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to,
@@ -749,7 +751,7 @@ async def get_document_handling_data_history(
 
 
 @router.get("/dashboard/unit-inbound-data-history", response_model=UnitInboundDataHistoryResponse)
-async def get_unit_inbound_data_history(
+def get_unit_inbound_data_history(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -797,7 +799,7 @@ async def get_unit_inbound_data_history(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_unit_inbound_data_history(
+        result = controller.get_unit_inbound_data_history(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to,
@@ -820,7 +822,7 @@ async def get_unit_inbound_data_history(
 
 
 @router.get("/dashboard/top-penerimaan-unit", response_model=TopPenerimaanUnitResponse)
-async def get_top_penerimaan_unit(
+def get_top_penerimaan_unit(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -864,7 +866,7 @@ async def get_top_penerimaan_unit(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_penerimaan_unit(
+        result = controller.get_top_penerimaan_unit(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -885,7 +887,7 @@ async def get_top_penerimaan_unit(
 
 
 @router.get("/dashboard/leasing/po-document-status", response_model=PODocumentStatusResponse)
-async def get_po_document_status(
+def get_po_document_status(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -932,7 +934,7 @@ async def get_po_document_status(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_po_document_status_statistics(
+        result = controller.get_po_document_status_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -953,7 +955,7 @@ async def get_po_document_status(
 
 
 @router.get("/dashboard/payment/revenue-trend", response_model=TrenRevenueResponse)
-async def get_revenue_trend(
+def get_revenue_trend(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     current_year: str = Query(..., description="Current year in YYYY format"),
     db: Session = Depends(get_db)
@@ -989,7 +991,7 @@ async def get_revenue_trend(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_trend_data(
+        result = controller.get_revenue_trend_data(
             dealer_id=dealer_id,
             current_year=current_year
         )
@@ -1009,7 +1011,7 @@ async def get_revenue_trend(
 
 
 @router.get("/dashboard/leasing/po-creation-monthly", response_model=POCreationMonthlyResponse)
-async def get_po_creation_monthly(
+def get_po_creation_monthly(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     current_year: str = Query(..., description="Current year in YYYY format"),
     db: Session = Depends(get_db)
@@ -1045,7 +1047,7 @@ async def get_po_creation_monthly(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_po_creation_monthly_data(
+        result = controller.get_po_creation_monthly_data(
             dealer_id=dealer_id,
             current_year=current_year
         )
@@ -1065,7 +1067,7 @@ async def get_po_creation_monthly(
 
 
 @router.get("/dashboard/document-handling/permohonan-faktur", response_model=PermohonanFakturResponse)
-async def get_permohonan_faktur_data(
+def get_permohonan_faktur_data(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date for filtering (YYYY-MM-DD format)"),
     date_to: str = Query(..., description="End date for filtering (YYYY-MM-DD format)"),
@@ -1107,7 +1109,7 @@ async def get_permohonan_faktur_data(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_permohonan_faktur_data(
+        result = controller.get_permohonan_faktur_data(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1128,7 +1130,7 @@ async def get_permohonan_faktur_data(
 
 
 @router.get("/dashboard/document-handling/stnk-diterima", response_model=STNKDiterimaResponse)
-async def get_stnk_diterima_data(
+def get_stnk_diterima_data(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date for filtering (YYYY-MM-DD format)"),
     date_to: str = Query(..., description="End date for filtering (YYYY-MM-DD format)"),
@@ -1171,7 +1173,7 @@ async def get_stnk_diterima_data(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_stnk_diterima_data(
+        result = controller.get_stnk_diterima_data(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1192,7 +1194,7 @@ async def get_stnk_diterima_data(
 
 
 @router.get("/dashboard/document-handling/bpkb-diterima", response_model=BPKBDiterimaResponse)
-async def get_bpkb_diterima_data(
+def get_bpkb_diterima_data(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date for filtering (YYYY-MM-DD format)"),
     date_to: str = Query(..., description="End date for filtering (YYYY-MM-DD format)"),
@@ -1235,7 +1237,7 @@ async def get_bpkb_diterima_data(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_bpkb_diterima_data(
+        result = controller.get_bpkb_diterima_data(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1256,7 +1258,7 @@ async def get_bpkb_diterima_data(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1300,7 +1302,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1321,7 +1323,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1365,7 +1367,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1386,7 +1388,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1430,7 +1432,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1451,7 +1453,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/delivery-process/status-counts", response_model=DeliveryProcessStatusResponse)
-async def get_delivery_process_status_counts(
+def get_delivery_process_status_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1494,7 +1496,7 @@ async def get_delivery_process_status_counts(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_delivery_process_status_statistics(
+        result = controller.get_delivery_process_status_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1515,7 +1517,7 @@ async def get_delivery_process_status_counts(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1559,7 +1561,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1580,7 +1582,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1624,7 +1626,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1645,7 +1647,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1689,7 +1691,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1710,7 +1712,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/prospect/followup-status-counts", response_model=ProspectFollowUpResponse)
-async def get_prospect_followup_status_counts(
+def get_prospect_followup_status_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1760,7 +1762,7 @@ async def get_prospect_followup_status_counts(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_prospect_followup_statistics(
+        result = controller.get_prospect_followup_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1781,7 +1783,7 @@ async def get_prospect_followup_status_counts(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1825,7 +1827,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1846,7 +1848,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1890,7 +1892,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1911,7 +1913,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -1955,7 +1957,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -1976,7 +1978,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/spk/status-counts", response_model=SPKStatusResponse)
-async def get_spk_status_counts(
+def get_spk_status_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2025,7 +2027,7 @@ async def get_spk_status_counts(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_spk_status_statistics(
+        result = controller.get_spk_status_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2046,7 +2048,7 @@ async def get_spk_status_counts(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2090,7 +2092,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2111,7 +2113,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2155,7 +2157,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2176,7 +2178,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2220,7 +2222,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2241,7 +2243,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/leasing/top-companies", response_model=TopLeasingResponse)
-async def get_top_leasing_companies(
+def get_top_leasing_companies(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2285,7 +2287,7 @@ async def get_top_leasing_companies(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_leasing_statistics(
+        result = controller.get_top_leasing_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2306,7 +2308,7 @@ async def get_top_leasing_companies(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2350,7 +2352,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2371,7 +2373,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2415,7 +2417,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2436,7 +2438,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2480,7 +2482,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2500,7 +2502,7 @@ async def get_top_driver_statistics(
         )
 
 @router.get("/dashboard/document-handling/count", response_model=DocumentHandlingCountResponse)
-async def get_document_handling_count(
+def get_document_handling_count(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2544,7 +2546,7 @@ async def get_document_handling_count(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_document_handling_statistics(
+        result = controller.get_document_handling_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2565,7 +2567,7 @@ async def get_document_handling_count(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2609,7 +2611,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2630,7 +2632,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2674,7 +2676,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2695,7 +2697,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2739,7 +2741,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2760,7 +2762,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/prospect/status-counts", response_model=StatusProspectResponse)
-async def get_prospect_status_counts(
+def get_prospect_status_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2810,7 +2812,7 @@ async def get_prospect_status_counts(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_status_prospect_statistics(
+        result = controller.get_status_prospect_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2831,7 +2833,7 @@ async def get_prospect_status_counts(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2875,7 +2877,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2896,7 +2898,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -2940,7 +2942,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -2961,7 +2963,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3005,7 +3007,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3026,7 +3028,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/prospect/metode-followup-counts", response_model=MetodeFollowUpResponse)
-async def get_prospect_metode_followup_counts(
+def get_prospect_metode_followup_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3075,7 +3077,7 @@ async def get_prospect_metode_followup_counts(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_metode_follow_up_statistics(
+        result = controller.get_metode_follow_up_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3096,7 +3098,7 @@ async def get_prospect_metode_followup_counts(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3140,7 +3142,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3161,7 +3163,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3205,7 +3207,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3226,7 +3228,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3270,7 +3272,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3291,7 +3293,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/prospect/sumber-top5", response_model=SumberProspectResponse)
-async def get_prospect_sumber_top5(
+def get_prospect_sumber_top5(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3349,7 +3351,7 @@ async def get_prospect_sumber_top5(
 
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_sumber_prospect_statistics(
+        result = controller.get_sumber_prospect_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3370,7 +3372,7 @@ async def get_prospect_sumber_top5(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3414,7 +3416,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3435,7 +3437,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3479,7 +3481,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3500,7 +3502,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3544,7 +3546,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3565,7 +3567,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/prospect/sebaran-kecamatan", response_model=SebaranProspectResponse)
-async def get_sebaran_prospect_statistics(
+def get_sebaran_prospect_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3609,7 +3611,7 @@ async def get_sebaran_prospect_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_sebaran_prospect_statistics(
+        result = controller.get_sebaran_prospect_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3630,7 +3632,7 @@ async def get_sebaran_prospect_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3674,7 +3676,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3695,7 +3697,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3739,7 +3741,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3760,7 +3762,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3804,7 +3806,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3825,7 +3827,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/prospect/data-table", response_model=ProspectDataTableResponse)
-async def get_prospect_data_table(
+def get_prospect_data_table(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3895,7 +3897,7 @@ async def get_prospect_data_table(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_prospect_data_table(
+        result = controller.get_prospect_data_table(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to,
@@ -3924,7 +3926,7 @@ async def get_prospect_data_table(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -3968,7 +3970,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -3989,7 +3991,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4033,7 +4035,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4054,7 +4056,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4098,7 +4100,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4119,7 +4121,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/dealing/top-units", response_model=TopDealingUnitsResponse)
-async def get_top_dealing_units_statistics(
+def get_top_dealing_units_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4163,7 +4165,7 @@ async def get_top_dealing_units_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_dealing_units_statistics(
+        result = controller.get_top_dealing_units_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4184,7 +4186,7 @@ async def get_top_dealing_units_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4228,7 +4230,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4249,7 +4251,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/revenue", response_model=RevenueResponse)
-async def get_revenue_statistics(
+def get_revenue_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4293,7 +4295,7 @@ async def get_revenue_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_revenue_statistics(
+        result = controller.get_revenue_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4314,7 +4316,7 @@ async def get_revenue_statistics(
 
 
 @router.get("/dashboard/delivery/top-drivers", response_model=TopDriverResponse)
-async def get_top_driver_statistics(
+def get_top_driver_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4358,7 +4360,7 @@ async def get_top_driver_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_top_driver_statistics(
+        result = controller.get_top_driver_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4379,7 +4381,7 @@ async def get_top_driver_statistics(
 
 
 @router.get("/dashboard/delivery/locations", response_model=DeliveryLocationResponse)
-async def get_delivery_location_statistics(
+def get_delivery_location_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4423,7 +4425,7 @@ async def get_delivery_location_statistics(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_delivery_location_statistics(
+        result = controller.get_delivery_location_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -4444,7 +4446,7 @@ async def get_delivery_location_statistics(
 
 
 @router.get("/dashboard/delivery/data-history", response_model=DeliveryDataHistoryResponse)
-async def get_delivery_data_history(
+def get_delivery_data_history(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -4521,7 +4523,7 @@ async def get_delivery_data_history(
         
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_delivery_data_history(
+        result = controller.get_delivery_data_history(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to,
@@ -4553,7 +4555,7 @@ async def get_delivery_data_history(
 
 
 @router.get("/dashboard/spk-dealing-process/data", response_model=SPKDealingProcessDataResponse)
-async def get_spk_dealing_process_data(
+def get_spk_dealing_process_data(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     page: int = Query(1, description="Page number (1-based)", ge=1),
     per_page: int = Query(20, description="Records per page", ge=1, le=100),
@@ -4595,7 +4597,7 @@ async def get_spk_dealing_process_data(
     try:
         # Create controller and get data
         controller = DashboardController(db)
-        result = await controller.get_spk_dealing_process_data(
+        result = controller.get_spk_dealing_process_data(
             dealer_id=dealer_id,
             page=page,
             per_page=per_page,
@@ -4620,3 +4622,88 @@ async def get_spk_dealing_process_data(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
+
+
+@router.post("/dashboard/tiles", response_model=DashboardTilesResponse)
+def get_dashboard_tiles(request: DashboardTilesRequest):
+    """
+    Compute several dashboard tiles for one dealer and date range in a single call
+    
+    Each tile is identified by its own GET endpoint path and returns exactly what that
+    endpoint returns. The dates are validated once for the whole batch and the tiles
+    run concurrently on a bounded worker pool, each with its own database session.
+    A failing tile is reported in its result without failing the batch.
+    
+    Args:
+        request: dealer_id, date range, tile ids and optional current_year
+        
+    Returns:
+        DashboardTilesResponse: Per-tile results with timing, in request order
+        
+    Example:
+        POST /api/v1/dashboard/tiles
+        {"dealer_id": "12284", "date_from": "2024-01-01", "date_to": "2024-12-31",
+         "tiles": ["/dashboard/payment-type/statistics", "/dashboard/delivery/top-drivers"]}
+    """
+    try:
+        # Validate date format
+        try:
+            datetime.strptime(request.date_from, '%Y-%m-%d')
+            datetime.strptime(request.date_to, '%Y-%m-%d')
+        except ValueError:
+            raise HTTPException(
+                status_code=400, 
+                detail="Invalid date format. Use YYYY-MM-DD format."
+            )
+        
+        # Validate date range
+        if request.date_from > request.date_to:
+            raise HTTPException(
+                status_code=400, 
+                detail="date_from must be less than or equal to date_to"
+            )
+        
+        # Validate year format (monthly trend tiles)
+        current_year = request.current_year or request.date_to[:4]
+        try:
+            year_int = int(current_year)
+            if year_int < 2000 or year_int > 2100:
+                raise ValueError("Year out of valid range")
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid year format. Use YYYY format (e.g., 2024)."
+            )
+        
+        tiles = list(dict.fromkeys(request.tiles))
+        unknown_tiles = [tile for tile in tiles if tile not in DASHBOARD_TILES]
+        if unknown_tiles:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown tiles: {', '.join(unknown_tiles)}"
+            )
+        
+        started = time.perf_counter()
+        results = dashboard_tile_service.run(
+            tiles=tiles,
+            dealer_id=request.dealer_id,
+            date_from=request.date_from,
+            date_to=request.date_to,
+            current_year=current_year
+        )
+        failed = sum(1 for result in results if not result.success)
+        
+        return DashboardTilesResponse(
+            success=failed == 0,
+            message="Data retrieved successfully" if failed == 0 else f"{failed} of {len(results)} tiles failed",
+            data=results,
+            total_duration_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
@@ -2,7 +2,6 @@
 Excel Export routes for downloading Excel files
 """
 
-import io
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
@@ -19,8 +18,22 @@ from app.schemas.excel_export import (
 router = APIRouter(tags=["excel-exports"])
 
 
+def _excel_file_response(controller: ExcelExportController, excel_file, metadata) -> StreamingResponse:
+    """Stream a finished temporary Excel file in chunks; the file is removed once sent"""
+    return StreamingResponse(
+        controller.excel_service.iter_file(excel_file),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={
+            "Content-Disposition": f"attachment; filename={metadata.filename}",
+            "Content-Length": str(metadata.file_size_bytes),
+            "X-Export-Records": str(metadata.total_records),
+            "X-Export-Type": metadata.export_type
+        }
+    )
+
+
 @router.get("/h23-dashboard/exports/work-order-excel")
-async def export_work_order_excel(
+def export_work_order_excel(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -63,25 +76,14 @@ async def export_work_order_excel(
         controller.validate_export_request(dealer_id, date_from, date_to)
         
         # Generate Excel file
-        excel_bytes, metadata = controller.export_work_order_excel(
+        excel_file, metadata = controller.export_work_order_excel(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
         )
         
-        # Create streaming response
-        excel_stream = io.BytesIO(excel_bytes)
-        
-        return StreamingResponse(
-            io.BytesIO(excel_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename={metadata.filename}",
-                "Content-Length": str(metadata.file_size_bytes),
-                "X-Export-Records": str(metadata.total_records),
-                "X-Export-Type": metadata.export_type
-            }
-        )
+        # Stream the finished file from disk
+        return _excel_file_response(controller, excel_file, metadata)
         
     except ValueError as ve:
         raise HTTPException(
@@ -96,7 +98,7 @@ async def export_work_order_excel(
 
 
 @router.get("/h23-dashboard/exports/njb-nsc-excel")
-async def export_njb_nsc_excel(
+def export_njb_nsc_excel(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -139,23 +141,14 @@ async def export_njb_nsc_excel(
         controller.validate_export_request(dealer_id, date_from, date_to)
         
         # Generate Excel file
-        excel_bytes, metadata = controller.export_njb_nsc_excel(
+        excel_file, metadata = controller.export_njb_nsc_excel(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
         )
         
-        # Create streaming response
-        return StreamingResponse(
-            io.BytesIO(excel_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename={metadata.filename}",
-                "Content-Length": str(metadata.file_size_bytes),
-                "X-Export-Records": str(metadata.total_records),
-                "X-Export-Type": metadata.export_type
-            }
-        )
+        # Stream the finished file from disk
+        return _excel_file_response(controller, excel_file, metadata)
         
     except ValueError as ve:
         raise HTTPException(
@@ -170,7 +163,7 @@ async def export_njb_nsc_excel(
 
 
 @router.get("/h23-dashboard/exports/hlo-excel")
-async def export_hlo_excel(
+def export_hlo_excel(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -211,23 +204,14 @@ async def export_hlo_excel(
         controller.validate_export_request(dealer_id, date_from, date_to)
         
         # Generate Excel file
-        excel_bytes, metadata = controller.export_hlo_excel(
+        excel_file, metadata = controller.export_hlo_excel(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
         )
         
-        # Create streaming response
-        return StreamingResponse(
-            io.BytesIO(excel_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename={metadata.filename}",
-                "Content-Length": str(metadata.file_size_bytes),
-                "X-Export-Records": str(metadata.total_records),
-                "X-Export-Type": metadata.export_type
-            }
-        )
+        # Stream the finished file from disk
+        return _excel_file_response(controller, excel_file, metadata)
         
     except ValueError as ve:
         raise HTTPException(
@@ -242,7 +226,7 @@ async def export_hlo_excel(
 
 
 @router.get("/h23-dashboard/exports/work-order-detail-excel")
-async def export_work_order_detail_excel(
+def export_work_order_detail_excel(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -278,23 +262,14 @@ async def export_work_order_detail_excel(
         controller.validate_export_request(dealer_id, date_from, date_to)
 
         # Generate Excel file
-        excel_bytes, metadata = controller.export_work_order_detail_excel(
+        excel_file, metadata = controller.export_work_order_detail_excel(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
         )
 
-        # Create streaming response
-        return StreamingResponse(
-            io.BytesIO(excel_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename={metadata.filename}",
-                "Content-Length": str(metadata.file_size_bytes),
-                "X-Export-Records": str(metadata.total_records),
-                "X-Export-Type": metadata.export_type
-            }
-        )
+        # Stream the finished file from disk
+        return _excel_file_response(controller, excel_file, metadata)
 
     except ValueError as ve:
         raise HTTPException(
@@ -309,7 +284,7 @@ async def export_work_order_detail_excel(
 
 
 @router.get("/h23-dashboard/exports/njb-nsc-detail-excel")
-async def export_njb_nsc_detail_excel(
+def export_njb_nsc_detail_excel(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -346,23 +321,14 @@ async def export_njb_nsc_detail_excel(
         controller.validate_export_request(dealer_id, date_from, date_to)
 
         # Generate Excel file
-        excel_bytes, metadata = controller.export_njb_nsc_detail_excel(
+        excel_file, metadata = controller.export_njb_nsc_detail_excel(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
         )
 
-        # Create streaming response
-        return StreamingResponse(
-            io.BytesIO(excel_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename={metadata.filename}",
-                "Content-Length": str(metadata.file_size_bytes),
-                "X-Export-Records": str(metadata.total_records),
-                "X-Export-Type": metadata.export_type
-            }
-        )
+        # Stream the finished file from disk
+        return _excel_file_response(controller, excel_file, metadata)
 
     except ValueError as ve:
         raise HTTPException(
@@ -377,7 +343,7 @@ async def export_njb_nsc_detail_excel(
 
 
 @router.get("/h23-dashboard/exports/hlo-detail-excel")
-async def export_hlo_detail_excel(
+def export_hlo_detail_excel(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -412,23 +378,14 @@ async def export_hlo_detail_excel(
         controller.validate_export_request(dealer_id, date_from, date_to)
 
         # Generate Excel file
-        excel_bytes, metadata = controller.export_hlo_detail_excel(
+        excel_file, metadata = controller.export_hlo_detail_excel(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
         )
 
-        # Create streaming response
-        return StreamingResponse(
-            io.BytesIO(excel_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename={metadata.filename}",
-                "Content-Length": str(metadata.file_size_bytes),
-                "X-Export-Records": str(metadata.total_records),
-                "X-Export-Type": metadata.export_type
-            }
-        )
+        # Stream the finished file from disk
+        return _excel_file_response(controller, excel_file, metadata)
 
     except ValueError as ve:
         raise HTTPException(
@@ -443,7 +400,7 @@ async def export_hlo_detail_excel(
 
 
 @router.get("/h23-dashboard/exports/preview")
-async def get_export_preview(
+def get_export_preview(
     export_type: str = Query(..., description="Export type: work_order, work_order_detail, njb_nsc, njb_nsc_detail, hlo, or hlo_detail"),
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
@@ -503,4 +460,123 @@ async def get_export_preview(
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/h23-dashboard/exports/jobs", status_code=202)
+def submit_export_job(
+    export_type: str = Query(..., description="Export type: work_order, work_order_detail, njb_nsc, njb_nsc_detail, hlo, or hlo_detail"),
+    dealer_id: str = Query(..., description="Dealer ID to filter by"),
+    date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
+    date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
+    db: Session = Depends(get_db)
+):
+    """
+    Submit an Excel export job
+
+    The export runs on a background worker; poll the job and download the file once it is
+    completed. Finished files are cached per export type, dealer, date range and data
+    version, so repeating a request for data that has not changed since is completed
+    immediately (cached=true).
+
+    Args:
+        export_type: Type of export (work_order, work_order_detail, njb_nsc, njb_nsc_detail, hlo, or hlo_detail)
+        dealer_id: The dealer ID to filter records
+        date_from: Start date for filtering (YYYY-MM-DD format)
+        date_to: End date for filtering (YYYY-MM-DD format)
+
+    Returns:
+        JSON: Export job status
+
+    Example:
+        POST /api/v1/h23-dashboard/exports/jobs?export_type=work_order_detail&dealer_id=12284&date_from=2024-01-01&date_to=2024-01-31
+    """
+    try:
+        controller = ExcelExportController(db)
+
+        job = controller.submit_export_job(
+            export_type=export_type,
+            dealer_id=dealer_id,
+            date_from=date_from,
+            date_to=date_to
+        )
+
+        return {
+            "success": True,
+            "message": "Export file ready" if job.status == "completed" else "Export job submitted",
+            "job": job
+        }
+
+    except ValueError as ve:
+        raise HTTPException(
+            status_code=400,
+            detail=str(ve)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.get("/h23-dashboard/exports/jobs/{job_id}")
+def get_export_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """
+    Get the status of an Excel export job
+
+    Args:
+        job_id: Job ID returned when the job was submitted
+
+    Returns:
+        JSON: Export job status (running, completed or failed)
+
+    Example:
+        GET /api/v1/h23-dashboard/exports/jobs/3f2a9c0e5b7d41e8a6c1d2e3f4a5b6c7
+    """
+    controller = ExcelExportController(db)
+    job = controller.get_export_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail="Export job not found or expired"
+        )
+
+    return {
+        "success": True,
+        "message": f"Export job {job.status}",
+        "job": job
+    }
+
+
+@router.get("/h23-dashboard/exports/jobs/{job_id}/download")
+def download_export_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """
+    Download the Excel file of a completed export job
+
+    Args:
+        job_id: Job ID returned when the job was submitted
+
+    Returns:
+        StreamingResponse: Excel file download
+
+    Example:
+        GET /api/v1/h23-dashboard/exports/jobs/3f2a9c0e5b7d41e8a6c1d2e3f4a5b6c7/download
+    """
+    controller = ExcelExportController(db)
+    result = controller.get_export_job_file(job_id)
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail="Export file not available; the job is unknown, still running, failed or expired"
+        )
+
+    # Streamed from a handle opened before responding, so cache pruning can't remove it mid-download
+    excel_file, metadata = result
+    return _excel_file_response(controller, excel_file, metadata)
+
@@ -25,7 +25,7 @@ router = APIRouter(tags=["h23-dashboard"])
 # Work Order Section APIs
 
 @router.get("/h23-dashboard/work-order/total-unit-entry", response_model=TotalUnitEntryResponse)
-async def get_total_unit_entry(
+def get_total_unit_entry(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -70,7 +70,7 @@ async def get_total_unit_entry(
         controller = H23DashboardController(db)
         
         # Get data
-        result = await controller.get_total_unit_entry(
+        result = controller.get_total_unit_entry(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -88,7 +88,7 @@ async def get_total_unit_entry(
 
 
 @router.get("/h23-dashboard/work-order/revenue", response_model=WorkOrderRevenueResponse)
-async def get_work_order_revenue(
+def get_work_order_revenue(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -133,7 +133,7 @@ async def get_work_order_revenue(
         controller = H23DashboardController(db)
         
         # Get data
-        result = await controller.get_work_order_revenue(
+        result = controller.get_work_order_revenue(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -151,7 +151,7 @@ async def get_work_order_revenue(
 
 
 @router.get("/h23-dashboard/work-order/status-counts", response_model=WorkOrderStatusResponse)
-async def get_work_order_status_counts(
+def get_work_order_status_counts(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -197,7 +197,7 @@ async def get_work_order_status_counts(
         controller = H23DashboardController(db)
         
         # Get data
-        result = await controller.get_work_order_status_statistics(
+        result = controller.get_work_order_status_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -217,7 +217,7 @@ async def get_work_order_status_counts(
 # Pembayaran Section APIs
 
 @router.get("/h23-dashboard/pembayaran/njb-statistics", response_model=NJBStatisticsResponse)
-async def get_njb_statistics(
+def get_njb_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -262,7 +262,7 @@ async def get_njb_statistics(
         controller = H23DashboardController(db)
         
         # Get data
-        result = await controller.get_njb_statistics(
+        result = controller.get_njb_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -280,7 +280,7 @@ async def get_njb_statistics(
 
 
 @router.get("/h23-dashboard/pembayaran/nsc-statistics", response_model=NSCStatisticsResponse)
-async def get_nsc_statistics(
+def get_nsc_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -325,7 +325,7 @@ async def get_nsc_statistics(
         controller = H23DashboardController(db)
         
         # Get data
-        result = await controller.get_nsc_statistics(
+        result = controller.get_nsc_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
@@ -343,7 +343,7 @@ async def get_nsc_statistics(
 
 
 @router.get("/h23-dashboard/pembayaran/hlo-statistics", response_model=HLOStatisticsResponse)
-async def get_hlo_statistics(
+def get_hlo_statistics(
     dealer_id: str = Query(..., description="Dealer ID to filter by"),
     date_from: str = Query(..., description="Start date in YYYY-MM-DD format"),
     date_to: str = Query(..., description="End date in YYYY-MM-DD format"),
@@ -388,7 +388,7 @@ async def get_hlo_statistics(
         controller = H23DashboardController(db)
         
         # Get data
-        result = await controller.get_hlo_statistics(
+        result = controller.get_hlo_statistics(
             dealer_id=dealer_id,
             date_from=date_from,
             date_to=date_to
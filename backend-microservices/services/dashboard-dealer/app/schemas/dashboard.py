@@ -2,7 +2,7 @@
 Dashboard schemas for API responses
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from decimal import Decimal
 
@@ -723,3 +723,32 @@ class ActiveDealersResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class DashboardTilesRequest(BaseModel):
+    """Request schema for computing several dashboard tiles in one call"""
+    dealer_id: str = Field(..., description="Dealer ID to filter by")
+    date_from: str = Field(..., description="Start date in YYYY-MM-DD format")
+    date_to: str = Field(..., description="End date in YYYY-MM-DD format")
+    tiles: List[str] = Field(..., min_length=1, description="Tile ids: the tiles' own endpoint paths, e.g. /dashboard/payment-type/statistics")
+    current_year: Optional[str] = Field(None, description="Year (YYYY) for the monthly trend tiles; defaults to the year of date_to")
+
+
+class DashboardTileResult(BaseModel):
+    """Result of one tile in a batch"""
+    tile: str = Field(..., description="Tile id")
+    success: bool = Field(..., description="Whether the tile was computed successfully")
+    message: str = Field(..., description="Tile response message")
+    duration_ms: float = Field(..., description="Time spent computing the tile in milliseconds")
+    data: Optional[Dict[str, Any]] = Field(None, description="The tile's response, as returned by its own endpoint")
+
+
+class DashboardTilesResponse(BaseModel):
+    """Response schema for a batch of dashboard tiles"""
+    success: bool = Field(True, description="Whether every tile was computed successfully")
+    message: str = Field("Data retrieved successfully", description="Response message")
+    data: List[DashboardTileResult] = Field(..., description="Tile results in request order")
+    total_duration_ms: float = Field(..., description="Wall-clock time for the whole batch in milliseconds")
+
+    class Config:
+        from_attributes = True
@@ -102,6 +102,23 @@ class ExcelExportError(BaseModel):
         from_attributes = True
 
 
+class ExcelExportJob(BaseModel):
+    """Status of an asynchronous Excel export job"""
+    job_id: str = Field(..., description="Job ID (stable for the same export type, dealer, date range and data version)")
+    export_type: str = Field(..., description="Export type (work_order, work_order_detail, njb_nsc, njb_nsc_detail, hlo, hlo_detail)")
+    dealer_id: str = Field(..., description="Dealer ID")
+    date_from: str = Field(..., description="Start date (YYYY-MM-DD)")
+    date_to: str = Field(..., description="End date (YYYY-MM-DD)")
+    status: str = Field(..., description="running, completed or failed")
+    cached: bool = Field(False, description="Whether a previously generated file was reused")
+    metadata: Optional[ExcelExportMetadata] = Field(None, description="Export metadata once completed")
+    error_message: Optional[str] = Field(None, description="Error message when failed")
+    download_url: Optional[str] = Field(None, description="Download path once completed")
+
+    class Config:
+        from_attributes = True
+
+
 # Column configurations for each export type
 WORK_ORDER_COLUMNS = [
     {"key": "no", "header": "No"},
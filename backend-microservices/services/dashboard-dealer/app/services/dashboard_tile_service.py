@@ -0,0 +1,128 @@
+"""
+Batch computation of dashboard tiles on a bounded thread pool
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+# Add utils to path
+utils_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../utils'))
+if utils_path not in sys.path:
+    sys.path.append(utils_path)
+
+from utils.logger import setup_logger
+from app.config import settings
+from app.dependencies import db_manager
+from app.controllers.dashboard_controller import DashboardController
+from app.controllers.h23_dashboard_controller import H23DashboardController
+from app.schemas.dashboard import DashboardTileResult
+
+logger = setup_logger(__name__)
+
+# Tile id (the tile's own GET endpoint) -> (controller class, method, takes current_year instead of a date range)
+DASHBOARD_TILES: Dict[str, Tuple[type, str, bool]] = {
+    "/dashboard/unit-inbound/status-counts": (DashboardController, "get_unit_inbound_status_statistics", False),
+    "/dashboard/payment-type/statistics": (DashboardController, "get_payment_type_statistics", False),
+    "/dashboard/payment-method/statistics": (DashboardController, "get_payment_method_statistics", False),
+    "/dashboard/payment-status/statistics": (DashboardController, "get_payment_status_statistics", False),
+    "/dashboard/payment-revenue/total": (DashboardController, "get_payment_revenue_total", False),
+    "/dashboard/payment/revenue-trend": (DashboardController, "get_revenue_trend_data", True),
+    "/dashboard/top-penerimaan-unit": (DashboardController, "get_top_penerimaan_unit", False),
+    "/dashboard/leasing/po-document-status": (DashboardController, "get_po_document_status_statistics", False),
+    "/dashboard/leasing/po-creation-monthly": (DashboardController, "get_po_creation_monthly_data", True),
+    "/dashboard/leasing/top-companies": (DashboardController, "get_top_leasing_statistics", False),
+    "/dashboard/document-handling/permohonan-faktur": (DashboardController, "get_permohonan_faktur_data", False),
+    "/dashboard/document-handling/stnk-diterima": (DashboardController, "get_stnk_diterima_data", False),
+    "/dashboard/document-handling/bpkb-diterima": (DashboardController, "get_bpkb_diterima_data", False),
+    "/dashboard/document-handling/count": (DashboardController, "get_document_handling_statistics", False),
+    "/dashboard/delivery-process/status-counts": (DashboardController, "get_delivery_process_status_statistics", False),
+    "/dashboard/delivery/top-drivers": (DashboardController, "get_top_driver_statistics", False),
+    "/dashboard/delivery/locations": (DashboardController, "get_delivery_location_statistics", False),
+    "/dashboard/prospect/followup-status-counts": (DashboardController, "get_prospect_followup_statistics", False),
+    "/dashboard/prospect/status-counts": (DashboardController, "get_status_prospect_statistics", False),
+    "/dashboard/prospect/metode-followup-counts": (DashboardController, "get_metode_follow_up_statistics", False),
+    "/dashboard/prospect/sumber-top5": (DashboardController, "get_sumber_prospect_statistics", False),
+    "/dashboard/prospect/sebaran-kecamatan": (DashboardController, "get_sebaran_prospect_statistics", False),
+    "/dashboard/spk/status-counts": (DashboardController, "get_spk_status_statistics", False),
+    "/dashboard/dealing/top-units": (DashboardController, "get_top_dealing_units_statistics", False),
+    "/dashboard/revenue": (DashboardController, "get_revenue_statistics", False),
+    "/h23-dashboard/work-order/total-unit-entry": (H23DashboardController, "get_total_unit_entry", False),
+    "/h23-dashboard/work-order/revenue": (H23DashboardController, "get_work_order_revenue", False),
+    "/h23-dashboard/work-order/status-counts": (H23DashboardController, "get_work_order_status_statistics", False),
+    "/h23-dashboard/pembayaran/njb-statistics": (H23DashboardController, "get_njb_statistics", False),
+    "/h23-dashboard/pembayaran/nsc-statistics": (H23DashboardController, "get_nsc_statistics", False),
+    "/h23-dashboard/pembayaran/hlo-statistics": (H23DashboardController, "get_hlo_statistics", False),
+}
+
+
+class DashboardTileService:
+    """Computes several dashboard tiles for one dealer and date range concurrently
+
+    Each tile runs the same controller method as its own endpoint, on its own session,
+    in a process-wide pool of max_workers threads, so a batch never holds more than
+    max_workers database connections however many tiles (or batches) are in flight.
+    """
+
+    def __init__(self, max_workers: int):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dashboard_tile")
+
+    def run(
+        self,
+        tiles: List[str],
+        dealer_id: str,
+        date_from: str,
+        date_to: str,
+        current_year: str
+    ) -> List[DashboardTileResult]:
+        """Run the given (known, de-duplicated) tiles and return their results in request order"""
+        futures = [
+            self.executor.submit(self._run_tile, tile, dealer_id, date_from, date_to, current_year)
+            for tile in tiles
+        ]
+        return [future.result() for future in futures]
+
+    def _run_tile(
+        self,
+        tile: str,
+        dealer_id: str,
+        date_from: str,
+        date_to: str,
+        current_year: str
+    ) -> DashboardTileResult:
+        controller_class, method_name, uses_year = DASHBOARD_TILES[tile]
+        started = time.perf_counter()
+        session_gen = db_manager.get_session()
+        try:
+            db = next(session_gen)
+            method = getattr(controller_class(db), method_name)
+            if uses_year:
+                result = method(dealer_id=dealer_id, current_year=current_year)
+            else:
+                result = method(dealer_id=dealer_id, date_from=date_from, date_to=date_to)
+
+            return DashboardTileResult(
+                tile=tile,
+                success=result.success,
+                message=result.message,
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+                data=result.model_dump()
+            )
+
+        except Exception as e:
+            logger.error(f"Error computing dashboard tile {tile} for dealer {dealer_id}: {str(e)}")
+            return DashboardTileResult(
+                tile=tile,
+                success=False,
+                message=f"Error retrieving data: {str(e)}",
+                duration_ms=round((time.perf_counter() - started) * 1000, 2)
+            )
+
+        finally:
+            session_gen.close()
+
+
+# Global dashboard tile service instance
+dashboard_tile_service = DashboardTileService(max_workers=settings.dashboard_tile_workers)
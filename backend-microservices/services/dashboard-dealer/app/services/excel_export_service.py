@@ -5,9 +5,16 @@ Excel Export Service for generating downloadable Excel files
 import io
 import os
 import sys
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import pandas as pd
+import tempfile
+from decimal import Decimal
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Iterable, Iterator, IO, Tuple
+from datetime import date, datetime, timedelta
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
 
 # Add utils to path
 utils_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../utils'))
@@ -20,148 +27,227 @@ logger = setup_logger(__name__)
 
 
 class ExcelExportService:
-    """Service for generating Excel files from data"""
-    
+    """Service for generating Excel files from data
+
+    Rows are written through a write-only openpyxl workbook, so memory stays flat no
+    matter how many rows the (streamed) input yields. Styles are registered once as
+    named styles and column widths are estimated from the first rows only.
+    """
+
+    # Same cell formats pandas' ExcelWriter applied to date and datetime values
+    DATE_FORMAT = "YYYY-MM-DD"
+    DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+    # Rows buffered up front to estimate column widths (widths must be set before writing)
+    WIDTH_SAMPLE_ROWS = 500
+    MIN_COLUMN_WIDTH = 10
+    MAX_COLUMN_WIDTH = 50
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(self):
         self.default_sheet_name = "Data Export"
-    
+
+    def write_excel(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        columns: List[Dict[str, str]],
+        target,
+        sheet_name: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> int:
+        """
+        Write rows to an Excel workbook in constant memory
+
+        Args:
+            rows: Iterable of dictionaries (a list or a streaming repository generator)
+            columns: List of dictionaries with 'key' and 'header' for each column
+            target: Binary file object (or path) the workbook is saved to
+            sheet_name: Name of the Excel sheet
+            title: Optional title row above the headers
+
+        Returns:
+            int: Number of data rows written
+        """
+        # Row number goes first; the 'no' entry in the column list only names it
+        data_columns = [col for col in columns if col['key'] != 'no']
+        headers = ['No'] + [col['header'] for col in data_columns]
+        keys = [col['key'] for col in data_columns]
+
+        rows = iter(rows)
+        sample = list(islice(rows, self.WIDTH_SAMPLE_ROWS))
+
+        workbook = Workbook(write_only=True)
+        header_style, data_styles = self._register_styles(workbook)
+        worksheet = workbook.create_sheet(title=sheet_name or self.default_sheet_name)
+
+        for col_num, width in enumerate(self._estimate_column_widths(headers, keys, sample), 1):
+            worksheet.column_dimensions[get_column_letter(col_num)].width = width
+
+        if title:
+            title_cell = WriteOnlyCell(worksheet, value=title)
+            title_cell.font = Font(bold=True, size=14)
+            title_cell.alignment = Alignment(horizontal="center")
+            worksheet.append([title_cell])
+            worksheet.merged_cells.add(f"A1:{get_column_letter(len(headers))}1")
+
+        worksheet.append([self._styled_cell(worksheet, header, header_style) for header in headers])
+
+        written = 0
+        for index, row in enumerate(chain(sample, rows), 1):
+            values = [index] + [self._cell_value(row.get(key)) for key in keys]
+            worksheet.append([
+                self._styled_cell(worksheet, value, self._data_style(data_styles, value)) for value in values
+            ])
+            written = index
+
+        workbook.save(target)
+        return written
+
     def create_excel_file(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         columns: List[Dict[str, str]],
         sheet_name: Optional[str] = None,
         title: Optional[str] = None
     ) -> bytes:
         """
         Create Excel file from data with proper formatting
-        
+
         Args:
-            data: List of dictionaries containing the data
+            data: Iterable of dictionaries containing the data
             columns: List of dictionaries with 'key' and 'header' for each column
             sheet_name: Name of the Excel sheet
             title: Optional title for the Excel sheet
-            
+
         Returns:
             bytes: Excel file content as bytes
         """
         try:
-            logger.info(f"Creating Excel file with {len(data)} records and {len(columns)} columns")
-            
-            if not data:
-                logger.warning("No data provided, creating empty Excel with headers only")
-                # Create empty DataFrame with just headers
-                headers = [col['header'] for col in columns]
-                df = pd.DataFrame(columns=headers)
-            else:
-                # Create DataFrame from data
-                processed_data = []
-                for index, row in enumerate(data, 1):
-                    processed_row = {'No': index}  # Add row number
-                    for col in columns:
-                        if col['key'] != 'no':  # Skip 'no' as we handle it separately
-                            processed_row[col['header']] = row.get(col['key'], '')
-                    processed_data.append(processed_row)
-                
-                df = pd.DataFrame(processed_data)
-            
-            # Create Excel file in memory
             buffer = io.BytesIO()
-            
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                sheet_name = sheet_name or self.default_sheet_name
-                
-                # Write DataFrame to Excel
-                df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=0)
-                
-                # Get the workbook and worksheet to apply formatting
-                workbook = writer.book
-                worksheet = writer.sheets[sheet_name]
-                
-                # Apply formatting
-                self._apply_excel_formatting(worksheet, df, title)
-            
-            buffer.seek(0)
+            written = self.write_excel(data, columns, buffer, sheet_name=sheet_name, title=title)
             excel_bytes = buffer.getvalue()
             buffer.close()
-            
-            logger.info(f"Excel file created successfully, size: {len(excel_bytes)} bytes")
+
+            logger.info(f"Excel file created successfully: {written} records, size: {len(excel_bytes)} bytes")
             return excel_bytes
-            
+
         except Exception as e:
             logger.error(f"Error creating Excel file: {str(e)}")
             raise Exception(f"Failed to create Excel file: {str(e)}")
-    
-    def _apply_excel_formatting(self, worksheet, df: pd.DataFrame, title: Optional[str] = None):
+
+    def create_excel_tempfile(
+        self,
+        data: Iterable[Dict[str, Any]],
+        columns: List[Dict[str, str]],
+        sheet_name: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> Tuple[IO[bytes], int, int]:
         """
-        Apply formatting to Excel worksheet
-        
+        Create Excel file in an anonymous temporary file instead of memory
+
         Args:
-            worksheet: openpyxl worksheet object
-            df: pandas DataFrame
-            title: Optional title for the sheet
+            data: Iterable of dictionaries containing the data
+            columns: List of dictionaries with 'key' and 'header' for each column
+            sheet_name: Name of the Excel sheet
+            title: Optional title for the Excel sheet
+
+        Returns:
+            Tuple of (file rewound to the start, records written, file size in bytes).
+            Pass the file to iter_file() to stream it; it is deleted once closed.
         """
+        excel_file = tempfile.TemporaryFile(suffix=".xlsx")
         try:
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-            
-            # Header formatting
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Border styling
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            # Apply header formatting
-            for col_num, _ in enumerate(df.columns, 1):
-                cell = worksheet.cell(row=1, column=col_num)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = thin_border
-            
-            # Apply borders to data cells
-            for row_num in range(2, len(df) + 2):
-                for col_num in range(1, len(df.columns) + 1):
-                    cell = worksheet.cell(row=row_num, column=col_num)
-                    cell.border = thin_border
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # Set minimum and maximum column width
-                adjusted_width = min(max(max_length + 2, 10), 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Add title if provided
-            if title:
-                worksheet.insert_rows(1)
-                title_cell = worksheet.cell(row=1, column=1, value=title)
-                title_cell.font = Font(bold=True, size=14)
-                title_cell.alignment = Alignment(horizontal="center")
-                
-                # Merge cells for title
-                worksheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(df.columns))
-            
-            logger.debug("Excel formatting applied successfully")
-            
+            written = self.write_excel(data, columns, excel_file, sheet_name=sheet_name, title=title)
+            size = excel_file.tell()
+            excel_file.seek(0)
+
+            logger.info(f"Excel file created successfully: {written} records, size: {size} bytes")
+            return excel_file, written, size
+
         except Exception as e:
-            logger.warning(f"Error applying Excel formatting: {str(e)}")
-            # Continue without formatting if there's an error
-    
+            excel_file.close()
+            logger.error(f"Error creating Excel file: {str(e)}")
+            raise Exception(f"Failed to create Excel file: {str(e)}")
+
+    def iter_file(self, excel_file: IO[bytes]) -> Iterator[bytes]:
+        """Yield a finished Excel file in chunks for a StreamingResponse, closing it at the end"""
+        try:
+            while True:
+                chunk = excel_file.read(self.STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            excel_file.close()
+
+    def _register_styles(self, workbook: Workbook) -> Tuple[str, Dict[type, str]]:
+        """Register the header and data cell styles once per workbook
+
+        Returns the header style name and the data style names keyed by value type
+        (``object`` for values without a number format).
+        """
+        thin_border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+
+        header_style = NamedStyle(name="export_header")
+        header_style.font = Font(bold=True, color="FFFFFF")
+        header_style.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_style.alignment = Alignment(horizontal="center", vertical="center")
+        header_style.border = thin_border
+        workbook.add_named_style(header_style)
+
+        data_styles = {}
+        for value_type, name, number_format in (
+            (object, "export_data", None),
+            (date, "export_date", self.DATE_FORMAT),
+            (datetime, "export_datetime", self.DATETIME_FORMAT),
+        ):
+            style = NamedStyle(name=name)
+            style.border = thin_border
+            if number_format:
+                style.number_format = number_format
+            workbook.add_named_style(style)
+            data_styles[value_type] = style.name
+
+        return header_style.name, data_styles
+
+    @staticmethod
+    def _data_style(data_styles: Dict[type, str], value) -> str:
+        """Data style for a cell value; dates need a number format or Excel shows serials"""
+        if isinstance(value, datetime):
+            return data_styles[datetime]
+        if isinstance(value, date):
+            return data_styles[date]
+        return data_styles[object]
+
+    def _styled_cell(self, worksheet, value, style: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = style
+        return cell
+
+    def _estimate_column_widths(self, headers: List[str], keys: List[str], sample: List[Dict[str, Any]]) -> List[int]:
+        """Column widths from the header and the sampled rows, clamped to [MIN, MAX]"""
+        widths = [len(headers[0])]
+        for header, key in zip(headers[1:], keys):
+            longest = len(str(header))
+            for row in sample:
+                value = row.get(key)
+                if value is not None:
+                    longest = max(longest, len(str(value)))
+            widths.append(longest)
+        return [min(max(width + 2, self.MIN_COLUMN_WIDTH), self.MAX_COLUMN_WIDTH) for width in widths]
+
+    @staticmethod
+    def _cell_value(value):
+        """Pass through types openpyxl writes natively; stringify anything else (UUIDs, etc.)"""
+        if value is None or isinstance(value, (str, int, float, Decimal, bool, date, datetime)):
+            return value
+        return str(value)
+
     def generate_filename(
         self,
         export_type: str,
@@ -171,13 +257,13 @@ class ExcelExportService:
     ) -> str:
         """
         Generate standardized filename for Excel export
-        
+
         Args:
             export_type: Type of export (e.g., 'WorkOrder', 'NJB_NSC', 'HLO')
             dealer_id: Dealer ID
             date_from: Start date
             date_to: End date
-            
+
         Returns:
             str: Generated filename
         """
@@ -185,4 +271,4 @@ class ExcelExportService:
         indonesia_time = datetime.now() + timedelta(hours=7)
         timestamp = indonesia_time.strftime("%Y%m%d_%H%M%S")
         filename = f"{export_type}_Export_{dealer_id}_{date_from.replace('-', '')}_{date_to.replace('-', '')}_{timestamp}.xlsx"
-        return filename
\ No newline at end of file
+        return filename
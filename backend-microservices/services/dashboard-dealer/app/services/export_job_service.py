@@ -0,0 +1,228 @@
+"""
+Asynchronous Excel export jobs with an on-disk artifact cache
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, IO, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+# Add utils to path
+utils_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../utils'))
+if utils_path not in sys.path:
+    sys.path.append(utils_path)
+
+from utils.logger import setup_logger
+from app.config import settings
+from app.dependencies import db_manager
+
+logger = setup_logger(__name__)
+
+# Builds one export with the given session: returns the rewound Excel file and its metadata
+ExportBuilder = Callable[[Session], Tuple[IO[bytes], Any]]
+
+
+class ExportJobService:
+    """Runs Excel exports on a background thread pool and caches finished files on disk
+
+    A job ID is derived from (export_type, dealer_id, date range, data version), so a
+    repeat request for unchanged data maps to the same finished file, and every API
+    worker process sees the same job state through the cache directory:
+
+        <job_id>.xlsx   finished workbook
+        <job_id>.json   job description + export metadata (written last)
+        <job_id>.lock   job is running (ignored after RUNNING_TIMEOUT_SECONDS)
+        <job_id>.error  job description + failure message
+
+    Files are written under a per-writer temp name and renamed into place, so a job
+    restarted after a stale lock never interleaves its writes with the original run.
+    Downloads are served from a handle opened up front, which pruning cannot pull away.
+    """
+
+    RUNNING_TIMEOUT_SECONDS = 1800
+
+    def __init__(self, cache_dir: str, ttl_hours: int, max_workers: int):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="excel_export")
+
+    @staticmethod
+    def job_id_for(export_type: str, dealer_id: str, date_from: str, date_to: str, data_version: str) -> str:
+        key = f"{export_type}|{dealer_id}|{date_from}|{date_to}|{data_version}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, job_id: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{job_id}.{suffix}")
+
+    def _age_seconds(self, path: str) -> Optional[float]:
+        try:
+            return time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _read_json(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path: str, payload: Dict[str, Any]) -> None:
+        """Write via a temp file + rename so readers never see a partial file"""
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, path)
+
+    def _remove(self, *paths: str) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current job state from the cache directory, or None if unknown/expired"""
+        meta_path = self._path(job_id, "json")
+        age = self._age_seconds(meta_path)
+        if age is not None and age < self.ttl_seconds and os.path.exists(self._path(job_id, "xlsx")):
+            job = self._read_json(meta_path)
+            if job:
+                return {**job, "status": "completed"}
+
+        lock_path = self._path(job_id, "lock")
+        age = self._age_seconds(lock_path)
+        if age is not None:
+            if age < self.RUNNING_TIMEOUT_SECONDS:
+                job = self._read_json(lock_path) or {"job_id": job_id}
+                return {**job, "status": "running"}
+            # Worker died mid-export; let the next submit start over
+            self._remove(lock_path)
+
+        job = self._read_json(self._path(job_id, "error"))
+        if job:
+            return {**job, "status": "failed"}
+
+        return None
+
+    def get_file(self, job_id: str) -> Optional[Tuple[IO[bytes], Dict[str, Any]]]:
+        """Open handle and metadata of a completed job's workbook; the caller closes the handle"""
+        job = self.get_status(job_id)
+        if not job or job["status"] != "completed":
+            return None
+        try:
+            return open(self._path(job_id, "xlsx"), "rb"), job["metadata"]
+        except FileNotFoundError:
+            # Pruned between the status check and the open
+            return None
+
+    def submit(
+        self,
+        export_type: str,
+        dealer_id: str,
+        date_from: str,
+        date_to: str,
+        data_version: str,
+        build: ExportBuilder
+    ) -> Dict[str, Any]:
+        """Start an export job unless the same data is already exported or being exported"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.prune_expired()
+
+        job_id = self.job_id_for(export_type, dealer_id, date_from, date_to, data_version)
+        existing = self.get_status(job_id)
+        if existing and existing["status"] == "completed":
+            return {**existing, "cached": True}
+        if existing and existing["status"] == "running":
+            return existing
+
+        job = {
+            "job_id": job_id,
+            "export_type": export_type,
+            "dealer_id": dealer_id,
+            "date_from": date_from,
+            "date_to": date_to,
+            "data_version": data_version,
+        }
+        owner = uuid.uuid4().hex
+
+        # O_EXCL makes the claim atomic across threads and worker processes
+        try:
+            fd = os.open(self._path(job_id, "lock"), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return self.get_status(job_id) or {**job, "status": "running"}
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({**job, "owner": owner}, handle)
+
+        self._remove(self._path(job_id, "error"))
+        self.executor.submit(self._run, job, build, owner)
+        logger.info(f"Export job {job_id} queued: {export_type} dealer {dealer_id} {date_from}..{date_to}")
+        return {**job, "status": "running"}
+
+    def _run(self, job: Dict[str, Any], build: ExportBuilder, owner: str) -> None:
+        job_id = job["job_id"]
+        xlsx_path = self._path(job_id, "xlsx")
+        tmp_path = f"{xlsx_path}.{owner}.tmp"
+        session_gen = db_manager.get_session()
+        try:
+            db = next(session_gen)
+            excel_file, metadata = build(db)
+            try:
+                with open(tmp_path, "wb") as out:
+                    shutil.copyfileobj(excel_file, out)
+            finally:
+                excel_file.close()
+            os.replace(tmp_path, xlsx_path)
+
+            self._write_json(self._path(job_id, "json"), {**job, "metadata": metadata.model_dump()})
+            logger.info(f"Export job {job_id} completed: {metadata.total_records} records, {metadata.file_size_bytes} bytes")
+
+        except Exception as e:
+            logger.error(f"Export job {job_id} failed: {str(e)}")
+            self._remove(tmp_path)
+            self._write_json(self._path(job_id, "error"), {**job, "error_message": str(e)})
+
+        finally:
+            self._release_lock(job_id, owner)
+            session_gen.close()
+
+    def _release_lock(self, job_id: str, owner: str) -> None:
+        """Remove the job's lock unless a restarted run (after a stale lock) has claimed it"""
+        lock_path = self._path(job_id, "lock")
+        lock = self._read_json(lock_path)
+        if lock is not None and lock.get("owner") not in (None, owner):
+            return
+        self._remove(lock_path)
+
+    def prune_expired(self) -> int:
+        """Delete cached files older than the TTL; returns files removed"""
+        removed = 0
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return 0
+
+        for name in names:
+            if name.endswith(".lock"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            age = self._age_seconds(path)
+            if age is not None and age >= self.ttl_seconds:
+                self._remove(path)
+                removed += 1
+        return removed
+
+
+# Global export job service instance
+export_job_service = ExportJobService(
+    cache_dir=settings.export_cache_dir,
+    ttl_hours=settings.export_cache_ttl_hours,
+    max_workers=settings.export_job_workers
+)
@@ -0,0 +1,21 @@
+"""
+Date range filters on the typed DATE columns parsed from DGI date strings at ingest
+"""
+from datetime import date, datetime
+from typing import Union
+
+from sqlalchemy import and_
+
+
+def as_date(value: Union[str, date, datetime]) -> date:
+    """Coerce a YYYY-MM-DD string (or date/datetime) to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+def date_between(column, date_from: Union[str, date], date_to: Union[str, date]):
+    """Inclusive ``date_from <= column <= date_to`` filter on a DATE column (index friendly)"""
+    return and_(column >= as_date(date_from), column <= as_date(date_to))
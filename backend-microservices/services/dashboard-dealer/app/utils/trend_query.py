@@ -0,0 +1,99 @@
+"""
+Current vs previous-period counts for the dashboard trend (KPI) cards in a single scan
+"""
+from datetime import date
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from sqlalchemy import and_, false, func, or_
+
+from app.utils.date_filter import as_date, date_between
+
+# Import dateutil for date calculations
+try:
+    from dateutil.relativedelta import relativedelta
+    DATEUTIL_AVAILABLE = True
+except ImportError:
+    DATEUTIL_AVAILABLE = False
+    relativedelta = None
+
+
+def previous_month_period(date_from: Union[str, date], date_to: Union[str, date]) -> Optional[Tuple[date, date]]:
+    """The date range shifted back one month, or None without python-dateutil"""
+    if not DATEUTIL_AVAILABLE:
+        return None
+    return as_date(date_from) - relativedelta(months=1), as_date(date_to) - relativedelta(months=1)
+
+
+def count_with_previous_period(
+    db,
+    source,
+    counted,
+    date_column,
+    date_from: Union[str, date],
+    date_to: Union[str, date],
+    conditions: Iterable[Any] = (),
+    join: Optional[Tuple[Any, Any]] = None,
+    distinct: bool = False
+) -> Tuple[int, int]:
+    """
+    (current, previous) COUNT of ``counted`` for the range and the range one month earlier
+
+    Both periods come from one pass over rows in either range, using
+    ``COUNT(...) FILTER (WHERE ...)`` per period. Overlapping periods are counted
+    independently, so the result matches two separate filtered counts.
+
+    Args:
+        db: Database session
+        source: Model the rows are selected from
+        counted: Column to count (non-NULL values)
+        date_column: DATE column the periods filter on
+        date_from: Start of the current period (inclusive)
+        date_to: End of the current period (inclusive)
+        conditions: Additional filters shared by both periods
+        join: Optional (target, onclause) joined to source
+        distinct: Count distinct values of ``counted``
+    """
+    current_period = date_between(date_column, date_from, date_to)
+    previous_dates = previous_month_period(date_from, date_to)
+    previous_period = date_between(date_column, *previous_dates) if previous_dates else false()
+
+    counted_expr = func.distinct(counted) if distinct else counted
+    query = db.query(
+        func.count(counted_expr).filter(current_period),
+        func.count(counted_expr).filter(previous_period)
+    ).select_from(source)
+    if join is not None:
+        query = query.join(*join)
+
+    current_count, previous_count = query.filter(
+        and_(*conditions, or_(current_period, previous_period))
+    ).one()
+    return int(current_count or 0), int(previous_count or 0)
+
+
+def trend_summary(current_count: int, previous_count: int) -> Dict[str, Any]:
+    """Trend arrow and percentage change of a KPI card"""
+    if previous_count == 0:
+        if current_count > 0:
+            trend = 'up'
+            percentage = 100.0
+        else:
+            trend = 'stable'
+            percentage = 0.0
+    else:
+        percentage_change = ((current_count - previous_count) / previous_count) * 100
+        percentage = round(abs(percentage_change), 1)
+
+        if percentage_change > 0:
+            trend = 'up'
+        elif percentage_change < 0:
+            trend = 'down'
+        else:
+            trend = 'stable'
+
+    return {
+        'count': current_count,
+        'previous_count': previous_count,
+        'trend': trend,
+        'percentage': percentage
+    }
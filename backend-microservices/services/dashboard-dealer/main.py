@@ -20,6 +20,7 @@ from app.config import settings
 from app.routes import dashboard_router, health_router, admin_dashboard_router, h23_dashboard_router, excel_export_router
 from utils.database import DatabaseManager
 from utils.logger import setup_logger
+from utils.threadpool import configure_threadpool
 
 # Setup logger
 logger = setup_logger(__name__)
@@ -33,6 +34,10 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info(f"Starting {settings.service_name} v{settings.service_version}")
+    configure_threadpool(
+        settings.threadpool_max_workers,
+        reserved_connections=settings.dashboard_tile_workers + settings.export_job_workers
+    )
     
     # Initialize database connection (tables already exist in dealer_integration schema)
     try:
@@ -0,0 +1,170 @@
+"""
+Tests for the single-scan trend card query
+
+count_with_previous_period must return exactly what the two separate per-period
+COUNT queries it replaced returned.
+"""
+
+import random
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import Column, Date, ForeignKey, Integer, String, create_engine, func
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.utils import trend_query
+from app.utils.date_filter import as_date, date_between
+from app.utils.trend_query import count_with_previous_period, previous_month_period, trend_summary
+
+Base = declarative_base()
+
+
+class Handling(Base):
+    """Parent rows carrying the dealer, like DocumentHandlingData"""
+    __tablename__ = "handling"
+
+    id = Column(Integer, primary_key=True)
+    dealer_id = Column(String(10), nullable=False)
+
+
+class HandlingUnit(Base):
+    """Child rows carrying the filtered date, like DocumentHandlingUnit"""
+    __tablename__ = "handling_unit"
+
+    id = Column(Integer, primary_key=True)
+    handling_id = Column(Integer, ForeignKey("handling.id"), nullable=False)
+    received_date = Column(Date, nullable=True)
+
+
+DEALER_ID = "00001"
+
+DATE_RANGES = [
+    ("2025-03-01", "2025-03-31"),  # a calendar month
+    ("2025-03-10", "2025-03-12"),  # short window, the gap between periods is not counted
+    ("2025-02-01", "2025-03-31"),  # longer than a month, the periods overlap
+    ("2025-03-31", "2025-03-31"),  # previous period clipped to 2025-02-28
+    ("2025-01-01", "2025-04-30"),
+    ("2026-01-01", "2026-01-31"),  # no rows at all
+]
+
+
+@pytest.fixture(scope="module")
+def db():
+    """SQLite session with two dealers' rows spread over January to April 2025"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    rng = random.Random(23)
+    for handling_id in range(1, 121):
+        session.add(Handling(id=handling_id, dealer_id=rng.choice([DEALER_ID, "00002"])))
+    for unit_id in range(1, 1201):
+        offset = rng.randrange(120)
+        session.add(HandlingUnit(
+            id=unit_id,
+            handling_id=rng.randrange(1, 121),
+            received_date=None if offset % 17 == 0 else date(2025, 1, 1) + timedelta(days=offset)
+        ))
+    session.commit()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def two_query_counts(db, date_from, date_to, distinct=False):
+    """Baseline: one COUNT query per period, as the repositories used to run"""
+    counted = func.distinct(HandlingUnit.handling_id) if distinct else HandlingUnit.id
+
+    def period_count(period_from, period_to):
+        return int(
+            db.query(func.count(counted))
+            .select_from(HandlingUnit)
+            .join(Handling, HandlingUnit.handling_id == Handling.id)
+            .filter(
+                Handling.dealer_id == DEALER_ID,
+                HandlingUnit.received_date.isnot(None),
+                date_between(HandlingUnit.received_date, period_from, period_to)
+            )
+            .scalar() or 0
+        )
+
+    previous_from = as_date(date_from) - relativedelta(months=1)
+    previous_to = as_date(date_to) - relativedelta(months=1)
+    return period_count(date_from, date_to), period_count(previous_from, previous_to)
+
+
+def single_scan_counts(db, date_from, date_to, distinct=False):
+    return count_with_previous_period(
+        db,
+        source=HandlingUnit,
+        counted=HandlingUnit.handling_id if distinct else HandlingUnit.id,
+        date_column=HandlingUnit.received_date,
+        date_from=date_from,
+        date_to=date_to,
+        conditions=(Handling.dealer_id == DEALER_ID, HandlingUnit.received_date.isnot(None)),
+        join=(Handling, HandlingUnit.handling_id == Handling.id),
+        distinct=distinct
+    )
+
+
+class TestCountWithPreviousPeriod:
+    """Single scan versus the per-period baseline queries"""
+
+    @pytest.mark.parametrize("date_from,date_to", DATE_RANGES)
+    def test_matches_two_queries(self, db, date_from, date_to):
+        assert single_scan_counts(db, date_from, date_to) == two_query_counts(db, date_from, date_to)
+
+    @pytest.mark.parametrize("date_from,date_to", DATE_RANGES)
+    def test_matches_two_queries_distinct(self, db, date_from, date_to):
+        assert single_scan_counts(db, date_from, date_to, distinct=True) == \
+            two_query_counts(db, date_from, date_to, distinct=True)
+
+    def test_overlapping_periods_count_independently(self, db):
+        current, previous = single_scan_counts(db, "2025-02-01", "2025-03-31")
+        february = two_query_counts(db, "2025-02-01", "2025-02-28")[0]
+        assert current > february > 0
+        assert previous >= february
+
+    def test_accepts_date_objects(self, db):
+        assert single_scan_counts(db, date(2025, 3, 1), date(2025, 3, 31)) == \
+            single_scan_counts(db, "2025-03-01", "2025-03-31")
+
+    def test_without_dateutil_previous_is_zero(self, db):
+        with patch.object(trend_query, "DATEUTIL_AVAILABLE", False):
+            current, previous = single_scan_counts(db, "2025-03-01", "2025-03-31")
+        assert (current, previous) == (two_query_counts(db, "2025-03-01", "2025-03-31")[0], 0)
+
+
+class TestPreviousMonthPeriod:
+    """Range shifted back one month"""
+
+    def test_shifts_both_ends(self):
+        assert previous_month_period("2025-03-01", "2025-03-31") == (date(2025, 2, 1), date(2025, 2, 28))
+
+    def test_clips_to_month_end(self):
+        assert previous_month_period("2024-03-31", "2024-03-31") == (date(2024, 2, 29), date(2024, 2, 29))
+
+    def test_crosses_year_boundary(self):
+        assert previous_month_period("2025-01-15", "2025-01-20") == (date(2024, 12, 15), date(2024, 12, 20))
+
+
+class TestTrendSummary:
+    """Trend arrow and percentage of a KPI card"""
+
+    def test_up(self):
+        assert trend_summary(15, 10) == {'count': 15, 'previous_count': 10, 'trend': 'up', 'percentage': 50.0}
+
+    def test_down(self):
+        assert trend_summary(2, 3) == {'count': 2, 'previous_count': 3, 'trend': 'down', 'percentage': 33.3}
+
+    def test_stable(self):
+        assert trend_summary(4, 4)['trend'] == 'stable'
+        assert trend_summary(0, 0) == {'count': 0, 'previous_count': 0, 'trend': 'stable', 'percentage': 0.0}
+
+    def test_no_previous_period(self):
+        assert trend_summary(7, 0) == {'count': 7, 'previous_count': 0, 'trend': 'up', 'percentage': 100.0}
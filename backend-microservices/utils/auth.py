@@ -3,9 +3,13 @@ Shared authentication utilities for microservices
 """
 
 import os
+import hashlib
+import threading
+import time
 import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from passlib.context import CryptContext
 from .logger import setup_logger
 
@@ -17,6 +21,10 @@ JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
+# Decoded-token cache (see TokenCache)
+JWT_DECODE_CACHE_SIZE = int(os.getenv("JWT_DECODE_CACHE_SIZE", "10000"))
+JWT_DECODE_CACHE_TTL_SECONDS = int(os.getenv("JWT_DECODE_CACHE_TTL_SECONDS", "300"))
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -187,6 +195,57 @@ class AuthUtils:
         return None
 
 
+class TokenCache:
+    """Bounded LRU of successfully decoded tokens, keyed by the token's SHA-256
+
+    Lets a service authenticate repeat requests without re-verifying the signature.
+    An entry is dropped once the token expires (or after ttl_seconds, whichever
+    comes first); invalid tokens are never cached. Thread-safe, since synchronous
+    routes and their dependencies run on worker threads.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """Decoded token data (from the cache when possible) or None if invalid"""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        now = time.time()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if now < expires_at:
+                    self.entries.move_to_end(key)
+                    return payload
+                del self.entries[key]
+
+        payload = AuthUtils.decode_token(token)
+        if payload is None or self.max_size <= 0:
+            return payload
+
+        expires_at = now + self.ttl_seconds
+        exp = payload.get("exp")
+        if exp:
+            expires_at = min(expires_at, float(exp))
+
+        with self.lock:
+            self.entries[key] = (expires_at, payload)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+        return payload
+
+
+# Process-wide decoded-token cache
+token_cache = TokenCache(max_size=JWT_DECODE_CACHE_SIZE, ttl_seconds=JWT_DECODE_CACHE_TTL_SECONDS)
+
+
 # Convenience functions
 def hash_password(password: str) -> str:
     """Hash password - convenience function"""
@@ -211,3 +270,8 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """Decode token - convenience function"""
     return AuthUtils.decode_token(token)
+
+
+def decode_token_cached(token: str) -> Optional[Dict[str, Any]]:
+    """Decode token through the process-wide TokenCache - convenience function"""
+    return token_cache.decode(token)
@@ -19,11 +19,15 @@ DATABASE_URL = os.getenv(
 )
 
 # Enhanced connection pooling for microservices
+POOL_SIZE = 15  # Base connections for microservice
+MAX_OVERFLOW = 30  # Additional connections during load
+POOL_CAPACITY = POOL_SIZE + MAX_OVERFLOW  # Most connections a process can hold at once
+
 engine = create_engine(
     DATABASE_URL,
     # Optimized pool settings for microservices
-    pool_size=15,  # Base connections for microservice
-    max_overflow=30,  # Additional connections during load
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     pool_pre_ping=True,  # Validate connections
     pool_recycle=1800,  # Recycle every 30 minutes
     pool_timeout=20,  # Connection wait timeout
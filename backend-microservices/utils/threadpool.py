@@ -0,0 +1,37 @@
+"""
+Bounded worker threadpool for synchronous (``def``) FastAPI routes
+"""
+
+from anyio import to_thread
+
+from .database import POOL_CAPACITY
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def configure_threadpool(max_workers: int, reserved_connections: int = 0) -> None:
+    """
+    Size the threadpool FastAPI runs ``def`` routes and dependencies in
+
+    Routes that only do blocking SQLAlchemy work are declared with plain ``def`` so
+    FastAPI offloads them here instead of running them on the event loop. Every
+    worker thread can hold a database connection, and so can the service's own
+    background executors, so max_workers plus those executors' threads
+    (``reserved_connections``) should not exceed the connection pool capacity
+    (POOL_SIZE + MAX_OVERFLOW in utils.database); otherwise threads queue on the pool
+    and time out. Must be called from the running event loop (e.g. the lifespan startup).
+
+    Args:
+        max_workers: Maximum concurrent worker threads
+        reserved_connections: Connections held by the service's other thread pools
+    """
+    if max_workers + reserved_connections > POOL_CAPACITY:
+        logger.warning(
+            f"Worker threadpool ({max_workers}) plus background workers ({reserved_connections}) "
+            f"exceed the database pool capacity ({POOL_CAPACITY}); requests may wait for connections"
+        )
+
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max_workers
+    logger.info(f"Worker threadpool limited to {max_workers} threads")
@@ -12,7 +12,7 @@ celery_app = Celery(
     "dealer_dashboard",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["tasks.data_fetcher", "tasks.data_fetcher_router"]
+    include=["tasks.data_fetcher", "tasks.data_fetcher_router", "tasks.job_queue_tasks"]
 )
 
 # Celery configuration
@@ -36,6 +36,11 @@ celery_app.conf.beat_schedule = {
         'task': 'tasks.data_fetcher_router.health_check',
         'schedule': crontab(minute='*/5'),  # Every 5 minutes
     },
+    # Recover the manual job queue after worker crashes/restarts
+    'dispatch-job-queue': {
+        'task': 'tasks.job_queue_tasks.dispatch_queued_jobs',
+        'schedule': crontab(minute='*'),  # Every minute
+    },
     # Dynamic schedules will be added by the scheduler
 }
 
@@ -14,6 +14,7 @@ from models.schemas import (
     CountResponse
 )
 from .base_controller import BaseController
+from tasks.api_clients import APIConfigManager
 
 router = APIRouter(tags=["configuration"])
 
@@ -90,6 +91,12 @@ async def get_api_configurations(db: Session = Depends(get_db)):
     return configs
 
 
+@router.get("/api-configurations/cache-stats")
+async def get_api_configuration_cache_stats():
+    """Get API configuration cache statistics for this process"""
+    return APIConfigManager.cache.get_stats()
+
+
 @router.post("/api-configurations/", response_model=APIConfigurationResponse)
 async def create_api_configuration(config: APIConfigurationCreate, db: Session = Depends(get_db)):
     """Create a new API configuration"""
@@ -102,6 +109,7 @@ async def create_api_configuration(config: APIConfigurationCreate, db: Session =
     db.add(db_config)
     db.commit()
     db.refresh(db_config)
+    APIConfigManager.invalidate_cache()
     
     BaseController.convert_uuid_to_string(db_config)
     BaseController.log_operation("CREATE_API_CONFIG", f"Created API config {config.config_name}")
@@ -122,6 +130,7 @@ async def update_api_configuration(config_id: str, config: APIConfigurationUpdat
     
     db.commit()
     db.refresh(db_config)
+    APIConfigManager.invalidate_cache()
     
     BaseController.convert_uuid_to_string(db_config)
     BaseController.log_operation("UPDATE_API_CONFIG", f"Updated API config {config_id}")
@@ -138,6 +147,7 @@ async def delete_api_configuration(config_id: str, db: Session = Depends(get_db)
 
     db.delete(db_config)
     db.commit()
+    APIConfigManager.invalidate_cache()
     
     BaseController.log_operation("DELETE_API_CONFIG", f"Deleted API config {config_id}")
     return {"message": "API configuration deleted successfully"}
@@ -271,6 +281,7 @@ async def initialize_api_configurations(db: Session = Depends(get_db)):
         db.add(config)
 
     db.commit()
+    APIConfigManager.invalidate_cache()
     
     BaseController.log_operation("INIT_API_CONFIGS", f"Initialized {len(default_configs)} default API configurations")
     return {"message": "Default API configurations initialized successfully", "count": len(default_configs)}
@@ -403,6 +414,7 @@ async def force_reinitialize_api_configurations(db: Session = Depends(get_db)):
             db.add(config)
 
         db.commit()
+        APIConfigManager.invalidate_cache()
 
         BaseController.log_operation("FORCE_REINIT_API_CONFIGS", f"Force re-initialized {len(default_configs)} API configurations (deleted {deleted_count} existing)")
         return {"message": f"API configurations force re-initialized successfully (deleted {deleted_count}, created {len(default_configs)})", "count": len(default_configs)}
@@ -2,6 +2,7 @@
 Jobs controller for manual job execution and job status management
 """
 from fastapi import APIRouter, Depends, HTTPException
+import asyncio
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 
@@ -11,24 +12,50 @@ from .base_controller import BaseController
 from celery_app import celery_app
 from job_queue_manager import add_job_to_queue, get_job_status as get_queue_job_status, get_queue_status, cancel_job as cancel_queue_job, clear_completed_jobs
 from tasks.enhanced_task_runner import enhanced_task_runner
+from tasks.api_clients import SharedHTTPTransport
+from tasks.processors.base_processor import BaseDataProcessor
+from tasks.job_queue_manager import JobPriority
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _parse_priority(priority: Optional[str]) -> JobPriority:
+    """Resolve a queue priority name, rejecting unknown values"""
+    try:
+        return JobPriority[(priority or "NORMAL").upper()]
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid priority '{priority}'. Use one of: {', '.join(p.name for p in JobPriority)}"
+        )
+
+
+def _manual_time_range(from_time: Optional[str], to_time: Optional[str]) -> tuple[str, str]:
+    """Fill a manual job's missing window with the whole current day
+
+    Jobs started without a window keep fetching today's data; only scheduled runs
+    (which never pass a window) fetch incrementally from the dealer's watermark.
+    """
+    return BaseDataProcessor.whole_day_time_range(from_time, to_time)
+
+
 # NEW: Queue-based job endpoints
 @router.post("/queue", response_model=Dict[str, Any])
 async def add_job_to_queue_endpoint(request: ManualFetchRequest, db: Session = Depends(get_db)):
-    """Add a job to the sequential queue (RECOMMENDED - prevents database conflicts)"""
+    """Add a job to the queue (RECOMMENDED - one running job per dealer prevents database conflicts)"""
     # Validate dealer exists
     BaseController.validate_dealer_exists(db, request.dealer_id, Dealer)
+    priority = _parse_priority(request.priority)
+    from_time, to_time = _manual_time_range(request.from_time, request.to_time)
 
     # Add job to queue
     job_id = await add_job_to_queue(
         dealer_id=request.dealer_id,
         fetch_type=request.fetch_type,
-        from_time=request.from_time,
-        to_time=request.to_time,
-        no_po=request.no_po
+        from_time=from_time,
+        to_time=to_time,
+        no_po=request.no_po,
+        priority=priority
     )
 
     BaseController.log_operation("ADD_JOB_TO_QUEUE", f"Added {request.fetch_type} job for dealer {request.dealer_id} to queue: {job_id}")
@@ -38,6 +65,7 @@ async def add_job_to_queue_endpoint(request: ManualFetchRequest, db: Session = D
         "job_id": job_id,
         "dealer_id": request.dealer_id,
         "fetch_type": request.fetch_type,
+        "priority": priority.name,
         "status": "queued"
     }
 
@@ -46,7 +74,7 @@ async def add_job_to_queue_endpoint(request: ManualFetchRequest, db: Session = D
 async def get_queue_status_endpoint():
     """Get overall queue status"""
     status = await get_queue_status()
-    BaseController.log_operation("GET_QUEUE_STATUS", f"Queue status: {status['queue_length']} jobs queued, processing: {status['is_processing']}")
+    BaseController.log_operation("GET_QUEUE_STATUS", f"Queue status: {status['queue_length']} jobs queued, {status['running_count']} running")
     return status
 
 
@@ -86,6 +114,9 @@ async def add_bulk_jobs_to_queue(
     db: Session = Depends(get_db)
 ):
     """Add multiple jobs to queue (RECOMMENDED for bulk operations)"""
+    priority = _parse_priority(request.priority)
+    from_time, to_time = _manual_time_range(request.from_time, request.to_time)
+
     # Validate all dealers exist
     valid_dealers = []
     invalid_dealers = []
@@ -112,8 +143,9 @@ async def add_bulk_jobs_to_queue(
             job_id = await add_job_to_queue(
                 dealer_id=dealer_id,
                 fetch_type=request.fetch_type,
-                from_time=request.from_time,
-                to_time=request.to_time
+                from_time=from_time,
+                to_time=to_time,
+                priority=priority
             )
 
             queued_jobs.append({
@@ -148,6 +180,7 @@ async def run_job(request: ManualFetchRequest, db: Session = Depends(get_db)):
     """Execute a manual data fetch job"""
     # Validate dealer exists
     BaseController.validate_dealer_exists(db, request.dealer_id, Dealer)
+    request.from_time, request.to_time = _manual_time_range(request.from_time, request.to_time)
 
     # Determine which task to run based on fetch_type
     if request.fetch_type == "pkb":
@@ -278,9 +311,14 @@ async def run_bulk_jobs(
     fetch_type: str = "prospect",
     from_time: Optional[str] = None,
     to_time: Optional[str] = None,
+    concurrent: bool = False,
     db: Session = Depends(get_db)
 ):
-    """Run jobs for multiple dealers"""
+    """Run jobs for multiple dealers
+
+    With ``concurrent=true`` a single task fetches all dealers concurrently
+    (see DataFetcherRouter.execute_fetch_many) instead of one task per dealer.
+    """
     # Validate all dealers exist
     valid_dealers = []
     invalid_dealers = []
@@ -297,7 +335,23 @@ async def run_bulk_jobs(
             status_code=400, 
             detail=f"Invalid dealer IDs: {', '.join(invalid_dealers)}"
         )
-    
+
+    from_time, to_time = _manual_time_range(from_time, to_time)
+
+    if concurrent:
+        task = celery_app.send_task(
+            "tasks.data_fetcher_router.fetch_data_for_dealers",
+            args=[fetch_type, valid_dealers, from_time, to_time]
+        )
+        BaseController.log_operation("RUN_BULK_JOBS_CONCURRENT", f"Started concurrent {fetch_type} fetch for {len(valid_dealers)} dealers: {task.id}")
+        return {
+            "message": "Concurrent bulk job started",
+            "total_dealers": len(dealer_ids),
+            "task_id": task.id,
+            "fetch_type": fetch_type,
+            "status": "started"
+        }
+
     # Start jobs for all valid dealers
     started_jobs = []
     failed_jobs = []
@@ -490,6 +544,28 @@ async def get_job_system_health():
         }
 
 
+@router.get("/http-pool/stats")
+async def get_http_pool_stats():
+    """Get shared DGI HTTP connection pool stats for this API process and the Celery workers"""
+    api_stats = SharedHTTPTransport.get_pool_stats()
+
+    worker_stats = {}
+    try:
+        # health_check runs inside a worker and reports that worker's pool
+        result = celery_app.send_task("tasks.data_fetcher_router.health_check")
+        worker_stats = await asyncio.to_thread(result.get, timeout=10)
+        worker_stats = worker_stats.get("http_pool", {})
+    except Exception as e:
+        worker_stats = {"error": str(e)}
+
+    BaseController.log_operation("GET_HTTP_POOL_STATS", f"API pool requests sent: {api_stats['requests_sent']}")
+
+    return {
+        "api_process": api_stats,
+        "worker_sample": worker_stats
+    }
+
+
 # ============================================================================
 # ENHANCED BATCH PROCESSING ENDPOINTS
 # ============================================================================
@@ -499,13 +575,14 @@ async def run_enhanced_batch_job(request: ManualFetchRequest, db: Session = Depe
     """Run a single batch processing job with enhanced performance optimizations"""
     # Validate dealer exists
     BaseController.validate_dealer_exists(db, request.dealer_id, Dealer)
+    from_time, to_time = _manual_time_range(request.from_time, request.to_time)
 
     try:
         result = enhanced_task_runner.run_single_task(
             processor_type=request.fetch_type,
             dealer_id=request.dealer_id,
-            from_time=request.from_time,
-            to_time=request.to_time,
+            from_time=from_time,
+            to_time=to_time,
             priority="normal",
             no_po=request.no_po
         )
@@ -578,11 +655,12 @@ async def run_enhanced_bulk_jobs(request: BulkJobRequest, db: Session = Depends(
         # Convert to task format
         tasks = []
         for job in request.jobs:
+            from_time, to_time = _manual_time_range(job.from_time, job.to_time)
             tasks.append({
                 'processor_type': job.fetch_type,
                 'dealer_id': job.dealer_id,
-                'from_time': job.from_time,
-                'to_time': job.to_time,
+                'from_time': from_time,
+                'to_time': to_time,
                 'priority': 'normal',
                 'kwargs': {'no_po': job.no_po} if hasattr(job, 'no_po') and job.no_po else {}
             })
@@ -124,6 +124,7 @@ class ProspectData(Base):
     created_time = Column(DateTime)
     modified_time = Column(DateTime)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
     
     # Relationships
     dealer = relationship("Dealer", back_populates="prospect_data")
@@ -151,6 +152,7 @@ class FetchLog(Base):
     status = Column(String(20))  # success, failed, partial
     records_fetched = Column(Integer, default=0)
     error_message = Column(Text)
+    records_changed = Column(Integer)  # Rows actually inserted/updated (unchanged payloads skipped)
     fetch_duration_seconds = Column(Integer)
     started_at = Column(DateTime)
     completed_at = Column(DateTime, default=datetime.utcnow)
@@ -158,6 +160,20 @@ class FetchLog(Base):
     # Relationships
     dealer = relationship("Dealer", back_populates="fetch_logs")
 
+class FetchWatermark(Base):
+    """High-water mark of the last successful incremental fetch per dealer and fetch type"""
+    __tablename__ = "fetch_watermarks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    dealer_id = Column(String(10), ForeignKey("dealers.dealer_id"), nullable=False)
+    fetch_type = Column(String(50), nullable=False)
+    last_to_time = Column(DateTime, nullable=False)  # to_time of the last successful window
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('dealer_id', 'fetch_type', name='uq_fetch_watermark_dealer_fetch_type'),
+    )
+
 class PKBData(Base):
     __tablename__ = "pkb_data"
 
@@ -211,8 +227,10 @@ class PKBData(Base):
     waktu_pekerjaan = Column(String(20))
     status_work_order = Column(String(10))
     created_time = Column(String(50))
+    created_date = Column(Date, nullable=True)  # Parsed from created_time at ingest
     modified_time = Column(String(50))
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Unique constraints for bulk upsert operations
     __table_args__ = (
@@ -285,6 +303,7 @@ class PartsInboundData(Base):
     created_time = Column(String(50))
     modified_time = Column(String(50))
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="parts_inbound_data")
@@ -318,14 +337,19 @@ class LeasingData(Base):
     tenor = Column(Integer, nullable=True)
     jumlah_cicilan = Column(Numeric(15, 2), nullable=True)
     tanggal_pengajuan = Column(String(50), nullable=True)
+    tanggal_pengajuan_date = Column(Date, nullable=True)  # Parsed from tanggal_pengajuan at ingest
     id_finance_company = Column(String(100), nullable=True)
     nama_finance_company = Column(String(255), nullable=True)
     id_po_finance_company = Column(String(100), nullable=True)
     tanggal_pembuatan_po = Column(String(50), nullable=True)
+    tanggal_pembuatan_po_date = Column(Date, nullable=True)  # Parsed from tanggal_pembuatan_po at ingest
     tanggal_pengiriman_po_finance_company = Column(String(50), nullable=True)
+    tanggal_pengiriman_po_finance_company_date = Column(Date, nullable=True)  # Parsed from tanggal_pengiriman_po_finance_company at ingest
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="leasing_data")
@@ -340,7 +364,9 @@ class DocumentHandlingData(Base):
     id_spk = Column(String(100), nullable=True, index=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="document_handling_data")
@@ -355,14 +381,17 @@ class DocumentHandlingUnit(Base):
     nomor_rangka = Column(String(100), nullable=True, index=True)
     nomor_faktur_stnk = Column(String(100), nullable=True)
     tanggal_pengajuan_stnk_ke_biro = Column(String(50), nullable=True)
+    tanggal_pengajuan_stnk_ke_biro_date = Column(Date, nullable=True)  # Parsed from tanggal_pengajuan_stnk_ke_biro at ingest
     status_faktur_stnk = Column(String(10), nullable=True)
     nomor_stnk = Column(String(100), nullable=True)
     tanggal_penerimaan_stnk_dari_biro = Column(String(50), nullable=True)
     plat_nomor = Column(String(50), nullable=True)
     nomor_bpkb = Column(String(100), nullable=True)
     tanggal_penerimaan_bpkb_dari_biro = Column(String(50), nullable=True)
+    tanggal_penerimaan_bpkb_dari_biro_date = Column(Date, nullable=True)  # Parsed from tanggal_penerimaan_bpkb_dari_biro at ingest
     tanggal_terima_stnk_oleh_konsumen = Column(String(50), nullable=True)
     tanggal_terima_bpkb_oleh_konsumen = Column(String(50), nullable=True)
+    tanggal_terima_bpkb_oleh_konsumen_date = Column(Date, nullable=True)  # Parsed from tanggal_terima_bpkb_oleh_konsumen at ingest
     nama_penerima_bpkb = Column(String(255), nullable=True)
     nama_penerima_stnk = Column(String(255), nullable=True)
     jenis_id_penerima_bpkb = Column(String(10), nullable=True)
@@ -384,12 +413,15 @@ class UnitInboundData(Base):
     dealer_id = Column(String(10), ForeignKey("dealers.dealer_id"), nullable=False)
     no_shipping_list = Column(String(100), nullable=True, index=True)
     tanggal_terima = Column(String(50), nullable=True)
+    tanggal_terima_date = Column(Date, nullable=True)  # Parsed from tanggal_terima at ingest
     main_dealer_id = Column(String(10), nullable=True)
     no_invoice = Column(String(100), nullable=True, index=True)
     status_shipping_list = Column(String(10), nullable=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="unit_inbound_data")
@@ -428,11 +460,13 @@ class DeliveryProcessData(Base):
     dealer_id = Column(String(10), ForeignKey("dealers.dealer_id"), nullable=False)
     delivery_document_id = Column(String(100), nullable=True, index=True)
     tanggal_pengiriman = Column(String(50), nullable=True)
+    tanggal_pengiriman_date = Column(Date, nullable=True)  # Parsed from tanggal_pengiriman at ingest
     id_driver = Column(String(100), nullable=True)
     status_delivery_document = Column(String(10), nullable=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="delivery_process_data")
@@ -480,7 +514,9 @@ class BillingProcessData(Base):
     note = Column(Text, nullable=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
+    modified_date = Column(Date, nullable=True)  # Parsed from modified_time at ingest
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="billing_process_data")
@@ -504,6 +540,7 @@ class UnitInvoiceData(Base):
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="unit_invoice_data")
@@ -546,6 +583,7 @@ class PartsSalesData(Base):
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="parts_sales_data")
@@ -587,8 +625,10 @@ class DPHLOData(Base):
     no_work_order = Column(String(100), nullable=True, index=True)
     id_customer = Column(String(100), nullable=True, index=True)
     created_time = Column(String(50), nullable=True)
+    created_date = Column(Date, nullable=True)  # Parsed from created_time at ingest
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Unique constraints for bulk upsert operations
     __table_args__ = (
@@ -635,8 +675,10 @@ class WorkshopInvoiceData(Base):
     honda_id_sa = Column(String(100), nullable=True)
     honda_id_mekanik = Column(String(100), nullable=True)
     created_time = Column(String(50), nullable=True)
+    created_date = Column(Date, nullable=True)  # Parsed from created_time at ingest
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Relationships
     dealer = relationship("Dealer", back_populates="workshop_invoice_data")
@@ -715,6 +757,7 @@ class UnpaidHLOData(Base):
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Unique constraints for bulk upsert operations
     __table_args__ = (
@@ -763,6 +806,7 @@ class PartsInvoiceData(Base):
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Unique constraints for bulk upsert operations
     __table_args__ = (
@@ -839,10 +883,12 @@ class SPKDealingProcessData(Base):
     id_sales_people = Column(String(50), nullable=True)
     id_event = Column(String(100), nullable=True)
     tanggal_pesanan = Column(String(50), nullable=True)
+    tanggal_pesanan_date = Column(Date, nullable=True)  # Parsed from tanggal_pesanan at ingest
     status_spk = Column(String(10), nullable=True)
     created_time = Column(String(50), nullable=True)
     modified_time = Column(String(50), nullable=True)
     fetched_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Payload hash; unchanged rows are skipped on upsert
 
     # Table constraints for bulk upsert operations
     __table_args__ = (
@@ -871,6 +917,7 @@ class SPKDealingProcessUnit(Base):
     tipe_pembayaran = Column(String(10), nullable=True)
     jumlah_tanda_jadi = Column(Numeric(15, 2), nullable=True)
     tanggal_pengiriman = Column(String(50), nullable=True)
+    tanggal_pengiriman_date = Column(Date, nullable=True)  # Parsed from tanggal_pengiriman at ingest
     id_sales_program = Column(Text, nullable=True)
     id_apparel = Column(Text, nullable=True)
     created_time = Column(String(50), nullable=True)
@@ -917,6 +964,47 @@ class APIConfiguration(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+
+class DashboardDailyRollup(Base):
+    """Per-(dealer, day, dimension) aggregates behind the dashboard-dealer tiles"""
+    __tablename__ = "dashboard_daily_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    dealer_id = Column(String(10), ForeignKey("dealers.dealer_id"), nullable=False)
+    metric = Column(String(50), nullable=False)  # e.g. payment_type, top_driver
+    day = Column(Date, nullable=False)
+    dimension = Column(String(255))  # Grouped value (status, payment type, driver...); NULL when ungrouped
+    record_count = Column(Integer, nullable=False, default=0)
+    amount_total = Column(Numeric(20, 2))  # Only for metrics that sum an amount
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Typed DATE columns derived from DGI date strings (YYYY-MM-DD[ HH:MM:SS] or DD/MM/YYYY).
+# Processors fill them at ingest so dashboard date filters can use (dealer_id, date) indexes.
+DERIVED_DATE_COLUMNS = {
+    UnitInboundData: {"tanggal_terima_date": "tanggal_terima", "modified_date": "modified_time"},
+    BillingProcessData: {"modified_date": "modified_time"},
+    LeasingData: {
+        "tanggal_pengajuan_date": "tanggal_pengajuan",
+        "tanggal_pembuatan_po_date": "tanggal_pembuatan_po",
+        "tanggal_pengiriman_po_finance_company_date": "tanggal_pengiriman_po_finance_company",
+        "modified_date": "modified_time",
+    },
+    DocumentHandlingData: {"modified_date": "modified_time"},
+    DocumentHandlingUnit: {
+        "tanggal_pengajuan_stnk_ke_biro_date": "tanggal_pengajuan_stnk_ke_biro",
+        "tanggal_penerimaan_bpkb_dari_biro_date": "tanggal_penerimaan_bpkb_dari_biro",
+        "tanggal_terima_bpkb_oleh_konsumen_date": "tanggal_terima_bpkb_oleh_konsumen",
+    },
+    SPKDealingProcessData: {"tanggal_pesanan_date": "tanggal_pesanan"},
+    SPKDealingProcessUnit: {"tanggal_pengiriman_date": "tanggal_pengiriman"},
+    DeliveryProcessData: {"tanggal_pengiriman_date": "tanggal_pengiriman"},
+    PKBData: {"created_date": "created_time"},
+    WorkshopInvoiceData: {"created_date": "created_time"},
+    DPHLOData: {"created_date": "created_time"},
+}
+
+
 def get_db() -> Session:
     db = SessionLocal()
     try:
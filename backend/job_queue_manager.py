@@ -1,16 +1,22 @@
 """
-Job Queue Manager for Sequential Job Execution
-Prevents database transaction conflicts by running jobs one at a time
+Job Queue Manager for Manual Fetch Jobs
+Redis-backed priority queue that runs jobs concurrently while allowing at most one
+running job per dealer (prevents database transaction conflicts on a dealer's rows)
 """
 
 import asyncio
+import json
+import os
+import threading
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from enum import Enum
 import logging
 from dataclasses import dataclass, asdict
-import json
+
+from tasks.batch_config import BatchProcessingConfig
+from tasks.job_queue_manager import JobPriority
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +38,7 @@ class QueuedJob:
     from_time: Optional[str] = None
     to_time: Optional[str] = None
     no_po: Optional[str] = None
+    priority: JobPriority = JobPriority.NORMAL
     status: JobStatus = JobStatus.QUEUED
     created_at: datetime = None
     started_at: Optional[datetime] = None
@@ -47,12 +54,14 @@ class QueuedJob:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         data = asdict(self)
-        # Convert datetime objects to ISO strings
+        # Convert datetime and enum objects to JSON-friendly values
         for key, value in data.items():
             if isinstance(value, datetime):
                 data[key] = value.isoformat() if value else None
             elif isinstance(value, JobStatus):
                 data[key] = value.value
+            elif isinstance(value, JobPriority):
+                data[key] = value.name
         return data
 
     @classmethod
@@ -62,227 +71,427 @@ class QueuedJob:
         for key in ['created_at', 'started_at', 'completed_at']:
             if data.get(key):
                 data[key] = datetime.fromisoformat(data[key])
-        
+
         if 'status' in data and isinstance(data['status'], str):
             data['status'] = JobStatus(data['status'])
-        
+
+        if 'priority' in data and isinstance(data['priority'], str):
+            data['priority'] = JobPriority[data['priority']]
+
         return cls(**data)
 
 
+# Celery task name and positional argument builder per fetch type
+FETCH_TASKS = {
+    "pkb": ("tasks.data_fetcher_router.fetch_pkb_data", lambda job: []),
+    "parts_inbound": ("tasks.data_fetcher_router.fetch_parts_inbound_data", lambda job: [job.no_po or ""]),
+    "leasing": ("tasks.data_fetcher_router.fetch_leasing_data", lambda job: [job.no_po or ""]),
+    "doch_read": ("tasks.data_fetcher_router.fetch_document_handling_data", lambda job: [job.no_po or "", ""]),
+    "uinb_read": ("tasks.data_fetcher_router.fetch_unit_inbound_data", lambda job: [job.no_po or "", ""]),
+    "bast_read": ("tasks.data_fetcher_router.fetch_delivery_process_data", lambda job: [job.no_po or "", "", ""]),
+    "inv1_read": ("tasks.data_fetcher_router.fetch_billing_process_data", lambda job: [job.no_po or "", ""]),
+    "mdinvh1_read": ("tasks.data_fetcher_router.fetch_unit_invoice_data", lambda job: [job.no_po or "", ""]),
+    "prsl_read": ("tasks.data_fetcher_router.fetch_parts_sales_data", lambda job: [job.no_po or ""]),
+    "dphlo_read": ("tasks.data_fetcher_router.fetch_dp_hlo_data", lambda job: [job.no_po or "", ""]),
+    "inv2_read": ("tasks.data_fetcher_router.fetch_workshop_invoice_data", lambda job: [job.no_po or ""]),
+    "unpaidhlo_read": ("tasks.data_fetcher_router.fetch_unpaid_hlo_data", lambda job: [job.no_po or "", ""]),
+    "mdinvh3_read": ("tasks.data_fetcher_router.fetch_parts_invoice_data", lambda job: [job.no_po or ""]),
+    "spk_read": ("tasks.data_fetcher_router.fetch_spk_dealing_process_data", lambda job: [job.no_po or "", ""]),
+    "prospect": ("tasks.data_fetcher_router.fetch_prospect_data", lambda job: []),
+}
+
+# Atomically claim runnable jobs: highest priority first, skipping dealers that already
+# have a running job, until the global concurrency limit is reached
+CLAIM_JOBS_SCRIPT = """
+local pending_key, running_key = KEYS[1], KEYS[2]
+local max_running = tonumber(ARGV[1])
+local lock_ttl = tonumber(ARGV[2])
+local prefix = ARGV[3]
+local scan_limit = tonumber(ARGV[4])
+
+local slots = max_running - redis.call('SCARD', running_key)
+local claimed = {}
+if slots <= 0 then
+    return claimed
+end
+
+local candidates = redis.call('ZRANGE', pending_key, 0, scan_limit - 1)
+for _, job_id in ipairs(candidates) do
+    if #claimed >= slots then
+        break
+    end
+    local raw = redis.call('GET', prefix .. 'job:' .. job_id)
+    if not raw then
+        redis.call('ZREM', pending_key, job_id)
+    else
+        local dealer_id = cjson.decode(raw)['dealer_id']
+        if redis.call('SET', prefix .. 'dealer:' .. dealer_id, job_id, 'NX', 'EX', lock_ttl) then
+            redis.call('ZREM', pending_key, job_id)
+            redis.call('SADD', running_key, job_id)
+            table.insert(claimed, job_id)
+        end
+    end
+end
+return claimed
+"""
+
+# Release a dealer lock only if it is still held by the given job
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# Push back a dealer lock's expiry only if it is still held by the given job
+EXTEND_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+end
+return 0
+"""
+
+# Fail a running job whose dealer lock is gone, unless its completion callback got there
+# first (the job is then no longer in the running set)
+REAP_JOB_SCRIPT = """
+local running_key, lock_key, job_key, history_key = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local job_id = ARGV[1]
+
+if redis.call('SISMEMBER', running_key, job_id) == 0 or redis.call('GET', lock_key) == job_id then
+    return 0
+end
+redis.call('SET', job_key, ARGV[2], 'EX', tonumber(ARGV[3]))
+redis.call('SREM', running_key, job_id)
+redis.call('ZADD', history_key, tonumber(ARGV[4]), job_id)
+return 1
+"""
+
+
 class JobQueueManager:
-    """Manages sequential job execution to prevent database conflicts"""
-    
-    def __init__(self):
-        self.job_queue: List[QueuedJob] = []
-        self.current_job: Optional[QueuedJob] = None
-        self.is_processing = False
-        self._lock = asyncio.Lock()
-        
-    async def add_job(self, dealer_id: str, fetch_type: str, from_time: str = None, 
-                     to_time: str = None, no_po: str = None) -> str:
-        """Add a job to the queue"""
-        async with self._lock:
-            job_id = str(uuid.uuid4())
-            job = QueuedJob(
-                id=job_id,
-                dealer_id=dealer_id,
-                fetch_type=fetch_type,
-                from_time=from_time,
-                to_time=to_time,
-                no_po=no_po
+    """Manages concurrent job execution with per-dealer mutual exclusion
+
+    Queue state lives in Redis so it survives API restarts and is shared by every
+    API process:
+
+    - ``job:<id>``       JSON job record (expires after the history TTL once finished)
+    - ``pending``        sorted set of queued job ids, ordered by priority then age
+    - ``running``        set of job ids dispatched to Celery
+    - ``history``        sorted set of finished job ids by completion time
+    - ``dealer:<id>``    lock held by the dealer's running job
+
+    Completion is tracked with Celery link/link_error callbacks, which mark the job
+    finished, release the dealer lock and dispatch the next runnable jobs.
+
+    The dealer lock doubles as the job's heartbeat: it is claimed with the dispatch
+    TTL, and once the task starts the worker re-extends it every heartbeat interval
+    (see tasks/job_queue_tasks.py). A job whose lock expired lost its worker and is
+    reaped on the next dispatch.
+    """
+
+    # Celery message headers identifying the queued job a task runs for
+    JOB_ID_HEADER = "queued_job_id"
+    DEALER_ID_HEADER = "queued_job_dealer_id"
+
+    KEY_PREFIX = "dgi:jobq:"
+    # Pending jobs inspected per dispatch when looking for a dealer without a running job
+    DISPATCH_SCAN_LIMIT = 200
+
+    def __init__(self, redis_url: str = None, max_concurrency: int = None):
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.max_concurrency = max_concurrency or BatchProcessingConfig.JOB_QUEUE_MAX_CONCURRENCY
+        self.lock_ttl = BatchProcessingConfig.JOB_QUEUE_DEALER_LOCK_TTL_SECONDS
+        self.heartbeat_interval = BatchProcessingConfig.JOB_QUEUE_HEARTBEAT_INTERVAL_SECONDS
+        self.heartbeat_ttl = BatchProcessingConfig.JOB_QUEUE_HEARTBEAT_TTL_SECONDS
+        self.history_ttl = BatchProcessingConfig.JOB_QUEUE_HISTORY_TTL_HOURS * 3600
+        self._redis = None
+        self._claim_jobs = None
+        self._release_lock = None
+        self._reap_job = None
+        self._extend_lock = None
+        # Celery task id -> stop event of the heartbeat thread running in this worker
+        self._heartbeats: Dict[str, threading.Event] = {}
+        self._heartbeats_lock = threading.Lock()
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            import redis
+            self._redis = redis.Redis.from_url(self.redis_url, decode_responses=True)
+            self._claim_jobs = self._redis.register_script(CLAIM_JOBS_SCRIPT)
+            self._release_lock = self._redis.register_script(RELEASE_LOCK_SCRIPT)
+            self._reap_job = self._redis.register_script(REAP_JOB_SCRIPT)
+            self._extend_lock = self._redis.register_script(EXTEND_LOCK_SCRIPT)
+        return self._redis
+
+    def _key(self, name: str) -> str:
+        return f"{self.KEY_PREFIX}{name}"
+
+    @staticmethod
+    def _queue_score(job: QueuedJob) -> float:
+        """Lower scores run first: priority band, then FIFO by creation time"""
+        band = max(p.value for p in JobPriority) - job.priority.value
+        return band * 1e13 + job.created_at.timestamp() * 1000
+
+    def _save_job(self, job: QueuedJob, pipe=None) -> None:
+        client = pipe if pipe is not None else self.redis
+        ttl = self.history_ttl if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING) else None
+        client.set(self._key(f"job:{job.id}"), json.dumps(job.to_dict(), default=str), ex=ttl)
+
+    def _load_job(self, job_id: str) -> Optional[QueuedJob]:
+        raw = self.redis.get(self._key(f"job:{job_id}"))
+        return QueuedJob.from_dict(json.loads(raw)) if raw else None
+
+    def _load_jobs(self, job_ids: List[str]) -> List[QueuedJob]:
+        if not job_ids:
+            return []
+        raws = self.redis.mget([self._key(f"job:{job_id}") for job_id in job_ids])
+        return [QueuedJob.from_dict(json.loads(raw)) for raw in raws if raw]
+
+    def add_job(self, dealer_id: str, fetch_type: str, from_time: str = None,
+                to_time: str = None, no_po: str = None,
+                priority: JobPriority = JobPriority.NORMAL) -> str:
+        """Add a job to the queue and dispatch whatever can run now"""
+        job = QueuedJob(
+            id=str(uuid.uuid4()),
+            dealer_id=dealer_id,
+            fetch_type=fetch_type,
+            from_time=from_time,
+            to_time=to_time,
+            no_po=no_po,
+            priority=priority
+        )
+
+        pipe = self.redis.pipeline()
+        self._save_job(job, pipe)
+        pipe.zadd(self._key("pending"), {job.id: self._queue_score(job)})
+        pipe.execute()
+        logger.info(f"Added job {job.id} to queue: {fetch_type} for dealer {dealer_id} (priority {priority.name})")
+
+        self.dispatch()
+        return job.id
+
+    def dispatch(self) -> int:
+        """Send runnable jobs to Celery; returns the number of jobs started"""
+        self._reap_lost_jobs()
+
+        claimed = self._claim_jobs(
+            keys=[self._key("pending"), self._key("running")],
+            args=[self.max_concurrency, self.lock_ttl, self.KEY_PREFIX, self.DISPATCH_SCAN_LIMIT]
+        )
+        for job in self._load_jobs(claimed):
+            self._start_job(job)
+        return len(claimed)
+
+    def _start_job(self, job: QueuedJob) -> None:
+        """Send a claimed job to Celery with completion callbacks"""
+        from celery_app import celery_app
+
+        task_name, extra_args = FETCH_TASKS.get(job.fetch_type, FETCH_TASKS["prospect"])
+        task_args = [job.dealer_id, job.from_time, job.to_time] + extra_args(job)
+
+        # Saved as RUNNING before sending: a fast task's completion callback must not be
+        # overwritten by this write
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        job.celery_task_id = uuid.uuid4().hex
+        try:
+            self._save_job(job)
+            celery_app.send_task(
+                task_name,
+                args=task_args,
+                task_id=job.celery_task_id,
+                link=celery_app.signature("tasks.job_queue_tasks.job_succeeded", kwargs={"job_id": job.id}),
+                link_error=celery_app.signature("tasks.job_queue_tasks.job_failed", kwargs={"job_id": job.id}),
+                headers={self.JOB_ID_HEADER: job.id, self.DEALER_ID_HEADER: job.dealer_id}
             )
-            
-            self.job_queue.append(job)
-            logger.info(f"Added job {job_id} to queue: {fetch_type} for dealer {dealer_id}")
-            
-            # Start processing if not already running
-            if not self.is_processing:
-                asyncio.create_task(self._process_queue())
-            
-            return job_id
-    
-    async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+            logger.info(f"Started job {job.id}: {job.fetch_type} for dealer {job.dealer_id} (task {job.celery_task_id})")
+        except Exception as e:
+            logger.error(f"Failed to send job {job.id} to Celery: {e}")
+            self._finish(job, JobStatus.FAILED, error_message=str(e))
+
+    def complete_job(self, job_id: str, result: Any = None, error_message: str = None) -> None:
+        """Record a job's outcome (called from the Celery callbacks) and dispatch the next jobs"""
+        job = self._load_job(job_id)
+        if not job:
+            logger.warning(f"Completion received for unknown job {job_id}")
+            return
+
+        if error_message is None and isinstance(result, dict) and result.get("status") in ("error", "failed"):
+            error_message = result.get("message") or result.get("error") or "Task reported failure"
+
+        status = JobStatus.FAILED if error_message else JobStatus.COMPLETED
+        self._finish(job, status, result=result, error_message=error_message)
+        logger.info(f"Completed job {job_id} with status {status.value}")
+
+        self.dispatch()
+
+    def _finish(self, job: QueuedJob, status: JobStatus, result: Any = None, error_message: str = None) -> None:
+        job.status = status
+        job.completed_at = datetime.utcnow()
+        job.result = result if isinstance(result, dict) else None
+        job.error_message = error_message
+
+        pipe = self.redis.pipeline()
+        self._save_job(job, pipe)
+        pipe.srem(self._key("running"), job.id)
+        pipe.zadd(self._key("history"), {job.id: job.completed_at.timestamp()})
+        pipe.execute()
+        self._release_lock(keys=[self._key(f"dealer:{job.dealer_id}")], args=[job.id])
+
+    def extend_lock(self, job_id: str, dealer_id: str) -> bool:
+        """Renew a running job's dealer lock for another heartbeat TTL; False if it was lost"""
+        self.redis  # connects and registers the Lua scripts on first use
+        return bool(self._extend_lock(keys=[self._key(f"dealer:{dealer_id}")], args=[job_id, self.heartbeat_ttl]))
+
+    def start_heartbeat(self, task_id: str, job_id: str, dealer_id: str) -> None:
+        """Keep a job's dealer lock alive while its Celery task runs (called in the worker)"""
+        if not self.extend_lock(job_id, dealer_id):
+            logger.warning(f"Job {job_id} started after losing its dealer lock")
+            return
+
+        stop_event = threading.Event()
+        with self._heartbeats_lock:
+            self._heartbeats[task_id] = stop_event
+        threading.Thread(
+            target=self._heartbeat,
+            args=(job_id, dealer_id, stop_event),
+            name=f"jobq-heartbeat-{job_id}",
+            daemon=True
+        ).start()
+
+    def stop_heartbeat(self, task_id: str) -> None:
+        """Stop the heartbeat of a finished task; the completion callback releases the lock"""
+        with self._heartbeats_lock:
+            stop_event = self._heartbeats.pop(task_id, None)
+        if stop_event is not None:
+            stop_event.set()
+
+    def _heartbeat(self, job_id: str, dealer_id: str, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self.heartbeat_interval):
+            try:
+                if not self.extend_lock(job_id, dealer_id):
+                    logger.warning(f"Job {job_id} lost its dealer lock while running, stopping heartbeat")
+                    return
+            except Exception as e:
+                # Transient Redis error: retry on the next beat, the TTL covers a few misses
+                logger.warning(f"Heartbeat for job {job_id} failed: {e}")
+
+    def _reap_lost_jobs(self) -> None:
+        """Fail running jobs whose dealer lock expired without a callback (missed heartbeats, e.g. worker crash)"""
+        running_ids = list(self.redis.smembers(self._key("running")))
+        running_jobs = self._load_jobs(running_ids)
+        for job in running_jobs:
+            job.status = JobStatus.FAILED
+            job.completed_at = datetime.utcnow()
+            job.error_message = "Job timed out without a completion callback"
+            reaped = self._reap_job(
+                keys=[
+                    self._key("running"),
+                    self._key(f"dealer:{job.dealer_id}"),
+                    self._key(f"job:{job.id}"),
+                    self._key("history")
+                ],
+                args=[
+                    job.id,
+                    json.dumps(job.to_dict(), default=str),
+                    self.history_ttl,
+                    job.completed_at.timestamp()
+                ]
+            )
+            if reaped:
+                logger.warning(f"Job {job.id} lost its dealer lock without completing, marked failed")
+
+        # Running ids whose job record is gone
+        stale = set(running_ids) - {job.id for job in running_jobs}
+        if stale:
+            self.redis.srem(self._key("running"), *stale)
+
+    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific job"""
-        async with self._lock:
-            # Check current job
-            if self.current_job and self.current_job.id == job_id:
-                return self.current_job.to_dict()
-            
-            # Check queue
-            for job in self.job_queue:
-                if job.id == job_id:
-                    return job.to_dict()
-            
-            return None
-    
-    async def get_queue_status(self) -> Dict[str, Any]:
+        job = self._load_job(job_id)
+        return job.to_dict() if job else None
+
+    def get_queue_status(self, limit: int = 100) -> Dict[str, Any]:
         """Get overall queue status"""
-        async with self._lock:
-            return {
-                "current_job": self.current_job.to_dict() if self.current_job else None,
-                "queue_length": len(self.job_queue),
-                "queued_jobs": [job.to_dict() for job in self.job_queue],
-                "is_processing": self.is_processing
-            }
-    
-    async def cancel_job(self, job_id: str) -> bool:
+        pending_key = self._key("pending")
+        running_jobs = self._load_jobs(list(self.redis.smembers(self._key("running"))))
+        queued_jobs = self._load_jobs(self.redis.zrange(pending_key, 0, limit - 1))
+        return {
+            "running_jobs": [job.to_dict() for job in running_jobs],
+            "running_count": len(running_jobs),
+            "max_concurrency": self.max_concurrency,
+            "queue_length": self.redis.zcard(pending_key),
+            "queued_jobs": [job.to_dict() for job in queued_jobs],
+            "is_processing": bool(running_jobs)
+        }
+
+    def cancel_job(self, job_id: str) -> bool:
         """Cancel a queued job (cannot cancel running job)"""
-        async with self._lock:
-            for i, job in enumerate(self.job_queue):
-                if job.id == job_id:
-                    job.status = JobStatus.CANCELLED
-                    job.completed_at = datetime.utcnow()
-                    job.error_message = "Job cancelled by user"
-                    self.job_queue.pop(i)
-                    logger.info(f"Cancelled job {job_id}")
-                    return True
+        if not self.redis.zrem(self._key("pending"), job_id):
             return False
-    
-    async def clear_completed_jobs(self) -> int:
-        """Clear completed/failed jobs from history"""
-        async with self._lock:
-            initial_count = len(self.job_queue)
-            self.job_queue = [job for job in self.job_queue 
-                            if job.status in [JobStatus.QUEUED, JobStatus.RUNNING]]
-            cleared_count = initial_count - len(self.job_queue)
-            logger.info(f"Cleared {cleared_count} completed jobs")
-            return cleared_count
-    
-    async def _process_queue(self):
-        """Process jobs in the queue sequentially"""
-        if self.is_processing:
-            return
-        
-        self.is_processing = True
-        logger.info("Started job queue processing")
-        
-        try:
-            while True:
-                async with self._lock:
-                    if not self.job_queue:
-                        break
-                    
-                    # Get next job
-                    self.current_job = self.job_queue.pop(0)
-                    self.current_job.status = JobStatus.RUNNING
-                    self.current_job.started_at = datetime.utcnow()
-                
-                logger.info(f"Processing job {self.current_job.id}: {self.current_job.fetch_type} for dealer {self.current_job.dealer_id}")
-                
-                # Execute the job
-                await self._execute_job(self.current_job)
-                
-                # Mark job as completed
-                async with self._lock:
-                    self.current_job.completed_at = datetime.utcnow()
-                    if self.current_job.status == JobStatus.RUNNING:
-                        self.current_job.status = JobStatus.COMPLETED
-                    
-                    logger.info(f"Completed job {self.current_job.id} with status {self.current_job.status.value}")
-                    self.current_job = None
-                
-                # Small delay between jobs to prevent overwhelming the system
-                await asyncio.sleep(1)
-        
-        finally:
-            self.is_processing = False
-            logger.info("Stopped job queue processing")
-    
-    async def _execute_job(self, job: QueuedJob):
-        """Execute a single job using Celery"""
-        from celery_app import celery_app
-        
-        try:
-            # Determine task name and arguments
-            if job.fetch_type == "pkb":
-                task_name = "tasks.data_fetcher_router.fetch_pkb_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time]
-            elif job.fetch_type == "parts_inbound":
-                task_name = "tasks.data_fetcher_router.fetch_parts_inbound_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or ""]
-            elif job.fetch_type == "leasing":
-                task_name = "tasks.data_fetcher_router.fetch_leasing_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or ""]
-            elif job.fetch_type == "doch_read":
-                task_name = "tasks.data_fetcher_router.fetch_document_handling_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            elif job.fetch_type == "uinb_read":
-                task_name = "tasks.data_fetcher_router.fetch_unit_inbound_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            elif job.fetch_type == "bast_read":
-                task_name = "tasks.data_fetcher_router.fetch_delivery_process_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", "", ""]
-            elif job.fetch_type == "inv1_read":
-                task_name = "tasks.data_fetcher_router.fetch_billing_process_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            elif job.fetch_type == "mdinvh1_read":
-                task_name = "tasks.data_fetcher_router.fetch_unit_invoice_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            elif job.fetch_type == "prsl_read":
-                task_name = "tasks.data_fetcher_router.fetch_parts_sales_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or ""]
-            elif job.fetch_type == "dphlo_read":
-                task_name = "tasks.data_fetcher_router.fetch_dp_hlo_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            elif job.fetch_type == "inv2_read":
-                task_name = "tasks.data_fetcher_router.fetch_workshop_invoice_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or ""]
-            elif job.fetch_type == "unpaidhlo_read":
-                task_name = "tasks.data_fetcher_router.fetch_unpaid_hlo_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            elif job.fetch_type == "mdinvh3_read":
-                task_name = "tasks.data_fetcher_router.fetch_parts_invoice_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or ""]
-            elif job.fetch_type == "spk_read":
-                task_name = "tasks.data_fetcher_router.fetch_spk_dealing_process_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time, job.no_po or "", ""]
-            else:  # prospect
-                task_name = "tasks.data_fetcher_router.fetch_prospect_data"
-                task_args = [job.dealer_id, job.from_time, job.to_time]
-            
-            # Execute Celery task synchronously (wait for completion)
-            task = celery_app.send_task(task_name, args=task_args)
-            job.celery_task_id = task.id
-            
-            # Wait for task completion
-            result = task.get(timeout=300)  # 5 minute timeout
-            
-            job.result = result
-            job.status = JobStatus.COMPLETED
-            logger.info(f"Job {job.id} completed successfully: {result}")
-            
-        except Exception as e:
-            job.status = JobStatus.FAILED
-            job.error_message = str(e)
-            logger.error(f"Job {job.id} failed: {e}")
+
+        job = self._load_job(job_id)
+        if job:
+            job.status = JobStatus.CANCELLED
+            job.completed_at = datetime.utcnow()
+            job.error_message = "Job cancelled by user"
+            pipe = self.redis.pipeline()
+            self._save_job(job, pipe)
+            pipe.zadd(self._key("history"), {job.id: job.completed_at.timestamp()})
+            pipe.execute()
+        logger.info(f"Cancelled job {job_id}")
+        return True
+
+    def clear_completed_jobs(self) -> int:
+        """Clear completed/failed/cancelled jobs from history"""
+        history_key = self._key("history")
+        job_ids = self.redis.zrange(history_key, 0, -1)
+        if not job_ids:
+            return 0
+
+        pipe = self.redis.pipeline()
+        pipe.delete(*[self._key(f"job:{job_id}") for job_id in job_ids])
+        pipe.zrem(history_key, *job_ids)
+        pipe.execute()
+        logger.info(f"Cleared {len(job_ids)} completed jobs")
+        return len(job_ids)
+
+    def trim_history(self) -> None:
+        """Drop history entries whose job records have expired"""
+        cutoff = (datetime.utcnow() - timedelta(seconds=self.history_ttl)).timestamp()
+        self.redis.zremrangebyscore(self._key("history"), "-inf", cutoff)
 
 
 # Global job queue manager instance
 job_queue_manager = JobQueueManager()
 
 
-# Convenience functions for easy access
-async def add_job_to_queue(dealer_id: str, fetch_type: str, from_time: str = None, 
-                          to_time: str = None, no_po: str = None) -> str:
+# Convenience functions for easy access (Redis calls run off the event loop)
+async def add_job_to_queue(dealer_id: str, fetch_type: str, from_time: str = None,
+                           to_time: str = None, no_po: str = None,
+                           priority: JobPriority = JobPriority.NORMAL) -> str:
     """Add a job to the global queue"""
-    return await job_queue_manager.add_job(dealer_id, fetch_type, from_time, to_time, no_po)
+    return await asyncio.to_thread(
+        job_queue_manager.add_job, dealer_id, fetch_type, from_time, to_time, no_po, priority
+    )
 
 
 async def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
     """Get status of a specific job"""
-    return await job_queue_manager.get_job_status(job_id)
+    return await asyncio.to_thread(job_queue_manager.get_job_status, job_id)
 
 
 async def get_queue_status() -> Dict[str, Any]:
     """Get overall queue status"""
-    return await job_queue_manager.get_queue_status()
+    return await asyncio.to_thread(job_queue_manager.get_queue_status)
 
 
 async def cancel_job(job_id: str) -> bool:
     """Cancel a queued job"""
-    return await job_queue_manager.cancel_job(job_id)
+    return await asyncio.to_thread(job_queue_manager.cancel_job, job_id)
 
 
 async def clear_completed_jobs() -> int:
     """Clear completed jobs"""
-    return await job_queue_manager.clear_completed_jobs()
+    return await asyncio.to_thread(job_queue_manager.clear_completed_jobs)
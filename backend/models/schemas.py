@@ -151,6 +151,7 @@ class ManualFetchRequest(BaseModel):
     to_time: Optional[str] = None
     fetch_type: Optional[str] = "prospect"  # prospect, pkb, or parts_inbound
     no_po: Optional[str] = ""  # For parts_inbound filtering
+    priority: Optional[str] = "NORMAL"  # Job queue priority: LOW, NORMAL, HIGH, CRITICAL
 
 
 class JobResponse(BaseModel):
@@ -193,6 +194,7 @@ class BulkJobRequest(BaseModel):
     fetch_type: str = "prospect"
     from_time: Optional[str] = None
     to_time: Optional[str] = None
+    priority: Optional[str] = "NORMAL"  # Job queue priority: LOW, NORMAL, HIGH, CRITICAL
 
 
 # Fetch Log schemas
@@ -204,6 +206,7 @@ class FetchLogResponse(BaseModel):
     fetch_type: str
     status: str
     records_fetched: int
+    records_changed: Optional[int] = None
     error_message: Optional[str]
     fetch_duration_seconds: Optional[int]
     completed_at: datetime
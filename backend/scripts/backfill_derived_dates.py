@@ -0,0 +1,82 @@
+"""
+One-off backfill for the typed DATE columns added in migration 023
+Parses the existing DGI date strings (YYYY-MM-DD[ HH:MM:SS] / DD/MM/YYYY) into the
+*_date columns listed in database.DERIVED_DATE_COLUMNS. New rows are filled at ingest
+by the processors; this only needs to run once after the migration. Safe to re-run.
+
+Usage: python scripts/backfill_derived_dates.py [--batch-size 5000] [--table pkb_data]
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to Python path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy import and_, or_, update
+
+from database import SessionLocal, DERIVED_DATE_COLUMNS
+from utils.date_parsing import parse_dgi_date
+
+
+def backfill_model(model_class, derived_dates: dict, batch_size: int) -> int:
+    """Fill missing derived dates for one table, walking it in primary key order"""
+    db = SessionLocal()
+    updated = 0
+    last_id = None
+
+    pending = or_(*[
+        and_(getattr(model_class, date_column).is_(None), getattr(model_class, source_column).isnot(None))
+        for date_column, source_column in derived_dates.items()
+    ])
+    source_columns = [getattr(model_class, source_column) for source_column in derived_dates.values()]
+
+    try:
+        while True:
+            query = db.query(model_class.id, *source_columns).filter(pending)
+            if last_id is not None:
+                query = query.filter(model_class.id > last_id)
+            rows = query.order_by(model_class.id).limit(batch_size).all()
+            if not rows:
+                break
+
+            params = []
+            for row in rows:
+                values = {"id": row[0]}
+                for date_column, raw_value in zip(derived_dates.keys(), row[1:]):
+                    values[date_column] = parse_dgi_date(raw_value)
+                params.append(values)
+
+            db.execute(update(model_class), params)
+            db.commit()
+
+            updated += len(params)
+            last_id = rows[-1][0]
+            print(f"  {model_class.__tablename__}: {updated} rows backfilled")
+
+        return updated
+
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill typed DATE columns from DGI date strings")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--table", help="Only backfill this table (e.g. pkb_data)")
+    args = parser.parse_args()
+
+    for model_class, derived_dates in DERIVED_DATE_COLUMNS.items():
+        if args.table and model_class.__tablename__ != args.table:
+            continue
+        print(f"Backfilling {model_class.__tablename__} ({', '.join(derived_dates)})...")
+        total = backfill_model(model_class, derived_dates, args.batch_size)
+        print(f"✅ {model_class.__tablename__}: {total} rows updated")
+
+
+if __name__ == "__main__":
+    main()
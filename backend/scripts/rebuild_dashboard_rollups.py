@@ -0,0 +1,50 @@
+"""
+Rebuild dashboard_daily_rollups (migration 024) from the ingest tables
+Processors keep the rollups current for the days each run touches; run this once after
+the migration (and after backfill_derived_dates.py), or to repair a dealer whose refresh
+failed. Safe to re-run.
+
+Usage: python scripts/rebuild_dashboard_rollups.py [--dealer-id 12284] [--metric payment_type]
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to Python path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from database import SessionLocal, Dealer
+from tasks.dashboard_rollups import ROLLUP_METRICS, rebuild_rollups
+
+
+def main():
+    metric_names = [metric.name for metric in ROLLUP_METRICS]
+
+    parser = argparse.ArgumentParser(description="Rebuild dashboard daily rollups")
+    parser.add_argument("--dealer-id", help="Only rebuild this dealer")
+    parser.add_argument("--metric", action="append", choices=metric_names,
+                        help="Only rebuild this metric (repeatable)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.dealer_id:
+            dealer_ids = [args.dealer_id]
+        else:
+            dealer_ids = [row[0] for row in db.query(Dealer.dealer_id).order_by(Dealer.dealer_id).all()]
+
+        for dealer_id in dealer_ids:
+            rebuilt = rebuild_rollups(db, dealer_id, args.metric)
+            db.commit()
+            print(f"✅ {dealer_id}: {rebuilt} metrics rebuilt")
+
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the BaseDataProcessor.bulk_upsert helpers: COPY text encoding, the
+RETURNING columns and rollup day tracking
+"""
+import sys
+import os
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+# Add the backend directory to the Python path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
+
+from database import UnitInboundData
+from tasks.processors.base_processor import BaseDataProcessor
+
+
+class SampleProcessor(BaseDataProcessor):
+    """Minimal concrete processor to exercise the base class helpers"""
+
+    def __init__(self):
+        super().__init__("sample")
+
+    def fetch_api_data(self, dealer, from_time, to_time, **kwargs):
+        return {}
+
+    def process_records(self, db, dealer_id, api_data):
+        return 0
+
+
+def postgres_session():
+    """Stand-in session exposing only the PostgreSQL dialect the helpers quote with"""
+    db = Mock()
+    db.get_bind.return_value.dialect = postgresql.dialect()
+    return db
+
+
+def test_copy_text_value_scalars():
+    """NULL, booleans and numbers use COPY's text representation"""
+    encode = BaseDataProcessor._copy_text_value
+    key = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+    assert encode(None) == "\\N"
+    assert encode(True) == "t"
+    assert encode(False) == "f"
+    assert encode(0) == "0"
+    assert encode(12.5) == "12.5"
+    assert encode(Decimal("1500000.00")) == "1500000.00"
+    assert encode(key) == "12345678-1234-5678-1234-567812345678"
+
+
+def test_copy_text_value_dates_and_json():
+    """Dates are ISO formatted and dicts/lists are written as JSON"""
+    encode = BaseDataProcessor._copy_text_value
+
+    assert encode(date(2025, 1, 31)) == "2025-01-31"
+    assert encode(datetime(2025, 1, 31, 8, 15)) == "2025-01-31T08:15:00"
+    assert encode({"no_rangka": "MH1"}) == '{"no_rangka": "MH1"}'
+    assert encode([1, 2]) == "[1, 2]"
+
+
+def test_copy_text_value_escapes_delimiters():
+    """Backslashes, tabs and line breaks cannot split a COPY row or column"""
+    encode = BaseDataProcessor._copy_text_value
+
+    assert encode("plain text") == "plain text"
+    assert encode("a\tb") == "a\\tb"
+    assert encode("line 1\nline 2\r\n") == "line 1\\nline 2\\r\\n"
+    assert encode("C:\\dealer") == "C:\\\\dealer"
+    assert encode("\\N") == "\\\\N"
+    # JSON escapes are themselves escaped so COPY hands PostgreSQL the original JSON
+    assert encode({"catatan": "a\tb"}) == '{"catatan": "a\\\\tb"}'
+    assert "\t" not in encode({"catatan": "a\tb"})
+
+
+def test_prior_day_sql_correlates_on_id():
+    """The prior-day sub-select reads the same row of the target table"""
+    quote = postgresql.dialect().identifier_preparer.quote
+
+    sql = BaseDataProcessor._prior_day_sql(quote, "unit_inbound_data", "tanggal_terima_date")
+
+    assert sql == (
+        "(SELECT prior.tanggal_terima_date FROM unit_inbound_data AS prior"
+        " WHERE prior.id = unit_inbound_data.id)"
+    )
+
+
+def test_upsert_returning_columns():
+    """id and natural key first, then one prior-day column per rollup day column"""
+    processor = SampleProcessor()
+    db = postgres_session()
+
+    assert processor._upsert_returning(db, UnitInboundData, None, ()) == []
+
+    returning = processor._upsert_returning(db, UnitInboundData, "no_shipping_list", ("tanggal_terima_date",))
+    assert len(returning) == 3
+
+    stmt = insert(UnitInboundData).values(dealer_id="12284", no_shipping_list="SL-1").returning(*returning)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    returning_sql = sql.split("RETURNING", 1)[1]
+
+    assert returning_sql.strip().startswith("unit_inbound_data.id, unit_inbound_data.no_shipping_list, (SELECT prior.")
+    # The sub-select is correlated, not a second FROM entry of the INSERT
+    assert sql.count("FROM") == 1
+
+
+def test_track_rollup_days_skips_missing_dates():
+    """Days written by an upsert are recorded per (model, day column)"""
+    processor = SampleProcessor()
+    processor._reset_rollup_days()
+    records = [
+        {"no_shipping_list": "SL-1", "tanggal_terima_date": date(2025, 1, 1)},
+        {"no_shipping_list": "SL-2", "tanggal_terima_date": None},
+        {"no_shipping_list": "SL-3"},
+        {"no_shipping_list": "SL-4", "tanggal_terima_date": date(2025, 1, 2)},
+    ]
+
+    processor._track_rollup_days(UnitInboundData, records, ("tanggal_terima_date",))
+
+    assert processor.rollup_days == {
+        (UnitInboundData, "tanggal_terima_date"): {date(2025, 1, 1), date(2025, 1, 2)}
+    }
+
+
+def test_track_prior_rollup_days_reads_trailing_columns():
+    """Prior days are the last len(day_columns) values of each RETURNING row"""
+    processor = SampleProcessor()
+    processor._reset_rollup_days()
+    day_columns = ("tanggal_terima_date", "modified_date")
+    rows = [
+        ("id-1", "SL-1", date(2024, 12, 31), date(2025, 1, 5)),
+        ("id-2", "SL-2", None, None),  # inserted row, no prior version
+        ("id-3", "SL-3", date(2024, 12, 30), None),
+    ]
+
+    processor._track_rollup_days(UnitInboundData, [{"tanggal_terima_date": date(2025, 1, 1)}], day_columns)
+    processor._track_prior_rollup_days(UnitInboundData, day_columns, rows)
+
+    assert processor.rollup_days == {
+        (UnitInboundData, "tanggal_terima_date"): {date(2025, 1, 1), date(2024, 12, 31), date(2024, 12, 30)},
+        (UnitInboundData, "modified_date"): {date(2025, 1, 5)},
+    }
+
+
+def main():
+    """Run the helper tests without pytest"""
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_") and callable(value)]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"All {len(tests)} bulk upsert helper tests passed")
+
+
+if __name__ == "__main__":
+    main()
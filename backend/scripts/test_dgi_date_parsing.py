@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for parse_dgi_date and the typed DATE columns derived from DGI date strings at ingest
+"""
+import sys
+import os
+from datetime import date, datetime
+
+# Add the backend directory to the Python path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from utils.date_parsing import parse_dgi_date
+
+
+def test_parse_dgi_date_formats():
+    """ISO and DD/MM/YYYY dates parse, with or without a time part"""
+    assert parse_dgi_date("2025-01-31") == date(2025, 1, 31)
+    assert parse_dgi_date("2025-01-31 08:15:00") == date(2025, 1, 31)
+    assert parse_dgi_date("2025-01-31T08:15:00+07:00") == date(2025, 1, 31)
+    assert parse_dgi_date("31/01/2025") == date(2025, 1, 31)
+    assert parse_dgi_date("31/01/2025 08:15:00") == date(2025, 1, 31)
+    assert parse_dgi_date("  2025-01-31  ") == date(2025, 1, 31)
+
+
+def test_parse_dgi_date_passes_dates_through():
+    """date and datetime values need no parsing"""
+    assert parse_dgi_date(date(2025, 1, 31)) == date(2025, 1, 31)
+    assert parse_dgi_date(datetime(2025, 1, 31, 23, 59)) == date(2025, 1, 31)
+
+
+def test_parse_dgi_date_rejects_without_raising():
+    """Empty, short, unknown and impossible dates yield None"""
+    assert parse_dgi_date(None) is None
+    assert parse_dgi_date("") is None
+    assert parse_dgi_date("   ") is None
+    assert parse_dgi_date("2025-1-5") is None
+    assert parse_dgi_date("31-01-2025") is None
+    assert parse_dgi_date("2025-02-30") is None
+    assert parse_dgi_date("31/13/2025") is None
+    assert parse_dgi_date("not a date") is None
+
+
+def test_with_derived_dates_adds_parsed_columns():
+    """Derived columns are parsed from their source column; the input record is left as is"""
+    from tasks.processors.base_processor import BaseDataProcessor
+
+    derived_dates = {"tanggal_terima_date": "tanggal_terima", "modified_date": "modified_time"}
+    record = {"no_shipping_list": "SL-1", "tanggal_terima": "31/01/2025", "modified_time": "2025-02-01 10:00:00"}
+
+    result = BaseDataProcessor._with_derived_dates(record, derived_dates)
+
+    assert result["tanggal_terima_date"] == date(2025, 1, 31)
+    assert result["modified_date"] == date(2025, 2, 1)
+    assert result["tanggal_terima"] == "31/01/2025"
+    assert "tanggal_terima_date" not in record
+
+
+def test_with_derived_dates_only_for_present_sources():
+    """A source column missing from the payload does not overwrite its DATE column"""
+    from tasks.processors.base_processor import BaseDataProcessor
+
+    derived_dates = {"tanggal_terima_date": "tanggal_terima", "modified_date": "modified_time"}
+
+    result = BaseDataProcessor._with_derived_dates({"tanggal_terima": "invalid"}, derived_dates)
+    assert result == {"tanggal_terima": "invalid", "tanggal_terima_date": None}
+
+    record = {"no_shipping_list": "SL-1"}
+    assert BaseDataProcessor._with_derived_dates(record, derived_dates) is record
+
+
+def test_derived_date_columns_match_models():
+    """Every derived column is a DATE column next to an existing source column"""
+    from sqlalchemy import Date
+    from database import DERIVED_DATE_COLUMNS
+
+    for model_class, derived_dates in DERIVED_DATE_COLUMNS.items():
+        columns = model_class.__table__.columns
+        for date_column, source_column in derived_dates.items():
+            assert date_column in columns, f"{model_class.__name__}.{date_column} missing"
+            assert isinstance(columns[date_column].type, Date), f"{model_class.__name__}.{date_column} is not a DATE"
+            assert source_column in columns, f"{model_class.__name__}.{source_column} missing"
+
+
+def main():
+    """Run the date parsing tests without pytest"""
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_") and callable(value)]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"All {len(tests)} DGI date parsing tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for the Redis Lua scripts of the job queue: claiming jobs under the per-dealer
+lock, releasing and extending a lock only for its owner, and reaping lost jobs
+
+Needs a Redis server (TEST_REDIS_URL, default redis://localhost:6379/15); every test
+works under its own key prefix and removes its keys afterwards.
+"""
+import sys
+import os
+import json
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# Add the backend directory to the Python path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import pytest
+import redis
+
+from job_queue_manager import JobQueueManager, JobStatus, QueuedJob
+from tasks.job_queue_manager import JobPriority
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@contextmanager
+def queue_manager(max_concurrency: int = 2):
+    """JobQueueManager on an isolated key prefix"""
+    manager = JobQueueManager(redis_url=TEST_REDIS_URL, max_concurrency=max_concurrency)
+    manager.KEY_PREFIX = f"test:jobq:{uuid.uuid4().hex[:8]}:"
+    try:
+        manager.redis.ping()
+    except redis.ConnectionError:
+        pytest.skip(f"Redis not reachable at {TEST_REDIS_URL}")
+
+    try:
+        yield manager
+    finally:
+        keys = list(manager.redis.scan_iter(f"{manager.KEY_PREFIX}*"))
+        if keys:
+            manager.redis.delete(*keys)
+
+
+def enqueue(manager: JobQueueManager, dealer_id: str, age_seconds: int = 0,
+            priority: JobPriority = JobPriority.NORMAL) -> QueuedJob:
+    """Store a queued job the way add_job does, without dispatching it"""
+    job = QueuedJob(
+        id=str(uuid.uuid4()),
+        dealer_id=dealer_id,
+        fetch_type="prospect",
+        priority=priority,
+        created_at=datetime(2025, 1, 1) + timedelta(seconds=age_seconds)
+    )
+    manager._save_job(job)
+    manager.redis.zadd(manager._key("pending"), {job.id: manager._queue_score(job)})
+    return job
+
+
+def claim(manager: JobQueueManager) -> list:
+    return manager._claim_jobs(
+        keys=[manager._key("pending"), manager._key("running")],
+        args=[manager.max_concurrency, manager.lock_ttl, manager.KEY_PREFIX, manager.DISPATCH_SCAN_LIMIT]
+    )
+
+
+def test_claim_skips_dealers_with_a_running_job():
+    """One job per dealer at a time, in priority then FIFO order"""
+    with queue_manager(max_concurrency=3) as manager:
+        first = enqueue(manager, "00001", age_seconds=0)
+        second_same_dealer = enqueue(manager, "00001", age_seconds=1)
+        other_dealer = enqueue(manager, "00002", age_seconds=2)
+        urgent = enqueue(manager, "00003", age_seconds=3, priority=JobPriority.HIGH)
+
+        claimed = claim(manager)
+
+        assert claimed == [urgent.id, first.id, other_dealer.id]
+        assert manager.redis.smembers(manager._key("running")) == set(claimed)
+        assert manager.redis.zrange(manager._key("pending"), 0, -1) == [second_same_dealer.id]
+        assert manager.redis.get(manager._key("dealer:00001")) == first.id
+        assert 0 < manager.redis.ttl(manager._key("dealer:00001")) <= manager.lock_ttl
+
+
+def test_claim_respects_the_concurrency_limit():
+    """Only the free slots are filled, counting jobs already running"""
+    with queue_manager(max_concurrency=2) as manager:
+        manager.redis.sadd(manager._key("running"), "already-running")
+        first = enqueue(manager, "00001", age_seconds=0)
+        enqueue(manager, "00002", age_seconds=1)
+
+        assert claim(manager) == [first.id]
+        assert claim(manager) == []
+        assert manager.redis.zcard(manager._key("pending")) == 1
+
+
+def test_claim_drops_pending_ids_without_a_record():
+    """Pending entries whose job record expired are removed instead of claimed"""
+    with queue_manager() as manager:
+        manager.redis.zadd(manager._key("pending"), {"missing-job": 0})
+        job = enqueue(manager, "00001")
+
+        assert claim(manager) == [job.id]
+        assert manager.redis.zcard(manager._key("pending")) == 0
+
+
+def test_release_lock_only_for_its_owner():
+    """A finished job cannot release a lock that was re-claimed by another job"""
+    with queue_manager() as manager:
+        lock_key = manager._key("dealer:00001")
+        manager.redis.set(lock_key, "job-b")
+
+        assert manager._release_lock(keys=[lock_key], args=["job-a"]) == 0
+        assert manager.redis.get(lock_key) == "job-b"
+
+        assert manager._release_lock(keys=[lock_key], args=["job-b"]) == 1
+        assert manager.redis.exists(lock_key) == 0
+
+
+def test_extend_lock_only_for_its_owner():
+    """The heartbeat renews the lock TTL while the job still holds it"""
+    with queue_manager() as manager:
+        lock_key = manager._key("dealer:00001")
+        manager.redis.set(lock_key, "job-a", ex=5)
+
+        assert manager.extend_lock("job-a", "00001") is True
+        assert manager.redis.ttl(lock_key) > 5
+
+        manager.redis.set(lock_key, "job-b", ex=5)
+        assert manager.extend_lock("job-a", "00001") is False
+        assert manager.redis.ttl(lock_key) <= 5
+
+        manager.redis.delete(lock_key)
+        assert manager.extend_lock("job-a", "00001") is False
+
+
+def test_reap_fails_only_jobs_that_lost_their_lock():
+    """Running jobs whose lock expired are failed; held locks and stale ids are left alone"""
+    with queue_manager(max_concurrency=3) as manager:
+        lost = enqueue(manager, "00001", age_seconds=0)
+        alive = enqueue(manager, "00002", age_seconds=1)
+        assert set(claim(manager)) == {lost.id, alive.id}
+        manager.redis.delete(manager._key("dealer:00001"))
+        manager.redis.sadd(manager._key("running"), "record-gone")
+
+        manager._reap_lost_jobs()
+
+        assert manager.redis.smembers(manager._key("running")) == {alive.id}
+        assert manager.redis.zrange(manager._key("history"), 0, -1) == [lost.id]
+        reaped = json.loads(manager.redis.get(manager._key(f"job:{lost.id}")))
+        assert reaped["status"] == JobStatus.FAILED.value
+        assert 0 < manager.redis.ttl(manager._key(f"job:{lost.id}")) <= manager.history_ttl
+        assert manager._load_job(alive.id).status == JobStatus.QUEUED
+
+
+def test_reap_leaves_jobs_completed_by_their_callback():
+    """A job the completion callback already finished is not overwritten as failed"""
+    with queue_manager() as manager:
+        job = enqueue(manager, "00001")
+        claim(manager)
+        running_job = manager._load_job(job.id)
+        manager._finish(running_job, JobStatus.COMPLETED, result={"status": "success"})
+
+        reaped = manager._reap_job(
+            keys=[
+                manager._key("running"),
+                manager._key("dealer:00001"),
+                manager._key(f"job:{job.id}"),
+                manager._key("history")
+            ],
+            args=[job.id, json.dumps({"status": JobStatus.FAILED.value}), manager.history_ttl, 0]
+        )
+
+        assert reaped == 0
+        assert manager._load_job(job.id).status == JobStatus.COMPLETED
+
+
+def main():
+    """Run the job queue script tests without pytest"""
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_") and callable(value)]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"All {len(tests)} job queue script tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,13 @@ Provides centralized API configuration and client management
 """
 
 import httpx
+import importlib.util
 import logging
+import os
+import threading
 import time
 import asyncio
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 from database import SessionLocal, APIConfiguration
 from utils.dgi_token_generator import DGITokenManager
@@ -88,12 +92,121 @@ def retry_with_backoff(retry_config: APIRetryConfig = None):
         return wrapper
     return decorator
 
+class APIConfigCache:
+    """In-process TTL cache for API configurations
+
+    API configurations are static between admin edits, so the fetch path reads
+    them from memory instead of querying Postgres for every client instance.
+    Entries expire after ``ttl_seconds`` (missing configurations after the much
+    shorter ``negative_ttl_seconds``, so a newly added one is picked up quickly);
+    edits made through the configuration
+    controller bump a version counter in Redis, which every process polls at
+    most once per ``version_check_interval`` seconds and drops its cache on change.
+    """
+
+    VERSION_KEY = "dgi:api_config:version"
+
+    def __init__(self, ttl_seconds: float = 300, version_check_interval: float = 15,
+                 negative_ttl_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.version_check_interval = version_check_interval
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self._version_checked_at = 0.0
+        self._redis = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_redis(self):
+        if self._redis is None:
+            import redis
+            self._redis = redis.Redis.from_url(
+                os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                socket_timeout=1,
+                socket_connect_timeout=1
+            )
+        return self._redis
+
+    def _check_version(self) -> None:
+        """Drop cached entries if another process published a config change"""
+        now = time.monotonic()
+        if now - self._version_checked_at < self.version_check_interval:
+            return
+        self._version_checked_at = now
+
+        try:
+            version = self._get_redis().get(self.VERSION_KEY)
+        except Exception as e:
+            # Redis unavailable: fall back to TTL-only expiry
+            logger.debug(f"API config version check failed, relying on TTL: {e}")
+            return
+
+        if version != self._version:
+            if self._version is not None:
+                logger.info("API configuration version changed, clearing config cache")
+            self._version = version
+            with self._lock:
+                self._entries.clear()
+
+    def get(self, config_name: str, loader) -> Optional[Dict[str, Any]]:
+        """Get a cached configuration, calling ``loader(config_name)`` on a miss"""
+        self._check_version()
+
+        entry = self._entries.get(config_name)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return dict(entry[1]) if entry[1] is not None else None
+
+        self.misses += 1
+        config = loader(config_name)
+        ttl = self.ttl_seconds if config is not None else self.negative_ttl_seconds
+        with self._lock:
+            self._entries[config_name] = (time.monotonic() + ttl, config)
+        return dict(config) if config is not None else None
+
+    def invalidate(self, publish: bool = True) -> None:
+        """Clear the local cache and (optionally) tell other processes to do the same"""
+        with self._lock:
+            self._entries.clear()
+
+        if publish:
+            try:
+                # Store as bytes so it compares equal to what GET returns
+                self._version = str(self._get_redis().incr(self.VERSION_KEY)).encode()
+            except Exception as e:
+                logger.warning(f"Failed to publish API config invalidation, other workers expire on TTL: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds
+        }
+
+
 class APIConfigManager:
     """Manages API configurations from database"""
-    
+
+    cache = APIConfigCache(
+        ttl_seconds=float(os.getenv("API_CONFIG_CACHE_TTL", "300")),
+        version_check_interval=float(os.getenv("API_CONFIG_VERSION_CHECK_INTERVAL", "15")),
+        negative_ttl_seconds=float(os.getenv("API_CONFIG_CACHE_NEGATIVE_TTL", "30"))
+    )
+
     @staticmethod
     def get_api_config(config_name: str) -> Optional[Dict[str, Any]]:
-        """Get API configuration by name"""
+        """Get API configuration by name (served from the in-process cache)"""
+        return APIConfigManager.cache.get(config_name, APIConfigManager._load_api_config)
+
+    @staticmethod
+    def _load_api_config(config_name: str) -> Optional[Dict[str, Any]]:
+        """Load API configuration by name from the database"""
         db = SessionLocal()
         try:
             config = db.query(APIConfiguration).filter(
@@ -111,6 +224,11 @@ class APIConfigManager:
             return None
         finally:
             db.close()
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Invalidate cached API configurations in every process"""
+        APIConfigManager.cache.invalidate()
     
     @staticmethod
     def get_default_config() -> Dict[str, Any]:
@@ -163,6 +281,96 @@ class APIConfigManager:
             "verify": True
         }
 
+class SharedHTTPTransport:
+    """Process-wide pooled HTTP client shared by all DGI API clients
+
+    Every Celery worker process gets its own keep-alive connection pool, so
+    consecutive fetches for different dealers and fetch types reuse the TCP/TLS
+    connection to the DGI gateway instead of paying a new handshake per call.
+    The client is recreated after a fork (prefork workers) and never shared
+    across processes.
+    """
+
+    _client: Optional[httpx.Client] = None
+    _owner_pid: Optional[int] = None
+    _lock = threading.Lock()
+    _stats = {
+        "clients_created": 0,
+        "requests_sent": 0,
+        "created_at": None
+    }
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """HTTP/2 needs the optional h2 package (httpx[http2])"""
+        return importlib.util.find_spec("h2") is not None
+
+    @staticmethod
+    def _client_config() -> Dict[str, Any]:
+        return APIConfigManager.create_enhanced_client_config(APIConfigManager.get_default_config())
+
+    @classmethod
+    def _on_request(cls, request: httpx.Request) -> None:
+        # Request hooks run concurrently on every thread sharing the client
+        with cls._lock:
+            cls._stats["requests_sent"] += 1
+
+    @classmethod
+    def get_client(cls) -> httpx.Client:
+        """Get the pooled client for the current process, creating it on first use"""
+        pid = os.getpid()
+        if cls._client is not None and cls._owner_pid == pid and not cls._client.is_closed:
+            return cls._client
+
+        with cls._lock:
+            if cls._client is None or cls._owner_pid != pid or cls._client.is_closed:
+                if cls._owner_pid != pid:
+                    # Never reuse sockets inherited from the parent process; just drop them
+                    cls._stats.update(clients_created=0, requests_sent=0)
+                client_config = cls._client_config()
+                http2 = cls._http2_available()
+                cls._client = httpx.Client(
+                    http2=http2,
+                    event_hooks={"request": [cls._on_request]},
+                    **client_config
+                )
+                cls._owner_pid = pid
+                cls._stats["clients_created"] += 1
+                cls._stats["created_at"] = datetime.utcnow().isoformat()
+                logger.info(f"Created shared DGI HTTP client for process {pid} (http2={http2})")
+        return cls._client
+
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, Any]:
+        """Get shared client statistics and the pool's configured limits for the current process"""
+        client_config = cls._client_config()
+        limits, timeout = client_config["limits"], client_config["timeout"]
+        with cls._lock:
+            return {
+                "pid": os.getpid(),
+                "active": cls._client is not None and cls._owner_pid == os.getpid() and not cls._client.is_closed,
+                "http2_available": cls._http2_available(),
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+                "keepalive_expiry": limits.keepalive_expiry,
+                "timeout": {
+                    "connect": timeout.connect,
+                    "read": timeout.read,
+                    "write": timeout.write,
+                    "pool": timeout.pool
+                },
+                **cls._stats
+            }
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the pooled client owned by the current process"""
+        with cls._lock:
+            if cls._client is not None and cls._owner_pid == os.getpid():
+                cls._client.close()
+            cls._client = None
+            cls._owner_pid = None
+
 class ProspectAPIClient:
     """Client for Prospect Data API calls"""
     
@@ -188,10 +396,10 @@ class ProspectAPIClient:
         
         logger.info(f"Calling Prospect API for dealer {dealer_id} at {url}")
         
-        with httpx.Client(timeout=self.config['timeout_seconds']) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        client = SharedHTTPTransport.get_client()
+        response = client.post(url, headers=headers, json=payload, timeout=self.config['timeout_seconds'])
+        response.raise_for_status()
+        return response.json()
 
 class PKBAPIClient:
     """Client for PKB (Service Record) API calls"""
@@ -217,10 +425,10 @@ class PKBAPIClient:
         
         logger.info(f"Calling PKB API for dealer {dealer_id} at {url} with payload {payload}" )
         
-        with httpx.Client(timeout=self.config['timeout_seconds']) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        client = SharedHTTPTransport.get_client()
+        response = client.post(url, headers=headers, json=payload, timeout=self.config['timeout_seconds'])
+        response.raise_for_status()
+        return response.json()
 
 class PartsInboundAPIClient:
     """Client for Parts Inbound API calls"""
@@ -246,10 +454,10 @@ class PartsInboundAPIClient:
 
         logger.info(f"Calling Parts Inbound API for dealer {dealer_id} at {url}")
 
-        with httpx.Client(timeout=self.config['timeout_seconds']) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        client = SharedHTTPTransport.get_client()
+        response = client.post(url, headers=headers, json=payload, timeout=self.config['timeout_seconds'])
+        response.raise_for_status()
+        return response.json()
 
 class LeasingAPIClient:
     """Client for Leasing Requirement API calls"""
@@ -278,10 +486,10 @@ class LeasingAPIClient:
 
         logger.info(f"Calling Leasing API for dealer {dealer_id} at {url}")
 
-        with httpx.Client(timeout=self.config['timeout_seconds']) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        client = SharedHTTPTransport.get_client()
+        response = client.post(url, headers=headers, json=payload, timeout=self.config['timeout_seconds'])
+        response.raise_for_status()
+        return response.json()
 
 
 class DocumentHandlingAPIClient:
@@ -315,10 +523,10 @@ class DocumentHandlingAPIClient:
 
         logger.info(f"Calling Document Handling API for dealer {dealer_id} at {url}")
 
-        with httpx.Client(timeout=self.config['timeout_seconds']) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        client = SharedHTTPTransport.get_client()
+        response = client.post(url, headers=headers, json=payload, timeout=self.config['timeout_seconds'])
+        response.raise_for_status()
+        return response.json()
 
 
 class UnitInboundAPIClient:
@@ -356,35 +564,35 @@ class UnitInboundAPIClient:
 
             logger.info(f"Calling Unit Inbound API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Unit Inbound API connection failed: {e}")
@@ -438,35 +646,35 @@ class DeliveryProcessAPIClient:
 
             logger.info(f"Calling Delivery Process API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Delivery Process API connection failed: {e}")
@@ -518,35 +726,35 @@ class BillingProcessAPIClient:
 
             logger.info(f"Calling Billing Process API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Billing Process API connection failed: {e}")
@@ -598,35 +806,35 @@ class UnitInvoiceAPIClient:
 
             logger.info(f"Calling Unit Invoice API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Unit Invoice API connection failed: {e}")
@@ -676,35 +884,35 @@ class PartsSalesAPIClient:
 
             logger.info(f"Calling Parts Sales API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Parts Sales API connection failed: {e}")
@@ -773,38 +981,38 @@ class DPHLOAPIClient:
             # Enhanced client configuration
             client_config = APIConfigManager.create_enhanced_client_config(self.config)
 
-            with httpx.Client(**client_config) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=client_config["timeout"])
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
+            logger.debug(f"API response type: {type(json_response)}")
 
-                # Record success for circuit breaker
-                self.circuit_breaker.record_success()
-                return json_response
+            # Record success for circuit breaker
+            self.circuit_breaker.record_success()
+            return json_response
 
         except (httpx.ConnectError, httpx.TimeoutException, httpx.HTTPStatusError) as e:
             # Record failure for circuit breaker
@@ -858,35 +1066,35 @@ class WorkshopInvoiceAPIClient:
 
             logger.info(f"Calling Workshop Invoice API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Workshop Invoice API connection failed: {e}")
@@ -938,35 +1146,35 @@ class UnpaidHLOAPIClient:
 
             logger.info(f"Calling Unpaid HLO API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Unpaid HLO API connection failed: {e}")
@@ -1016,35 +1224,35 @@ class PartsInvoiceAPIClient:
 
             logger.info(f"Calling Parts Invoice API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"Parts Invoice API connection failed: {e}")
@@ -1097,35 +1305,35 @@ class SPKDealingProcessAPIClient:
 
             logger.info(f"Calling SPK Dealing Process API for dealer {dealer_id} at {url}")
 
-            with httpx.Client(timeout=self.config.get('timeout_seconds', 30)) as client:
-                logger.debug(f"Making POST request to {url}")
-                logger.debug(f"Headers: {headers}")
-                logger.debug(f"Payload: {payload}")
+            client = SharedHTTPTransport.get_client()
+            logger.debug(f"Making POST request to {url}")
+            logger.debug(f"Headers: {headers}")
+            logger.debug(f"Payload: {payload}")
 
-                response = client.post(url, headers=headers, json=payload)
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
+            response = client.post(url, headers=headers, json=payload, timeout=self.config.get('timeout_seconds', 30))
+            logger.debug(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Get response text first for debugging
-                response_text = response.text
-                logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
+            # Get response text first for debugging
+            response_text = response.text
+            logger.debug(f"Response text: {response_text[:500]}...")  # First 500 chars
 
-                # Get JSON response with validation
-                if not response_text:
-                    raise ValueError("API returned empty response")
+            # Get JSON response with validation
+            if not response_text:
+                raise ValueError("API returned empty response")
 
-                try:
-                    json_response = response.json()
-                except Exception as json_error:
-                    raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
+            try:
+                json_response = response.json()
+            except Exception as json_error:
+                raise ValueError(f"Failed to parse JSON response: {json_error}. Response text: {response_text[:200]}")
 
-                if json_response is None:
-                    raise ValueError("API returned None JSON response")
+            if json_response is None:
+                raise ValueError("API returned None JSON response")
 
-                logger.debug(f"API response type: {type(json_response)}")
-                return json_response
+            logger.debug(f"API response type: {type(json_response)}")
+            return json_response
 
         except httpx.ConnectError as e:
             logger.error(f"SPK Dealing Process API connection failed: {e}")
@@ -1280,6 +1488,7 @@ def initialize_default_api_configs():
             db.add(config)
         
         db.commit()
+        APIConfigManager.invalidate_cache()
         logger.info("Default API configurations initialized successfully")
         
     except Exception as e:
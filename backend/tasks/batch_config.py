@@ -40,7 +40,29 @@ class BatchProcessingConfig:
     MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "3"))
     MAX_JOBS_PER_DEALER = int(os.getenv("MAX_JOBS_PER_DEALER", "1"))
     JOB_TIMEOUT_SECONDS = int(os.getenv("JOB_TIMEOUT_SECONDS", "3600"))  # 1 hour
+
+    # Incremental Fetch Window Settings
+    INCREMENTAL_FETCH_ENABLED = os.getenv("INCREMENTAL_FETCH_ENABLED", "true").lower() == "true"
+    INCREMENTAL_FETCH_OVERLAP_MINUTES = int(os.getenv("INCREMENTAL_FETCH_OVERLAP_MINUTES", "15"))
+    INCREMENTAL_FETCH_MAX_LOOKBACK_HOURS = int(os.getenv("INCREMENTAL_FETCH_MAX_LOOKBACK_HOURS", "72"))
+
+    # Concurrent Multi-Dealer Fetch Settings
+    FANOUT_MAX_CONCURRENCY_PER_HOST = int(os.getenv("FANOUT_MAX_CONCURRENCY_PER_HOST", "8"))
+    FANOUT_WRITE_CONCURRENCY = int(os.getenv("FANOUT_WRITE_CONCURRENCY", "2"))
+
+    # Redis-backed Manual Job Queue Settings
+    JOB_QUEUE_MAX_CONCURRENCY = int(os.getenv("JOB_QUEUE_MAX_CONCURRENCY", "4"))
+    JOB_QUEUE_DEALER_LOCK_TTL_SECONDS = int(os.getenv("JOB_QUEUE_DEALER_LOCK_TTL_SECONDS", "1800"))  # Claim until the task starts
+    JOB_QUEUE_HEARTBEAT_INTERVAL_SECONDS = int(os.getenv("JOB_QUEUE_HEARTBEAT_INTERVAL_SECONDS", "30"))
+    JOB_QUEUE_HEARTBEAT_TTL_SECONDS = int(os.getenv("JOB_QUEUE_HEARTBEAT_TTL_SECONDS", "120"))  # Lock lifetime without a heartbeat
+    JOB_QUEUE_HISTORY_TTL_HOURS = int(os.getenv("JOB_QUEUE_HISTORY_TTL_HOURS", "24"))
     
+    # Dashboard Daily Rollup Settings
+    DASHBOARD_ROLLUPS_ENABLED = os.getenv("DASHBOARD_ROLLUPS_ENABLED", "true").lower() == "true"
+
+    # Gateway Response Cache Settings (bump the dealer's cache generation after runs that changed data)
+    GATEWAY_CACHE_INVALIDATION_ENABLED = os.getenv("GATEWAY_CACHE_INVALIDATION_ENABLED", "true").lower() == "true"
+
     # Resource Monitoring
     MEMORY_THRESHOLD_PERCENT = int(os.getenv("MEMORY_THRESHOLD_PERCENT", "80"))
     CPU_THRESHOLD_PERCENT = int(os.getenv("CPU_THRESHOLD_PERCENT", "90"))
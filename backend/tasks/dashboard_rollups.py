@@ -0,0 +1,191 @@
+"""
+Incremental daily rollups for the dashboard-dealer tiles
+
+Each metric aggregates one ingest table into dashboard_daily_rollups rows keyed by
+(dealer_id, metric, day, dimension). Processors record which days a run touched and
+refresh_rollups() recomputes just those days; rebuild via scripts/rebuild_dashboard_rollups.py.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import and_, delete, func, insert, literal, null, select
+
+from database import (
+    BillingProcessData,
+    DashboardDailyRollup,
+    DeliveryProcessData,
+    DeliveryProcessDetail,
+    LeasingData,
+    UnitInboundData,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RollupMetric:
+    """One tile aggregate: COUNT(counted) [and SUM(amount)] per day and dimension"""
+    name: str
+    source: Any
+    day_column: str
+    dimension: Optional[Any] = None
+    counted: Optional[Any] = None
+    amount: Optional[Any] = None
+    conditions: Tuple[Any, ...] = ()
+    join: Optional[Tuple[Any, Any]] = None
+
+    @property
+    def day(self):
+        return getattr(self.source, self.day_column)
+
+
+# Mirrors the filters of the matching DashboardRepository queries in dashboard-dealer
+ROLLUP_METRICS = (
+    RollupMetric(
+        name="unit_inbound_status",
+        source=UnitInboundData,
+        day_column="tanggal_terima_date",
+        dimension=UnitInboundData.status_shipping_list,
+    ),
+    RollupMetric(
+        name="payment_type",
+        source=BillingProcessData,
+        day_column="modified_date",
+        dimension=BillingProcessData.tipe_pembayaran,
+        amount=BillingProcessData.amount,
+    ),
+    RollupMetric(
+        name="payment_method",
+        source=BillingProcessData,
+        day_column="modified_date",
+        dimension=BillingProcessData.cara_bayar,
+        conditions=(BillingProcessData.cara_bayar.isnot(None),),
+    ),
+    RollupMetric(
+        name="payment_status",
+        source=BillingProcessData,
+        day_column="modified_date",
+        dimension=BillingProcessData.status,
+        conditions=(BillingProcessData.status.isnot(None),),
+    ),
+    RollupMetric(
+        name="top_leasing",
+        source=LeasingData,
+        day_column="tanggal_pengajuan_date",
+        dimension=LeasingData.nama_finance_company,
+        counted=LeasingData.id_po_finance_company,
+        conditions=(
+            LeasingData.nama_finance_company.isnot(None),
+            LeasingData.id_po_finance_company.isnot(None),
+        ),
+    ),
+    RollupMetric(
+        name="po_creation",
+        source=LeasingData,
+        day_column="tanggal_pembuatan_po_date",
+        counted=LeasingData.id_po_finance_company,
+        conditions=(LeasingData.id_po_finance_company.isnot(None),),
+    ),
+    RollupMetric(
+        name="delivery_status",
+        source=DeliveryProcessData,
+        day_column="tanggal_pengiriman_date",
+        dimension=DeliveryProcessData.status_delivery_document,
+    ),
+    RollupMetric(
+        name="top_driver",
+        source=DeliveryProcessData,
+        day_column="tanggal_pengiriman_date",
+        dimension=DeliveryProcessData.id_driver,
+        counted=DeliveryProcessDetail.id_spk,
+        conditions=(
+            DeliveryProcessData.id_driver.isnot(None),
+            DeliveryProcessData.id_driver != '',
+            DeliveryProcessDetail.id_spk.isnot(None),
+        ),
+        join=(DeliveryProcessDetail, DeliveryProcessData.id == DeliveryProcessDetail.delivery_process_data_id),
+    ),
+)
+
+# Day columns per source table that processors must track while upserting
+ROLLUP_DAY_COLUMNS: Dict[Any, Tuple[str, ...]] = {}
+for _metric in ROLLUP_METRICS:
+    _columns = ROLLUP_DAY_COLUMNS.setdefault(_metric.source, ())
+    if _metric.day_column not in _columns:
+        ROLLUP_DAY_COLUMNS[_metric.source] = _columns + (_metric.day_column,)
+
+
+def _refresh_metric(db, metric: RollupMetric, dealer_id: str, days: Optional[Iterable[date]]) -> None:
+    """Replace the rollup rows of one metric for a dealer (all days when ``days`` is None)
+
+    Concurrent refreshes of the same (dealer, metric) are serialized by a transaction-scoped
+    advisory lock, so one cannot insert between the other's DELETE and INSERT and hit
+    the unique index. Locks are taken in ROLLUP_METRICS order, so runs cannot deadlock.
+    """
+    table = DashboardDailyRollup
+    source_filter = [metric.source.dealer_id == dealer_id, metric.day.isnot(None), *metric.conditions]
+    rollup_filter = [table.dealer_id == dealer_id, table.metric == metric.name]
+    if days is not None:
+        days = sorted(days)
+        source_filter.append(metric.day.in_(days))
+        rollup_filter.append(table.day.in_(days))
+
+    grouping = [metric.source.dealer_id, metric.day]
+    if metric.dimension is not None:
+        grouping.append(metric.dimension)
+    dimension = metric.dimension if metric.dimension is not None else null()
+    counted = metric.counted if metric.counted is not None else metric.source.id
+    amount = func.sum(metric.amount) if metric.amount is not None else null()
+
+    query = select(
+        metric.source.dealer_id,
+        literal(metric.name),
+        metric.day,
+        dimension,
+        func.count(counted),
+        amount,
+        literal(datetime.utcnow()),
+    ).select_from(metric.source)
+    if metric.join is not None:
+        query = query.join(*metric.join)
+    query = query.where(and_(*source_filter)).group_by(*grouping)
+
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"{dealer_id}:{metric.name}"))))
+    db.execute(delete(table).where(and_(*rollup_filter)))
+    db.execute(insert(table).from_select(
+        ['dealer_id', 'metric', 'day', 'dimension', 'record_count', 'amount_total', 'refreshed_at'],
+        query,
+    ))
+
+
+def refresh_rollups(db, dealer_id: str, touched_days: Dict[Tuple[Any, str], Set[date]]) -> int:
+    """Recompute the rollup days touched by a processor run; caller commits.
+
+    ``touched_days`` maps (source model, day column) to the days whose rows were
+    written, including the previous day of rows that moved. Returns metrics refreshed.
+    """
+    refreshed = 0
+    for metric in ROLLUP_METRICS:
+        days = touched_days.get((metric.source, metric.day_column))
+        if not days:
+            continue
+        _refresh_metric(db, metric, dealer_id, days)
+        refreshed += 1
+    return refreshed
+
+
+def rebuild_rollups(db, dealer_id: str, metric_names: Optional[Iterable[str]] = None) -> int:
+    """Recompute every day of the given metrics (all by default) for one dealer; caller commits"""
+    wanted = set(metric_names) if metric_names else None
+    rebuilt = 0
+    for metric in ROLLUP_METRICS:
+        if wanted is not None and metric.name not in wanted:
+            continue
+        _refresh_metric(db, metric, dealer_id, None)
+        rebuilt += 1
+    return rebuilt
+
+
+__all__ = ["RollupMetric", "ROLLUP_METRICS", "ROLLUP_DAY_COLUMNS", "refresh_rollups", "rebuild_rollups"]
@@ -5,8 +5,14 @@ This file acts as the main entry point and router for all data fetching operatio
 from celery import current_task
 from celery_app import celery_app
 from datetime import datetime
+from urllib.parse import urlparse
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+from database import SessionLocal, Dealer
 
 from .processors.prospect_processor import ProspectDataProcessor
 from .processors.pkb_processor import PKBDataProcessor
@@ -23,7 +29,8 @@ from .processors.workshop_invoice_processor import WorkshopInvoiceDataProcessor
 from .processors.unpaid_hlo_processor import UnpaidHLODataProcessor
 from .processors.parts_invoice_processor import PartsInvoiceDataProcessor
 from .processors.spk_dealing_process_processor import SPKDealingProcessDataProcessor
-from .api_clients import initialize_default_api_configs
+from .api_clients import initialize_default_api_configs, SharedHTTPTransport, CircuitBreaker, APIConfigManager
+from .batch_config import BatchProcessingConfig
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -70,6 +77,168 @@ class DataFetcherRouter:
         processor = self.get_processor(fetch_type)
         return processor.execute(dealer_id, from_time, to_time, **kwargs)
 
+    def execute_fetch_many(self, fetch_type: str, dealer_ids: List[str], from_time: str = None,
+                           to_time: str = None, max_concurrency: Optional[int] = None,
+                           write_concurrency: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """Fetch one fetch_type for many dealers concurrently, then store each payload
+
+        API calls fan out on asyncio (bounded per DGI host and guarded by the host's
+        circuit breaker); each payload is then written through the processor's normal
+        execute() path, with at most ``write_concurrency`` writers at a time.
+        """
+        processor = self.get_processor(fetch_type)
+        engine = ConcurrentFetchEngine(
+            max_concurrency or BatchProcessingConfig.FANOUT_MAX_CONCURRENCY_PER_HOST,
+            write_concurrency or BatchProcessingConfig.FANOUT_WRITE_CONCURRENCY
+        )
+        return asyncio.run(engine.run(processor, dealer_ids, from_time, to_time, **kwargs))
+
+
+class ConcurrentFetchEngine:
+    """Asyncio fan-out of processor API fetches across dealers
+
+    Processors and API clients are synchronous, so each fetch runs in a worker
+    thread; the shared pooled HTTP client is thread-safe and keeps connections
+    alive across dealers. Each run caps its own in-flight fetches at max_concurrency;
+    on top of that, circuit breakers and a semaphore of FANOUT_MAX_CONCURRENCY_PER_HOST
+    slots are per DGI host and shared by every run in the process, so concurrent
+    fan-outs to one host never exceed that bound together.
+    """
+
+    _host_breakers: Dict[str, CircuitBreaker] = {}
+    _host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+    _host_breakers_lock = threading.Lock()
+
+    def __init__(self, max_concurrency: int, write_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.write_concurrency = max(1, write_concurrency)
+
+    @staticmethod
+    def _host_key(processor) -> str:
+        """Resolve the DGI host a processor talks to"""
+        api_client = getattr(processor, "api_client", None)
+        config = getattr(api_client, "config", None) or APIConfigManager.get_default_config()
+        return urlparse(config.get("base_url", "")).netloc or "dgi"
+
+    @classmethod
+    def _get_breaker(cls, host: str) -> CircuitBreaker:
+        breaker = cls._host_breakers.get(host)
+        if breaker is not None:
+            return breaker
+        # Several runs (threads) may meet a new host at once; all must share one breaker
+        with cls._host_breakers_lock:
+            return cls._host_breakers.setdefault(host, CircuitBreaker(
+                failure_threshold=BatchProcessingConfig.CIRCUIT_BREAKER_THRESHOLD,
+                recovery_timeout=BatchProcessingConfig.CIRCUIT_BREAKER_TIMEOUT
+            ))
+
+    @classmethod
+    def _get_host_semaphore(cls, host: str) -> threading.BoundedSemaphore:
+        semaphore = cls._host_semaphores.get(host)
+        if semaphore is not None:
+            return semaphore
+        with cls._host_breakers_lock:
+            return cls._host_semaphores.setdefault(
+                host, threading.BoundedSemaphore(max(1, BatchProcessingConfig.FANOUT_MAX_CONCURRENCY_PER_HOST))
+            )
+
+    @staticmethod
+    def _fetch_with_slot(host_semaphore: threading.BoundedSemaphore, processor, dealer: Dealer,
+                         from_time: str, to_time: str, **kwargs) -> Dict[str, Any]:
+        """Call the DGI API while holding one of the host's process-wide slots (runs in a worker thread)"""
+        with host_semaphore:
+            return processor.fetch_api_data(dealer, from_time, to_time, **kwargs)
+
+    @staticmethod
+    def _load_dealers(processor, dealer_ids: List[str]) -> tuple[Dict[str, Dealer], Dict[str, Any]]:
+        """Load all requested dealers and their incremental fetch watermarks"""
+        db = SessionLocal()
+        try:
+            dealers = db.query(Dealer).filter(Dealer.dealer_id.in_(dealer_ids)).all()
+            watermarks = processor.get_watermarks(db, dealer_ids)
+            return {dealer.dealer_id: dealer for dealer in dealers}, watermarks
+        finally:
+            db.close()
+
+    async def run(self, processor, dealer_ids: List[str], from_time: str = None,
+                  to_time: str = None, **kwargs) -> Dict[str, Any]:
+        started = time.monotonic()
+        requested_from, requested_to = from_time, to_time
+
+        dealers, watermarks = await asyncio.to_thread(self._load_dealers, processor, dealer_ids)
+        host = self._host_key(processor)
+        breaker = self._get_breaker(host)
+        host_semaphore = self._get_host_semaphore(host)
+        fetch_semaphore = asyncio.Semaphore(self.max_concurrency)
+        write_semaphore = asyncio.Semaphore(self.write_concurrency)
+
+        async def fetch_and_store(dealer_id: str) -> Dict[str, Any]:
+            dealer = dealers.get(dealer_id)
+            if dealer is None:
+                return {"status": "failed", "dealer_id": dealer_id, "error": f"Dealer {dealer_id} not found"}
+            if not dealer.is_active:
+                return {"status": "skipped", "dealer_id": dealer_id, "reason": "dealer_inactive"}
+
+            # Each dealer gets its own window when running incrementally off its watermark
+            dealer_from, dealer_to, advance_to = processor.resolve_time_range(
+                requested_from, requested_to, watermarks.get(dealer_id)
+            )
+
+            async with fetch_semaphore:
+                if not breaker.can_execute():
+                    return {"status": "skipped", "dealer_id": dealer_id, "reason": f"circuit_open:{host}"}
+                fetch_started = time.monotonic()
+                try:
+                    api_data = await asyncio.to_thread(
+                        self._fetch_with_slot, host_semaphore, processor, dealer, dealer_from, dealer_to, **kwargs
+                    )
+                except Exception as e:
+                    breaker.record_failure()
+                    logger.error(f"Concurrent {processor.fetch_type} fetch failed for dealer {dealer_id}: {e}")
+                    return {"status": "failed", "dealer_id": dealer_id, "error": str(e)}
+                fetch_seconds = round(time.monotonic() - fetch_started, 3)
+
+                # Processors convert transport errors into status=0 payloads
+                if isinstance(api_data, dict) and api_data.get("status") == 1:
+                    breaker.record_success()
+                elif isinstance(api_data, dict) and str(api_data.get("message", "")).startswith("Fetch Error"):
+                    breaker.record_failure()
+
+            async with write_semaphore:
+                try:
+                    result = await asyncio.to_thread(
+                        processor.execute, dealer_id, dealer_from, dealer_to,
+                        api_data=api_data, advance_to=advance_to, **kwargs
+                    )
+                except Exception as e:
+                    return {"status": "failed", "dealer_id": dealer_id, "error": str(e),
+                            "fetch_seconds": fetch_seconds}
+            result["fetch_seconds"] = fetch_seconds
+            return result
+
+        results = await asyncio.gather(*(fetch_and_store(dealer_id) for dealer_id in dealer_ids))
+
+        summary = {
+            "status": "completed",
+            "fetch_type": processor.fetch_type,
+            "host": host,
+            "from_time": requested_from,
+            "to_time": requested_to,
+            "total_dealers": len(dealer_ids),
+            "succeeded": sum(1 for r in results if r.get("status") == "success"),
+            "failed": sum(1 for r in results if r.get("status") == "failed"),
+            "skipped": sum(1 for r in results if r.get("status") == "skipped"),
+            "records_processed": sum(r.get("records_processed", 0) for r in results),
+            "duration_seconds": round(time.monotonic() - started, 3),
+            "results": results
+        }
+        logger.info(
+            f"Concurrent {processor.fetch_type} fetch for {len(dealer_ids)} dealers finished in "
+            f"{summary['duration_seconds']}s: {summary['succeeded']} ok, {summary['failed']} failed, "
+            f"{summary['skipped']} skipped"
+        )
+        return summary
+
 
 # Global router instance
 router = DataFetcherRouter()
@@ -77,8 +246,12 @@ router = DataFetcherRouter()
 
 @celery_app.task(bind=True)
 def health_check(self):
-    """Health check task"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    """Health check task (includes the worker's shared DGI HTTP pool stats)"""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        "http_pool": SharedHTTPTransport.get_pool_stats()
+    }
 
 
 @celery_app.task(bind=True)
@@ -238,6 +411,14 @@ def fetch_spk_dealing_process_data(self, dealer_id: str, from_time: str = None,
                               id_prospect=id_prospect, id_sales_people=id_sales_people)
 
 
+@celery_app.task(bind=True)
+def fetch_data_for_dealers(self, fetch_type: str, dealer_ids: List[str], from_time: str = None,
+                           to_time: str = None, max_concurrency: int = None):
+    """Fetch one data type for many dealers concurrently in a single task"""
+    return router.execute_fetch_many(fetch_type, dealer_ids, from_time, to_time,
+                                     max_concurrency=max_concurrency)
+
+
 # Convenience functions for direct processor access (useful for testing)
 def get_prospect_processor() -> ProspectDataProcessor:
     """Get prospect processor instance"""
@@ -332,6 +513,7 @@ __all__ = [
     'fetch_unpaid_hlo_data',
     'fetch_parts_invoice_data',
     'fetch_spk_dealing_process_data',
+    'fetch_data_for_dealers',
     'router',
     'get_prospect_processor',
     'get_pkb_processor',
@@ -0,0 +1,41 @@
+"""
+Invalidation of the API gateway's dashboard response cache
+
+The gateway stamps every cached dashboard response with the dealer's generation
+counter in Redis and treats entries from an older generation as misses, so bumping
+the counter after an ingestion run that changed data retires all of that dealer's
+cached responses at once.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Must match ResponseCacheMiddleware.GENERATION_KEY in the api-gateway
+GENERATION_KEY = "gateway:cache:generation:{dealer_id}"
+
+_redis = None
+
+
+def _get_redis():
+    global _redis
+    if _redis is None:
+        import redis
+        _redis = redis.Redis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            socket_timeout=1,
+            socket_connect_timeout=1
+        )
+    return _redis
+
+
+def invalidate_dealer_responses(dealer_id: str) -> None:
+    """Make every gateway-cached dashboard response for the dealer stale"""
+    try:
+        _get_redis().incr(GENERATION_KEY.format(dealer_id=dealer_id))
+    except Exception as e:
+        # Cached responses still expire on the gateway TTL
+        logger.warning(f"Failed to invalidate gateway cache for dealer {dealer_id}: {e}")
+
+
+__all__ = ["GENERATION_KEY", "invalidate_dealer_responses"]
@@ -0,0 +1,53 @@
+"""
+Celery callbacks for the Redis-backed manual job queue (job_queue_manager.py)
+"""
+import logging
+
+from celery.signals import task_prerun, task_postrun
+
+from celery_app import celery_app
+from job_queue_manager import job_queue_manager
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def job_succeeded(result, job_id: str):
+    """link callback: record the fetch result and start the next queued jobs"""
+    job_queue_manager.complete_job(job_id, result=result)
+
+
+@celery_app.task
+def job_failed(request, exc, traceback, job_id: str):
+    """link_error callback: record the failure and start the next queued jobs"""
+    logger.error(f"Queued job {job_id} failed in task {request.id}: {exc}")
+    job_queue_manager.complete_job(job_id, error_message=str(exc))
+
+
+@celery_app.task
+def dispatch_queued_jobs():
+    """Periodic safety net: reap jobs lost to worker crashes and dispatch pending work"""
+    started = job_queue_manager.dispatch()
+    job_queue_manager.trim_history()
+    return {"started": started}
+
+
+@task_prerun.connect
+def start_queued_job_heartbeat(task_id=None, task=None, **kwargs):
+    """Keep the dealer lock of a queued job alive from the moment its task starts"""
+    job_id = getattr(task.request, job_queue_manager.JOB_ID_HEADER, None)
+    dealer_id = getattr(task.request, job_queue_manager.DEALER_ID_HEADER, None)
+    if not job_id or not dealer_id:
+        return
+    try:
+        job_queue_manager.start_heartbeat(task_id, job_id, dealer_id)
+    except Exception as e:
+        logger.warning(f"Could not start heartbeat for queued job {job_id}: {e}")
+
+
+@task_postrun.connect
+def stop_queued_job_heartbeat(task_id=None, **kwargs):
+    job_queue_manager.stop_heartbeat(task_id)
+
+
+__all__ = ["job_succeeded", "job_failed", "dispatch_queued_jobs"]
@@ -2,25 +2,168 @@
 Base processor class for common data fetching functionality
 """
 from abc import ABC, abstractmethod
-from datetime import datetime, date
-from typing import Dict, Any, Optional
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from typing import Dict, Any, List, Optional
+import hashlib
+import io
+import json
 import logging
-from sqlalchemy import text
+import threading
+import uuid
+from sqlalchemy import text, func, literal_column, tuple_
 from sqlalchemy.dialects.postgresql import insert
 import psycopg2.errors
 from sqlalchemy.exc import IntegrityError, OperationalError, DatabaseError
 
-from database import SessionLocal, Dealer, FetchLog
+from database import SessionLocal, Dealer, FetchLog, FetchWatermark, DERIVED_DATE_COLUMNS
+from utils.date_parsing import parse_dgi_date
+from ..batch_config import BatchProcessingConfig
+from ..dashboard_rollups import ROLLUP_DAY_COLUMNS, refresh_rollups
+from ..gateway_cache import invalidate_dealer_responses
 
 logger = logging.getLogger(__name__)
 
 
 class BaseDataProcessor(ABC):
     """Base class for all data processors"""
+
+    # Write engine used by bulk_upsert: "values" (multi-row INSERT ... VALUES) or
+    # "copy" (COPY into a temp staging table, then one INSERT ... SELECT merge).
+    # Processors that load large batches override this.
+    bulk_upsert_engine = "values"
     
+    # Columns left out of the content hash: bookkeeping set by us, not by the DGI payload
+    content_hash_excluded_columns = ('id', 'fetched_at', 'content_hash')
+
     def __init__(self, fetch_type: str):
         self.fetch_type = fetch_type
         self.logger = logger
+        # Processors are shared across threads by the concurrent fan-out, so per-run
+        # counters live in thread-local storage
+        self._run_stats = threading.local()
+
+    @property
+    def records_changed(self) -> int:
+        """Rows actually inserted or updated by bulk_upsert during the current run"""
+        return getattr(self._run_stats, 'records_changed', 0)
+
+    def _reset_records_changed(self) -> None:
+        self._run_stats.records_changed = 0
+
+    def _add_records_changed(self, count: int) -> None:
+        if count and count > 0:
+            self._run_stats.records_changed = self.records_changed + count
+
+    @property
+    def rollup_days(self) -> Dict[tuple, set]:
+        """(model, day column) -> days written during the current run, for refresh_rollups"""
+        return getattr(self._run_stats, 'rollup_days', {})
+
+    def _reset_rollup_days(self) -> None:
+        self._run_stats.rollup_days = {}
+
+    def _rollup_day_columns(self, model_class) -> tuple:
+        """Day columns of a model feeding the dashboard rollups (empty when rollups are off)"""
+        if not BatchProcessingConfig.DASHBOARD_ROLLUPS_ENABLED:
+            return ()
+        return ROLLUP_DAY_COLUMNS.get(model_class, ())
+
+    def _touched_rollup_days(self, model_class, day_columns: tuple) -> Dict[str, set]:
+        touched = getattr(self._run_stats, 'rollup_days', None)
+        if touched is None:
+            touched = self._run_stats.rollup_days = {}
+        return {column: touched.setdefault((model_class, column), set()) for column in day_columns}
+
+    def _track_rollup_days(self, model_class, records: list, day_columns: tuple) -> None:
+        """Record the rollup days an upsert writes, taken from the records' derived DATE columns"""
+        for column, days in self._touched_rollup_days(model_class, day_columns).items():
+            days.update(record[column] for record in records if record.get(column) is not None)
+
+    def _track_prior_rollup_days(self, model_class, day_columns: tuple, rows: list) -> None:
+        """Record the days rewritten rows had before the upsert (returned by ``_prior_day_sql``)
+
+        A row whose date moved must also refresh the day it left.
+        """
+        touched = self._touched_rollup_days(model_class, day_columns)
+        offset = len(day_columns)
+        for row in rows:
+            for column, value in zip(day_columns, row[-offset:]):
+                if value is not None:
+                    touched[column].add(value)
+
+    @staticmethod
+    def _prior_day_sql(quote, table_name: str, column: str) -> str:
+        """Correlated sub-select of a row's day column as it was before the upsert
+
+        Sub-selects in RETURNING read the snapshot taken before the statement ran, so
+        they yield the pre-update day of rewritten rows (NULL for inserted ones)
+        without a separate lookup query.
+        """
+        return (
+            f"(SELECT prior.{quote(column)} FROM {quote(table_name)} AS prior"
+            f" WHERE prior.{quote('id')} = {quote(table_name)}.{quote('id')})"
+        )
+
+    def _upsert_returning(self, db, model_class, return_ids_by: Optional[str], day_columns: tuple) -> list:
+        """RETURNING columns of an upsert: id and natural key, then the rows' prior rollup days"""
+        returning = []
+        if return_ids_by:
+            returning.extend([model_class.id, getattr(model_class, return_ids_by)])
+        if day_columns:
+            quote = db.get_bind().dialect.identifier_preparer.quote
+            returning.extend(
+                literal_column(self._prior_day_sql(quote, model_class.__table__.name, column))
+                for column in day_columns
+            )
+        return returning
+
+    def _refresh_rollups(self, db, dealer_id: str) -> None:
+        """Recompute the dashboard rollup days touched by this run
+
+        The fetched data is already committed, so a failure here is only logged;
+        scripts/rebuild_dashboard_rollups.py repairs the dealer's rollups.
+        """
+        touched = self.rollup_days
+        if not touched or not BatchProcessingConfig.DASHBOARD_ROLLUPS_ENABLED:
+            return
+        try:
+            refreshed = refresh_rollups(db, dealer_id, touched)
+            db.commit()
+            self.logger.debug(f"Refreshed {refreshed} dashboard rollup metrics for dealer {dealer_id}")
+        except Exception as e:
+            self.logger.warning(f"Dashboard rollup refresh failed for dealer {dealer_id} ({self.fetch_type}): {e}")
+            self._safe_rollback(db)
+
+    def _invalidate_gateway_cache(self, dealer_id: str) -> None:
+        """Retire the gateway's cached dashboard responses for a dealer whose data changed"""
+        if self.records_changed > 0 and BatchProcessingConfig.GATEWAY_CACHE_INVALIDATION_ENABLED:
+            invalidate_dealer_responses(dealer_id)
+
+    def compute_content_hash(self, record: Dict[str, Any]) -> str:
+        """Stable SHA-256 of a record's payload columns (key order independent)"""
+        payload = {
+            key: value for key, value in record.items()
+            if key not in self.content_hash_excluded_columns
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _with_derived_dates(record: Dict[str, Any], derived_dates: Dict[str, str]) -> Dict[str, Any]:
+        """Copy of a record with its typed DATE columns parsed from the source strings"""
+        parsed = {
+            date_column: parse_dgi_date(record.get(source_column))
+            for date_column, source_column in derived_dates.items()
+            if source_column in record
+        }
+        return {**record, **parsed} if parsed else record
+
+    def _upsert_where(self, model_class, stmt):
+        """ON CONFLICT DO UPDATE predicate that skips rows whose content hash is unchanged"""
+        if 'content_hash' not in model_class.__table__.columns:
+            return None
+        return model_class.__table__.c.content_hash.is_distinct_from(stmt.excluded.content_hash)
     
     def _is_transaction_aborted(self, db) -> bool:
         """Check if PostgreSQL transaction is in aborted state"""
@@ -107,14 +250,79 @@ class BaseDataProcessor(ABC):
             else:
                 raise ValueError(f"Failed to get dealer info for {dealer_id}: {e}")
     
-    def set_default_time_range(self, from_time: Optional[str], to_time: Optional[str]) -> tuple[str, str]:
-        """Set default time range if not provided"""
+    @staticmethod
+    def whole_day_time_range(from_time: Optional[str], to_time: Optional[str]) -> tuple[str, str]:
+        """Fill a missing window with the whole current day (also used for manual jobs)"""
         if not from_time or not to_time:
             today = date.today()
             from_time = f"{today} 00:00:00"
             to_time = f"{today} 23:59:59"
         return from_time, to_time
+
+    def set_default_time_range(self, from_time: Optional[str], to_time: Optional[str]) -> tuple[str, str]:
+        """Set default time range if not provided"""
+        return self.whole_day_time_range(from_time, to_time)
     
+    def get_watermarks(self, db, dealer_ids: List[str]) -> Dict[str, datetime]:
+        """Get the incremental fetch high-water marks for dealers (one query)"""
+        rows = db.query(FetchWatermark.dealer_id, FetchWatermark.last_to_time).filter(
+            FetchWatermark.fetch_type == self.fetch_type,
+            FetchWatermark.dealer_id.in_(dealer_ids)
+        ).all()
+        return {dealer_id: last_to_time for dealer_id, last_to_time in rows}
+
+    def resolve_time_range(self, from_time: Optional[str], to_time: Optional[str],
+                           watermark: Optional[datetime]) -> tuple[str, str, Optional[datetime]]:
+        """Resolve the fetch window, using the dealer's watermark when no window is given
+
+        Returns ``(from_time, to_time, advance_to)`` where ``advance_to`` is the watermark
+        to record after a successful run, or None for explicit (manual/backfill) windows.
+        Without a watermark the processor's default window is used and the watermark
+        starts at "now"; afterwards each run requests only ``[watermark - overlap, now]``.
+        A window longer than the configured maximum lookback is cut at the lookback and
+        the watermark only advances to the end of that cut, so a dealer that fell behind
+        catches up over the following runs instead of skipping the gap.
+        """
+        if (from_time and to_time) or not BatchProcessingConfig.INCREMENTAL_FETCH_ENABLED:
+            from_time, to_time = self.set_default_time_range(from_time, to_time)
+            return from_time, to_time, None
+
+        now = datetime.now().replace(microsecond=0)
+        if watermark is None:
+            from_time, to_time = self.set_default_time_range(None, None)
+            advance_to = min(datetime.strptime(to_time, "%Y-%m-%d %H:%M:%S"), now)
+            return from_time, to_time, advance_to
+
+        window_start = watermark - timedelta(minutes=BatchProcessingConfig.INCREMENTAL_FETCH_OVERLAP_MINUTES)
+        window_end = min(
+            now,
+            window_start + timedelta(hours=BatchProcessingConfig.INCREMENTAL_FETCH_MAX_LOOKBACK_HOURS)
+        )
+        if window_end < now:
+            self.logger.warning(
+                f"{self.fetch_type} watermark {watermark} is older than the "
+                f"{BatchProcessingConfig.INCREMENTAL_FETCH_MAX_LOOKBACK_HOURS}h lookback, "
+                f"catching up through {window_end}"
+            )
+        return window_start.strftime("%Y-%m-%d %H:%M:%S"), window_end.strftime("%Y-%m-%d %H:%M:%S"), window_end
+
+    def advance_watermark(self, db, dealer_id: str, advance_to: datetime) -> None:
+        """Move the dealer's watermark forward (never backwards); committed with the fetch log"""
+        stmt = insert(FetchWatermark).values(
+            dealer_id=dealer_id,
+            fetch_type=self.fetch_type,
+            last_to_time=advance_to,
+            updated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['dealer_id', 'fetch_type'],
+            set_={
+                'last_to_time': func.greatest(FetchWatermark.last_to_time, stmt.excluded.last_to_time),
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        db.execute(stmt)
+
     def validate_api_response(self, api_data: Dict[str, Any]) -> None:
         """Validate API response status"""
         if api_data.get("status") != 1:
@@ -129,7 +337,8 @@ class BaseDataProcessor(ABC):
         return data
     
     def log_fetch_result(self, db, dealer_id: str, status: str, records_processed: int,
-                        duration: int, start_time: datetime, error_message: str = None) -> None:
+                        duration: int, start_time: datetime, error_message: str = None,
+                        records_changed: Optional[int] = None) -> None:
         """Log fetch result to database with transaction safety"""
         try:
             # Check if transaction is aborted before logging
@@ -143,6 +352,7 @@ class BaseDataProcessor(ABC):
                 fetch_type=self.fetch_type,
                 status=status,
                 records_fetched=records_processed,
+                records_changed=records_changed,
                 error_message=error_message,
                 fetch_duration_seconds=duration,
                 started_at=start_time,
@@ -161,6 +371,7 @@ class BaseDataProcessor(ABC):
                         fetch_type=self.fetch_type,
                         status=status,
                         records_fetched=records_processed,
+                        records_changed=records_changed,
                         error_message=error_message,
                         fetch_duration_seconds=duration,
                         started_at=start_time,
@@ -178,16 +389,69 @@ class BaseDataProcessor(ABC):
             self.logger.error(f"Error logging fetch result: {e}")
             raise
 
-    def bulk_upsert(self, db, model_class, records: list, conflict_columns: list, batch_size: int = 1000):
-        """Perform bulk upsert operation using PostgreSQL ON CONFLICT with enhanced error handling"""
+    def bulk_upsert(self, db, model_class, records: list, conflict_columns: list, batch_size: int = 1000,
+                    engine: Optional[str] = None, return_ids_by: Optional[str] = None):
+        """Perform bulk upsert operation using PostgreSQL ON CONFLICT with enhanced error handling
+
+        ``engine`` overrides the processor's ``bulk_upsert_engine`` for this call.
+
+        When ``return_ids_by`` names a natural-key column, the upsert uses RETURNING and
+        the result is ``(processed, {natural_key: id})`` so parent/child processors can map
+        foreign keys without a follow-up lookup query.
+
+        Models with a ``content_hash`` column get a per-record payload hash, and conflicting
+        rows are only rewritten when the hash differs. Rows actually written are added to
+        ``records_changed``.
+
+        Typed DATE columns listed in ``DERIVED_DATE_COLUMNS`` are parsed from their source
+        date strings here, so every processor fills them at ingest.
+
+        Models feeding the dashboard rollups have their touched days recorded for
+        ``execute`` to refresh once the run is committed.
+        """
+        id_map = {} if return_ids_by else None
+
+        def result(processed: int):
+            if return_ids_by:
+                self._fill_unchanged_ids(db, model_class, records, conflict_columns, return_ids_by, id_map)
+                return processed, id_map
+            return processed
+
         if not records:
-            return 0
+            return result(0)
+
+        derived_dates = DERIVED_DATE_COLUMNS.get(model_class)
+        if derived_dates:
+            records = [self._with_derived_dates(record, derived_dates) for record in records]
+
+        if 'content_hash' in model_class.__table__.columns:
+            records = [
+                {**record, 'content_hash': self.compute_content_hash(record)}
+                for record in records
+            ]
+
+        day_columns = self._rollup_day_columns(model_class)
+        self._track_rollup_days(model_class, records, day_columns)
+
+        if (engine or self.bulk_upsert_engine) == "copy":
+            try:
+                # Savepoint so a failed COPY doesn't abort work already done in this transaction
+                with db.begin_nested():
+                    return result(self._copy_upsert(db, model_class, records, conflict_columns,
+                                                    return_ids_by, id_map, day_columns))
+            except Exception as copy_error:
+                if id_map:
+                    id_map.clear()
+                self.logger.warning(
+                    f"COPY upsert failed for {model_class.__name__}, falling back to batched VALUES upsert: {copy_error}"
+                )
 
         total_processed = 0
 
         # Process records in batches to manage memory
         for i in range(0, len(records), batch_size):
             batch = records[i:i + batch_size]
+            update_dict = None
 
             try:
                 # Check transaction state before batch operation
@@ -212,10 +476,22 @@ class BaseDataProcessor(ABC):
 
                 stmt = stmt.on_conflict_do_update(
                     index_elements=conflict_columns,
-                    set_=update_dict
+                    set_=update_dict,
+                    where=self._upsert_where(model_class, stmt)
                 )
-
-                result = db.execute(stmt)
+                returning = self._upsert_returning(db, model_class, return_ids_by, day_columns)
+                if returning:
+                    stmt = stmt.returning(*returning)
+
+                # Savepoint so a failed batch doesn't discard the batches already written
+                with db.begin_nested():
+                    batch_result = db.execute(stmt)
+                    batch_rows = list(batch_result) if returning else None
+                if return_ids_by:
+                    id_map.update({row[1]: row[0] for row in batch_rows})
+                if day_columns:
+                    self._track_prior_rollup_days(model_class, day_columns, batch_rows)
+                self._add_records_changed(batch_result.rowcount)
                 total_processed += len(batch)
 
                 self.logger.debug(f"Processed batch of {len(batch)} records for {model_class.__name__}")
@@ -229,26 +505,149 @@ class BaseDataProcessor(ABC):
                     # Log the problematic batch data for debugging
                     self.logger.debug(f"Problematic batch data sample: {batch[:3] if len(batch) > 3 else batch}")
 
-                # Force rollback and retry with individual inserts
-                if self._safe_rollback(db):
-                    total_processed += self._fallback_individual_inserts(
-                        db, model_class, batch, conflict_columns, update_dict
-                    )
-                else:
-                    self.logger.error(f"Failed to recover from PostgreSQL error in batch for {model_class.__name__}")
-                    raise
-                    
+                # Only this batch's savepoint was rolled back; retry it with individual inserts
+                total_processed += self._fallback_individual_inserts(
+                    db, model_class, batch, conflict_columns, update_dict, return_ids_by, id_map, day_columns
+                )
+
             except Exception as e:
                 self.logger.error(f"General error in bulk upsert batch: {e}")
                 # Try individual inserts for this batch as fallback
                 total_processed += self._fallback_individual_inserts(
-                    db, model_class, batch, conflict_columns, None
+                    db, model_class, batch, conflict_columns, None, return_ids_by, id_map, day_columns
                 )
 
-        return total_processed
+        return result(total_processed)
     
-    def _fallback_individual_inserts(self, db, model_class, batch: list, conflict_columns: list, update_dict: dict = None):
-        """Fallback to individual inserts when batch operations fail"""
+    def _fill_unchanged_ids(self, db, model_class, records: list, conflict_columns: list,
+                            return_ids_by: str, id_map: dict, batch_size: int = 1000) -> None:
+        """Look up ids for rows RETURNING skipped because their content hash was unchanged"""
+        missing = [
+            record for record in records
+            if record.get(return_ids_by) is not None and record.get(return_ids_by) not in id_map
+        ]
+        if not missing:
+            return
+
+        key_column = getattr(model_class, return_ids_by)
+        conflict_attrs = [getattr(model_class, name) for name in conflict_columns]
+        for i in range(0, len(missing), batch_size):
+            keys = {
+                tuple(record.get(name) for name in conflict_columns)
+                for record in missing[i:i + batch_size]
+            }
+            rows = db.query(model_class.id, key_column).filter(tuple_(*conflict_attrs).in_(list(keys))).all()
+            id_map.update({key: row_id for row_id, key in rows})
+
+    @staticmethod
+    def _copy_text_value(value) -> str:
+        """Encode a Python value for COPY ... FROM STDIN text format"""
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        elif isinstance(value, (int, float, Decimal, uuid.UUID)):
+            return str(value)
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def _copy_upsert(self, db, model_class, records: list, conflict_columns: list,
+                     return_ids_by: Optional[str] = None, id_map: Optional[dict] = None,
+                     day_columns: tuple = ()) -> int:
+        """Upsert records by streaming them into a temp staging table with COPY and merging once
+
+        Rows are COPYed (text format) into a session-local staging table shaped like the
+        target's columns, then merged with a single INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+        Duplicate keys within the payload resolve to the last occurrence, matching what
+        sequential VALUES batches would leave behind. With ``return_ids_by`` the merge
+        RETURNs ids into ``id_map``; with ``day_columns`` it also RETURNs the rows' prior
+        rollup days (see ``_prior_day_sql``).
+        """
+        table = model_class.__table__
+        quote = db.get_bind().dialect.identifier_preparer.quote
+
+        # Columns present in the payload plus Python-side defaults SQLAlchemy would have applied
+        record_keys = set()
+        for record in records:
+            record_keys.update(record.keys())
+        columns = [col for col in table.columns if col.name in record_keys]
+        default_columns = [
+            col for col in table.columns
+            if col.name not in record_keys and col.default is not None and not col.default.is_sequence
+        ]
+        all_columns = columns + default_columns
+        column_names = [col.name for col in all_columns]
+
+        def default_value(col):
+            return col.default.arg(None) if col.default.is_callable else col.default.arg
+
+        buffer = io.StringIO()
+        for record in records:
+            values = [record.get(col.name) for col in columns]
+            values.extend(default_value(col) for col in default_columns)
+            buffer.write("\t".join(self._copy_text_value(v) for v in values))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        stage = f"_stage_{table.name}_{uuid.uuid4().hex[:8]}"
+        cols_sql = ", ".join(quote(name) for name in column_names)
+        conflict_sql = ", ".join(quote(name) for name in conflict_columns)
+        update_columns = [name for name in column_names if name not in conflict_columns and name != "id"]
+        set_parts = [f"{quote(name)} = EXCLUDED.{quote(name)}" for name in update_columns if name != "fetched_at"]
+        if "fetched_at" in table.columns:
+            set_parts.append(f"{quote('fetched_at')} = (now() AT TIME ZONE 'utc')")
+        action_sql = f"DO UPDATE SET {', '.join(set_parts)}" if set_parts else "DO NOTHING"
+        if set_parts and "content_hash" in column_names:
+            action_sql += (
+                f" WHERE {quote(table.name)}.{quote('content_hash')}"
+                f" IS DISTINCT FROM EXCLUDED.{quote('content_hash')}"
+            )
+        returning = [quote('id'), quote(return_ids_by)] if return_ids_by else []
+        returning.extend(self._prior_day_sql(quote, table.name, column) for column in day_columns)
+        returning_sql = f" RETURNING {', '.join(returning)}" if returning else ""
+
+        raw_connection = db.connection().connection
+        with raw_connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                f"SELECT {cols_sql} FROM {quote(table.name)} WITH NO DATA"
+            )
+            cursor.execute(f"ALTER TABLE {stage} ADD COLUMN _copy_seq BIGSERIAL")
+            cursor.copy_expert(f"COPY {stage} ({cols_sql}) FROM STDIN", buffer)
+            cursor.execute(
+                f"INSERT INTO {quote(table.name)} ({cols_sql}) "
+                f"SELECT DISTINCT ON ({conflict_sql}) {cols_sql} FROM {stage} "
+                f"ORDER BY {conflict_sql}, _copy_seq DESC "
+                f"ON CONFLICT ({conflict_sql}) {action_sql}{returning_sql}"
+            )
+            self._add_records_changed(cursor.rowcount)
+            rows = cursor.fetchall() if returning else []
+            if return_ids_by:
+                id_map.update({row[1]: row[0] for row in rows})
+            if day_columns:
+                self._track_prior_rollup_days(model_class, day_columns, rows)
+            cursor.execute(f"DROP TABLE {stage}")
+
+        self.logger.debug(f"COPY upsert merged {len(records)} records into {table.name}")
+        return len(records)
+
+    def _fallback_individual_inserts(self, db, model_class, batch: list, conflict_columns: list, update_dict: dict = None,
+                                     return_ids_by: Optional[str] = None, id_map: Optional[dict] = None,
+                                     day_columns: tuple = ()):
+        """Fallback to individual inserts when batch operations fail
+
+        Each record is written in its own savepoint, so a rejected record is skipped
+        without rolling back the rest of the transaction.
+        """
         processed = 0
         
         for record in batch:
@@ -273,15 +672,28 @@ class BaseDataProcessor(ABC):
                 
                 stmt = stmt.on_conflict_do_update(
                     index_elements=conflict_columns,
-                    set_=update_dict
+                    set_=update_dict,
+                    where=self._upsert_where(model_class, stmt)
                 )
-                db.execute(stmt)
+                returning = self._upsert_returning(db, model_class, return_ids_by, day_columns)
+                if returning:
+                    stmt = stmt.returning(*returning)
+                    with db.begin_nested():
+                        row = db.execute(stmt).first()
+                    if row:
+                        if return_ids_by:
+                            id_map[row[1]] = row[0]
+                        if day_columns:
+                            self._track_prior_rollup_days(model_class, day_columns, [row])
+                        self._add_records_changed(1)
+                else:
+                    with db.begin_nested():
+                        rowcount = db.execute(stmt).rowcount
+                    self._add_records_changed(rowcount)
                 processed += 1
                 
             except (psycopg2.errors.InFailedSqlTransaction, psycopg2.errors.IntegrityError) as pg_error:
                 self.logger.error(f"PostgreSQL error in individual insert: {pg_error}")
-                # Try to recover transaction state
-                self._safe_rollback(db)
                 continue
                 
             except Exception as individual_error:
@@ -329,10 +741,19 @@ class BaseDataProcessor(ABC):
         """Process API records and save to database - must be implemented by subclasses"""
         pass
     
-    def execute(self, dealer_id: str, from_time: str = None, to_time: str = None, **kwargs) -> Dict[str, Any]:
-        """Main execution method - template pattern"""
+    def execute(self, dealer_id: str, from_time: str = None, to_time: str = None,
+                api_data: Optional[Dict[str, Any]] = None, advance_to: Optional[datetime] = None,
+                **kwargs) -> Dict[str, Any]:
+        """Main execution method - template pattern
+
+        When ``api_data`` is given (payload already fetched by the concurrent
+        multi-dealer fan-out) the API call is skipped and only the write stage runs;
+        ``advance_to`` then carries the watermark that window was resolved with.
+        """
         db = None
         start_time = datetime.utcnow()
+        self._reset_records_changed()
+        self._reset_rollup_days()
 
         try:
             # Create database session with retry logic
@@ -341,11 +762,16 @@ class BaseDataProcessor(ABC):
             # Get dealer information
             dealer = self.get_dealer_info(db, dealer_id)
 
-            # Set default time range
-            from_time, to_time = self.set_default_time_range(from_time, to_time)
+            # Resolve time range (incremental from the watermark when no window is given)
+            if not from_time or not to_time:
+                watermark = None
+                if BatchProcessingConfig.INCREMENTAL_FETCH_ENABLED:
+                    watermark = self.get_watermarks(db, [dealer_id]).get(dealer_id)
+                from_time, to_time, advance_to = self.resolve_time_range(from_time, to_time, watermark)
 
-            # Fetch API data
-            api_data = self.fetch_api_data(dealer, from_time, to_time, **kwargs)
+            # Fetch API data unless it was prefetched
+            if api_data is None:
+                api_data = self.fetch_api_data(dealer, from_time, to_time, **kwargs)
 
             # Validate response
             self.validate_api_response(api_data)
@@ -357,17 +783,35 @@ class BaseDataProcessor(ABC):
             if not hasattr(self, '_handles_own_commits') or not self._handles_own_commits:
                 db.commit()
 
+            # Refresh the dashboard rollups for the days this run wrote
+            self._refresh_rollups(db, dealer_id)
+
+            # Advance the watermark; committed together with the fetch log
+            if advance_to is not None:
+                self.advance_watermark(db, dealer_id, advance_to)
+
             # Log successful fetch
             duration = int((datetime.utcnow() - start_time).total_seconds())
-            self.log_fetch_result(db, dealer_id, "success", records_processed, duration, start_time)
+            records_changed = self.records_changed
+            self.log_fetch_result(db, dealer_id, "success", records_processed, duration, start_time,
+                                  records_changed=records_changed)
+
+            # Cached dashboard responses for this dealer are stale once the new data is committed
+            self._invalidate_gateway_cache(dealer_id)
 
-            self.logger.info(f"Successfully fetched {records_processed} {self.fetch_type} records for dealer {dealer_id}")
+            self.logger.info(
+                f"Successfully fetched {records_processed} {self.fetch_type} records for dealer {dealer_id} "
+                f"({records_changed} changed)"
+            )
 
             return {
                 "status": "success",
                 "dealer_id": dealer_id,
                 "records_processed": records_processed,
-                "duration_seconds": duration
+                "records_changed": records_changed,
+                "duration_seconds": duration,
+                "from_time": from_time,
+                "to_time": to_time
             }
 
         except (psycopg2.errors.InFailedSqlTransaction, psycopg2.errors.IntegrityError, DatabaseError) as pg_error:
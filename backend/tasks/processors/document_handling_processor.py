@@ -146,41 +146,32 @@ class DocumentHandlingDataProcessor(BaseDataProcessor):
                 self.logger.warning(f"No valid document handling records to process for dealer {dealer_id}")
                 return 0
 
-            # Bulk upsert document records
-            main_processed = self.bulk_upsert(
+            # Bulk upsert document records; RETURNING gives the id_so -> id map for units
+            main_processed, document_mapping = self.bulk_upsert(
                 db,
                 DocumentHandlingData,
                 document_records,
                 conflict_columns=['dealer_id', 'id_so'],
-                batch_size=500
+                batch_size=500,
+                return_ids_by='id_so'
             )
 
             # Process unit records if any
             unit_processed = 0
             if unit_records:
-                # Get document ID mapping for foreign keys
-                document_query = db.query(
-                    DocumentHandlingData.id,
-                    DocumentHandlingData.id_so
-                ).filter(DocumentHandlingData.dealer_id == dealer_id)
-
-                document_mapping = {}
-                for doc_id, id_so in document_query:
-                    document_mapping[id_so] = doc_id
-
                 # Update unit records with proper foreign keys
+                valid_units = []
                 for unit_record in unit_records:
                     id_so = unit_record.pop('document_id_so')
                     if id_so in document_mapping:
                         unit_record['document_handling_data_id'] = document_mapping[id_so]
-                    else:
-                        continue  # Skip if parent not found
+                        valid_units.append(unit_record)
 
                 # Bulk upsert unit records
                 unit_processed = self.bulk_upsert(
                     db,
                     DocumentHandlingUnit,
-                    unit_records,
+                    valid_units,
                     conflict_columns=['document_handling_data_id', 'nomor_rangka'],
                     batch_size=500
                 )
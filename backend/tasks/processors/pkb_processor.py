@@ -12,6 +12,9 @@ from .base_processor import BaseDataProcessor
 
 class PKBDataProcessor(BaseDataProcessor):
     """Processor for PKB (Service Record) data"""
+
+    # Backfills load tens of thousands of rows; stream them with COPY
+    bulk_upsert_engine = "copy"
     
     def __init__(self):
         super().__init__("pkb")
@@ -198,15 +201,16 @@ class PKBDataProcessor(BaseDataProcessor):
 
             # Phase 1: Bulk upsert main PKB records and commit immediately
             self.logger.info(f"Phase 1: Processing {len(pkb_records)} main PKB records for dealer {dealer_id}")
-            main_processed = self.bulk_upsert(
+            main_processed, pkb_mapping = self.bulk_upsert(
                 db,
                 PKBData,
                 pkb_records,
                 conflict_columns=['dealer_id', 'no_work_order'],
-                batch_size=500
+                batch_size=500,
+                return_ids_by='no_work_order'
             )
 
-            # Commit PKB data immediately to make it available for FK references
+            # Commit PKB data immediately so a failing child phase can't roll it back
             try:
                 db.commit()
                 self.logger.info(f"✅ Phase 1 complete: Committed {main_processed} PKB records for dealer {dealer_id}")
@@ -222,7 +226,7 @@ class PKBDataProcessor(BaseDataProcessor):
                     self.logger.info(f"Phase 2: Processing {len(service_records)} service records for dealer {dealer_id}")
                     services_processed = self._process_child_records(
                         db, dealer_id, service_records, PKBService,
-                        ['pkb_data_id', 'id_job'], "services"
+                        ['pkb_data_id', 'id_job'], "services", pkb_mapping
                     )
 
                     # Commit services separately
@@ -242,7 +246,7 @@ class PKBDataProcessor(BaseDataProcessor):
                     self.logger.info(f"Phase 3: Processing {len(part_records)} part records for dealer {dealer_id}")
                     parts_processed = self._process_child_records(
                         db, dealer_id, part_records, PKBPart,
-                        ['pkb_data_id', 'id_job', 'parts_number'], "parts"
+                        ['pkb_data_id', 'id_job', 'parts_number'], "parts", pkb_mapping
                     )
 
                     # Commit parts separately
@@ -269,7 +273,7 @@ class PKBDataProcessor(BaseDataProcessor):
             raise
 
     def _process_child_records(self, db, dealer_id: str, child_records: list, model_class,
-                              conflict_columns: list, record_type: str) -> int:
+                              conflict_columns: list, record_type: str, pkb_mapping: Dict[str, Any]) -> int:
         """
         Process child records (services or parts) with proper FK mapping to committed PKB data
 
@@ -280,6 +284,7 @@ class PKBDataProcessor(BaseDataProcessor):
             model_class: SQLAlchemy model class (PKBService or PKBPart)
             conflict_columns: Columns for conflict resolution
             record_type: Type of records for logging ("services" or "parts")
+            pkb_mapping: Work order -> PKBData.id map returned by the Phase 1 upsert
 
         Returns:
             Number of records processed
@@ -289,52 +294,6 @@ class PKBDataProcessor(BaseDataProcessor):
                 self.logger.info(f"No {record_type} records to process for dealer {dealer_id}")
                 return 0
 
-            # Extract work orders from child records
-            work_orders = []
-            for record in child_records:
-                wo = record.get('work_order')
-                if wo:
-                    work_orders.append(wo)
-
-            if not work_orders:
-                self.logger.warning(f"No work orders found in {record_type} records for dealer {dealer_id}")
-                return 0
-
-            # Sanitize work orders and limit batch size to prevent SQL corruption
-            sanitized_work_orders = []
-            for wo in work_orders:
-                if wo and isinstance(wo, str) and len(wo.strip()) > 0:
-                    # Clean the work order number to prevent SQL injection/corruption
-                    clean_wo = str(wo).strip()[:50]  # Limit length
-                    if clean_wo and clean_wo not in sanitized_work_orders:
-                        sanitized_work_orders.append(clean_wo)
-
-            if not sanitized_work_orders:
-                self.logger.warning(f"No valid work orders found for {record_type} mapping in dealer {dealer_id}")
-                return 0
-
-            # Build PKB mapping from committed data
-            pkb_mapping = {}
-            batch_size = 50  # Limit to prevent parameter overflow
-
-            for i in range(0, len(sanitized_work_orders), batch_size):
-                batch_work_orders = sanitized_work_orders[i:i + batch_size]
-                try:
-                    # Query committed PKB data for FK mapping
-                    pkb_query = db.query(PKBData.id, PKBData.no_work_order).filter(
-                        PKBData.dealer_id == dealer_id,
-                        PKBData.no_work_order.in_(batch_work_orders)
-                    ).all()
-
-                    for pkb_id, work_order in pkb_query:
-                        pkb_mapping[work_order] = pkb_id
-
-                    self.logger.debug(f"Mapped {len(pkb_query)} work orders in batch {i//batch_size + 1} for {record_type}")
-
-                except Exception as query_error:
-                    self.logger.error(f"Error querying PKB {record_type} mapping batch {i//batch_size + 1}: {query_error}")
-                    continue
-
             if not pkb_mapping:
                 self.logger.warning(f"No PKB mappings found for {record_type} in dealer {dealer_id}")
                 return 0
@@ -153,29 +153,19 @@ class ProspectDataProcessor(BaseDataProcessor):
                 self.logger.warning(f"No valid prospect records to process for dealer {dealer_id}")
                 return 0
 
-            # Bulk upsert main prospect records
-            main_processed = self.bulk_upsert(
+            # Bulk upsert main prospect records; RETURNING gives the id_prospect -> id map for units
+            main_processed, prospect_mapping = self.bulk_upsert(
                 db,
                 ProspectData,
                 prospect_records,
                 conflict_columns=['dealer_id', 'id_prospect'],
-                batch_size=500
+                batch_size=500,
+                return_ids_by='id_prospect'
             )
 
             # Process unit records if any
             if unit_records:
-                # First, get the mapping of prospect IDs to database IDs
-                prospect_ids = [record['id_prospect'] for record in prospect_records if record['id_prospect']]
-                if prospect_ids:
-                    prospect_mapping = {}
-                    prospect_query = db.query(ProspectData.id, ProspectData.id_prospect).filter(
-                        ProspectData.dealer_id == dealer_id,
-                        ProspectData.id_prospect.in_(prospect_ids)
-                    ).all()
-
-                    for prospect_db_id, prospect_id in prospect_query:
-                        prospect_mapping[prospect_id] = prospect_db_id
-
+                if prospect_mapping:
                     # Update unit records with correct foreign keys
                     valid_units = []
                     for unit in unit_records:
@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 class SPKDealingProcessDataProcessor(BaseDataProcessor):
     """Processor for SPK dealing process data from SPK API"""
+
+    # Backfills load tens of thousands of rows; stream them with COPY
+    bulk_upsert_engine = "copy"
     
     def __init__(self):
         super().__init__("spk_read")
@@ -185,41 +188,32 @@ class SPKDealingProcessDataProcessor(BaseDataProcessor):
                 self.logger.warning(f"No valid SPK dealing process records to process for dealer {dealer_id}")
                 return 0
 
-            # Bulk upsert SPK records
-            main_processed = self.bulk_upsert(
+            # Bulk upsert SPK records; RETURNING gives the id_spk -> id map for children
+            main_processed, spk_mapping = self.bulk_upsert(
                 db,
                 SPKDealingProcessData,
                 spk_records,
                 conflict_columns=['dealer_id', 'id_spk'],
-                batch_size=500
+                batch_size=500,
+                return_ids_by='id_spk'
             )
 
             # Process unit records if any
             unit_processed = 0
             if unit_records:
-                # Get SPK ID mapping for foreign keys
-                spk_query = db.query(
-                    SPKDealingProcessData.id,
-                    SPKDealingProcessData.id_spk
-                ).filter(SPKDealingProcessData.dealer_id == dealer_id)
-
-                spk_mapping = {}
-                for spk_id, id_spk in spk_query:
-                    spk_mapping[id_spk] = spk_id
-
                 # Update unit records with proper foreign keys
+                valid_units = []
                 for unit_record in unit_records:
                     id_spk = unit_record.pop('spk_id_spk')
                     if id_spk in spk_mapping:
                         unit_record['spk_dealing_process_data_id'] = spk_mapping[id_spk]
-                    else:
-                        continue  # Skip if parent not found
+                        valid_units.append(unit_record)
 
                 # Bulk upsert unit records
                 unit_processed = self.bulk_upsert(
                     db,
                     SPKDealingProcessUnit,
-                    unit_records,
+                    valid_units,
                     conflict_columns=['spk_dealing_process_data_id', 'kode_tipe_unit', 'kode_warna'],
                     batch_size=500
                 )
@@ -228,18 +222,18 @@ class SPKDealingProcessDataProcessor(BaseDataProcessor):
             family_processed = 0
             if family_records:
                 # Update family records with proper foreign keys
+                valid_family = []
                 for family_record in family_records:
                     id_spk = family_record.pop('spk_id_spk')
                     if id_spk in spk_mapping:
                         family_record['spk_dealing_process_data_id'] = spk_mapping[id_spk]
-                    else:
-                        continue  # Skip if parent not found
+                        valid_family.append(family_record)
 
                 # Bulk upsert family member records
                 family_processed = self.bulk_upsert(
                     db,
                     SPKDealingProcessFamilyMember,
-                    family_records,
+                    valid_family,
                     conflict_columns=['spk_dealing_process_data_id', 'anggota_kk'],
                     batch_size=500
                 )
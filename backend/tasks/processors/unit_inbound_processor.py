@@ -152,29 +152,19 @@ class UnitInboundDataProcessor(BaseDataProcessor):
                 logger.warning(f"No valid unit inbound records to process for dealer {dealer_id}")
                 return 0
 
-            # Bulk upsert main inbound records
-            main_processed = self.bulk_upsert(
+            # Bulk upsert main inbound records; RETURNING gives the shipping list -> id map for units
+            main_processed, inbound_mapping = self.bulk_upsert(
                 db,
                 UnitInboundData,
                 inbound_records,
                 conflict_columns=['dealer_id', 'no_shipping_list'],
-                batch_size=500
+                batch_size=500,
+                return_ids_by='no_shipping_list'
             )
 
             # Process unit records if any
             if unit_records:
-                # First, get the mapping of shipping list numbers to database IDs
-                shipping_lists = [record['no_shipping_list'] for record in inbound_records if record['no_shipping_list']]
-                if shipping_lists:
-                    inbound_mapping = {}
-                    inbound_query = db.query(UnitInboundData.id, UnitInboundData.no_shipping_list).filter(
-                        UnitInboundData.dealer_id == dealer_id,
-                        UnitInboundData.no_shipping_list.in_(shipping_lists)
-                    ).all()
-
-                    for inbound_id, shipping_list in inbound_query:
-                        inbound_mapping[shipping_list] = inbound_id
-
+                if inbound_mapping:
                     # Update unit records with correct foreign keys
                     valid_units = []
                     for unit in unit_records:
@@ -0,0 +1,32 @@
+"""
+Parsing helpers for the free-form date strings returned by the DGI APIs
+"""
+from datetime import date, datetime
+from typing import Optional
+
+# Formats seen in DGI payloads, matched against the first 10 characters (time part ignored)
+DGI_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y")
+
+
+def parse_dgi_date(value) -> Optional[date]:
+    """Parse a DGI date string such as '2025-01-31', '2025-01-31 08:15:00' or '31/01/2025'
+
+    Returns None for empty or unparseable values instead of raising.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    text = str(value).strip()[:10]
+    if len(text) < 10:
+        return None
+
+    for fmt in DGI_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
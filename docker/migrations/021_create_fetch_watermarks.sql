@@ -0,0 +1,20 @@
+-- Migration: Create fetch_watermarks table
+-- Version: 021
+-- Date: 2026-10-16
+-- Description: Stores the high-water mark of the last successful incremental fetch per (dealer_id, fetch_type)
+--              so scheduled runs only request the delta since the previous success
+
+SET search_path TO dealer_integration, public;
+
+CREATE TABLE IF NOT EXISTS fetch_watermarks (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    dealer_id VARCHAR(10) NOT NULL,
+    fetch_type VARCHAR(50) NOT NULL,
+    last_to_time TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fetch_watermarks_pkey PRIMARY KEY (id),
+    CONSTRAINT fetch_watermarks_dealer_id_fkey FOREIGN KEY (dealer_id) REFERENCES dealers(dealer_id),
+    CONSTRAINT uq_fetch_watermark_dealer_fetch_type UNIQUE (dealer_id, fetch_type)
+);
+
+COMMENT ON TABLE fetch_watermarks IS 'High-water mark (last successful to_time) per dealer and fetch type for incremental DGI fetches';
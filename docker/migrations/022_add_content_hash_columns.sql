@@ -0,0 +1,28 @@
+-- Migration: Add content_hash columns and fetch_logs.records_changed
+-- Version: 022
+-- Date: 2026-10-16
+-- Description: Stores a per-record payload hash on DGI ingest tables so upserts can skip rows whose
+--              content has not changed (ON CONFLICT ... DO UPDATE ... WHERE content_hash IS DISTINCT FROM),
+--              and records how many rows each fetch actually changed
+
+SET search_path TO dealer_integration, public;
+
+ALTER TABLE prospect_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE pkb_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE parts_inbound_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE leasing_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE document_handling_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE unit_inbound_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE delivery_process_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE billing_process_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE unit_invoice_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE parts_sales_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE dp_hlo_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE workshop_invoice_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE unpaid_hlo_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE parts_invoice_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+ALTER TABLE spk_dealing_process_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
+
+ALTER TABLE fetch_logs ADD COLUMN IF NOT EXISTS records_changed INTEGER NULL;
+
+COMMENT ON COLUMN fetch_logs.records_changed IS 'Rows inserted or updated by the fetch; unchanged payloads are not counted';
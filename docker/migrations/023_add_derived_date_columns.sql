@@ -0,0 +1,82 @@
+-- Migration: Add typed DATE columns for dashboard date filters
+-- Version: 023
+-- Date: 2026-10-16
+-- Description: Adds DATE columns parsed from the DGI date strings (YYYY-MM-DD[ HH:MM:SS] or DD/MM/YYYY)
+--              that dashboard tiles filter on, indexed on (dealer_id, date) (child tables: (parent_id, date)).
+--              Processors fill them at ingest; run backend/scripts/backfill_derived_dates.py once for existing rows.
+
+SET search_path TO dealer_integration, public;
+
+-- unit_inbound_data
+ALTER TABLE unit_inbound_data ADD COLUMN IF NOT EXISTS tanggal_terima_date DATE NULL;
+ALTER TABLE unit_inbound_data ADD COLUMN IF NOT EXISTS modified_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_unit_inbound_data_dealer_tanggal_terima_date ON unit_inbound_data(dealer_id, tanggal_terima_date);
+CREATE INDEX IF NOT EXISTS idx_unit_inbound_data_dealer_modified_date ON unit_inbound_data(dealer_id, modified_date);
+
+-- billing_process_data
+ALTER TABLE billing_process_data ADD COLUMN IF NOT EXISTS modified_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_billing_process_data_dealer_modified_date ON billing_process_data(dealer_id, modified_date);
+
+-- leasing_data
+ALTER TABLE leasing_data ADD COLUMN IF NOT EXISTS tanggal_pengajuan_date DATE NULL;
+ALTER TABLE leasing_data ADD COLUMN IF NOT EXISTS tanggal_pembuatan_po_date DATE NULL;
+ALTER TABLE leasing_data ADD COLUMN IF NOT EXISTS tanggal_pengiriman_po_finance_company_date DATE NULL;
+ALTER TABLE leasing_data ADD COLUMN IF NOT EXISTS modified_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_leasing_data_dealer_tanggal_pengajuan_date ON leasing_data(dealer_id, tanggal_pengajuan_date);
+CREATE INDEX IF NOT EXISTS idx_leasing_data_dealer_tanggal_pembuatan_po_date ON leasing_data(dealer_id, tanggal_pembuatan_po_date);
+CREATE INDEX IF NOT EXISTS idx_leasing_data_dealer_tgl_pengiriman_po_fc_date ON leasing_data(dealer_id, tanggal_pengiriman_po_finance_company_date);
+CREATE INDEX IF NOT EXISTS idx_leasing_data_dealer_modified_date ON leasing_data(dealer_id, modified_date);
+
+-- document_handling_data
+ALTER TABLE document_handling_data ADD COLUMN IF NOT EXISTS modified_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_document_handling_data_dealer_modified_date ON document_handling_data(dealer_id, modified_date);
+
+-- document_handling_units
+ALTER TABLE document_handling_units ADD COLUMN IF NOT EXISTS tanggal_pengajuan_stnk_ke_biro_date DATE NULL;
+ALTER TABLE document_handling_units ADD COLUMN IF NOT EXISTS tanggal_penerimaan_bpkb_dari_biro_date DATE NULL;
+ALTER TABLE document_handling_units ADD COLUMN IF NOT EXISTS tanggal_terima_bpkb_oleh_konsumen_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_doc_handling_units_parent_tgl_pengajuan_stnk_date ON document_handling_units(document_handling_data_id, tanggal_pengajuan_stnk_ke_biro_date);
+CREATE INDEX IF NOT EXISTS idx_doc_handling_units_parent_tgl_penerimaan_bpkb_date ON document_handling_units(document_handling_data_id, tanggal_penerimaan_bpkb_dari_biro_date);
+CREATE INDEX IF NOT EXISTS idx_doc_handling_units_parent_tgl_terima_bpkb_date ON document_handling_units(document_handling_data_id, tanggal_terima_bpkb_oleh_konsumen_date);
+
+-- spk_dealing_process_data
+ALTER TABLE spk_dealing_process_data ADD COLUMN IF NOT EXISTS tanggal_pesanan_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_spk_dealing_process_data_dealer_tanggal_pesanan_date ON spk_dealing_process_data(dealer_id, tanggal_pesanan_date);
+
+-- spk_dealing_process_units
+ALTER TABLE spk_dealing_process_units ADD COLUMN IF NOT EXISTS tanggal_pengiriman_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_spk_dealing_process_units_parent_tanggal_pengiriman_date ON spk_dealing_process_units(spk_dealing_process_data_id, tanggal_pengiriman_date);
+
+-- delivery_process_data
+ALTER TABLE delivery_process_data ADD COLUMN IF NOT EXISTS tanggal_pengiriman_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_delivery_process_data_dealer_tanggal_pengiriman_date ON delivery_process_data(dealer_id, tanggal_pengiriman_date);
+
+-- pkb_data
+ALTER TABLE pkb_data ADD COLUMN IF NOT EXISTS created_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_pkb_data_dealer_created_date ON pkb_data(dealer_id, created_date);
+
+-- workshop_invoice_data
+ALTER TABLE workshop_invoice_data ADD COLUMN IF NOT EXISTS created_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_workshop_invoice_data_dealer_created_date ON workshop_invoice_data(dealer_id, created_date);
+
+-- dp_hlo_data
+ALTER TABLE dp_hlo_data ADD COLUMN IF NOT EXISTS created_date DATE NULL;
+CREATE INDEX IF NOT EXISTS idx_dp_hlo_data_dealer_created_date ON dp_hlo_data(dealer_id, created_date);
+
+COMMENT ON COLUMN unit_inbound_data.tanggal_terima_date IS 'Date parsed from tanggal_terima at ingest';
+COMMENT ON COLUMN unit_inbound_data.modified_date IS 'Date parsed from modified_time at ingest';
+COMMENT ON COLUMN billing_process_data.modified_date IS 'Date parsed from modified_time at ingest';
+COMMENT ON COLUMN leasing_data.tanggal_pengajuan_date IS 'Date parsed from tanggal_pengajuan at ingest';
+COMMENT ON COLUMN leasing_data.tanggal_pembuatan_po_date IS 'Date parsed from tanggal_pembuatan_po at ingest';
+COMMENT ON COLUMN leasing_data.tanggal_pengiriman_po_finance_company_date IS 'Date parsed from tanggal_pengiriman_po_finance_company at ingest';
+COMMENT ON COLUMN leasing_data.modified_date IS 'Date parsed from modified_time at ingest';
+COMMENT ON COLUMN document_handling_data.modified_date IS 'Date parsed from modified_time at ingest';
+COMMENT ON COLUMN document_handling_units.tanggal_pengajuan_stnk_ke_biro_date IS 'Date parsed from tanggal_pengajuan_stnk_ke_biro at ingest';
+COMMENT ON COLUMN document_handling_units.tanggal_penerimaan_bpkb_dari_biro_date IS 'Date parsed from tanggal_penerimaan_bpkb_dari_biro at ingest';
+COMMENT ON COLUMN document_handling_units.tanggal_terima_bpkb_oleh_konsumen_date IS 'Date parsed from tanggal_terima_bpkb_oleh_konsumen at ingest';
+COMMENT ON COLUMN spk_dealing_process_data.tanggal_pesanan_date IS 'Date parsed from tanggal_pesanan at ingest';
+COMMENT ON COLUMN spk_dealing_process_units.tanggal_pengiriman_date IS 'Date parsed from tanggal_pengiriman at ingest';
+COMMENT ON COLUMN delivery_process_data.tanggal_pengiriman_date IS 'Date parsed from tanggal_pengiriman at ingest';
+COMMENT ON COLUMN pkb_data.created_date IS 'Date parsed from created_time at ingest';
+COMMENT ON COLUMN workshop_invoice_data.created_date IS 'Date parsed from created_time at ingest';
+COMMENT ON COLUMN dp_hlo_data.created_date IS 'Date parsed from created_time at ingest';
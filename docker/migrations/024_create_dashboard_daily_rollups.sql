@@ -0,0 +1,31 @@
+-- Migration: Create dashboard daily rollups
+-- Version: 024
+-- Date: 2026-10-16
+-- Description: Per-(dealer_id, metric, day, dimension) aggregates behind the dashboard-dealer tiles
+--              (status counts, payment type/method/status, top leasing, top drivers, revenue trend,
+--              PO creation monthly). Processors refresh the days each run touches; run
+--              backend/scripts/rebuild_dashboard_rollups.py once to build them for existing data.
+
+SET search_path TO dealer_integration, public;
+
+CREATE TABLE IF NOT EXISTS dashboard_daily_rollups (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    dealer_id VARCHAR(10) NOT NULL,
+    metric VARCHAR(50) NOT NULL,
+    day DATE NOT NULL,
+    dimension VARCHAR(255) NULL,
+    record_count INTEGER NOT NULL DEFAULT 0,
+    amount_total NUMERIC(20, 2) NULL,
+    refreshed_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT dashboard_daily_rollups_pkey PRIMARY KEY (id),
+    CONSTRAINT dashboard_daily_rollups_dealer_id_fkey FOREIGN KEY (dealer_id) REFERENCES dealers(dealer_id)
+);
+
+-- One row per grouped value; NULL dimensions (ungrouped metrics, NULL statuses) are one bucket
+CREATE UNIQUE INDEX IF NOT EXISTS uq_dashboard_daily_rollups_key
+    ON dashboard_daily_rollups(dealer_id, metric, day, dimension) NULLS NOT DISTINCT;
+
+COMMENT ON TABLE dashboard_daily_rollups IS 'Daily per-dealer aggregates answering dashboard-dealer tiles without scanning ingest tables';
+COMMENT ON COLUMN dashboard_daily_rollups.metric IS 'unit_inbound_status, payment_type, payment_method, payment_status, top_leasing, po_creation, delivery_status, top_driver';
+COMMENT ON COLUMN dashboard_daily_rollups.dimension IS 'Grouped value of the metric (status code, payment type, finance company, driver); NULL when ungrouped';
+COMMENT ON COLUMN dashboard_daily_rollups.amount_total IS 'SUM of the amount column for metrics that carry one (payment_type)';
@@ -0,0 +1,54 @@
+-- Migration: Add parsed tanggal_rating DATE column to customer satisfaction
+-- Version: 025
+-- Date: 2026-10-16
+-- Description: tanggal_rating is stored as an Indonesian date string ('24 Desember 2024'), so the
+--              dashboard date filters had to parse every row in SQL. Adds tanggal_rating_date, filled
+--              by the upload from now on, backfills existing rows with the same parsing rules and
+--              indexes it. Unparseable values stay NULL (they never matched a date filter before).
+
+SET search_path TO customer, public;
+
+ALTER TABLE customer_satisfaction_raw ADD COLUMN IF NOT EXISTS tanggal_rating_date DATE NULL;
+
+-- Same 'D[D] Month YYYY' rules as the former query-time CASE; impossible dates yield NULL
+CREATE OR REPLACE FUNCTION pg_temp.parse_tanggal_rating(value TEXT) RETURNS DATE AS $$
+DECLARE
+    month_number INTEGER;
+BEGIN
+    IF value IS NULL OR value !~ '^[0-9]{1,2} [A-Za-z]+ [0-9]{4}$' THEN
+        RETURN NULL;
+    END IF;
+
+    month_number := CASE LOWER(SPLIT_PART(value, ' ', 2))
+        WHEN 'januari' THEN 1
+        WHEN 'februari' THEN 2
+        WHEN 'maret' THEN 3
+        WHEN 'april' THEN 4
+        WHEN 'mei' THEN 5
+        WHEN 'juni' THEN 6
+        WHEN 'juli' THEN 7
+        WHEN 'agustus' THEN 8
+        WHEN 'september' THEN 9
+        WHEN 'oktober' THEN 10
+        WHEN 'november' THEN 11
+        WHEN 'desember' THEN 12
+    END;
+    IF month_number IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    RETURN MAKE_DATE(SPLIT_PART(value, ' ', 3)::INTEGER, month_number, SPLIT_PART(value, ' ', 1)::INTEGER);
+EXCEPTION
+    WHEN OTHERS THEN
+        RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+UPDATE customer_satisfaction_raw
+SET tanggal_rating_date = pg_temp.parse_tanggal_rating(tanggal_rating)
+WHERE tanggal_rating_date IS NULL
+  AND tanggal_rating IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_customer_satisfaction_raw_tanggal_rating_date ON customer_satisfaction_raw(tanggal_rating_date);
+
+COMMENT ON COLUMN customer_satisfaction_raw.tanggal_rating_date IS 'tanggal_rating parsed to a DATE at upload; used by the date filters';